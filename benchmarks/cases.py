@@ -0,0 +1,262 @@
+"""
+Benchmark cases.
+
+Every case is a setup function ``setup(df) -> run`` registered in ``CASES``.
+Setup work (building masks, fitting for detect-only cases) happens outside the
+timed region; only ``run()`` is measured. Adding a detector or handler to the
+suite is one ``CASES`` entry.
+"""
+
+import tempfile
+
+import pandas as pd
+
+from typing import Callable, Dict, List
+
+import outlipy  # registers the df.outli and series.outli accessors
+from outlipy import (IQRDetector, ZScoreDetector, MADDetector, PercentileDetector, MahalanobisDetector,
+                     IsolationForestDetector, HBOSDetector, ECODDetector, KNNDetector, LOFDetector, DriftMonitor,
+                     WinsorizationHandler, MeanHandler, MedianHandler, RemoveHandler,
+                     ConstantHandler, InterpolateHandler, GroupedHandler, Plan)
+
+from .data import GROUP_COLUMN
+
+Setup = Callable[[pd.DataFrame], Callable[[], object]]
+
+
+def _features(df: pd.DataFrame) -> List[str]:
+    return [c for c in df.columns if c != GROUP_COLUMN]
+
+
+def _mask(df: pd.DataFrame) -> pd.DataFrame:
+    return IQRDetector(exclude = [GROUP_COLUMN]).detect(df)
+
+
+# ---------------------------------------------------------------
+#                           Detectors
+# ---------------------------------------------------------------
+
+DETECTORS = {
+    "iqr": lambda: IQRDetector(exclude = [GROUP_COLUMN]),
+    "zscore": lambda: ZScoreDetector(exclude = [GROUP_COLUMN]),
+    "mad": lambda: MADDetector(exclude = [GROUP_COLUMN]),
+    "percentile": lambda: PercentileDetector(exclude = [GROUP_COLUMN]),
+    "zscore_float32": lambda: ZScoreDetector(exclude = [GROUP_COLUMN], dtype = "float32"),
+    "mad_float32": lambda: MADDetector(exclude = [GROUP_COLUMN], dtype = "float32"),
+    "iqr_omit": lambda: IQRDetector(exclude = [GROUP_COLUMN], nan_policy = "omit"),
+    "iqr_sampled": lambda: IQRDetector(exclude = [GROUP_COLUMN], sample = 100_000, random_state = 0),
+    "mad_sampled": lambda: MADDetector(exclude = [GROUP_COLUMN], sample = 100_000, random_state = 0),
+    "iqr_incremental": lambda: IQRDetector(exclude = [GROUP_COLUMN], incremental = True),
+    "zscore_incremental": lambda: ZScoreDetector(exclude = [GROUP_COLUMN], incremental = True),
+    "mad_incremental": lambda: MADDetector(exclude = [GROUP_COLUMN], incremental = True),
+    "iqr_frequencies": lambda: IQRDetector(exclude = [GROUP_COLUMN], max_cardinality = 256),
+    "mad_frequencies": lambda: MADDetector(exclude = [GROUP_COLUMN], max_cardinality = 256),
+    "mahalanobis": lambda: MahalanobisDetector(exclude = [GROUP_COLUMN]),
+    "mahalanobis_robust": lambda: MahalanobisDetector(exclude = [GROUP_COLUMN], robust = True, random_state = 0),
+    "isolation_forest": lambda: IsolationForestDetector(exclude = [GROUP_COLUMN], random_state = 0),
+    "hbos": lambda: HBOSDetector(exclude = [GROUP_COLUMN]),
+    "hbos_dynamic": lambda: HBOSDetector(exclude = [GROUP_COLUMN], binning = "dynamic"),
+    "ecod": lambda: ECODDetector(exclude = [GROUP_COLUMN]),
+    "knn": lambda: KNNDetector(exclude = [GROUP_COLUMN]),
+    "knn_brute": lambda: KNNDetector(exclude = [GROUP_COLUMN], algorithm = "brute"),
+    "knn_sampled": lambda: KNNDetector(exclude = [GROUP_COLUMN], max_samples = 10_000, random_state = 0),
+    "lof": lambda: LOFDetector(exclude = [GROUP_COLUMN]),
+}
+
+
+def _fit_case(make) -> Setup:
+    def setup(df):
+        return lambda: make().fit(df)
+    return setup
+
+
+def _detect_case(make) -> Setup:
+    def setup(df):
+        detector = make().fit(df)
+        return lambda: detector.detect(df)
+    return setup
+
+
+def _sweep_case(make) -> Setup:
+    def setup(df):
+        detector = make().fit(df)
+        thresholds = [0.5 + 0.05 * i for i in range(100)]
+        return lambda: detector.sweep(df, thresholds)
+    return setup
+
+
+def _cached_fit_case(make, fingerprint: str) -> Setup:
+    def setup(df):
+        directory = tempfile.mkdtemp(prefix = "outlipy-bench-")
+
+        def run():
+            # Only the timed fits use the cache, which the setup fit warmed.
+            outlipy.set_cache(directory, fingerprint = fingerprint)
+
+            try:
+                return make().fit(df)
+            finally:
+                outlipy.set_cache(None)
+
+        run()
+        return run
+    return setup
+
+
+def _update_case(make) -> Setup:
+    def setup(df):
+        detector = make().fit(df)
+        appended = df.iloc[-max(1, len(df) // 100):]
+        return lambda: detector.update(appended)
+    return setup
+
+
+def _drift_case(make) -> Setup:
+    def setup(df):
+        detector = make().fit(df)
+        monitor = DriftMonitor().record(detector, df)
+        return lambda: monitor.record(detector, df)
+    return setup
+
+
+# ---------------------------------------------------------------
+#                           Handlers
+# ---------------------------------------------------------------
+
+HANDLERS = {
+    "mean": lambda cols: MeanHandler(columns = cols),
+    "median": lambda cols: MedianHandler(columns = cols),
+    "constant": lambda cols: ConstantHandler(fill_value = 0.0, columns = cols),
+    "remove": lambda cols: RemoveHandler(columns = cols),
+    "interpolate": lambda cols: InterpolateHandler(columns = cols),
+    "winsorization": lambda cols: WinsorizationHandler(columns = cols),
+    "grouped": lambda cols: GroupedHandler(group_by = [GROUP_COLUMN], columns = cols),
+}
+
+
+def _handler_case(make) -> Setup:
+    def setup(df):
+        handler = make(_features(df))
+        mask = _mask(df)
+        return lambda: handler.apply(df, outlier_mask = mask)
+    return setup
+
+
+# ---------------------------------------------------------------
+#                           Plans
+# ---------------------------------------------------------------
+
+def _workflow(df: pd.DataFrame):
+    """
+    Three detectors, any-combined, then median and winsorization on two halves of the columns.
+    """
+    cols = _features(df)
+    half = max(1, len(cols) // 2)
+    detectors = [
+        IQRDetector(exclude = [GROUP_COLUMN]),
+        PercentileDetector(threshold = (0.01, 0.99), exclude = [GROUP_COLUMN]),
+        MADDetector(exclude = [GROUP_COLUMN])
+    ]
+    handlers = [MedianHandler(columns = cols[:half])]
+
+    if cols[half:]:
+        handlers.append(WinsorizationHandler(limits = (0.01, 0.99), columns = cols[half:]))
+
+    return detectors, handlers
+
+
+def _chained_case(df):
+    def run():
+        detectors, handlers = _workflow(df)
+        mask = None
+
+        for detector in detectors:
+            mask = detector.detect(df) if mask is None else mask | detector.detect(df)
+
+        out = df
+
+        for handler in handlers:
+            out = handler.apply(out, outlier_mask = mask)
+
+        return out
+    return run
+
+
+def _plan_case(df):
+    return lambda: Plan(*_workflow(df)).run(df)
+
+
+def _replace_chained_case(df):
+    def run():
+        mask = IQRDetector(exclude = [GROUP_COLUMN]).detect(df)
+        return ConstantHandler(fill_value = 0.0, columns = _features(df)).apply(df, outlier_mask = mask)
+    return run
+
+
+def _replace_fused_case(df):
+    # Bound check, mask and replacement of every column in one kernel.
+    return lambda: Plan([IQRDetector(exclude = [GROUP_COLUMN])], [ConstantHandler(fill_value = 0.0, columns = _features(df))]).run(df)
+
+
+# ---------------------------------------------------------------
+#                           Accessors
+# ---------------------------------------------------------------
+
+def _accessor_detect_case(method: str) -> Setup:
+    def setup(df):
+        return lambda: getattr(df.outli, method)(exclude = [GROUP_COLUMN])
+    return setup
+
+
+def _accessor_handle_case(method: str, **kwargs) -> Setup:
+    def setup(df):
+        mask = _mask(df)
+        cols = _features(df)
+        return lambda: getattr(df.outli, method)(outlier_mask = mask, columns = cols, **kwargs)
+    return setup
+
+
+def _series_case(method: str, **kwargs) -> Setup:
+    def setup(df):
+        series = df[_features(df)[0]]
+        return lambda: getattr(series.outli, method)(**kwargs)
+    return setup
+
+
+CASES: Dict[str, Setup] = {}
+
+for _name, _make in DETECTORS.items():
+    CASES[f"detector.{_name}.fit"] = _fit_case(_make)
+    CASES[f"detector.{_name}.detect"] = _detect_case(_make)
+
+# One scoring pass for a 100-threshold grid, vs. 100 detect calls.
+for _name in ("iqr", "zscore", "mad", "iqr_frequencies"):
+    CASES[f"detector.{_name}.sweep"] = _sweep_case(DETECTORS[_name])
+
+# Refit on 1% appended rows, vs. a full fit of the incremental detector.
+# Refits of unchanged data restored from the disk cache.
+for _name in ("iqr", "mad"):
+    CASES[f"detector.{_name}.fit_cached"] = _cached_fit_case(DETECTORS[_name], "full")
+    CASES[f"detector.{_name}.fit_cached_sampled"] = _cached_fit_case(DETECTORS[_name], "sampled")
+
+for _name in ("iqr_incremental", "zscore_incremental", "mad_incremental"):
+    CASES[f"detector.{_name}.update"] = _update_case(DETECTORS[_name])
+
+CASES["drift.iqr.record"] = _drift_case(DETECTORS["iqr"])
+
+for _name, _make in HANDLERS.items():
+    CASES[f"handler.{_name}.apply"] = _handler_case(_make)
+
+# The same workflow chained step by step and as one fused plan.
+CASES["plan.chained.run"] = _chained_case
+CASES["plan.fused.run"] = _plan_case
+CASES["plan.replace_chained.run"] = _replace_chained_case
+CASES["plan.replace_fused.run"] = _replace_fused_case
+
+for _method in ("iqr", "zscore", "mad", "percentile"):
+    CASES[f"accessor.df.{_method}"] = _accessor_detect_case(_method)
+    CASES[f"accessor.series.{_method}"] = _series_case(_method)
+
+CASES["accessor.series.rolling_zscore"] = _series_case("rolling_zscore", window = 100)
+CASES["accessor.df.median"] = _accessor_handle_case("median")
+CASES["accessor.df.group"] = _accessor_handle_case("group", group_by = [GROUP_COLUMN])
@@ -0,0 +1,67 @@
+"""
+Benchmark inputs: the bundled datasets and synthetic frames.
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+from typing import Dict, Optional
+
+DATASET_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "dataset")
+
+GROUP_COLUMN = "group"
+
+
+def load_bundled() -> Dict[str, pd.DataFrame]:
+    """
+    Load the bundled CSV datasets, numeric columns only, without missing values.
+
+    A small integer ``group`` column is added so the grouped handler can run.
+    """
+    frames = {}
+
+    for name, filename in (("salary", "Salary_Data.csv"), ("breast_cancer", "breast-cancer.csv")):
+        path = os.path.join(DATASET_DIR, filename)
+
+        if not os.path.exists(path):
+            continue
+
+        df = pd.read_csv(path).select_dtypes(include = [np.number]).dropna()
+        df = df.drop(columns = [c for c in df.columns if c == "id"]).reset_index(drop = True)
+        df[GROUP_COLUMN] = np.arange(len(df)) % 8
+
+        frames[name] = df
+
+    return frames
+
+
+def make_synthetic(
+        rows: int,
+        cols: int,
+        outlier_rate: float = 0.01,
+        seed: Optional[int] = 0
+) -> pd.DataFrame:
+    """
+    Build a float frame of standard normal values with injected outliers.
+
+    :param rows: Number of rows.
+    :param cols: Number of numeric columns.
+    :param outlier_rate: Fraction of cells replaced by values 8 to 20 standard deviations away.
+    :param seed: Seed of the random generator.
+    """
+    rng = np.random.default_rng(seed)
+
+    data = rng.standard_normal((rows, cols))
+
+    if outlier_rate > 0:
+        n_outliers = int(rows * cols * outlier_rate)
+        flat = data.reshape(-1)
+        positions = rng.integers(0, flat.size, size = n_outliers)
+        flat[positions] = rng.choice([-1.0, 1.0], size = len(positions)) * rng.uniform(8, 20, size = len(positions))
+
+    df = pd.DataFrame(data, columns = [f"x{i}" for i in range(cols)])
+    df[GROUP_COLUMN] = np.arange(rows) % 8
+
+    return df
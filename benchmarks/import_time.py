@@ -0,0 +1,102 @@
+"""
+Import-time benchmark for ``import outlipy``.
+
+Runs ``python -X importtime -c "import outlipy"`` in fresh interpreters and
+sums the self time of OutliPy's own modules, leaving out pandas and NumPy
+which every user pays for anyway. Fails when the median exceeds the budget, or
+when a module that should load lazily (detectors, handlers, exceptions) is
+imported eagerly.
+
+Usage (from the repository root)::
+
+    python -m benchmarks.import_time
+    python -m benchmarks.import_time --budget-ms 20 --runs 15
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+from typing import Dict, List, Tuple
+
+SRC = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+
+# Modules that ``import outlipy`` must not load.
+LAZY_MODULES = (
+    "outlipy.detection.iqr",
+    "outlipy.detection.base",
+    "outlipy.handling.base",
+    "outlipy.exceptions.columns",
+    "outlipy.utils.validation",
+)
+
+
+def _import_once(statement: str) -> Tuple[Dict[str, int], int]:
+    """
+    Return the self time (us) of every imported module and the cumulative time of outlipy.
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = SRC + os.pathsep + env.get("PYTHONPATH", "")
+
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output = True, text = True, env = env, check = True
+    )
+
+    self_times = {}
+    cumulative = 0
+
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+
+        self_us, cumulative_us, module = line[len("import time:"):].split("|")
+        module = module.strip()
+        self_times[module] = int(self_us)
+
+        if module == "outlipy":
+            cumulative = int(cumulative_us)
+
+    return self_times, cumulative
+
+
+def main(argv = None) -> int:
+    parser = argparse.ArgumentParser(description = "Measure the cost of `import outlipy`.")
+    parser.add_argument("--runs", type = int, default = 9)
+    parser.add_argument("--budget-ms", type = float, default = 25.0, help = "Budget for the self time of outlipy.* modules.")
+    args = parser.parse_args(argv)
+
+    own: List[float] = []
+    total: List[float] = []
+    loaded = set()
+
+    for _ in range(args.runs):
+        self_times, cumulative = _import_once("import outlipy")
+
+        own.append(sum(us for module, us in self_times.items() if module.split(".")[0] == "outlipy") / 1e3)
+        total.append(cumulative / 1e3)
+        loaded.update(self_times)
+
+    own_ms = statistics.median(own)
+    total_ms = statistics.median(total)
+
+    print(f"outlipy modules (self): {own_ms:8.2f} ms   budget {args.budget_ms:.2f} ms")
+    print(f"import outlipy (total): {total_ms:8.2f} ms   including pandas / numpy")
+
+    eager = [module for module in LAZY_MODULES if module in loaded]
+
+    if eager:
+        print(f"eagerly imported, should be lazy: {', '.join(eager)}")
+        return 1
+
+    if own_ms > args.budget_ms:
+        print("import-time budget exceeded")
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,212 @@
+"""
+Run the OutliPy benchmark suite.
+
+Usage (from the repository root)::
+
+    python -m benchmarks.run                                # quick grid + bundled datasets
+    python -m benchmarks.run --rows 1e3 1e6 1e8 --cols 1 100
+    python -m benchmarks.run --cases "detector.iqr.*" --outlier-rate 0.05
+    python -m benchmarks.run --engine numpy                 # kernels without numba
+    python -m benchmarks.run --save-baseline                # refresh benchmarks/baseline.json
+
+Each case records the best and median wall time over ``--repeat`` runs, the
+throughput in rows and cells per second, and the peak memory traced by
+``tracemalloc`` during one extra run. Results are compared against the baseline
+JSON and the process exits with status 1 when a case is slower than the
+baseline by more than ``--tolerance``.
+"""
+
+import argparse
+import fnmatch
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from typing import Dict, List, Tuple
+
+from outlipy.core import kernels
+
+from .cases import CASES
+from .data import load_bundled, make_synthetic
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+
+def _inputs(args) -> List[Tuple[str, pd.DataFrame]]:
+    """
+    Yield ``(label, frame)`` for the bundled datasets and every synthetic size.
+    """
+    inputs = []
+
+    if not args.no_bundled:
+        inputs.extend(load_bundled().items())
+
+    for rows in args.rows:
+        for cols in args.cols:
+            if rows * cols > args.max_cells:
+                print(f"skipping rows={rows:g} cols={cols}: above --max-cells", file = sys.stderr)
+                continue
+
+            label = f"synthetic_r{rows:g}_c{cols}_o{args.outlier_rate:g}"
+            inputs.append((label, make_synthetic(int(rows), cols, args.outlier_rate, seed = args.seed)))
+
+    return inputs
+
+
+def _measure(run, repeat: int) -> Dict[str, float]:
+    """
+    Time ``run`` and trace its peak memory in a separate run.
+    """
+    run()  # warm-up
+
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "best_s": min(timings),
+        "median_s": statistics.median(timings),
+        "peak_bytes": peak,
+    }
+
+
+def run_suite(args) -> Dict[str, Dict[str, float]]:
+    results = {}
+
+    selected = [name for name in CASES if any(fnmatch.fnmatch(name, pattern) for pattern in args.cases)]
+
+    for label, df in _inputs(args):
+        n_rows, n_cols = df.shape
+
+        for name in selected:
+            key = f"{name}@{label}"
+
+            try:
+                run = CASES[name](df)
+                record = _measure(run, args.repeat)
+            except Exception as e:   # a failing case must not hide the others
+                print(f"{key:<70} FAILED: {type(e).__name__}: {str(e).splitlines()[0] if str(e) else ''}", file = sys.stderr)
+                continue
+
+            record["rows"] = n_rows
+            record["cols"] = n_cols
+            record["rows_per_s"] = n_rows / record["best_s"] if record["best_s"] else float("inf")
+            record["cells_per_s"] = n_rows * n_cols / record["best_s"] if record["best_s"] else float("inf")
+
+            results[key] = record
+
+            print(f"{key:<70} {record['best_s'] * 1e3:10.3f} ms {record['rows_per_s']:14.0f} rows/s {record['peak_bytes'] / 2**20:9.2f} MiB")
+
+    return results
+
+
+def compare(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]], tolerance: float, min_seconds: float) -> List[str]:
+    """
+    Return the keys that are slower than the baseline beyond the tolerance.
+
+    Differences below ``min_seconds`` are treated as timer noise.
+    """
+    regressions = []
+
+    for key, record in sorted(results.items()):
+        if key not in baseline:
+            continue
+
+        old = baseline[key]["best_s"]
+        new = record["best_s"]
+        ratio = new / old if old else float("inf")
+
+        flag = ""
+        if new > old * (1 + tolerance) and new - old > min_seconds:
+            regressions.append(key)
+            flag = "  REGRESSION"
+
+        old_peak = baseline[key].get("peak_bytes")
+        memory = f"{record['peak_bytes'] / old_peak:6.2f}x mem" if old_peak else ""
+
+        print(f"{key:<70} {ratio:6.2f}x time {memory}{flag}")
+
+    return regressions
+
+
+def _metadata() -> Dict[str, str]:
+    import outlipy
+
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "outlipy": getattr(outlipy, "__version__", "dev"),
+        "engine": kernels.get_engine(),
+    }
+
+
+def main(argv = None) -> int:
+    parser = argparse.ArgumentParser(description = "Benchmark OutliPy detectors, handlers and accessors.")
+    parser.add_argument("--rows", type = float, nargs = "+", default = [1e3, 1e5], help = "Synthetic row counts (1e3 - 1e8).")
+    parser.add_argument("--cols", type = int, nargs = "+", default = [1, 10], help = "Synthetic column counts (1 - 10k).")
+    parser.add_argument("--outlier-rate", type = float, default = 0.01, help = "Fraction of synthetic cells that are outliers.")
+    parser.add_argument("--seed", type = int, default = 0)
+    parser.add_argument("--max-cells", type = float, default = 2e8, help = "Skip synthetic frames larger than this many cells.")
+    parser.add_argument("--no-bundled", action = "store_true", help = "Skip the datasets shipped in dataset/.")
+    parser.add_argument("--cases", nargs = "+", default = ["*"], help = "Glob patterns of case names to run.")
+    parser.add_argument("--repeat", type = int, default = 5)
+    parser.add_argument("--baseline", default = DEFAULT_BASELINE, help = "Baseline JSON to compare against.")
+    parser.add_argument("--save-baseline", action = "store_true", help = "Write the results to --baseline instead of comparing.")
+    parser.add_argument("--output", help = "Also write the results to this JSON file.")
+    parser.add_argument("--tolerance", type = float, default = 0.25, help = "Allowed slowdown before a case is a regression.")
+    parser.add_argument("--min-seconds", type = float, default = 1e-3, help = "Ignore slowdowns smaller than this.")
+    parser.add_argument("--engine", choices = kernels.ENGINES, default = "auto", help = "Kernel engine (numba needs the optional dependency).")
+    args = parser.parse_args(argv)
+
+    kernels.set_engine(args.engine)
+
+    results = run_suite(args)
+    payload = {"meta": _metadata(), "results": results}
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(payload, f, indent = 2, sort_keys = True)
+
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(payload, f, indent = 2, sort_keys = True)
+        print(f"baseline written to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"no baseline at {args.baseline}; run with --save-baseline to create one")
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)["results"]
+
+    print("\ncomparison against baseline")
+    regressions = compare(results, baseline, args.tolerance, args.min_seconds)
+
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) beyond {args.tolerance:.0%}")
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
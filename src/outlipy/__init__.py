@@ -1,21 +1,87 @@
-from .accessors import OutlierAccessor
-from .detection import IQRDetector, ZScoreDetector, MADDetector, PercentileDetector
-from .handling import (WinsorizationHandler, MeanHandler, MedianHandler, 
-                       RemoveHandler, ConstantHandler, InterpolateHandler,
-                       GroupedHandler)
+from typing import TYPE_CHECKING
+
+# Importing the accessors registers df.outli and series.outli. They only load
+# the detector and handler modules when a method is first called.
+from .accessors import OutlierAccessor, SeriesOutlierAccessor
+from .core.lazy import lazy_attributes
+
+# Everything else is imported on first access, see outlipy.core.lazy.
+__getattr__, __dir__ = lazy_attributes(__name__, {
+    "IQRDetector": ".detection",
+    "ZScoreDetector": ".detection",
+    "MADDetector": ".detection",
+    "PercentileDetector": ".detection",
+    "MahalanobisDetector": ".detection",
+    "IsolationForestDetector": ".detection",
+    "HBOSDetector": ".detection",
+    "ECODDetector": ".detection",
+    "KNNDetector": ".detection",
+    "LOFDetector": ".detection",
+    "WinsorizationHandler": ".handling",
+    "MeanHandler": ".handling",
+    "MedianHandler": ".handling",
+    "RemoveHandler": ".handling",
+    "ConstantHandler": ".handling",
+    "InterpolateHandler": ".handling",
+    "GroupedHandler": ".handling",
+    "profile": ".core.instrumentation",
+    "add_hook": ".core.instrumentation",
+    "remove_hook": ".core.instrumentation",
+    "log_hook": ".core.instrumentation",
+    "set_engine": ".core.kernels",
+    "get_engine": ".core.kernels",
+    "set_cache": ".core.cache",
+    "get_cache": ".core.cache",
+    "ValidationReport": ".utils",
+    "SweepResult": ".detection",
+    "DriftMonitor": ".detection",
+    "Plan": ".plan",
+})
+
+if TYPE_CHECKING:
+    from .detection import (IQRDetector, ZScoreDetector, MADDetector, PercentileDetector, MahalanobisDetector,
+                            IsolationForestDetector, HBOSDetector, ECODDetector, KNNDetector, LOFDetector,
+                            SweepResult, DriftMonitor)
+    from .handling import (WinsorizationHandler, MeanHandler, MedianHandler,
+                           RemoveHandler, ConstantHandler, InterpolateHandler,
+                           GroupedHandler)
+    from .core.instrumentation import profile, add_hook, remove_hook, log_hook
+    from .core.kernels import set_engine, get_engine
+    from .core.cache import set_cache, get_cache
+    from .utils import ValidationReport
+    from .plan import Plan
 
 
 __all__ = [
     "OutlierAccessor",
+    "SeriesOutlierAccessor",
     "IQRDetector",
     "ZScoreDetector",
     "MADDetector",
     "PercentileDetector",
+    "MahalanobisDetector",
+    "IsolationForestDetector",
+    "HBOSDetector",
+    "ECODDetector",
+    "KNNDetector",
+    "LOFDetector",
+    "SweepResult",
+    "DriftMonitor",
     "WinsorizationHandler",
     "MeanHandler",
     "MedianHandler",
     "RemoveHandler",
     "ConstantHandler",
     "InterpolateHandler",
-    "GroupedHandler"
-]
\ No newline at end of file
+    "GroupedHandler",
+    "Plan",
+    "profile",
+    "add_hook",
+    "remove_hook",
+    "log_hook",
+    "set_engine",
+    "get_engine",
+    "set_cache",
+    "get_cache",
+    "ValidationReport"
+]
@@ -1,5 +1,7 @@
 from .dataframe import OutlierAccessor
+from .series import SeriesOutlierAccessor
 
 __all__ = [
-    "OutlierAccessor"
+    "OutlierAccessor",
+    "SeriesOutlierAccessor"
 ]
\ No newline at end of file
@@ -3,10 +3,8 @@ from pandas.api.extensions import register_dataframe_accessor
 
 from typing import Optional, List, Union, Tuple
 
-from ..detection import IQRDetector, ZScoreDetector, MADDetector, PercentileDetector
-from ..handling import (MeanHandler, MedianHandler, WinsorizationHandler, 
-                        RemoveHandler, ConstantHandler, InterpolateHandler,
-                        GroupedHandler)
+# The detector and handler modules are resolved on first use (lazy packages).
+from .. import detection, handling, utils, exceptions
 
 @register_dataframe_accessor("outli")
 class OutlierAccessor:
@@ -22,7 +20,11 @@ class OutlierAccessor:
             *, 
             threshold: float = 1.5, 
             columns: Optional[List[str]] = None,
-            exclude: Optional[List[str]] = None
+            exclude: Optional[List[str]] = None,
+            dtype: str = "float64",
+            nan_policy: str = "raise",
+            sample: Optional[Union[int, float]] = None,
+            random_state: Optional[int] = None
     ) -> pd.DataFrame:
         """
         Detect outliers using the IQR method.
@@ -31,11 +33,16 @@ class OutlierAccessor:
         :type threshold: float
         :type threshold: float
         :param columns: Columns to evaluate. If None, detector should auto-detect numeric columns.
+        :param dtype: Compute precision of the scores, "float64" (default) or "float32".
+        :param nan_policy: "raise" (default) rejects NaN; "omit" ignores NaN and never flags it.
+        :param sample: Fit on a random sample: a number of rows or a fraction of them. None uses every row.
+        :param random_state: Seed of the sample.
         :return: DataFrame of booleans: True = outlier, False = normal.
         :rtype: DataFrame
         """
 
-        method = IQRDetector(threshold = threshold, columns = columns, exclude = exclude)
+        method = detection.IQRDetector(threshold = threshold, columns = columns, exclude = exclude, dtype = dtype, nan_policy = nan_policy,
+                                       sample = sample, random_state = random_state)
         mask = method.detect(df = self._df)
         return mask
 
@@ -44,7 +51,11 @@ class OutlierAccessor:
             *, 
             threshold: float = 3.0, 
             columns: Optional[List[str]] = None,
-            exclude: Optional[List[str]] = None
+            exclude: Optional[List[str]] = None,
+            dtype: str = "float64",
+            nan_policy: str = "raise",
+            sample: Optional[Union[int, float]] = None,
+            random_state: Optional[int] = None
     ) -> pd.DataFrame:
         """
         Detect outliers using the Zscore method.
@@ -52,11 +63,16 @@ class OutlierAccessor:
         :param threshold: The value used to determine outlier boundaries.
         :type threshold: float
         :param columns: Columns to evaluate. If None, detector should auto-detect numeric columns.
+        :param dtype: Compute precision of the scores, "float64" (default) or "float32".
+        :param nan_policy: "raise" (default) rejects NaN; "omit" ignores NaN and never flags it.
+        :param sample: Fit on a random sample: a number of rows or a fraction of them. None uses every row.
+        :param random_state: Seed of the sample.
         :return: DataFrame of booleans: True = outlier, False = normal.
         :rtype: DataFrame
         """
 
-        method = ZScoreDetector(threshold = threshold, columns = columns, exclude = exclude)
+        method = detection.ZScoreDetector(threshold = threshold, columns = columns, exclude = exclude, dtype = dtype, nan_policy = nan_policy,
+                                          sample = sample, random_state = random_state)
         mask = method.detect(df = self._df)
         return mask
     
@@ -65,13 +81,18 @@ class OutlierAccessor:
             *,
             threshold: float = 3.5,
             columns: Optional[List[str]] = None,
-            exclude: Optional[List[str]] = None
+            exclude: Optional[List[str]] = None,
+            dtype: str = "float64",
+            nan_policy: str = "raise",
+            sample: Optional[Union[int, float]] = None,
+            random_state: Optional[int] = None
     ) -> pd.DataFrame:
         """
         
         """
 
-        method = MADDetector(threshold = threshold, columns = columns, exclude = exclude)
+        method = detection.MADDetector(threshold = threshold, columns = columns, exclude = exclude, dtype = dtype, nan_policy = nan_policy,
+                                       sample = sample, random_state = random_state)
         mask = method.detect(df = self._df)
         return mask
 
@@ -80,13 +101,245 @@ class OutlierAccessor:
             *,
             threshold: Union[Tuple[float, float], float] = (0.05, 0.95),
             columns: Optional[List[str]] = None,
-            exclude: Optional[List[str]] = None
+            exclude: Optional[List[str]] = None,
+            dtype: str = "float64",
+            nan_policy: str = "raise",
+            sample: Optional[Union[int, float]] = None,
+            random_state: Optional[int] = None
     ) -> pd.DataFrame:
         
-        method = PercentileDetector(threshold = threshold, columns = columns, exclude = exclude)
+        method = detection.PercentileDetector(threshold = threshold, columns = columns, exclude = exclude, dtype = dtype, nan_policy = nan_policy,
+                                              sample = sample, random_state = random_state)
         mask = method.detect(df = self._df)
         return mask
     
+    def mahalanobis(
+            self,
+            *,
+            threshold: float = 0.975,
+            columns: Optional[List[str]] = None,
+            exclude: Optional[List[str]] = None,
+            robust: bool = False,
+            random_state: Optional[int] = None,
+            dtype: str = "float64",
+            nan_policy: str = "raise"
+    ) -> pd.DataFrame:
+        """
+        Detect rows that are outlying in the combination of their features (Mahalanobis distance).
+
+        :param threshold: Chi-square quantile used as cutoff for the squared distance.
+        :type threshold: float
+        :param robust: Use the robust Minimum Covariance Determinant estimate instead of the sample covariance.
+        :type robust: bool
+        :return: DataFrame of booleans, the row flag repeated in every evaluated column.
+        :rtype: DataFrame
+        """
+
+        method = detection.MahalanobisDetector(
+            threshold = threshold, columns = columns, exclude = exclude, robust = robust,
+            random_state = random_state, dtype = dtype, nan_policy = nan_policy
+        )
+        mask = method.detect(df = self._df)
+        return mask
+
+    def isolation_forest(
+            self,
+            *,
+            threshold: float = 0.6,
+            columns: Optional[List[str]] = None,
+            exclude: Optional[List[str]] = None,
+            n_estimators: int = 100,
+            max_samples: int = 256,
+            random_state: Optional[int] = None,
+            n_jobs: int = 1,
+            dtype: str = "float64",
+            nan_policy: str = "raise"
+    ) -> pd.DataFrame:
+        """
+        Detect outlying rows with an Isolation Forest.
+
+        :param threshold: Anomaly score in (0, 1) above which a row is an outlier.
+        :type threshold: float
+        :param n_jobs: Worker processes used to grow the trees (-1 = all CPUs).
+        :type n_jobs: int
+        :return: DataFrame of booleans, the row flag repeated in every evaluated column.
+        :rtype: DataFrame
+        """
+
+        method = detection.IsolationForestDetector(
+            threshold = threshold, columns = columns, exclude = exclude, n_estimators = n_estimators,
+            max_samples = max_samples, random_state = random_state, n_jobs = n_jobs,
+            dtype = dtype, nan_policy = nan_policy
+        )
+        mask = method.detect(df = self._df)
+        return mask
+
+    def hbos(
+            self,
+            *,
+            threshold: float = 0.99,
+            columns: Optional[List[str]] = None,
+            exclude: Optional[List[str]] = None,
+            n_bins: int = 10,
+            binning: str = "static",
+            dtype: str = "float64",
+            nan_policy: str = "raise"
+    ) -> pd.DataFrame:
+        """
+        Detect outlying rows with the Histogram-based Outlier Score.
+
+        :param threshold: Quantile of the score distribution used as cutoff.
+        :type threshold: float
+        :param binning: "static" (equal width) or "dynamic" (equal frequency) bins.
+        :type binning: str
+        :return: DataFrame of booleans, the row flag repeated in every evaluated column.
+        :rtype: DataFrame
+        """
+
+        method = detection.HBOSDetector(
+            threshold = threshold, columns = columns, exclude = exclude, n_bins = n_bins,
+            binning = binning, dtype = dtype, nan_policy = nan_policy
+        )
+        mask = method.detect(df = self._df)
+        return mask
+
+    def ecod(
+            self,
+            *,
+            threshold: float = 0.99,
+            columns: Optional[List[str]] = None,
+            exclude: Optional[List[str]] = None,
+            dtype: str = "float64",
+            nan_policy: str = "raise"
+    ) -> pd.DataFrame:
+        """
+        Detect outlying rows with ECOD (empirical tail probabilities).
+
+        :param threshold: Quantile of the fitted scores used as cutoff.
+        :type threshold: float
+        :return: DataFrame of booleans, the row flag repeated in every evaluated column.
+        :rtype: DataFrame
+        """
+
+        method = detection.ECODDetector(
+            threshold = threshold, columns = columns, exclude = exclude, dtype = dtype, nan_policy = nan_policy
+        )
+        mask = method.detect(df = self._df)
+        return mask
+
+    def knn(
+            self,
+            *,
+            threshold: float = 0.99,
+            columns: Optional[List[str]] = None,
+            exclude: Optional[List[str]] = None,
+            n_neighbors: int = 5,
+            method: str = "largest",
+            algorithm: str = "auto",
+            n_jobs: int = 1,
+            max_samples: Optional[int] = None,
+            random_state: Optional[int] = None,
+            dtype: str = "float64",
+            nan_policy: str = "raise"
+    ) -> pd.DataFrame:
+        """
+        Detect outlying rows by their distance to the nearest other rows.
+
+        :param threshold: Quantile of the fitted scores used as cutoff.
+        :type threshold: float
+        :param max_samples: Index a random sample of this many rows (approximate mode).
+        :type max_samples: Optional[int]
+        :return: DataFrame of booleans, the row flag repeated in every evaluated column.
+        :rtype: DataFrame
+        """
+
+        detector = detection.KNNDetector(
+            threshold = threshold, columns = columns, exclude = exclude, n_neighbors = n_neighbors,
+            method = method, algorithm = algorithm, n_jobs = n_jobs, max_samples = max_samples,
+            random_state = random_state, dtype = dtype, nan_policy = nan_policy
+        )
+        mask = detector.detect(df = self._df)
+        return mask
+
+    def lof(
+            self,
+            *,
+            threshold: float = 0.99,
+            columns: Optional[List[str]] = None,
+            exclude: Optional[List[str]] = None,
+            n_neighbors: int = 20,
+            algorithm: str = "auto",
+            n_jobs: int = 1,
+            max_samples: Optional[int] = None,
+            random_state: Optional[int] = None,
+            dtype: str = "float64",
+            nan_policy: str = "raise"
+    ) -> pd.DataFrame:
+        """
+        Detect outlying rows with the Local Outlier Factor.
+
+        :param threshold: Quantile of the fitted scores used as cutoff.
+        :type threshold: float
+        :param max_samples: Index a random sample of this many rows (approximate mode).
+        :type max_samples: Optional[int]
+        :return: DataFrame of booleans, the row flag repeated in every evaluated column.
+        :rtype: DataFrame
+        """
+
+        method = detection.LOFDetector(
+            threshold = threshold, columns = columns, exclude = exclude, n_neighbors = n_neighbors,
+            algorithm = algorithm, n_jobs = n_jobs, max_samples = max_samples,
+            random_state = random_state, dtype = dtype, nan_policy = nan_policy
+        )
+        mask = method.detect(df = self._df)
+        return mask
+
+    def sweep(
+            self,
+            method: str = "zscore",
+            *,
+            thresholds: List[float],
+            columns: Optional[List[str]] = None,
+            exclude: Optional[List[str]] = None,
+            masks: Optional[List[float]] = None,
+            dtype: str = "float64",
+            nan_policy: str = "raise",
+            sample: Optional[Union[int, float]] = None,
+            random_state: Optional[int] = None
+    ) -> "detection.SweepResult":
+        """
+        Count the outliers of a detection method for many thresholds in one pass.
+
+        :param method: "zscore", "mad" or "iqr".
+        :type method: str
+        :param thresholds: The thresholds to evaluate.
+        :type thresholds: List[float]
+        :param masks: Thresholds whose full mask should also be returned.
+        :type masks: Optional[List[float]]
+        :return: Counts and rates per threshold and column, plus the requested masks.
+        :rtype: SweepResult
+        """
+
+        detectors = {
+            "zscore": detection.ZScoreDetector,
+            "mad": detection.MADDetector,
+            "iqr": detection.IQRDetector
+        }
+
+        if method not in detectors:
+            raise exceptions.ConfigurationException(
+                error_code = "CON003",
+                method = "OutlierAccessor.sweep",
+                typed_method = method,
+                suggestion = "Use 'zscore', 'mad' or 'iqr'."
+            )
+
+        detector = detectors[method](
+            columns = columns, exclude = exclude, dtype = dtype, nan_policy = nan_policy,
+            sample = sample, random_state = random_state
+        )
+        return detector.sweep(self._df, thresholds, masks = masks)
+
     # ------------------------------------------------------
     #                   Handling
     # ------------------------------------------------------
@@ -95,10 +348,11 @@ class OutlierAccessor:
             self,
             *,
             outlier_mask: pd.DataFrame,
-            columns: Optional[List[str]] = None
+            columns: Optional[List[str]] = None,
+            dtype: str = "float64"
     ) -> pd.DataFrame:
         
-        handler = MeanHandler(columns = columns)
+        handler = handling.MeanHandler(columns = columns, dtype = dtype)
         cleaned = handler.apply(self._df, outlier_mask = outlier_mask)
         return cleaned
     
@@ -106,10 +360,11 @@ class OutlierAccessor:
             self,
             *,
             outlier_mask: pd.DataFrame,
-            columns: Optional[List[str]] = None
+            columns: Optional[List[str]] = None,
+            dtype: str = "float64"
     ) -> pd.DataFrame:
         
-        handler = MedianHandler(columns = columns)
+        handler = handling.MedianHandler(columns = columns, dtype = dtype)
         cleaned = handler.apply(self._df, outlier_mask = outlier_mask)
         return cleaned
     
@@ -117,10 +372,11 @@ class OutlierAccessor:
             self,
             *,
             limits: Tuple[float, float] = (0.05, 0.95),
-            columns: Optional[List[str]] = None
+            columns: Optional[List[str]] = None,
+            dtype: str = "float64"
     ) -> pd.DataFrame:
         
-        handler = WinsorizationHandler(limits = limits, columns = columns)
+        handler = handling.WinsorizationHandler(limits = limits, columns = columns, dtype = dtype)
         cleaned = handler.apply(self._df)
         return cleaned
     
@@ -131,7 +387,7 @@ class OutlierAccessor:
             columns: Optional[List[str]] = None
     ) -> pd.DataFrame:
         
-        handler = RemoveHandler(columns = columns)
+        handler = handling.RemoveHandler(columns = columns)
         cleaned = handler.apply(df = self._df, outlier_mask = outlier_mask)
         return cleaned
     
@@ -140,10 +396,11 @@ class OutlierAccessor:
             *,
             fill_value: float,
             outlier_mask: pd.DataFrame,
-            columns: Optional[List[str]] = None
+            columns: Optional[List[str]] = None,
+            dtype: str = "float64"
     ) -> pd.DataFrame:
         
-        handler = ConstantHandler(fill_value = fill_value, columns = columns)
+        handler = handling.ConstantHandler(fill_value = fill_value, columns = columns, dtype = dtype)
         cleaned = handler.apply(df = self._df, outlier_mask = outlier_mask)
         return cleaned
     
@@ -152,10 +409,11 @@ class OutlierAccessor:
             *,
             method: str = 'linear',
             outlier_mask: pd.DataFrame,
-            columns: Optional[List[str]] = None
+            columns: Optional[List[str]] = None,
+            dtype: str = "float64"
     ) -> pd.DataFrame:
         
-        handler = InterpolateHandler(method = method, columns = columns)
+        handler = handling.InterpolateHandler(method = method, columns = columns, dtype = dtype)
         cleaned = handler.apply(df = self._df, outlier_mask = outlier_mask)
         return cleaned
     
@@ -165,9 +423,19 @@ class OutlierAccessor:
             group_by: List[str],
             agg_func: str = "median",
             outlier_mask: pd.DataFrame,
-            columns: Optional[List[str]] = None
+            columns: Optional[List[str]] = None,
+            dtype: str = "float64"
     ) -> pd.DataFrame:
         
-        handler = GroupedHandler(group_by = group_by, agg_func = agg_func, columns = columns)
+        handler = handling.GroupedHandler(group_by = group_by, agg_func = agg_func, columns = columns, dtype = dtype)
         cleaned = handler.apply(df = self._df, outlier_mask = outlier_mask)
-        return cleaned
\ No newline at end of file
+        return cleaned
+
+    def validate(
+            self,
+            *,
+            columns: Optional[List[str]] = None,
+            exclude: Optional[List[str]] = None
+    ) -> "utils.ValidationReport":
+
+        return utils.build_validation_report(self._df, columns = columns, exclude = exclude)
@@ -0,0 +1,311 @@
+import pandas as pd
+import numpy as np
+from pandas.api.extensions import register_series_accessor
+
+from typing import Union, Tuple, TYPE_CHECKING
+
+# The detector, handler and validation modules are resolved on first use (lazy packages).
+from .. import detection, handling, exceptions, utils
+from ..core.instrumentation import stage
+
+if TYPE_CHECKING:
+    from ..detection.base import UnivariateDetectorBase
+
+@register_series_accessor("outli")
+class SeriesOutlierAccessor:
+    """
+    Single-column fast path of the ``outli`` accessor.
+
+    Detection and handling run directly on the underlying 1-D array with the
+    per-column kernels of the detectors and handlers, skipping DataFrame
+    validation and mask construction. Intended for tight loops over many Series.
+    """
+    def __init__(self, pandas_obj):
+        self._series = pandas_obj
+
+    # ------------------------------------
+    #               Helpers
+    # ------------------------------------
+
+    def _detect(self, detector: "UnivariateDetectorBase") -> pd.Series:
+        """
+        Fit the detector on this Series and return the boolean outlier Series.
+        """
+        series = self._series
+
+        with stage(detector, "series", series):
+            values = utils.validate_series_input(series, detector.__class__.__name__, allow_nan = detector.nan_policy == "omit")
+
+            scores = detector._fit_values(values, series.name)
+
+            if isinstance(values, np.ndarray):
+                mask = detector._detect_column(values, scores)
+            else:
+                mask = np.concatenate([detector._detect_column(chunk, scores) for chunk in detector._iter_chunks(values)])
+
+        return pd.Series(mask, index = series.index, name = series.name, copy = False)
+
+    def _handler_values(self, method: str, outlier_mask: Union[pd.Series, np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Validate the Series and the mask and return both as NumPy arrays.
+        """
+        series = self._series
+        values = utils.validate_series_input(series, method)
+
+        if not isinstance(values, np.ndarray):
+            values = series.to_numpy(dtype = np.float64)
+
+        if isinstance(outlier_mask, pd.Series):
+            if not series.index.equals(outlier_mask.index):
+                raise exceptions.HandlingException(
+                    error_code = "HEX001",
+                    method = method,
+                    suggestion = "Index mismatch: Series and outlier_mask must have the same index."
+                )
+            outlier_mask = outlier_mask.to_numpy()
+
+        outliers = np.asarray(outlier_mask, dtype = bool)
+
+        if outliers.shape != values.shape:
+            raise exceptions.HandlingException(
+                error_code = "HEX001",
+                method = method,
+                suggestion = "Shape mismatch: outlier_mask must have one entry per value of the Series."
+            )
+
+        return values, outliers
+
+    def _replace(self, values: np.ndarray, outliers: np.ndarray, replacement_val: float, dtype: np.dtype) -> pd.Series:
+        """
+        Return a new Series with the outliers replaced by ``replacement_val``.
+        Integer values are upcast to ``dtype`` when the replacement is a float.
+        """
+        if values.dtype.kind in "iu" and isinstance(replacement_val, (float, np.floating)):
+            cleaned = values.astype(dtype)
+        else:
+            cleaned = values.copy()
+
+        cleaned[outliers] = replacement_val
+
+        return pd.Series(cleaned, index = self._series.index, name = self._series.name, copy = False)
+
+    # ------------------------------------
+    #              Detection
+    # ------------------------------------
+
+    def iqr(self, *, threshold: float = 1.5, dtype: str = "float64", nan_policy: str = "raise") -> pd.Series:
+        """
+        Detect outliers using the IQR method.
+
+        :param threshold: Multiplier of the IQR used to define the bounds.
+        :type threshold: float
+        :param dtype: Compute precision of the scores, "float64" (default) or "float32".
+        :type dtype: str
+        :param nan_policy: "raise" (default) rejects NaN; "omit" ignores NaN and never flags it.
+        :type nan_policy: str
+        :return: Series of booleans: True = outlier, False = normal.
+        :rtype: Series
+        """
+
+        return self._detect(detection.IQRDetector(threshold = threshold, dtype = dtype, nan_policy = nan_policy))
+
+    def zscore(self, *, threshold: float = 3.0, dtype: str = "float64", nan_policy: str = "raise") -> pd.Series:
+        """
+        Detect outliers using the Zscore method.
+
+        :param threshold: Absolute Z-score above which a value is an outlier.
+        :type threshold: float
+        :param dtype: Compute precision of the scores, "float64" (default) or "float32".
+        :type dtype: str
+        :param nan_policy: "raise" (default) rejects NaN; "omit" ignores NaN and never flags it.
+        :type nan_policy: str
+        :return: Series of booleans: True = outlier, False = normal.
+        :rtype: Series
+        """
+
+        return self._detect(detection.ZScoreDetector(threshold = threshold, dtype = dtype, nan_policy = nan_policy))
+
+    def mad(self, *, threshold: float = 3.5, dtype: str = "float64", nan_policy: str = "raise") -> pd.Series:
+        """
+        Detect outliers using the Modified Z-score (MAD) method.
+
+        :param threshold: Absolute Modified Z-score above which a value is an outlier.
+        :type threshold: float
+        :param dtype: Compute precision of the scores, "float64" (default) or "float32".
+        :type dtype: str
+        :param nan_policy: "raise" (default) rejects NaN; "omit" ignores NaN and never flags it.
+        :type nan_policy: str
+        :return: Series of booleans: True = outlier, False = normal.
+        :rtype: Series
+        """
+
+        return self._detect(detection.MADDetector(threshold = threshold, dtype = dtype, nan_policy = nan_policy))
+
+    def percentile(self, *, threshold: Tuple[float, float] = (0.05, 0.95), dtype: str = "float64", nan_policy: str = "raise") -> pd.Series:
+        """
+        Detect outliers outside the given percentile range.
+
+        :param threshold: Lower and upper percentiles, e.g. (0.05, 0.95).
+        :type threshold: Tuple[float, float]
+        :param dtype: Compute precision of the scores, "float64" (default) or "float32".
+        :type dtype: str
+        :param nan_policy: "raise" (default) rejects NaN; "omit" ignores NaN and never flags it.
+        :type nan_policy: str
+        :return: Series of booleans: True = outlier, False = normal.
+        :rtype: Series
+        """
+
+        return self._detect(detection.PercentileDetector(threshold = threshold, dtype = dtype, nan_policy = nan_policy))
+
+    def rolling_zscore(self, *, window: int, threshold: float = 3.0, nan_policy: str = "raise") -> pd.Series:
+        """
+        Detect outliers against the mean and standard deviation of the ``window`` values before each value.
+
+        Suited to series whose level or spread drifts, where one mean and
+        standard deviation do not fit the whole series. The first ``window``
+        values, and the values whose window holds a NaN, are never flagged.
+
+        :param window: Number of preceding values the statistics are computed on, at least 2.
+        :type window: int
+        :param threshold: Absolute rolling Z-score above which a value is an outlier.
+        :type threshold: float
+        :param nan_policy: "raise" (default) rejects NaN; "omit" accepts NaN and never flags it.
+        :type nan_policy: str
+        :return: Series of booleans: True = outlier, False = normal.
+        :rtype: Series
+        """
+        # Imported on use: the accessor is registered by ``import outlipy``.
+        from ..core import kernels
+
+        method = "RollingZScore"
+
+        if isinstance(window, bool) or not isinstance(window, int) or window < 2:
+            raise exceptions.ConfigurationException(
+                error_code = "CON002",
+                method = method,
+                parameter_context = "window",
+                suggestion = "Use a window of at least 2 values, e.g. window = 50."
+            )
+
+        if isinstance(threshold, bool) or not isinstance(threshold, (int, float)) or threshold <= 0:
+            raise exceptions.ConfigurationException(
+                error_code = "CON002",
+                method = method,
+                parameter_context = "threshold",
+                suggestion = "Ensure threshold > 0, e.g. 3.0."
+            )
+
+        if nan_policy not in ("raise", "omit"):
+            raise exceptions.ConfigurationException(
+                error_code = "CON002",
+                method = method,
+                parameter_context = "nan_policy",
+                suggestion = "The nan_policy must be 'raise' or 'omit'."
+            )
+
+        series = self._series
+        values = utils.validate_series_input(series, method, allow_nan = nan_policy == "omit")
+        values = np.asarray(values, dtype = np.float64) if isinstance(values, np.ndarray) else series.to_numpy(dtype = np.float64, na_value = np.nan)
+
+        # Statistics of the windows ending just before every value.
+        means, stds = kernels.rolling_mean_std(values, window)
+        mask = np.zeros(len(values), dtype = bool)
+
+        with np.errstate(divide = "ignore", invalid = "ignore"):
+            mask[window:] = np.abs(values[window:] - means[window - 1:-1]) / stds[window - 1:-1] > threshold
+
+        return pd.Series(mask, index = series.index, name = series.name, copy = False)
+
+    # ------------------------------------------------------
+    #                   Handling
+    # ------------------------------------------------------
+
+    def mean(self, *, outlier_mask: Union[pd.Series, np.ndarray], dtype: str = "float64") -> pd.Series:
+
+        handler = handling.MeanHandler(dtype = dtype)
+        values, outliers = self._handler_values(handler.method, outlier_mask)
+
+        if not outliers.any():
+            return self._series.copy()
+
+        replacement_val = handler._replacement_value(values, outliers)
+
+        if pd.isna(replacement_val):
+            raise exceptions.HandlingException(
+                error_code = "HEX002",
+                method = handler.method,
+                suggestion = f"Cannot compute mean for '{self._series.name}'. All data points might be flagged as outliers."
+            )
+
+        return self._replace(values, outliers, replacement_val, handler.dtype)
+
+    def median(self, *, outlier_mask: Union[pd.Series, np.ndarray], dtype: str = "float64") -> pd.Series:
+
+        handler = handling.MedianHandler(dtype = dtype)
+        values, outliers = self._handler_values(handler.method, outlier_mask)
+
+        if not outliers.any():
+            return self._series.copy()
+
+        replacement_val = handler._replacement_value(values, outliers)
+
+        if pd.isna(replacement_val):
+            raise exceptions.HandlingException(
+                error_code = "HEX002",
+                method = handler.method,
+                suggestion = f"Cannot compute median for '{self._series.name}'. All data points might be flagged as outliers."
+            )
+
+        return self._replace(values, outliers, replacement_val, handler.dtype)
+
+    def conrep(self, *, fill_value: float, outlier_mask: Union[pd.Series, np.ndarray], dtype: str = "float64") -> pd.Series:
+
+        handler = handling.ConstantHandler(fill_value = fill_value, dtype = dtype)
+        values, outliers = self._handler_values(handler.method, outlier_mask)
+
+        if not outliers.any():
+            return self._series.copy()
+
+        return self._replace(values, outliers, handler.fill_value, handler.dtype)
+
+    def winsor(self, *, limits: Tuple[float, float] = (0.05, 0.95), dtype: str = "float64") -> pd.Series:
+
+        from ..core import kernels
+
+        handler = handling.WinsorizationHandler(limits = limits, dtype = dtype)
+        series = self._series
+        values = utils.validate_series_input(series, handler.method)
+
+        if not isinstance(values, np.ndarray):
+            values = series.to_numpy(dtype = np.float64)
+
+        lower_limit, upper_limit = handler._limits(values, series.name)
+
+        if values.dtype.kind in "iu":
+            values = values.astype(handler.dtype)
+
+        lower_limit, upper_limit = values.dtype.type(lower_limit), values.dtype.type(upper_limit)
+
+        return pd.Series(kernels.clip(values, lower_limit, upper_limit), index = series.index, name = series.name, copy = False)
+
+    def remove(self, *, outlier_mask: Union[pd.Series, np.ndarray]) -> pd.Series:
+
+        handler = handling.RemoveHandler()
+        _, outliers = self._handler_values(handler.method, outlier_mask)
+
+        return self._series[~outliers]
+
+    def interpolate(self, *, method: str = 'linear', outlier_mask: Union[pd.Series, np.ndarray], dtype: str = "float64") -> pd.Series:
+
+        handler = handling.InterpolateHandler(method = method, dtype = dtype)
+        values, outliers = self._handler_values(handler.method, outlier_mask)
+
+        if not outliers.any():
+            return self._series.copy()
+
+        if values.dtype.kind in "iu":
+            values = values.astype(handler.dtype)
+
+        series_to_fill = pd.Series(np.where(outliers, values.dtype.type(np.nan), values), index = self._series.index, name = self._series.name)
+
+        return series_to_fill.interpolate(method = handler.interpolation_method)     # type: ignore
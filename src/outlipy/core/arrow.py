@@ -0,0 +1,174 @@
+"""
+Optional Apache Arrow support.
+
+pyarrow is only imported when Arrow data is actually passed in, so it stays an
+optional dependency (``pip install outlipy[arrow]``).
+"""
+
+import numpy as np
+
+from typing import Any, Iterator, List, Union
+
+
+def require_pyarrow():
+    """
+    Import pyarrow or raise an ImportError explaining how to install it.
+    """
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise ImportError(
+            "Arrow input requires the optional dependency 'pyarrow'. "
+            "Install it with `pip install outlipy[arrow]`."
+        ) from e
+
+    return pyarrow
+
+
+def is_arrow_table(obj: Any) -> bool:
+    """
+    True if ``obj`` is a ``pyarrow.Table``, checked without importing pyarrow.
+    """
+    return type(obj).__name__ == "Table" and type(obj).__module__.startswith("pyarrow")
+
+
+def is_arrow_array(obj: Any) -> bool:
+    """
+    True if ``obj`` is a ``pyarrow.ChunkedArray`` or ``pyarrow.Array``.
+    """
+    return type(obj).__module__.startswith("pyarrow") and hasattr(obj, "null_count")
+
+
+def is_arrow_dtype(dtype: Any) -> bool:
+    """
+    True if ``dtype`` is a pandas ``ArrowDtype``.
+    """
+    return type(dtype).__name__ == "ArrowDtype"
+
+
+def is_numeric_type(arrow_type: Any) -> bool:
+    """
+    True if ``arrow_type`` is an Arrow integer or floating point type.
+    """
+    pa = require_pyarrow()
+    return pa.types.is_integer(arrow_type) or pa.types.is_floating(arrow_type)
+
+
+def series_to_arrow(series: Any):
+    """
+    Return the ``ChunkedArray`` backing an ``ArrowDtype`` Series without copying.
+    """
+    return series.array.__arrow_array__()
+
+
+def count_missing(values: Any) -> int:
+    """
+    Count nulls (from the validity bitmaps) plus NaN and inf values.
+    """
+    pa = require_pyarrow()
+    import pyarrow.compute as pc
+
+    missing = values.null_count
+
+    if pa.types.is_floating(values.type):
+        # is_finite leaves nulls as null, so only the non-finite values are counted.
+        missing += pc.sum(pc.invert(pc.is_finite(values))).as_py() or 0
+
+    return missing
+
+
+def count_infinite(values: Any) -> int:
+    """
+    Count the inf values, ignoring nulls and NaN.
+    """
+    pa = require_pyarrow()
+    import pyarrow.compute as pc
+
+    if not pa.types.is_floating(values.type):
+        return 0
+
+    return pc.sum(pc.is_inf(values)).as_py() or 0
+
+
+def drop_missing(values: Any):
+    """
+    Return the values without nulls and NaN, or ``values`` itself if there are none.
+    """
+    pa = require_pyarrow()
+    import pyarrow.compute as pc
+
+    if values.null_count:
+        values = pc.drop_null(values)
+
+    if pa.types.is_floating(values.type):
+        is_nan = pc.is_nan(values)
+
+        if pc.any(is_nan).as_py():
+            values = pc.filter(values, pc.invert(is_nan))
+
+    return values
+
+
+def iter_numpy_chunks(values: Any) -> Iterator[np.ndarray]:
+    """
+    Yield every chunk of an Arrow array as a NumPy array.
+
+    Chunks without nulls are exposed zero-copy; chunks with nulls are converted
+    with the nulls as NaN.
+    """
+    chunks = values.chunks if hasattr(values, "chunks") else [values]
+
+    for chunk in chunks:
+        yield chunk.to_numpy(zero_copy_only = chunk.null_count == 0)
+
+
+# ---------------------------------------------------------------
+#              Reductions computed on the Arrow chunks
+# ---------------------------------------------------------------
+
+def quantile(values: Any, q: Union[float, List[float]]) -> Union[float, np.ndarray]:
+    """
+    Linear-interpolated quantile(s), matching ``np.quantile``.
+    """
+    require_pyarrow()
+    import pyarrow.compute as pc
+
+    result = pc.quantile(values, q = q, interpolation = "linear").to_numpy(zero_copy_only = False)
+
+    return result if np.ndim(q) else result[0]
+
+
+def mean(values: Any) -> float:
+    require_pyarrow()
+    import pyarrow.compute as pc
+
+    return pc.mean(values).as_py()
+
+
+def std(values: Any) -> float:
+    """
+    Population standard deviation (ddof = 0).
+    """
+    require_pyarrow()
+    import pyarrow.compute as pc
+
+    return pc.stddev(values, ddof = 0).as_py()
+
+
+def abs_deviation(values: Any, center: float):
+    """
+    ``|values - center|`` as a new Arrow array.
+    """
+    pa = require_pyarrow()
+    import pyarrow.compute as pc
+
+    return pc.abs(pc.subtract(pc.cast(values, pa.float64()), center))
+
+
+def table_from_mask(mask: np.ndarray, columns: List[str]):
+    """
+    Build a boolean ``pyarrow.Table`` from a 2-D mask.
+    """
+    pa = require_pyarrow()
+
+    return pa.table({col: mask[:, i] for i, col in enumerate(columns)})
@@ -0,0 +1,396 @@
+"""
+Opt-in on-disk cache of fitted statistics and outlier masks.
+
+With ``set_cache(directory)`` every ``fit`` first computes a fingerprint of
+the fitted columns (their bytes, dtype and length) combined with the detector
+class and its parameters. When the same data was fitted with the same settings
+before, even in another process or notebook session, the fitted state of a
+univariate detector is read from the cache and the fit is skipped. With
+``masks=True``, ``detect`` also stores its masks, keyed by the fit and the
+fingerprint of the detected columns; row detectors (KNN, LOF, isolation
+forest, ...) keep models besides their statistics, so only their masks are
+cached.
+
+Fingerprints hash every byte of the columns by default ("full", about 1 GB/s).
+``fingerprint="sampled"`` hashes the length, the dtype and evenly spaced
+blocks of rows only, at a constant cost per column; it cannot see a change
+between the sampled blocks, so only use it for data that is replaced, not
+edited, between runs.
+
+Entries are pickles written atomically; the least recently used ones are
+deleted once the directory holds more than ``max_size`` bytes. Masks are
+stored sparse, as the positions of the flagged rows of every column (or
+bit-packed when that is smaller). Fits that depend on an unseeded random
+generator are never cached.
+
+Only point the cache at a directory you trust: entries are unpickled.
+"""
+
+import functools
+import hashlib
+import os
+import pickle
+import tempfile
+
+import numpy as np
+
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from . import arrow
+
+FORMAT = "outlipy.cache"
+VERSION = 1
+FINGERPRINTS = ("full", "sampled")
+
+# Sampled fingerprints: blocks of rows hashed per column, and rows per block.
+SAMPLED_BLOCKS = 64
+SAMPLED_ROWS = 1024
+
+# Full fingerprints of non-contiguous columns are hashed in copies of this many rows.
+HASH_ROWS = 1 << 20
+
+_cache: Optional["DiskCache"] = None
+
+
+@functools.lru_cache(maxsize = None)
+def _package_version() -> str:
+    try:
+        from importlib.metadata import version, PackageNotFoundError
+    except ImportError:
+        return "unknown"
+
+    try:
+        return version("outlipy")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+class DiskCache:
+    """
+    Directory of fitted states and masks, bounded to ``max_size`` bytes with LRU eviction.
+
+    :param directory: The cache directory, created if needed.
+    :type directory: Union[str, os.PathLike]
+    :param max_size: Bytes kept on disk before the least recently used entries are deleted.
+    :type max_size: int
+    :param fingerprint: "full" hashes every byte of the columns, "sampled" spaced blocks of rows.
+    :type fingerprint: str
+    :param masks: Also cache the masks returned by ``detect``.
+    :type masks: bool
+    """
+
+    def __init__(self, directory, max_size: int = 1 << 30, fingerprint: str = "full", masks: bool = False):
+        if fingerprint not in FINGERPRINTS:
+            raise ValueError(f"The fingerprint must be one of {FINGERPRINTS}, got {fingerprint!r}.")
+
+        if isinstance(max_size, bool) or not isinstance(max_size, int) or max_size < 0:
+            raise ValueError(f"The max_size must be a number of bytes >= 0, got {max_size!r}.")
+
+        self.directory = os.path.abspath(os.fspath(directory))
+        self.max_size = max_size
+        self.fingerprint = fingerprint
+        self.masks = masks
+        self.hits = 0
+        self.misses = 0
+        self._salt = f"{FORMAT}/{VERSION}/{_package_version()}/{fingerprint}".encode()
+
+        os.makedirs(self.directory, exist_ok = True)
+
+    def __repr__(self):
+        return f"DiskCache({self.directory!r}, max_size={self.max_size}, fingerprint={self.fingerprint!r}, masks={self.masks})"
+
+    # ------------------------------------
+    #               Keys
+    # ------------------------------------
+
+    def fit_key(self, detector: Any, columns: Iterable[Any], values: Callable[[Any], Any]) -> str:
+        """
+        Key of fitting ``detector`` (class and parameters) on the given columns.
+
+        :param columns: The validated columns.
+        :param values: Returns the values of a column (NumPy or Arrow), as ``_column_values``.
+        """
+        digest = hashlib.sha1(self._salt)
+        digest.update(_settings(detector))
+        self._update(digest, columns, values)
+
+        return "fit-" + digest.hexdigest()
+
+    def mask_key(self, detector: Any, fit_key: str, columns: Iterable[Any], values: Callable[[Any], Any]) -> str:
+        """
+        Key of the mask of ``detector``, fitted under ``fit_key``, on the given columns.
+
+        The parameters are read again at detection: those changed since the fit
+        (e.g. the threshold) give another mask.
+        """
+        digest = hashlib.sha1(fit_key.encode())
+        digest.update(_settings(detector))
+        self._update(digest, columns, values)
+
+        return "mask-" + digest.hexdigest()
+
+    def _update(self, digest, columns: Iterable[Any], values: Callable[[Any], Any]):
+        _hash_columns(digest, columns, values, self.fingerprint)
+
+    # ------------------------------------
+    #               Entries
+    # ------------------------------------
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + ".pkl")
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        The entry stored under ``key``, or None. A hit marks the entry as recently used.
+        """
+        path = self._path(key)
+
+        try:
+            with open(path, "rb") as file:
+                envelope = pickle.load(file)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except Exception:
+            # Truncated or written by an incompatible version: drop it.
+            _unlink(path)
+            self.misses += 1
+            return None
+
+        if not isinstance(envelope, dict) or envelope.get("format") != FORMAT or envelope.get("version") != VERSION:
+            _unlink(path)
+            self.misses += 1
+            return None
+
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+        self.hits += 1
+
+        return envelope["object"]
+
+    def put(self, key: str, obj: Any):
+        """
+        Atomically store ``obj`` under ``key``, then evict down to ``max_size``.
+        """
+        fd, temporary = tempfile.mkstemp(dir = self.directory, prefix = ".outlipy-", suffix = ".tmp")
+
+        try:
+            with os.fdopen(fd, "wb") as file:
+                pickle.dump({"format": FORMAT, "version": VERSION, "object": obj}, file, protocol = pickle.HIGHEST_PROTOCOL)
+
+            os.replace(temporary, self._path(key))
+        except BaseException:
+            _unlink(temporary)
+            raise
+
+        self.evict()
+
+    def evict(self):
+        """
+        Delete the least recently used entries until at most ``max_size`` bytes remain.
+        """
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+
+        for path, size, _ in sorted(entries, key = lambda entry: entry[2]):
+            if total <= self.max_size:
+                break
+
+            _unlink(path)
+            total -= size
+
+    def clear(self):
+        """
+        Delete every entry.
+        """
+        for path, _, _ in self._entries():
+            _unlink(path)
+
+    def size(self) -> int:
+        """
+        Bytes held by the entries.
+        """
+        return sum(size for _, size, _ in self._entries())
+
+    def _entries(self) -> List[tuple]:
+        """
+        ``(path, size, last use)`` of every entry; entries deleted meanwhile by another process are skipped.
+        """
+        entries = []
+
+        with os.scandir(self.directory) as scan:
+            for entry in scan:
+                if not entry.name.endswith(".pkl"):
+                    continue
+
+                try:
+                    status = entry.stat()
+                except FileNotFoundError:
+                    continue
+
+                entries.append((entry.path, status.st_size, status.st_mtime_ns))
+
+        return entries
+
+
+def _settings(detector: Any) -> bytes:
+    """
+    The class and public attributes (parameters) of a detector, as hashed in the keys.
+    """
+    settings = sorted((name, value) for name, value in vars(detector).items() if not name.startswith("_"))
+
+    return f"{type(detector).__module__}.{type(detector).__qualname__}{settings!r}".encode()
+
+
+def fingerprint(columns: Iterable[Any], values: Callable[[Any], Any]) -> str:
+    """
+    Full fingerprint of the given columns (names, dtypes, lengths and every byte), whether or not a cache is active.
+
+    :param columns: The columns.
+    :param values: Returns the values of a column (NumPy or Arrow), as ``_column_values``.
+    """
+    digest = hashlib.sha1(FORMAT.encode())
+    _hash_columns(digest, columns, values, "full")
+
+    return digest.hexdigest()
+
+
+def _hash_columns(digest, columns: Iterable[Any], values: Callable[[Any], Any], fingerprint: str):
+    for col in columns:
+        column = values(col)
+        chunks = [column] if isinstance(column, np.ndarray) else list(arrow.iter_numpy_chunks(column))
+        n_rows = sum(len(chunk) for chunk in chunks)
+        dtype = chunks[0].dtype.str if chunks else ""
+        digest.update(f"|{col!r}|{dtype}|{n_rows}|".encode())
+
+        if fingerprint == "full":
+            for chunk in chunks:
+                _hash_rows(digest, chunk, 0, len(chunk))
+        else:
+            _hash_sampled(digest, chunks, n_rows)
+
+
+def _unlink(path: str):
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+
+def _hash_rows(digest, values: np.ndarray, start: int, stop: int):
+    """
+    Hash rows ``start:stop`` of a 1-D column, copying strided columns in blocks.
+    """
+    if values.dtype.kind == "O":
+        digest.update(pickle.dumps(values[start:stop].tolist(), protocol = pickle.HIGHEST_PROTOCOL))
+        return
+
+    if values.flags.c_contiguous:
+        digest.update(values[start:stop].view(np.uint8))
+        return
+
+    for block in range(start, stop, HASH_ROWS):
+        digest.update(np.ascontiguousarray(values[block:min(block + HASH_ROWS, stop)]).view(np.uint8))
+
+
+def _hash_sampled(digest, chunks: List[np.ndarray], n_rows: int):
+    """
+    Hash ``SAMPLED_BLOCKS`` evenly spaced blocks of ``SAMPLED_ROWS`` rows (the first and last included).
+    """
+    if n_rows <= SAMPLED_BLOCKS * SAMPLED_ROWS:
+        for chunk in chunks:
+            _hash_rows(digest, chunk, 0, len(chunk))
+        return
+
+    starts = np.linspace(0, n_rows - SAMPLED_ROWS, SAMPLED_BLOCKS).astype(np.int64)
+    offsets = np.cumsum([0] + [len(chunk) for chunk in chunks])
+
+    for start in starts:
+        # A block may span chunk boundaries.
+        stop = start + SAMPLED_ROWS
+        first = int(np.searchsorted(offsets, start, side = "right")) - 1
+
+        for i in range(first, len(chunks)):
+            if offsets[i] >= stop:
+                break
+
+            _hash_rows(digest, chunks[i], max(start - offsets[i], 0), min(stop - offsets[i], len(chunks[i])))
+
+
+# ---------------------------------------------------------------
+#                           Masks
+# ---------------------------------------------------------------
+
+def pack_mask(mask: np.ndarray) -> Dict[str, Any]:
+    """
+    Sparse form of a 2-D boolean mask: the flagged rows of every column, or
+    its packed bits when they are smaller. Identical columns (row detectors)
+    are stored once.
+    """
+    n_rows, n_cols = mask.shape
+    index_dtype = np.uint32 if n_rows < 1 << 32 else np.uint64
+
+    if np.count_nonzero(mask) * np.dtype(index_dtype).itemsize > mask.size // 8:
+        return {"shape": mask.shape, "bits": np.packbits(mask, axis = 0)}
+
+    positions = []
+
+    for j in range(n_cols):
+        rows = np.flatnonzero(mask[:, j]).astype(index_dtype)
+
+        # The same object is pickled once.
+        if positions and np.array_equal(rows, positions[-1]):
+            rows = positions[-1]
+
+        positions.append(rows)
+
+    return {"shape": mask.shape, "positions": positions}
+
+
+def unpack_mask(packed: Dict[str, Any]) -> np.ndarray:
+    """
+    The boolean mask stored by ``pack_mask``.
+    """
+    n_rows, n_cols = packed["shape"]
+
+    if "bits" in packed:
+        return np.unpackbits(packed["bits"], axis = 0, count = n_rows).astype(bool)
+
+    mask = np.zeros((n_rows, n_cols), dtype = bool)
+
+    for j, rows in enumerate(packed["positions"]):
+        mask[rows, j] = True
+
+    return mask
+
+
+# ---------------------------------------------------------------
+#                        Active cache
+# ---------------------------------------------------------------
+
+def set_cache(directory = None, max_size: int = 1 << 30, fingerprint: str = "full", masks: bool = False) -> Optional[DiskCache]:
+    """
+    Cache fitted statistics (and with ``masks=True`` detection masks) in ``directory``;
+    ``set_cache(None)`` turns caching off.
+
+    :return: The active cache, or None.
+    """
+    global _cache
+
+    _cache = DiskCache(directory, max_size = max_size, fingerprint = fingerprint, masks = masks) if directory is not None else None
+
+    return _cache
+
+
+def get_cache() -> Optional[DiskCache]:
+    """
+    The active cache, or None when caching is off.
+    """
+    return _cache
+
+
+if os.environ.get("OUTLIPY_CACHE"):
+    set_cache(os.environ["OUTLIPY_CACHE"])
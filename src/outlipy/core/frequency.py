@@ -0,0 +1,138 @@
+"""
+Statistics of low-cardinality columns from their frequency table.
+
+A column with a few dozen distinct values over millions of rows is reduced
+once to its sorted distinct values and their counts; quantiles, medians,
+the MAD, the mean and the standard deviation are then computed on the table,
+at a cost proportional to the number of distinct values instead of rows.
+
+Quantiles are exact: the value at every position of the sorted column is read
+from the cumulative counts, and interpolated as ``np.quantile`` does. Means
+and deviations are count-weighted sums, equal to the row-wise results up to
+floating-point rounding.
+"""
+
+import numpy as np
+
+from typing import List, Optional, Union
+
+# Values inspected (evenly spaced) before counting a whole column.
+PROBE_SIZE = 4096
+
+
+class FrequencyTable:
+    """
+    Sorted distinct values of a column and the number of rows holding each.
+
+    Attributes:
+        values (np.ndarray): The distinct values in ascending order.
+        counts (np.ndarray): The number of rows of every value (int64).
+        total (int): The number of rows.
+    """
+
+    def __init__(self, values: np.ndarray, counts: np.ndarray):
+        self.values = values
+        self.counts = counts
+        self.total = int(counts.sum())
+        self._cumulative = np.cumsum(counts)
+
+    def __repr__(self):
+        return f"FrequencyTable(distinct={len(self.values)}, total={self.total})"
+
+    @classmethod
+    def from_values(cls, values: np.ndarray, max_cardinality: int) -> Optional["FrequencyTable"]:
+        """
+        Frequency table of a NumPy column, or None when it has more than
+        ``max_cardinality`` distinct values, is empty, or contains NaN.
+
+        An evenly spaced probe of the column is counted first, so high-cardinality
+        columns are usually rejected without a pass over every row.
+        """
+        if values.dtype.kind not in "fiu" or not len(values):
+            return None
+
+        if len(values) > PROBE_SIZE:
+            probe = values[::len(values) // PROBE_SIZE]
+
+            if len(np.unique(probe)) > max_cardinality:
+                return None
+
+        distinct, counts = np.unique(values, return_counts = True)
+
+        if len(distinct) > max_cardinality or (distinct.dtype.kind == "f" and np.isnan(distinct[-1])):
+            return None
+
+        return cls(distinct, counts.astype(np.int64, copy = False))
+
+    def at(self, positions: np.ndarray) -> np.ndarray:
+        """
+        Values at the given positions (0-based) of the sorted column.
+        """
+        return self.values[np.searchsorted(self._cumulative, positions, side = "right")]
+
+    def quantile(self, q: Union[float, List[float]]) -> Union[float, np.ndarray]:
+        """
+        Linear-interpolated quantile(s), equal to ``np.quantile`` of the full column.
+        """
+        positions = np.asarray(q, dtype = np.float64) * (self.total - 1)
+        below = np.floor(positions)
+        fraction = positions - below
+        low = self.at(below.astype(np.int64))
+        high = self.at(np.minimum(below.astype(np.int64) + 1, self.total - 1))
+
+        # Same interpolation as np.quantile, also for the rounding.
+        difference = high - low
+        result = np.where(fraction >= 0.5, high - difference * (1 - fraction), low + difference * fraction)
+
+        return result[()] if result.ndim == 0 else result
+
+    def median(self) -> float:
+        """
+        Median, the mean of the two middle values for an even row count (as ``np.median``).
+        """
+        low, high = self.at(np.array([(self.total - 1) // 2, self.total // 2]))
+
+        return (low + high) / 2
+
+    def mean(self) -> float:
+        return float(np.dot(self.values.astype(np.float64), self.counts) / self.total)
+
+    def std(self) -> float:
+        """
+        Population standard deviation (ddof = 0).
+        """
+        deviations = self.values.astype(np.float64) - self.mean()
+
+        return float(np.sqrt(np.dot(deviations * deviations, self.counts) / self.total))
+
+    def abs_deviation(self, center: float, dtype: Optional[np.dtype] = None) -> "FrequencyTable":
+        """
+        Frequency table of ``|values - center|`` (for the MAD), computed in ``dtype``.
+        """
+        deviations = np.subtract(self.values, center, dtype = dtype)
+        np.abs(deviations, out = deviations)
+        order = np.argsort(deviations, kind = "stable")
+
+        return FrequencyTable(deviations[order], self.counts[order])
+
+    def resample(self, rng: np.random.Generator) -> "FrequencyTable":
+        """
+        Table of a bootstrap resample of the rows (as many rows, drawn with
+        replacement): multinomial counts, without materializing the rows.
+        """
+        counts = rng.multinomial(self.total, self.counts / self.total)
+        kept = counts > 0
+
+        return FrequencyTable(self.values[kept], counts[kept])
+
+    def count_above(self, scores: np.ndarray, thresholds: np.ndarray) -> np.ndarray:
+        """
+        Number of rows whose score exceeds every threshold, from one score per distinct value.
+        NaN scores are never above a threshold.
+        """
+        order = np.argsort(scores, kind = "stable")
+        ordered = scores[order]
+        cumulative = np.concatenate(([0], np.cumsum(self.counts[order])))
+        n_valid = int(np.searchsorted(ordered, np.nan))
+
+        return cumulative[n_valid] - cumulative[np.searchsorted(ordered[:n_valid], thresholds, side = "right")]
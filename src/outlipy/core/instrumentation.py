@@ -0,0 +1,277 @@
+"""
+Opt-in timing and memory instrumentation.
+
+Detectors and handlers report their stages (``validate``, ``fit``, ``detect``,
+``apply``) through :func:`stage`. Nothing is recorded unless a :class:`profile`
+is active or a hook is registered; while disabled, a stage costs one flag check.
+
+Example::
+
+    with outlipy.profile(track_memory = True) as prof:
+        df.outli.iqr()
+
+    prof.summary()      # {"IQRDetector": {"validate": {...}, "fit": {...}, "detect": {...}}}
+    prof.to_dict()      # every record, ready for JSON
+
+    outlipy.add_hook(outlipy.log_hook())   # structured log line per stage
+"""
+
+import functools
+import logging
+import time
+import tracemalloc
+
+from typing import Any, Callable, Dict, List, Optional
+
+Record = Dict[str, Any]
+Hook = Callable[[Record], None]
+
+_hooks: List[Hook] = []
+_profiles: List["profile"] = []
+_memory_stack: List[Dict[str, int]] = []
+
+# Recomputed whenever a hook or profile is added or removed; the only thing
+# checked on the hot path.
+_enabled = False
+_track_memory = False
+
+
+def _refresh():
+    global _enabled, _track_memory
+
+    _enabled = bool(_hooks or _profiles)
+    _track_memory = any(p.track_memory for p in _profiles)
+
+
+def enabled() -> bool:
+    """
+    True if any profile or hook is currently collecting records.
+    """
+    return _enabled
+
+
+def add_hook(hook: Hook) -> Hook:
+    """
+    Register a callable that receives every stage record. Returns the hook.
+    """
+    _hooks.append(hook)
+    _refresh()
+    return hook
+
+
+def remove_hook(hook: Hook):
+    """
+    Unregister a hook previously passed to :func:`add_hook`.
+    """
+    _hooks.remove(hook)
+    _refresh()
+
+
+def log_hook(logger: Optional[logging.Logger] = None, level: int = logging.INFO) -> Hook:
+    """
+    Build a hook that emits one structured log line per stage.
+
+    The full record is attached as ``extra={"outlipy": record}`` so JSON log
+    formatters can pick it up.
+    """
+    logger = logger or logging.getLogger("outlipy")
+
+    def hook(record: Record):
+        logger.log(
+            level,
+            "%s.%s %.6fs rows=%s columns=%s bytes=%s",
+            record["component"], record["stage"], record["seconds"],
+            record["rows"], record["columns"], record["bytes"],
+            extra = {"outlipy": record}
+        )
+
+    return hook
+
+
+def _shape(data: Any):
+    """
+    Rows and columns of a DataFrame, Series, ndarray or Arrow table.
+    """
+    if data is None:
+        return None, None
+
+    shape = getattr(data, "shape", None)
+
+    if shape is None:
+        return len(data), None
+
+    if len(shape) == 1:
+        return shape[0], 1
+
+    return shape[0], shape[1]
+
+
+class _NullStage:
+    """
+    Shared no-op context manager returned while instrumentation is disabled.
+    """
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_STAGE = _NullStage()
+
+
+class _Stage:
+    __slots__ = ("component", "name", "data", "columns", "start", "memory")
+
+    def __init__(self, component: str, name: str, data: Any, columns: Optional[int]):
+        self.component = component
+        self.name = name
+        self.data = data
+        self.columns = columns
+        self.memory = None
+
+    def __enter__(self):
+        if _track_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+
+            current, peak = tracemalloc.get_traced_memory()
+
+            # Hand the peak seen so far to the enclosing stage before resetting it.
+            if _memory_stack:
+                _memory_stack[-1]["child_peak"] = max(_memory_stack[-1]["child_peak"], peak)
+
+            tracemalloc.reset_peak()
+            self.memory = {"start": current, "child_peak": 0}
+            _memory_stack.append(self.memory)
+
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        seconds = time.perf_counter() - self.start
+
+        allocated = None
+        if self.memory is not None:
+            _memory_stack.pop()
+            peak = max(tracemalloc.get_traced_memory()[1], self.memory["child_peak"])
+            allocated = max(peak - self.memory["start"], 0)
+
+            if _memory_stack:
+                _memory_stack[-1]["child_peak"] = max(_memory_stack[-1]["child_peak"], peak)
+
+        rows, columns = _shape(self.data)
+
+        record = {
+            "component": self.component,
+            "stage": self.name,
+            "seconds": seconds,
+            "rows": rows,
+            "columns": self.columns if self.columns is not None else columns,
+            "bytes": allocated,
+            "timestamp": time.time(),
+        }
+
+        for prof in _profiles:
+            prof.records.append(record)
+
+        for hook in _hooks:
+            hook(record)
+
+        return False
+
+
+def stage(owner: Any, name: str, data: Any = None, columns: Optional[int] = None):
+    """
+    Context manager timing one stage of a detector or handler call.
+
+    :param owner: The detector or handler (its class name is the component).
+    :param name: The stage name, e.g. ``"fit"``.
+    :param data: The input, used to report rows and columns.
+    :param columns: Number of columns actually processed, if known.
+    """
+    if not _enabled:
+        return _NULL_STAGE
+
+    return _Stage(owner.__class__.__name__, name, data, columns)
+
+
+def instrumented(name: str):
+    """
+    Decorator recording a whole method as one stage; ``data`` is its first argument.
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            if not _enabled:
+                return method(self, *args, **kwargs)
+
+            data = args[0] if args else kwargs.get("df")
+            with _Stage(self.__class__.__name__, name, data, None):
+                return method(self, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+class profile:
+    """
+    Context manager collecting stage records while it is active.
+
+    :param track_memory: Also record the bytes allocated per stage with
+        ``tracemalloc``. This slows the profiled code down noticeably.
+    """
+
+    def __init__(self, track_memory: bool = False):
+        self.track_memory = track_memory
+        self.records: List[Record] = []
+        self._started_tracing = False
+
+    def __enter__(self):
+        if self.track_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+
+        _profiles.append(self)
+        _refresh()
+        return self
+
+    def __exit__(self, *exc):
+        _profiles.remove(self)
+        _refresh()
+
+        if self._started_tracing and not _track_memory:
+            tracemalloc.stop()
+
+        return False
+
+    def summary(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """
+        Aggregate the records per component and stage.
+        """
+        summary: Dict[str, Dict[str, Dict[str, Any]]] = {}
+
+        for record in self.records:
+            entry = summary.setdefault(record["component"], {}).setdefault(
+                record["stage"], {"calls": 0, "seconds": 0.0, "rows": 0, "max_bytes": None}
+            )
+            entry["calls"] += 1
+            entry["seconds"] += record["seconds"]
+            entry["rows"] += record["rows"] or 0
+
+            if record["bytes"] is not None:
+                entry["max_bytes"] = max(entry["max_bytes"] or 0, record["bytes"])
+
+        return summary
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Records and summary as plain Python objects.
+        """
+        return {
+            "records": list(self.records),
+            "summary": self.summary(),
+        }
@@ -0,0 +1,328 @@
+"""
+Fused per-column kernels with an optional Numba backend.
+
+The NumPy expressions of the detectors and handlers make one pass and one
+temporary per operation (subtract, abs, divide, compare; compare and write
+for clipping; compare, copy and masked write for a detection followed by a
+constant replacement). With the optional dependency ``numba``
+(``pip install outlipy[numba]``) the same computations run as single-pass
+compiled loops without temporaries. Both engines give identical results:
+the loops do the same floating-point operations in the same order. Rolling
+statistics are the exception: the NumPy engine uses pandas' rolling windows,
+and both agree up to rounding.
+
+The engine is chosen with ``set_engine("auto" | "numba" | "numpy")`` or the
+``OUTLIPY_ENGINE`` environment variable. "auto" (default) uses Numba when it
+is installed, except for grouped medians, which only use their kernel when
+"numba" is selected explicitly. Numba is imported, and each kernel compiled, on first use only;
+compiled kernels are cached on disk.
+"""
+
+import importlib.util
+import os
+
+import numpy as np
+
+import pandas as pd
+
+from typing import Any, Callable, Dict, Tuple
+
+ENGINES = ("auto", "numba", "numpy")
+
+_engine = os.environ.get("OUTLIPY_ENGINE", "auto")
+_compiled: Dict[str, Callable] = {}
+
+
+def require_numba():
+    """
+    Import numba or raise an ImportError explaining how to install it.
+    """
+    try:
+        import numba
+    except ImportError as e:
+        raise ImportError(
+            "The 'numba' engine requires the optional dependency 'numba'. "
+            "Install it with `pip install outlipy[numba]` or use set_engine('numpy')."
+        ) from e
+
+    return numba
+
+
+def has_numba() -> bool:
+    """
+    True if numba is installed (without importing it).
+    """
+    return importlib.util.find_spec("numba") is not None
+
+
+def set_engine(engine: str):
+    """
+    Select the kernel engine: "auto" (Numba when installed), "numba" or "numpy".
+    """
+    global _engine
+
+    if engine not in ENGINES:
+        raise ValueError(f"The engine must be one of {ENGINES}, got {engine!r}.")
+
+    if engine == "numba":
+        require_numba()
+
+    _engine = engine
+
+
+def requested() -> str:
+    """
+    The engine as selected, before "auto" is resolved: "auto", "numba" or "numpy".
+    """
+    return _engine
+
+
+def get_engine() -> str:
+    """
+    The engine in use, "numba" or "numpy".
+    """
+    if _engine == "auto":
+        return "numba" if has_numba() else "numpy"
+
+    return _engine
+
+
+def _use_numba(*arrays: np.ndarray) -> bool:
+    """
+    True when the Numba engine is active and every array is a 1-D numeric NumPy array.
+    """
+    if get_engine() != "numba":
+        return False
+
+    return all(isinstance(a, np.ndarray) and a.ndim == 1 and a.dtype.kind in "fiub" for a in arrays)
+
+
+def _kernel(name: str) -> Callable:
+    kernel = _compiled.get(name)
+
+    if kernel is None:
+        kernel = _compiled[name] = require_numba().njit(cache = True, nogil = True)(_LOOPS[name])
+
+    return kernel
+
+
+# ---------------------------------------------------------------
+#                       Detection kernels
+# ---------------------------------------------------------------
+
+def outside(values: np.ndarray, lower: float, upper: float) -> np.ndarray:
+    """
+    ``(values < lower) | (values > upper)``; NaN is never outside.
+    """
+    if _use_numba(values):
+        out = np.empty(len(values), dtype = bool)
+        _kernel("outside")(values, float(lower), float(upper), out)
+        return out
+
+    return (values < lower) | (values > upper)
+
+
+def scaled_above(values: np.ndarray, center: float, factor: float, divisor: float, threshold: float, dtype: np.dtype) -> np.ndarray:
+    """
+    ``|values - center| * factor / divisor > threshold``, computed in ``dtype``.
+
+    The NumPy engine keeps one buffer updated in place; the multiplication is
+    skipped for ``factor == 1``. Numba is used for float64 only, where both
+    engines round identically.
+    """
+    if dtype == np.float64 and _use_numba(values):
+        out = np.empty(len(values), dtype = bool)
+        _kernel("scaled_above")(values, float(center), float(factor), float(divisor), float(threshold), out)
+        return out
+
+    scores = np.subtract(values, center, dtype = dtype)
+    np.abs(scores, out = scores)
+
+    if factor != 1:
+        scores *= factor
+
+    scores /= divisor
+
+    return scores > threshold
+
+
+def rolling_mean_std(values: np.ndarray, window: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Mean and standard deviation (ddof 1) of the ``window`` values ending at every
+    position, in one pass. NaN until the first full window, and for windows
+    holding a NaN.
+    """
+    if _use_numba(values):
+        means = np.empty(len(values))
+        stds = np.empty(len(values))
+        _kernel("rolling_mean_std")(values, window, means, stds)
+        return means, stds
+
+    rolling = pd.Series(values, dtype = np.float64, copy = False).rolling(window)
+
+    return rolling.mean().to_numpy(), rolling.std().to_numpy()
+
+
+# ---------------------------------------------------------------
+#                       Handling kernels
+# ---------------------------------------------------------------
+
+def replace_outside(values: np.ndarray, lower: float, upper: float, fill: Any) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    The mask ``(values < lower) | (values > upper)`` and a copy of ``values``
+    with the flagged values replaced by ``fill``: bound check, mask and
+    replacement write in one loop. NaN is never outside.
+    """
+    fill = values.dtype.type(fill)
+
+    if _use_numba(values):
+        mask = np.empty(len(values), dtype = bool)
+        out = np.empty_like(values)
+        _kernel("replace_outside")(values, float(lower), float(upper), fill, mask, out)
+        return mask, out
+
+    mask = outside(values, lower, upper)
+    out = values.copy()
+    out[mask] = fill
+
+    return mask, out
+
+
+def clip(values: np.ndarray, lower: Any, upper: Any) -> np.ndarray:
+    """
+    Copy of ``values`` with the values outside ``[lower, upper]`` replaced by the
+    bound they cross: bound check and write in one loop. NaN stays NaN.
+    """
+    if _use_numba(values):
+        out = np.empty_like(values)
+        _kernel("clip")(values, values.dtype.type(lower), values.dtype.type(upper), out)
+        return out
+
+    return np.clip(values, lower, upper)
+
+
+def group_medians(codes: np.ndarray, n_groups: int, values: np.ndarray, skip: np.ndarray) -> np.ndarray:
+    """
+    Median of the values of every group, leaving out the ``skip`` rows, NaN values
+    and rows without a group (code -1), in one bucketing pass. Groups without values get NaN.
+
+    Numba only, and only used when the "numba" engine is selected explicitly:
+    ``groupby(...).median`` already selects the medians in compiled code and is
+    as fast on typical group counts, with less memory.
+    """
+    return _kernel("group_medians")(codes, n_groups, values, skip)
+
+
+# ---------------------------------------------------------------
+#                   Loops compiled by Numba
+# ---------------------------------------------------------------
+
+def _outside_loop(values, lower, upper, out):
+    for i in range(values.shape[0]):
+        x = values[i]
+        out[i] = x < lower or x > upper
+
+
+def _scaled_above_loop(values, center, factor, divisor, threshold, out):
+    for i in range(values.shape[0]):
+        score = abs(values[i] - center)
+
+        if factor != 1.0:
+            score = score * factor
+
+        out[i] = score / divisor > threshold
+
+
+def _rolling_mean_std_loop(values, window, means, stds):
+    # Welford's updates, adding the entering value and removing the leaving one.
+    n, n_nan, mean, m2 = 0, 0, 0.0, 0.0
+
+    for i in range(values.shape[0]):
+        x = values[i]
+
+        if np.isnan(x):
+            n_nan += 1
+        else:
+            n += 1
+            delta = x - mean
+            mean += delta / n
+            m2 += delta * (x - mean)
+
+        if i >= window:
+            y = values[i - window]
+
+            if np.isnan(y):
+                n_nan -= 1
+            elif n == 1:
+                n, mean, m2 = 0, 0.0, 0.0
+            else:
+                n -= 1
+                delta = y - mean
+                mean -= delta / n
+                m2 -= delta * (y - mean)
+
+        if i < window - 1 or n_nan > 0:
+            means[i] = np.nan
+            stds[i] = np.nan
+        else:
+            means[i] = mean
+            stds[i] = np.sqrt(max(m2, 0.0) / (n - 1))
+
+
+def _replace_outside_loop(values, lower, upper, fill, mask, out):
+    for i in range(values.shape[0]):
+        x = values[i]
+        flagged = x < lower or x > upper
+        mask[i] = flagged
+        out[i] = fill if flagged else x
+
+
+def _clip_loop(values, lower, upper, out):
+    for i in range(values.shape[0]):
+        x = values[i]
+
+        if x < lower:
+            out[i] = lower
+        elif x > upper:
+            out[i] = upper
+        else:
+            out[i] = x
+
+
+def _group_medians_loop(codes, n_groups, values, skip):
+    # Bucket the kept values by group (counting sort), then take the median of every bucket.
+    counts = np.zeros(n_groups + 1, dtype = np.int64)
+
+    for i in range(values.shape[0]):
+        if codes[i] >= 0 and not skip[i] and not np.isnan(values[i]):
+            counts[codes[i] + 1] += 1
+
+    starts = np.cumsum(counts)
+    position = starts[:-1].copy()
+    buffer = np.empty(starts[-1], dtype = np.float64)
+
+    for i in range(values.shape[0]):
+        if codes[i] >= 0 and not skip[i] and not np.isnan(values[i]):
+            buffer[position[codes[i]]] = values[i]
+            position[codes[i]] += 1
+
+    medians = np.full(n_groups, np.nan)
+
+    for g in range(n_groups):
+        n = starts[g + 1] - starts[g]
+
+        if n > 0:
+            # Numba's median selects the middle values (quickselect) instead of sorting.
+            medians[g] = np.median(buffer[starts[g]:starts[g + 1]])
+
+    return medians
+
+
+_LOOPS = {
+    "outside": _outside_loop,
+    "scaled_above": _scaled_above_loop,
+    "rolling_mean_std": _rolling_mean_std_loop,
+    "replace_outside": _replace_outside_loop,
+    "clip": _clip_loop,
+    "group_medians": _group_medians_loop,
+}
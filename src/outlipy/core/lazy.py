@@ -0,0 +1,37 @@
+"""
+Lazy attribute loading for package ``__init__`` modules (PEP 562).
+
+A package lists which submodule defines each public name; the submodule is only
+imported the first time the name is accessed, and the value is then cached in
+the package namespace so later lookups are plain attribute access.
+"""
+
+import sys
+
+from importlib import import_module
+from typing import Callable, Dict, List, Tuple
+
+
+def lazy_attributes(package: str, attributes: Dict[str, str]) -> Tuple[Callable[[str], object], Callable[[], List[str]]]:
+    """
+    Build the module-level ``__getattr__`` and ``__dir__`` of a package.
+
+    :param package: ``__name__`` of the package.
+    :param attributes: Maps each public name to the relative submodule defining it, e.g. ``{"IQRDetector": ".iqr"}``.
+    """
+
+    def __getattr__(name: str):
+        submodule = attributes.get(name)
+
+        if submodule is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+        value = getattr(import_module(submodule, package), name)
+        setattr(sys.modules[package], name, value)
+
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package])) | set(attributes))
+
+    return __getattr__, __dir__
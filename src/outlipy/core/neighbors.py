@@ -0,0 +1,156 @@
+"""
+Batched k-nearest-neighbor queries for the neighbor-based detectors.
+
+Two backends answer the same queries:
+
+- ``"kd_tree"``: ``scipy.spatial.cKDTree``, O(log n) per query in low and
+  moderate dimensions. scipy is an optional dependency
+  (``pip install outlipy[neighbors]``) and is only imported when used.
+- ``"brute"``: blocked exact search with one matrix product per batch. It needs
+  no extra dependency and does not degrade with the dimension, but it is
+  O(n) per query.
+
+Queries are split into batches that run on a thread pool; both backends
+release the GIL while they work.
+"""
+
+import numpy as np
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Tuple
+
+# Above this many columns a KD-tree is rarely faster than brute force.
+KD_TREE_MAX_DIMENSIONS = 16
+
+
+def require_scipy():
+    """
+    Import scipy.spatial or raise an ImportError explaining how to install it.
+    """
+    try:
+        from scipy import spatial
+    except ImportError as e:
+        raise ImportError(
+            "The 'kd_tree' algorithm requires the optional dependency 'scipy'. "
+            "Install it with `pip install outlipy[neighbors]` or use algorithm = 'brute'."
+        ) from e
+
+    return spatial
+
+
+def has_scipy() -> bool:
+    """
+    True if scipy can be imported.
+    """
+    try:
+        require_scipy()
+    except ImportError:
+        return False
+
+    return True
+
+
+class NeighborIndex:
+    """
+    Index over the reference rows, built once and queried any number of times.
+
+    Attributes:
+        data (np.ndarray): The reference rows, float64 ``(n, p)``.
+        algorithm (str): The backend in use, "kd_tree" or "brute".
+        n_jobs (int): Threads answering the query batches.
+    """
+
+    # Rows per query batch for the KD-tree.
+    batch_size = 4096
+    # Size of the (batch x n) distance matrix of the brute-force search.
+    brute_cells = 2 ** 22
+
+    def __init__(self, data: np.ndarray, algorithm: str = "auto", n_jobs: int = 1):
+        if algorithm == "auto":
+            algorithm = "kd_tree" if data.shape[1] <= KD_TREE_MAX_DIMENSIONS and has_scipy() else "brute"
+
+        self.data = np.ascontiguousarray(data, dtype = np.float64)
+        self.algorithm = algorithm
+        self.n_jobs = n_jobs
+
+        if algorithm == "kd_tree":
+            self._tree = require_scipy().cKDTree(self.data)
+        else:
+            self._tree = None
+            self._squared_norms = np.einsum("ij,ij->i", self.data, self.data)
+
+    def __len__(self):
+        return len(self.data)
+
+    def query(self, points: np.ndarray, k: int, self_index: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Distances and positions of the ``k`` nearest reference rows of every point.
+
+        :param points: Query rows ``(m, p)``.
+        :param k: Number of neighbors, at most ``len(self)`` (minus one if rows skip themselves).
+        :param self_index: Position of every point among the reference rows, or -1.
+            A point never counts itself as its own neighbor.
+        :return: ``(distances, indices)``, both ``(m, k)`` and sorted by distance.
+        """
+        points = np.asarray(points, dtype = np.float64)
+        extra = 0 if self_index is None else 1
+        k_query = min(k + extra, len(self))
+
+        if self._tree is not None:
+            step = self.batch_size
+        else:
+            step = max(1, self.brute_cells // len(self))
+
+        bounds = [(start, min(start + step, len(points))) for start in range(0, len(points), step)]
+
+        if self.n_jobs == 1 or len(bounds) == 1:
+            results = [self._query_batch(points[start:stop], k_query) for start, stop in bounds]
+        else:
+            with ThreadPoolExecutor(max_workers = self.n_jobs) as executor:
+                results = list(executor.map(lambda bound: self._query_batch(points[bound[0]:bound[1]], k_query), bounds))
+
+        if results:
+            distances = np.concatenate([distance for distance, _ in results])
+            indices = np.concatenate([index for _, index in results])
+        else:
+            distances = np.empty((0, k_query))
+            indices = np.empty((0, k_query), dtype = np.intp)
+
+        if self_index is not None:
+            distances, indices = self._drop_self(distances, indices, self_index, k)
+
+        return distances, indices
+
+    def _query_batch(self, points: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        if self._tree is not None:
+            distances, indices = self._tree.query(points, k = k)
+            return distances.reshape(len(points), k), indices.reshape(len(points), k)
+
+        # ||x - y||^2 = ||x||^2 - 2 x.y + ||y||^2, one matrix product per batch.
+        squared = self._squared_norms - 2.0 * (points @ self.data.T)
+        squared += np.einsum("ij,ij->i", points, points)[:, None]
+        np.maximum(squared, 0.0, out = squared)
+
+        if k < len(self):
+            candidates = np.argpartition(squared, k - 1, axis = 1)[:, :k]
+        else:
+            candidates = np.broadcast_to(np.arange(len(self)), squared.shape)
+
+        candidate_squared = np.take_along_axis(squared, candidates, axis = 1)
+        order = np.argsort(candidate_squared, axis = 1)
+
+        return np.sqrt(np.take_along_axis(candidate_squared, order, axis = 1)), np.take_along_axis(candidates, order, axis = 1)
+
+    @staticmethod
+    def _drop_self(distances: np.ndarray, indices: np.ndarray, self_index: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Remove every point from its own neighbors, or the farthest extra neighbor
+        for points that are not reference rows (or were not returned, e.g. among many duplicates).
+        """
+        own = indices == np.asarray(self_index)[:, None]
+        own[~own.any(axis = 1), -1] = True
+
+        keep = ~own
+        shape = (len(indices), k)
+
+        return distances[keep].reshape(shape), indices[keep].reshape(shape)
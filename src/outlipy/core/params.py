@@ -0,0 +1,64 @@
+"""
+``get_params`` / ``set_params`` for detectors and handlers.
+
+The parameters are the arguments of ``__init__``, read back from the
+attributes of the same name, so detectors and handlers nested in the
+scikit-learn wrappers can be cloned and tuned by grid searches
+(``outlier__detector__threshold``). Classes storing an argument under another
+attribute name list it in ``_param_attributes``.
+"""
+
+import inspect
+
+from typing import Any, Dict, List
+
+
+class ParamsMixin:
+    """
+    Parameters of a detector or handler, as scikit-learn estimators expose them.
+    """
+
+    # Argument name -> attribute name, for arguments stored under another name.
+    _param_attributes: Dict[str, str] = {}
+
+    @classmethod
+    def _get_param_names(cls) -> List[str]:
+        signature = inspect.signature(cls.__init__)
+
+        return sorted(
+            name for name, parameter in signature.parameters.items()
+            if name != "self" and parameter.kind not in (parameter.VAR_POSITIONAL, parameter.VAR_KEYWORD)
+        )
+
+    def get_params(self, deep: bool = True) -> Dict[str, Any]:
+        """
+        The constructor arguments of this object.
+
+        :param deep: Unused: detectors and handlers hold no nested estimators.
+        :type deep: bool
+        :return: Argument name -> value.
+        :rtype: Dict[str, Any]
+        """
+        return {name: getattr(self, self._param_attributes.get(name, name)) for name in self._get_param_names()}
+
+    def set_params(self, **params) -> "ParamsMixin":
+        """
+        Set constructor arguments, validated as the constructor does. Fitted statistics are kept.
+
+        :return: This object.
+        :raises ValueError: An argument the constructor does not take.
+        """
+        names = self._get_param_names()
+        unknown = [name for name in params if name not in names]
+
+        if unknown:
+            raise ValueError(f"Invalid parameter(s) {unknown} for {self.__class__.__name__}. Valid parameters are: {names}.")
+
+        # Built once with every argument, so invalid values raise as in the constructor.
+        validated = self.__class__(**dict(self.get_params(), **params))
+
+        for name in params:
+            attribute = self._param_attributes.get(name, name)
+            setattr(self, attribute, getattr(validated, attribute))
+
+        return self
@@ -0,0 +1,60 @@
+"""
+Saving and loading fitted detectors.
+
+Detectors are stored with ``pickle`` inside a small envelope that names the
+format and its version, so a file that is not a saved detector is rejected
+with a clear error. Files are written to a temporary file in the same
+directory and moved into place with ``os.replace``; readers never see a
+half-written file, and a running service can pick up a new version by
+reloading the path.
+
+Only load files you trust: unpickling can execute arbitrary code.
+"""
+
+import os
+import pickle
+import tempfile
+
+from typing import Any, Union
+
+FORMAT = "outlipy.detector"
+VERSION = 1
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+
+def save(obj: Any, path: PathLike):
+    """
+    Atomically write ``obj`` to ``path``.
+    """
+    path = os.fspath(path)
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temporary = tempfile.mkstemp(dir = directory, prefix = ".outlipy-", suffix = ".tmp")
+
+    try:
+        with os.fdopen(fd, "wb") as file:
+            pickle.dump({"format": FORMAT, "version": VERSION, "object": obj}, file, protocol = pickle.HIGHEST_PROTOCOL)
+
+        os.replace(temporary, path)
+    except BaseException:
+        if os.path.exists(temporary):
+            os.unlink(temporary)
+        raise
+
+
+def load(path: PathLike) -> Any:
+    """
+    Read an object written by ``save``.
+
+    :raises ValueError: The file is not a saved detector, or was saved by a newer version.
+    """
+    with open(os.fspath(path), "rb") as file:
+        envelope = pickle.load(file)
+
+    if not isinstance(envelope, dict) or envelope.get("format") != FORMAT:
+        raise ValueError(f"{os.fspath(path)!r} is not a saved outlipy detector.")
+
+    if envelope.get("version", 0) > VERSION:
+        raise ValueError(f"{os.fspath(path)!r} was saved by a newer outlipy version (format {envelope['version']}).")
+
+    return envelope["object"]
@@ -0,0 +1,108 @@
+"""
+Row sampling for fitting on a subset of a large input.
+
+A sample is either a fixed number of rows (``int``) or a fraction of the rows
+(``float`` in (0, 1]). Streams of unknown length are sampled with a
+reservoir, which keeps a uniform sample of fixed size in one pass.
+"""
+
+import numpy as np
+
+from typing import Optional, Union
+
+Sample = Union[int, float]
+
+
+def is_valid_sample(sample: Optional[Sample]) -> bool:
+    """
+    True for None, a positive row count or a fraction in (0, 1].
+    """
+    if sample is None:
+        return True
+
+    if isinstance(sample, bool):
+        return False
+
+    if isinstance(sample, int):
+        return sample >= 1
+
+    return isinstance(sample, float) and 0 < sample <= 1
+
+
+def sample_size(sample: Sample, n_rows: int) -> int:
+    """
+    Number of rows a sample setting selects out of ``n_rows``.
+    """
+    if isinstance(sample, float):
+        return min(n_rows, max(1, round(sample * n_rows)))
+
+    return min(n_rows, sample)
+
+
+def sample_rows(n_rows: int, sample: Optional[Sample], rng: np.random.Generator) -> Optional[np.ndarray]:
+    """
+    Sorted positions of a uniform sample without replacement, or None when every row is used.
+
+    Sorted positions keep the reads of the sampled rows sequential.
+    """
+    if sample is None:
+        return None
+
+    size = sample_size(sample, n_rows)
+
+    if size >= n_rows:
+        return None
+
+    return np.sort(rng.choice(n_rows, size, replace = False))
+
+
+class Reservoir:
+    """
+    Uniform sample of ``size`` rows of a stream of row blocks (reservoir sampling).
+
+    Every row seen so far is in the reservoir with the same probability
+    ``size / seen``. Blocks are processed with vectorized draws: row ``i``
+    (counting from 0) replaces a random slot with probability ``size / (i + 1)``.
+
+    Attributes:
+        size (int): Capacity of the reservoir.
+        seen (int): Rows offered so far.
+    """
+
+    def __init__(self, size: int, n_columns: int, rng: np.random.Generator):
+        self.size = size
+        self.seen = 0
+        self._rows = np.empty((size, n_columns), dtype = np.float64)
+        self._rng = rng
+
+    def add(self, block: np.ndarray):
+        """
+        Offer the rows of a 2-D block.
+        """
+        filled = min(self.seen, self.size)
+
+        # Fill the free slots first.
+        free = min(self.size - filled, len(block))
+        self._rows[filled:filled + free] = block[:free]
+
+        rest = block[free:]
+        positions = self.seen + free + np.arange(len(rest))
+        self.seen += len(block)
+
+        if not len(rest):
+            return
+
+        slots = self._rng.integers(0, positions + 1)
+        accepted = np.flatnonzero(slots < self.size)
+
+        # A slot hit twice in the block keeps the later row.
+        slots = slots[accepted][::-1]
+        slots, first = np.unique(slots, return_index = True)
+        self._rows[slots] = rest[accepted[::-1][first]]
+
+    @property
+    def rows(self) -> np.ndarray:
+        """
+        The sampled rows.
+        """
+        return self._rows[:min(self.seen, self.size)]
@@ -0,0 +1,136 @@
+"""
+Fitted statistics in a memory-mapped file shared by several processes.
+
+The statistics of a univariate detector are one float64 matrix (a row per
+column, a column per statistic). ``publish`` writes it after a small pickled
+header to a single file; ``attach`` maps the matrix read-only with
+``np.memmap``, so every process attached to the same file reads the same
+pages of the OS page cache: one physical copy, and attaching costs a header
+read however many columns the model has.
+
+A new model version is published to a temporary file and moved over the old
+one with ``os.replace``. Processes still mapping the old file keep reading it
+until they call ``refresh``; nobody ever sees a half-written file.
+
+Layout: magic (8 bytes), header length (uint64, little endian), pickled
+header, zero padding to a multiple of 64 bytes, the matrix (C order).
+"""
+
+import os
+import pickle
+import struct
+import tempfile
+
+import numpy as np
+
+from typing import Any, Dict, Iterator, List, Mapping, Tuple
+
+MAGIC = b"OUTLIPY1"
+ALIGNMENT = 64
+
+
+def publish(path, header: Dict[str, Any], matrix: np.ndarray):
+    """
+    Atomically write ``header`` and the float64 ``matrix`` to ``path``.
+    """
+    path = os.fspath(path)
+    header = dict(header, shape = matrix.shape)
+    payload = pickle.dumps(header, protocol = pickle.HIGHEST_PROTOCOL)
+    prefix = MAGIC + struct.pack("<Q", len(payload)) + payload
+    prefix += b"\0" * (-len(prefix) % ALIGNMENT)
+
+    fd, temporary = tempfile.mkstemp(dir = os.path.dirname(os.path.abspath(path)), prefix = ".outlipy-", suffix = ".tmp")
+
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(prefix)
+            file.write(np.ascontiguousarray(matrix, dtype = np.float64).tobytes())
+
+        os.replace(temporary, path)
+    except BaseException:
+        if os.path.exists(temporary):
+            os.unlink(temporary)
+        raise
+
+
+def attach(path) -> Tuple[Dict[str, Any], np.ndarray, Tuple[int, int, int]]:
+    """
+    Header, read-only mapped matrix and version signature of a published file.
+
+    The signature (inode, size, modification time) changes whenever the file is replaced.
+    """
+    path = os.fspath(path)
+
+    with open(path, "rb") as file:
+        if file.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path!r} is not a published outlipy statistics file.")
+
+        (length,) = struct.unpack("<Q", file.read(8))
+        header = pickle.loads(file.read(length))
+        signature = _signature(os.fstat(file.fileno()))
+
+        offset = len(MAGIC) + 8 + length
+        offset += -offset % ALIGNMENT
+        shape = header["shape"]
+
+        # Mapped from the open file, not the path: a version published meanwhile
+        # replaces the path, and its matrix must not be paired with this header.
+        if shape[0] * shape[1] == 0:
+            matrix = np.empty(shape, dtype = np.float64)
+        else:
+            matrix = np.memmap(file, dtype = np.float64, mode = "r", offset = offset, shape = shape)
+
+    return header, matrix, signature
+
+
+def signature(path) -> Tuple[int, int, int]:
+    return _signature(os.stat(os.fspath(path)))
+
+
+def _signature(status: os.stat_result) -> Tuple[int, int, int]:
+    return status.st_ino, status.st_size, status.st_mtime_ns
+
+
+class SharedScores(Mapping):
+    """
+    Read-only ``{column: {statistic: value}}`` view of a mapped statistics matrix.
+
+    The per-column mappings are created on access and read the mapped matrix;
+    nothing is copied into the process.
+    """
+
+    def __init__(self, columns: List[Any], stat_names: List[str], matrix: np.ndarray):
+        self._positions = {col: i for i, col in enumerate(columns)}
+        self._stats = {name: j for j, name in enumerate(stat_names)}
+        self.matrix = matrix
+
+    def __getitem__(self, col) -> "_SharedRow":
+        return _SharedRow(self.matrix, self._positions[col], self._stats)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._positions)
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+
+class _SharedRow(Mapping):
+    """
+    The statistics of one column, read from the mapped matrix.
+    """
+
+    __slots__ = ("_matrix", "_row", "_stats")
+
+    def __init__(self, matrix: np.ndarray, row: int, stats: Dict[str, int]):
+        self._matrix = matrix
+        self._row = row
+        self._stats = stats
+
+    def __getitem__(self, name: str) -> float:
+        return float(self._matrix[self._row, self._stats[name]])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._stats)
+
+    def __len__(self) -> int:
+        return len(self._stats)
@@ -0,0 +1,117 @@
+"""
+Mergeable summaries of a column, for refitting on appended rows.
+
+A summary is built from a batch of values and merged with the summary of
+another batch; merging costs the size of the summaries, not of the rows they
+were built from. ``decay`` in (0, 1] down-weights the older summary at every
+merge, so the statistics follow a drifting column.
+
+- ``Moments``: count, mean and variance, merged exactly (Chan et al.).
+- ``QuantileSketch``: weighted sorted points. Exact up to ``size`` points;
+  larger inputs are compressed to ``size`` equal-weight points on an even
+  quantile grid, which keeps the minimum, the maximum and the quantile
+  function at the grid points.
+"""
+
+import numpy as np
+
+from . import stats
+
+
+class Moments:
+    """
+    Weighted count, mean and population variance of a column.
+
+    Attributes:
+        count (float): Weight of the summarized values (the row count without decay).
+        mean (float): Mean of the values.
+        variance (float): Population variance of the values (ddof = 0).
+    """
+
+    def __init__(self, count: float, mean: float, variance: float):
+        self.count = float(count)
+        self.mean = float(mean)
+        self.variance = float(variance)
+
+    def __repr__(self):
+        return f"Moments(count={self.count}, mean={self.mean}, variance={self.variance})"
+
+    def merge(self, other: "Moments", decay: float = 1.0) -> "Moments":
+        """
+        Moments of the values of both summaries, the values of ``self`` weighted by ``decay``.
+        """
+        n_a = self.count * decay
+
+        if n_a == 0:
+            return other
+
+        if other.count == 0:
+            return Moments(n_a, self.mean, self.variance)
+
+        n = n_a + other.count
+        delta = other.mean - self.mean
+        m2 = self.variance * n_a + other.variance * other.count + delta * delta * (n_a * other.count / n)
+
+        return Moments(n, self.mean + delta * (other.count / n), m2 / n)
+
+    @property
+    def std(self) -> float:
+        return float(np.sqrt(self.variance))
+
+
+class QuantileSketch:
+    """
+    Sorted points with weights approximating the distribution of a column.
+
+    Attributes:
+        points (np.ndarray): The points in ascending order (float64).
+        weights (np.ndarray): The weight of every point.
+        size (int): Largest number of points kept after a merge.
+    """
+
+    def __init__(self, points: np.ndarray, weights: np.ndarray, size: int = 2 ** 13):
+        self.points = points
+        self.weights = weights
+        self.size = size
+
+        if len(points) > size:
+            self._compress()
+
+    def __repr__(self):
+        return f"QuantileSketch(points={len(self.points)}, weight={self.weight})"
+
+    @classmethod
+    def from_values(cls, values: np.ndarray, weight: float = 1.0, size: int = 2 ** 13) -> "QuantileSketch":
+        """
+        Sketch of the (NaN-free) values, each counting ``weight`` times.
+        """
+        points = np.sort(np.asarray(values, dtype = np.float64))
+
+        return cls(points, np.full(len(points), float(weight)), size)
+
+    @property
+    def weight(self) -> float:
+        return float(self.weights.sum())
+
+    def merge(self, other: "QuantileSketch", decay: float = 1.0) -> "QuantileSketch":
+        """
+        Sketch of the values of both sketches, the values of ``self`` weighted by ``decay``.
+        """
+        points = np.concatenate([self.points, other.points])
+        weights = np.concatenate([self.weights * decay, other.weights])
+        order = np.argsort(points, kind = "stable")
+
+        return QuantileSketch(points[order], weights[order], self.size)
+
+    def quantile(self, q):
+        """
+        Linear-interpolated quantile(s); equal to ``np.quantile`` while the sketch is exact.
+        """
+        return stats.weighted_quantile(self.points, self.weights, q)
+
+    def _compress(self):
+        grid = np.linspace(0.0, 1.0, self.size)
+        total = self.weight
+
+        self.points = stats.weighted_quantile(self.points, self.weights, grid)
+        self.weights = np.full(self.size, total / self.size)
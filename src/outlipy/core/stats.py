@@ -0,0 +1,229 @@
+"""
+Column reductions used by the detectors.
+
+Each function accepts a 1-D NumPy array or an Arrow array and dispatches to
+NumPy or to ``pyarrow.compute`` so Arrow columns are reduced chunk by chunk
+instead of being converted first. Sums always accumulate in float64, also for
+float32 columns.
+"""
+
+import math
+import numpy as np
+
+from typing import Any, List, Optional, Tuple, Union
+
+from . import arrow
+
+
+def _accumulator(values: np.ndarray) -> Optional[type]:
+    """
+    float64 for narrower float columns; None where NumPy already accumulates in
+    float64 (float64 and integer input), which keeps its faster default path.
+    """
+    if values.dtype.kind == "f" and values.dtype.itemsize < 8:
+        return np.float64
+
+    return None
+
+
+def quantile(values: Any, q: Union[float, List[float]]) -> Union[float, np.ndarray]:
+    """
+    Linear-interpolated quantile(s) of ``values``.
+    """
+    if isinstance(values, np.ndarray):
+        return np.quantile(values, q)
+
+    return arrow.quantile(values, q)
+
+
+def median(values: Any) -> float:
+    if isinstance(values, np.ndarray):
+        return np.median(values)
+
+    return arrow.quantile(values, 0.5)
+
+
+def mean(values: Any) -> float:
+    if isinstance(values, np.ndarray):
+        return np.mean(values, dtype = _accumulator(values))
+
+    return arrow.mean(values)
+
+
+def std(values: Any) -> float:
+    """
+    Population standard deviation (ddof = 0).
+    """
+    if isinstance(values, np.ndarray):
+        return np.std(values, dtype = _accumulator(values))
+
+    return arrow.std(values)
+
+
+def abs_deviation(values: Any, center: float, dtype: Optional[np.dtype] = None) -> Any:
+    """
+    ``|values - center|`` in the same container type as ``values``.
+
+    For NumPy input the result is a single buffer of ``dtype`` (default: NumPy
+    promotion), integer columns are cast while subtracting.
+    """
+    if isinstance(values, np.ndarray):
+        deviation = np.subtract(values, center, dtype = dtype)
+        return np.abs(deviation, out = deviation)
+
+    return arrow.abs_deviation(values, center)
+
+
+def drop_nan(values: Any) -> Any:
+    """
+    ``values`` without NaN (and Arrow nulls).
+
+    Returns the input itself when nothing is missing, so columns without NaN
+    are never copied.
+    """
+    if isinstance(values, np.ndarray):
+        if values.dtype.kind != "f":
+            return values
+
+        missing = np.isnan(values)
+
+        return values[~missing] if missing.any() else values
+
+    return arrow.drop_missing(values)
+
+
+def weighted_quantile(points: np.ndarray, weights: np.ndarray, q: Union[float, List[float], np.ndarray]) -> Union[float, np.ndarray]:
+    """
+    Linear-interpolated quantile(s) of sorted ``points`` with positive ``weights``.
+
+    Point ``i`` sits at ``(C_i - (w_i + w_0) / 2) / (W - (w_0 + w_last) / 2)``
+    on the quantile axis (``C_i`` the cumulative weight, ``W`` the total), so
+    the first point is quantile 0, the last is quantile 1 and unit weights give
+    the same result as ``np.quantile``.
+    """
+    if len(points) == 1:
+        return points[0] if np.ndim(q) == 0 else np.full(np.shape(q), points[0])
+
+    cumulative = np.cumsum(weights)
+    positions = (cumulative - (weights + weights[0]) / 2) / (cumulative[-1] - (weights[0] + weights[-1]) / 2)
+
+    return np.interp(q, positions, points)
+
+
+# ---------------------------------------------------------------
+#                   Mergeable multivariate moments
+# ---------------------------------------------------------------
+
+def block_scatter(block: np.ndarray) -> Tuple[int, np.ndarray, np.ndarray]:
+    """
+    Row count, mean vector and scatter matrix ``sum((x - mean)(x - mean)^T)`` of a 2-D block.
+    """
+    n = len(block)
+    center = block.mean(axis = 0)
+    centered = block - center
+
+    return n, center, centered.T @ centered
+
+
+def merge_scatter(
+        n_a: int, mean_a: np.ndarray, scatter_a: np.ndarray,
+        n_b: int, mean_b: np.ndarray, scatter_b: np.ndarray
+) -> Tuple[int, np.ndarray, np.ndarray]:
+    """
+    Combine the moments of two row sets (Chan et al. pairwise update).
+
+    Merging per-block moments this way is as accurate as a two-pass
+    computation over all rows, without holding them in memory.
+    """
+    if n_a == 0:
+        return n_b, mean_b, scatter_b
+
+    if n_b == 0:
+        return n_a, mean_a, scatter_a
+
+    n = n_a + n_b
+    delta = mean_b - mean_a
+
+    return n, mean_a + delta * (n_b / n), scatter_a + scatter_b + np.outer(delta, delta) * (n_a * n_b / n)
+
+
+# ---------------------------------------------------------------
+#                       Chi-square quantile
+# ---------------------------------------------------------------
+
+def _gammainc_lower(a: float, x: float) -> float:
+    """
+    Regularized lower incomplete gamma function P(a, x).
+
+    Series expansion below ``a + 1``, Lentz continued fraction above.
+    """
+    if x <= 0:
+        return 0.0
+
+    log_prefix = a * math.log(x) - x - math.lgamma(a)
+
+    if x < a + 1:
+        term = total = 1.0 / a
+        n = a
+
+        for _ in range(1000):
+            n += 1
+            term *= x / n
+            total += term
+
+            if abs(term) < abs(total) * 1e-15:
+                break
+
+        return min(1.0, total * math.exp(log_prefix))
+
+    tiny = 1e-300
+    b = x + 1 - a
+    c = 1 / tiny
+    d = 1 / b
+    h = d
+
+    for i in range(1, 1000):
+        an = -i * (i - a)
+        b += 2
+        d = an * d + b
+        d = tiny if abs(d) < tiny else d
+        c = b + an / c
+        c = tiny if abs(c) < tiny else c
+        d = 1 / d
+        step = d * c
+        h *= step
+
+        if abs(step - 1) < 1e-15:
+            break
+
+    return max(0.0, 1.0 - math.exp(log_prefix) * h)
+
+
+def chi2_ppf(q: float, df: int) -> float:
+    """
+    Quantile of the chi-square distribution with ``df`` degrees of freedom.
+
+    Solved by bisection on the regularized incomplete gamma function, so it
+    needs no SciPy and is accurate to float64 precision.
+    """
+    if not 0 < q < 1:
+        raise ValueError(f"q must be in (0, 1), got {q}")
+
+    half = df / 2
+    low, high = 0.0, max(1.0, float(df))
+
+    while _gammainc_lower(half, high / 2) < q:
+        low, high = high, high * 2
+
+    for _ in range(200):
+        mid = (low + high) / 2
+
+        if _gammainc_lower(half, mid / 2) < q:
+            low = mid
+        else:
+            high = mid
+
+        if high - low <= 1e-12 * high:
+            break
+
+    return (low + high) / 2
@@ -1,13 +1,55 @@
-from .base import OutlierDetectorBase
-from .iqr import IQRDetector
-from .zscore import ZScoreDetector
-from .mad import MADDetector
-from .percentile import PercentileDetector
+from typing import TYPE_CHECKING
+
+from ..core.lazy import lazy_attributes
+
+# Submodules are imported on first access, see outlipy.core.lazy.
+__getattr__, __dir__ = lazy_attributes(__name__, {
+    "OutlierDetectorBase": ".base",
+    "UnivariateDetectorBase": ".base",
+    "MultivariateDetectorBase": ".base",
+    "IQRDetector": ".iqr",
+    "ZScoreDetector": ".zscore",
+    "MADDetector": ".mad",
+    "PercentileDetector": ".percentile",
+    "MahalanobisDetector": ".mahalanobis",
+    "IsolationForestDetector": ".isolation_forest",
+    "HBOSDetector": ".hbos",
+    "ECODDetector": ".ecod",
+    "KNNDetector": ".knn",
+    "LOFDetector": ".lof",
+    "SweepResult": ".sweep",
+    "DriftMonitor": ".drift",
+})
+
+if TYPE_CHECKING:
+    from .base import OutlierDetectorBase, UnivariateDetectorBase, MultivariateDetectorBase
+    from .iqr import IQRDetector
+    from .zscore import ZScoreDetector
+    from .mad import MADDetector
+    from .percentile import PercentileDetector
+    from .mahalanobis import MahalanobisDetector
+    from .isolation_forest import IsolationForestDetector
+    from .hbos import HBOSDetector
+    from .ecod import ECODDetector
+    from .knn import KNNDetector
+    from .lof import LOFDetector
+    from .sweep import SweepResult
+    from .drift import DriftMonitor
 
 __all__ = [
     "OutlierDetectorBase",
+    "UnivariateDetectorBase",
+    "MultivariateDetectorBase",
     "IQRDetector",
     "ZScoreDetector",
     "MADDetector",
-    "PercentileDetector"
-]
\ No newline at end of file
+    "PercentileDetector",
+    "MahalanobisDetector",
+    "IsolationForestDetector",
+    "HBOSDetector",
+    "ECODDetector",
+    "KNNDetector",
+    "LOFDetector",
+    "SweepResult",
+    "DriftMonitor"
+]
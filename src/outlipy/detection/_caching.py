@@ -0,0 +1,97 @@
+"""
+Disk-cache hooks of the detectors (see ``outlipy.core.cache``).
+"""
+
+import numpy as np
+import pandas as pd
+
+from typing import Any, Callable, Dict, Union
+
+from ..core import cache
+from ..core.instrumentation import stage
+
+
+class CachingMixin:
+    """
+    Fits restored from, and masks read from, the active disk cache.
+
+    ``fit`` calls ``_fit_cached`` after validating the input; ``detect`` passes
+    its mask computation to ``_cached_mask``.
+    """
+
+    # Whether ``fit`` restores the state of an identical cached fit (see outlipy.core.cache).
+    # Row detectors keep models besides their statistics and only cache their masks.
+    _cache_fits = False
+
+    def _fit_cached(self, df: Union[pd.DataFrame, np.ndarray]):
+        """
+        ``_compute_scores``, or the state of a cached fit of the same data, class and parameters.
+        """
+        disk = cache.get_cache()
+        self._cache_key = None
+
+        # Same data, class and parameters as a cached fit: restore its state instead of fitting.
+        # Row detectors only need the key to cache their masks.
+        if disk is not None and (self._cache_fits or disk.masks) and self._deterministic():
+            with stage(self, "fingerprint", df, len(self.columns)):
+                key = disk.fit_key(self, self.columns, lambda col: self._column_values(df, col))
+
+            state = disk.get(key) if self._cache_fits else None
+
+            if state is not None:
+                self._restore_state(state)
+            else:
+                with stage(self, "fit", df, len(self.columns)):
+                    self._compute_scores(df)
+
+                if self._cache_fits:
+                    disk.put(key, self._fitted_state())
+
+            self._cache_key = key
+        else:
+            with stage(self, "fit", df, len(self.columns) if self.columns is not None else None):
+                self._compute_scores(df)
+
+    def _deterministic(self) -> bool:
+        """
+        True when fitting the same data twice gives the same state, so the fit can be cached.
+        Detectors drawing random numbers need a ``random_state``.
+        """
+        return getattr(self, "random_state", None) is not None or not hasattr(self, "random_state")
+
+    def _fitted_state(self) -> Dict[str, Any]:
+        """
+        The fitted state stored by the cache when ``_cache_fits`` is set, restored with ``_restore_state``.
+        Detectors keeping more than ``self._scores`` extend both.
+        """
+        return {"scores": self._scores}
+
+    def _restore_state(self, state: Dict[str, Any]):
+        """
+        Restore a state returned by ``_fitted_state``.
+        """
+        self._scores = state["scores"]
+
+    def _cached_mask(self, df: Union[pd.DataFrame, np.ndarray], compute: Callable[[], np.ndarray]) -> np.ndarray:
+        """
+        The mask of ``df`` from the cache when mask caching is on and the detector
+        was fitted with caching on; otherwise (and on a miss) ``compute()``.
+        """
+        disk = cache.get_cache()
+        fit_key = getattr(self, "_cache_key", None)
+
+        if disk is None or not disk.masks or fit_key is None:
+            return compute()
+
+        with stage(self, "fingerprint", df, len(self.columns)):
+            key = disk.mask_key(self, fit_key, self.columns, lambda col: self._column_values(df, col))
+
+        packed = disk.get(key)
+
+        if packed is not None:
+            return cache.unpack_mask(packed)
+
+        mask = compute()
+        disk.put(key, cache.pack_mask(mask))
+
+        return mask
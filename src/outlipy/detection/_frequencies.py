@@ -0,0 +1,50 @@
+"""
+Low-cardinality fits of the univariate detectors, from frequency tables.
+"""
+
+import numpy as np
+
+from typing import Any, Dict, Optional
+
+from ..core.frequency import FrequencyTable
+from ..exceptions import ConfigurationException
+
+
+class FrequencyMixin:
+    """
+    With ``max_cardinality`` set, NumPy columns with at most that many distinct
+    values are reduced to their frequency table (distinct values and counts)
+    and fitted from it with ``_fit_frequencies``; threshold sweeps and the
+    bootstrap of ``confidence_intervals`` then also work on the table.
+    """
+
+    def _fit_prepared(self, values) -> Dict[str, Any]:
+        table = self._frequencies(values)
+
+        return self._fit_frequencies(table) if table is not None else self._fit_column(values)
+
+    def _frequencies(self, values) -> Optional[FrequencyTable]:
+        """
+        Frequency table of a NumPy column with at most ``max_cardinality`` distinct values, else None.
+        """
+        if self.max_cardinality is None or not isinstance(values, np.ndarray):
+            return None
+
+        return FrequencyTable.from_values(values, self.max_cardinality)
+
+    def _fit_frequencies(self, table: FrequencyTable) -> Dict[str, Any]:
+        """
+        The statistics of a single column computed from its frequency table.
+        Only needed with ``max_cardinality``.
+
+        :param table: The distinct values of the column and their counts.
+        :type table: FrequencyTable
+        :return: The statistics stored in ``self._scores`` for that column.
+        :rtype: Dict[str, Any]
+        """
+        raise ConfigurationException(
+            error_code = "CON003",
+            method = self.__class__.__name__,
+            typed_method = "low-cardinality fit",
+            suggestion = "Frequency-table fits are supported by the IQR, Z-score, MAD and percentile detectors."
+        )
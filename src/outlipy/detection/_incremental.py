@@ -0,0 +1,130 @@
+"""
+Incremental fits of the univariate detectors: mergeable summaries and ``update``.
+"""
+
+import numpy as np
+import pandas as pd
+
+from typing import Any, Dict, Optional, Union
+
+from ..core import stats
+from ..core.sketch import QuantileSketch
+from ..core.instrumentation import stage
+from ..exceptions import ConfigurationException
+
+
+class IncrementalMixin:
+    """
+    With ``incremental=True`` the fit also keeps a mergeable summary of every
+    column, and ``update`` refits on appended rows from it.
+
+    Detectors supporting updates implement ``_state_scores``, and ``_column_state``
+    when a quantile sketch is not the summary they need.
+    """
+
+    def update(self, df: Union[pd.DataFrame, np.ndarray], decay: float = 1.0):
+        """
+        Refit on appended rows without revisiting the rows fitted before.
+
+        The summary of the new rows is merged into the summary kept by the
+        previous fit or update, and the statistics are recomputed from it.
+        With ``decay < 1`` the earlier rows count ``decay`` times less at every
+        update; for batches arriving at irregular times use e.g.
+        ``decay = 0.5 ** (elapsed / half_life)``.
+
+        :param df: The appended rows, with the fitted columns.
+        :type df: Union[pd.DataFrame, np.ndarray]
+        :param decay: Weight of the earlier rows relative to the new ones, in (0, 1].
+        :type decay: float
+        """
+
+        if not self._fitted or not self._states:
+            raise ConfigurationException(
+                error_code = "CON001",
+                method = self.__class__.__name__,
+                parameter = "incremental",
+                suggestion = "Updates need an incremental fit: set incremental = True and call fit or fit_stream first."
+            )
+
+        if isinstance(decay, bool) or not isinstance(decay, (int, float)) or not 0 < decay <= 1:
+            raise ConfigurationException(
+                error_code = "CON002",
+                method = self.__class__.__name__,
+                parameter_context = "decay",
+                suggestion = "Ensure 0.0 < decay <= 1.0; 1.0 keeps every row at full weight."
+            )
+
+        self._validate_input(df)
+
+        with stage(self, "update", df, len(self.columns)):
+            states, scores = {}, {}
+
+            for col in self.columns:
+                values = self._column_values(df, col)
+
+                if self.nan_policy == "omit":
+                    values = stats.drop_nan(values)
+
+                state = self._states[col]
+
+                if len(values):
+                    state = state.merge(self._column_state(values, 1.0), decay)
+
+                states[col] = state
+                scores[col] = self._state_scores(state)
+
+        # Only replace the statistics once every column refitted.
+        self._states.update(states)
+        self._scores.update(scores)
+        self._samples = {}
+        self._cache_key = None
+
+        return self
+
+    def _fit_tracked(self, values, col, weight: float) -> Dict[str, Any]:
+        """
+        ``_fit_values``, also keeping the summary of the column when the fit is incremental.
+        """
+        values = self._prepared(values, col)
+        scores = self._fit_prepared(values)
+
+        if self.incremental:
+            self._states[col] = self._column_state(values, weight, scores)
+
+        return scores
+
+    def _column_state(self, values, weight: float, scores: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Mergeable summary of the (NaN-free) values of a column. Only needed for ``update``.
+
+        The default is a quantile sketch of the values.
+
+        :param values: The 1-D column values (NumPy or Arrow array).
+        :type values: Union[np.ndarray, pyarrow.ChunkedArray]
+        :param weight: Rows represented by every value (above 1 for a sampled fit).
+        :type weight: float
+        :param scores: The statistics fitted on these values, if any.
+        :type scores: Optional[Dict[str, Any]]
+        :return: A summary with a ``merge(other, decay)`` method.
+        :rtype: Any
+        """
+        if not isinstance(values, np.ndarray):
+            values = np.concatenate([np.empty(0)] + list(self._iter_chunks(values)))
+
+        return QuantileSketch.from_values(values, weight)
+
+    def _state_scores(self, state: Any) -> Dict[str, Any]:
+        """
+        The statistics of a column computed from its merged summary. Only needed for ``update``.
+
+        :param state: The summary built by ``_column_state`` and merged by ``update``.
+        :type state: Any
+        :return: The statistics stored in ``self._scores`` for that column.
+        :rtype: Dict[str, Any]
+        """
+        raise ConfigurationException(
+            error_code = "CON003",
+            method = self.__class__.__name__,
+            typed_method = "incremental update",
+            suggestion = "Incremental updates are supported by the IQR, Z-score, MAD and percentile detectors."
+        )
@@ -0,0 +1,163 @@
+"""
+Sampled fits of the univariate detectors: ``fit_stream`` and ``confidence_intervals``.
+"""
+
+import numpy as np
+import pandas as pd
+
+from typing import Any, Dict, Iterable, Tuple, Union
+
+from ..core import sampling
+from ..core.instrumentation import stage
+from ..exceptions import ConfigurationException, DetectionException
+
+
+class SamplingMixin:
+    """
+    Fits on a uniform sample of the rows (``sample``) and bootstrap intervals of their bounds.
+
+    ``fit`` samples the rows in ``_compute_scores``; ``fit_stream`` keeps a
+    reservoir sample of a stream of chunks. ``confidence_intervals`` needs
+    ``_bounds`` from the detector.
+    """
+
+    # Bootstrap resamples used by ``confidence_intervals``.
+    n_bootstrap = 200
+
+    def fit_stream(self, chunks: Iterable[Union[pd.DataFrame, np.ndarray]]):
+        """
+        Fit on a uniform sample of ``sample`` rows of a stream of chunks, read once.
+
+        Only the reservoir of sampled rows is kept in memory, so the stream can
+        be larger than memory. The columns are fixed by the first chunk.
+
+        :param chunks: DataFrames, Arrow tables or 2-D arrays with the same columns.
+        :type chunks: Iterable[Union[pd.DataFrame, np.ndarray]]
+        """
+
+        if not isinstance(self.sample, int):
+            raise ConfigurationException(
+                error_code = "CON002",
+                method = self.__class__.__name__,
+                parameter_context = "sample",
+                suggestion = "fit_stream needs the reservoir size as a number of rows, e.g. sample = 1_000_000."
+            )
+
+        reservoir = None
+
+        for chunk in chunks:
+            self._validate_input(chunk)
+
+            if reservoir is None:
+                reservoir = sampling.Reservoir(self.sample, len(self.columns), np.random.default_rng(self.random_state))
+
+            block = np.empty((len(chunk), len(self.columns)), dtype = np.float64)
+
+            for j, col in enumerate(self.columns):
+                for start, values in self._iter_offsets(self._column_values(chunk, col)):
+                    block[start:start + len(values), j] = values
+
+            reservoir.add(block)
+
+        if reservoir is None or reservoir.seen == 0:
+            raise DetectionException(
+                error_code = "DET001",
+                method = self.__class__.__name__,
+                specific_message = "The stream did not contain any rows.",
+                suggestion = "Pass at least one non-empty chunk."
+            )
+
+        rows = reservoir.rows
+
+        with stage(self, "fit", rows, len(self.columns)):
+            self._scores = {}
+            self._states = {}
+            self._shared_path = None
+            self._cache_key = None
+            self._samples = {col: rows[:, j] for j, col in enumerate(self.columns)}
+
+            for col, values in self._samples.items():
+                self._scores[col] = self._fit_tracked(values, col, reservoir.seen / len(rows))
+
+        self._fitted = True
+        return self
+
+    def confidence_intervals(self, level: float = 0.95) -> pd.DataFrame:
+        """
+        Bootstrap confidence intervals of the fitted bounds of a sampled fit.
+
+        The sample is resampled with replacement ``n_bootstrap`` times and
+        refitted; the interval holds the central ``level`` share of the refitted
+        bounds. A wide interval means the sample is too small for stable bounds.
+
+        :param level: Confidence level, e.g. 0.95.
+        :type level: float
+        :return: One row per column with the fitted bounds, their intervals and the sample size.
+        :rtype: pd.DataFrame
+        """
+
+        if not self._fitted or not self._samples:
+            raise ConfigurationException(
+                error_code = "CON001",
+                method = self.__class__.__name__,
+                parameter = "sample",
+                suggestion = "Confidence intervals need a sampled fit: set sample = ... and call fit or fit_stream first."
+            )
+
+        if not 0 < level < 1:
+            raise ConfigurationException(
+                error_code = "CON002",
+                method = self.__class__.__name__,
+                parameter_context = "level",
+                suggestion = "Ensure 0.0 < level < 1.0, e.g. 0.95."
+            )
+
+        rng = np.random.default_rng(self.random_state)
+        tails = [(1 - level) / 2, (1 + level) / 2]
+        records = []
+
+        for col, values in self._samples.items():
+            lower, upper = self._bounds(self._scores[col])
+            table = self._frequencies(self._prepared(values, col))
+            resampled = []
+
+            for _ in range(self.n_bootstrap):
+                try:
+                    if table is not None:
+                        # Multinomial counts of the distinct values instead of resampled rows.
+                        resampled.append(self._bounds(self._fit_frequencies(table.resample(rng))))
+                    else:
+                        resampled.append(self._bounds(self._fit_values(values[rng.integers(0, len(values), len(values))], col)))
+                except DetectionException:
+                    # e.g. a resample with zero spread; it carries no bound.
+                    continue
+
+            if resampled:
+                (lower_low, upper_low), (lower_high, upper_high) = np.quantile(np.array(resampled), tails, axis = 0)
+            else:
+                lower_low = lower_high = upper_low = upper_high = np.nan
+
+            records.append({
+                "lower": lower, "lower_ci_low": lower_low, "lower_ci_high": lower_high,
+                "upper": upper, "upper_ci_low": upper_low, "upper_ci_high": upper_high,
+                "sample_size": len(values)
+            })
+
+        return pd.DataFrame(records, index = pd.Index(list(self._samples), name = "column"))
+
+    def _bounds(self, scores: Dict[str, Any]) -> Tuple[float, float]:
+        """
+        The lower and upper value bounds implied by the statistics of a column.
+        Only needed for ``confidence_intervals``.
+
+        :param scores: The statistics returned by ``_fit_column``.
+        :type scores: Dict[str, Any]
+        :return: ``(lower, upper)``; values outside are outliers.
+        :rtype: Tuple[float, float]
+        """
+        raise ConfigurationException(
+            error_code = "CON003",
+            method = self.__class__.__name__,
+            typed_method = "confidence intervals",
+            suggestion = "Bounds are defined by the IQR, Z-score, MAD and percentile detectors."
+        )
@@ -0,0 +1,107 @@
+"""
+Statistics of the univariate detectors shared between processes: ``publish``, ``attach`` and ``refresh``.
+"""
+
+import copy
+import os
+
+import numpy as np
+
+from typing import List, Tuple, TYPE_CHECKING
+
+from ..core import persistence, shared
+from ..exceptions import ConfigurationException
+
+if TYPE_CHECKING:
+    from .base import UnivariateDetectorBase
+
+
+class SharingMixin:
+    """
+    ``publish`` writes the fitted statistics to a memory-mapped file that
+    any number of processes ``attach`` to read-only, sharing one physical copy.
+    """
+
+    def publish(self, path: persistence.PathLike):
+        """
+        Write the fitted statistics to a file that other processes ``attach`` to.
+
+        The statistics are stored as one float64 matrix (a row per column)
+        after the detector settings. Publishing to the path of an attached
+        model replaces it atomically; attached detectors switch on ``refresh``.
+
+        :param path: Destination file.
+        :type path: Union[str, os.PathLike]
+        """
+
+        if not self._fitted:
+            raise ConfigurationException(
+                error_code = "CON001",
+                method = self.__class__.__name__,
+                parameter = "fit",
+                suggestion = "Fit the detector before publishing its statistics."
+            )
+
+        settings, stat_names, matrix = self._statistics()
+
+        shared.publish(path, {"detector": settings, "stats": stat_names}, matrix)
+
+    def _statistics(self) -> Tuple["UnivariateDetectorBase", List[str], np.ndarray]:
+        """
+        The settings of the fitted detector without its statistics, the statistic
+        names, and the statistics as one float64 matrix (a row per column).
+        """
+        columns = list(self.columns)
+        stat_names = list(self._scores[columns[0]]) if columns else []
+        matrix = np.array([[self._scores[col][name] for name in stat_names] for col in columns], dtype = np.float64)
+
+        # The summaries and samples are left out too.
+        settings = copy.copy(self)
+        settings.__dict__.update(_scores = {}, _samples = {}, _states = {}, _shared_path = None, _shared_signature = None)
+
+        return settings, stat_names, matrix.reshape(len(columns), len(stat_names))
+
+    @classmethod
+    def attach(cls, path: persistence.PathLike) -> "UnivariateDetectorBase":
+        """
+        A fitted detector reading the statistics published at ``path`` read-only, without copying them.
+
+        :param path: File written by ``publish``.
+        :type path: Union[str, os.PathLike]
+        :return: The detector; ``detect`` and ``sweep`` work as on the published one.
+        :rtype: UnivariateDetectorBase
+        """
+        header, matrix, signature = shared.attach(path)
+        detector = header["detector"]
+
+        if not isinstance(detector, cls):
+            raise TypeError(f"{path!r} holds a {detector.__class__.__name__}, not a {cls.__name__}.")
+
+        detector._scores = shared.SharedScores(detector.columns, header["stats"], matrix)
+        detector._shared_path = os.fspath(path)
+        detector._shared_signature = signature
+
+        return detector
+
+    def refresh(self) -> bool:
+        """
+        Switch to the latest version published at the attached path, if it was replaced.
+
+        :return: True if a new version was attached.
+        :rtype: bool
+        """
+
+        if getattr(self, "_shared_path", None) is None:
+            raise ConfigurationException(
+                error_code = "CON001",
+                method = self.__class__.__name__,
+                parameter = "attach",
+                suggestion = "Only detectors created with attach(path) can refresh."
+            )
+
+        if shared.signature(self._shared_path) == self._shared_signature:
+            return False
+
+        self.__dict__.update(type(self).attach(self._shared_path).__dict__)
+
+        return True
@@ -0,0 +1,122 @@
+"""
+Threshold sweeps of the univariate detectors.
+"""
+
+import numpy as np
+import pandas as pd
+
+from typing import Any, Dict, Iterable, Optional, Union
+
+from ..core.instrumentation import stage
+from ..exceptions import ConfigurationException
+from .sweep import SweepResult
+
+
+class SweepMixin:
+    """
+    ``sweep`` counts the outliers for many thresholds from one scoring pass.
+    Detectors supporting sweeps implement ``_score_column``.
+    """
+
+    def sweep(
+            self,
+            df: Union[pd.DataFrame, np.ndarray],
+            thresholds: Iterable[float],
+            masks: Optional[Iterable[float]] = None
+    ) -> SweepResult:
+        """
+        Count the outliers of every column for many thresholds in one pass.
+
+        The fitted statistics do not depend on the threshold, so every column is
+        scored once, the scores are sorted, and the number of scores above each
+        threshold is read with ``searchsorted``. This replaces one ``detect`` per
+        candidate threshold. The counts are those ``detect`` would give (for IQR
+        up to values lying exactly on a bound).
+
+        :param df: The DataFrame, Arrow table or 2-D array. Fitted first if the detector is not fitted yet.
+        :type df: Union[pd.DataFrame, np.ndarray]
+        :param thresholds: The thresholds to evaluate.
+        :type thresholds: Iterable[float]
+        :param masks: Thresholds (among ``thresholds``) whose full mask should also be returned.
+        :type masks: Optional[Iterable[float]]
+        :return: Counts and rates per threshold and column, plus the requested masks.
+        :rtype: SweepResult
+        """
+        thresholds = np.asarray(list(thresholds), dtype = np.float64)
+        mask_thresholds = list(masks) if masks is not None else []
+
+        if thresholds.ndim != 1 or not len(thresholds) or not np.isfinite(thresholds).all() or (thresholds < 0).any():
+            raise ConfigurationException(
+                error_code = "CON002",
+                method = self.__class__.__name__,
+                parameter_context = "thresholds",
+                suggestion = "Pass a non-empty list of finite, non-negative thresholds."
+            )
+
+        if not set(mask_thresholds) <= set(thresholds.tolist()):
+            raise ConfigurationException(
+                error_code = "CON002",
+                method = self.__class__.__name__,
+                parameter_context = "masks",
+                suggestion = "Masks can only be requested for thresholds that are also in thresholds."
+            )
+
+        if not self._fitted:
+            self.fit(df)
+
+        with stage(self, "sweep", df, len(self.columns)):
+            n_rows = len(df)
+            counts = np.empty((len(thresholds), len(self.columns)), dtype = np.int64)
+            outlier_masks = {threshold: np.empty((n_rows, len(self.columns)), dtype = bool) for threshold in mask_thresholds}
+            column_scores = np.empty(n_rows, dtype = self.dtype)
+
+            for i, col in enumerate(self.columns):
+                values = self._column_values(df, col)
+                table = self._frequencies(values)
+
+                if table is not None:
+                    # One score per distinct value, counted with the value frequencies.
+                    counts[:, i] = table.count_above(self._score_column(table.values, self._scores[col]), thresholds.astype(self.dtype))
+
+                    if not outlier_masks:
+                        continue
+
+                for start, chunk in self._iter_offsets(values):
+                    column_scores[start:start + len(chunk)] = self._score_column(chunk, self._scores[col])
+
+                for threshold, mask in outlier_masks.items():
+                    np.greater(column_scores, threshold, out = mask[:, i])
+
+                if table is not None:
+                    continue
+
+                # NaN scores sort last and are never above a threshold.
+                ordered = np.sort(column_scores)
+                n_valid = int(np.searchsorted(ordered, np.nan))
+                counts[:, i] = n_valid - np.searchsorted(ordered[:n_valid], thresholds.astype(self.dtype), side = "right")
+
+            return SweepResult(
+                thresholds = thresholds,
+                counts = pd.DataFrame(counts, index = pd.Index(thresholds, name = "threshold"), columns = list(self.columns)),
+                n_rows = n_rows,
+                masks = {threshold: self._wrap_mask(df, mask) for threshold, mask in outlier_masks.items()}
+            )
+
+    def _score_column(self, values: np.ndarray, scores: Dict[str, Any]) -> np.ndarray:
+        """
+        Threshold-free outlier score of every value: a value is an outlier when
+        its score exceeds the threshold. Only needed for ``sweep``.
+
+        :param values: The 1-D column values.
+        :type values: np.ndarray
+        :param scores: The statistics returned by ``_fit_column``.
+        :type scores: Dict[str, Any]
+        :return: One score per value, in the compute dtype.
+        :rtype: np.ndarray
+        """
+        raise ConfigurationException(
+            error_code = "CON003",
+            method = self.__class__.__name__,
+            typed_method = "threshold sweep",
+            suggestion = "Sweeps are supported by detectors whose statistics do not depend on the threshold (IQR, Z-score, MAD)."
+        )
@@ -1,30 +1,62 @@
 import pandas as pd
+import numpy as np
 
 from abc import ABC, abstractmethod
-from typing import Optional, List, Union, Tuple
+from typing import Optional, List, Union, Tuple, Dict, Any, Iterator
 
-from ..utils import validate_input
+from ..utils import validate_input, validate_dtype
+from ..core import arrow, stats, sampling, persistence
+from ..exceptions import ConfigurationException, DetectionException
+from ..core.instrumentation import stage
+from ..core.params import ParamsMixin
+from ._caching import CachingMixin
+from ._frequencies import FrequencyMixin
+from ._incremental import IncrementalMixin
+from ._sampling import SamplingMixin
+from ._sharing import SharingMixin
+from ._sweeping import SweepMixin
 
-class OutlierDetectorBase(ABC):
+class OutlierDetectorBase(CachingMixin, ParamsMixin, ABC):
     """
     Abstract base class for all Outlier Detectors in OutliPy.
 
+    Detectors accept a pandas DataFrame or a ``pyarrow.Table`` (columns given by
+    name) or a 2-D NumPy array (columns given by position). The mask is returned
+    in the same container type as the input.
+
     Attributes:
         threshold (float): Threshold for detecting outliers.
         columns (Optional[List[str]]): Columns to analyze. If None, all numeric columns are used.
+        dtype (np.dtype): Precision of the score buffers ("float32" or "float64"). Reductions
+            always accumulate in float64; "float32" halves the memory of the temporaries.
+        nan_policy (str): "raise" (default) rejects columns with NaN; "omit" fits the
+            statistics on the non-missing values and never flags a NaN as an outlier.
     """
 
     def __init__(
-            self, 
-            threshold: Union[float, Tuple[float, float]] = 3.0, 
+            self,
+            threshold: Union[float, Tuple[float, float]] = 3.0,
             columns: Optional[List[str]] = None,
-            exclude: Optional[List[str]] = None
+            exclude: Optional[List[str]] = None,
+            dtype: str = "float64",
+            nan_policy: str = "raise"
     ):
+        if nan_policy not in ("raise", "omit"):
+            raise ConfigurationException(
+                error_code = "CON002",
+                method = self.__class__.__name__,
+                parameter_context = "nan_policy",
+                suggestion = "The nan_policy must be 'raise' or 'omit'."
+            )
+
         self.threshold = threshold
         self.columns = columns
         self.exclude = exclude
+        self.dtype = validate_dtype(dtype, self.__class__.__name__)
+        self.nan_policy = nan_policy
         self._fitted = False
         self._scores = {}  # Stores computed outlier scores per column
+        self._cache_key: Optional[str] = None  # Fingerprint of the last fit, when caching is on
 
     def __repr__(self):
         return f"{self.__class__.__name__}(threshold={self.threshold}, columns={self.columns}, exclude={self.exclude})"
@@ -33,37 +65,136 @@ class OutlierDetectorBase(ABC):
         cols = self.columns if self.columns else "All numeric columns"
         return f"{self.__class__.__name__} using threshold {self.threshold} on {cols}"
 
-    def _validate_input(self, df: pd.DataFrame):
+    def save(self, path: persistence.PathLike):
+        """
+        Save the detector with its fitted statistics to a file.
+
+        The file is replaced atomically, so a process loading ``path`` never
+        reads a half-written file.
+
+        :param path: Destination file.
+        :type path: Union[str, os.PathLike]
+        """
+        persistence.save(self, path)
+
+    @classmethod
+    def load(cls, path: persistence.PathLike) -> "OutlierDetectorBase":
+        """
+        Load a detector saved with ``save``. Only load files you trust (they are pickles).
+
+        :param path: File written by ``save``.
+        :type path: Union[str, os.PathLike]
+        :return: The detector, fitted if it was fitted when saved.
+        :rtype: OutlierDetectorBase
+        """
+        detector = persistence.load(path)
+
+        if not isinstance(detector, cls):
+            raise TypeError(f"{path!r} holds a {detector.__class__.__name__}, not a {cls.__name__}.")
+
+        return detector
+
+    def _validate_input(self, df: Union[pd.DataFrame, np.ndarray]):
         """
         Check if dataframe is valid and columns exist.
-        
+
         Args:
-            df (pd.DataFrame): The DataFrame to be validated.
+            df (Union[pd.DataFrame, np.ndarray]): The DataFrame, Arrow table or 2-D array to be validated.
         """
 
         detector_name = self.__class__.__name__
         columns = self.columns
         exclude = self.exclude
 
-        validated_cols = validate_input(df, detector_name, columns, exclude)
+        with stage(self, "validate", df):
+            validated_cols = validate_input(df, detector_name, columns, exclude, allow_nan = self.nan_policy == "omit")
 
         self.columns = validated_cols
 
+    @staticmethod
+    def _column_values(df: Union[pd.DataFrame, np.ndarray], col):
+        """
+        Return the 1-D values of a column without copying where possible.
+
+        For ndarray input ``col`` is a position; slicing a Fortran-ordered array
+        or a memmap yields a view. Arrow tables and ``ArrowDtype`` columns are
+        returned as their backing ``ChunkedArray``; nullable extension columns
+        are converted to float64 with NA as NaN.
+        """
+        if isinstance(df, np.ndarray):
+            return df[:, col]
+
+        if arrow.is_arrow_table(df):
+            return df.column(col)
+
+        series = df[col]
+
+        if arrow.is_arrow_dtype(series.dtype):
+            return arrow.series_to_arrow(series)
+
+        if not isinstance(series.dtype, np.dtype):
+            return series.to_numpy(dtype = np.float64, na_value = np.nan)
+
+        return series.to_numpy()
 
-    def fit(self, df: pd.DataFrame):
+    @staticmethod
+    def _take_values(values, rows: np.ndarray) -> np.ndarray:
+        """
+        The given positions of a column (NumPy or Arrow) as a NumPy array.
+        """
+        if isinstance(values, np.ndarray):
+            return values[rows]
+
+        return np.concatenate(list(arrow.iter_numpy_chunks(values.take(rows))))
+
+    @staticmethod
+    def _iter_chunks(values) -> Iterator[np.ndarray]:
+        """
+        Yield the column values as consecutive NumPy chunks.
+        """
+        if isinstance(values, np.ndarray):
+            yield values
+        else:
+            yield from arrow.iter_numpy_chunks(values)
+
+    @classmethod
+    def _iter_offsets(cls, values) -> Iterator[Tuple[int, np.ndarray]]:
+        """
+        Yield ``(start, chunk)`` for the consecutive NumPy chunks of a column.
+        """
+        start = 0
+
+        for chunk in cls._iter_chunks(values):
+            yield start, chunk
+            start += len(chunk)
+
+    def _wrap_mask(self, df: Union[pd.DataFrame, np.ndarray], mask: np.ndarray):
+        """
+        Return the mask in the same container type as the input.
+        """
+        if isinstance(df, np.ndarray):
+            return mask
+
+        if arrow.is_arrow_table(df):
+            return arrow.table_from_mask(mask, self.columns)
+
+        return pd.DataFrame(mask, index = df.index, columns = self.columns)
+
+    def fit(self, df: Union[pd.DataFrame, np.ndarray]):
         """
         Fit detector to the dataframe. Computes any statistics required for detection.
 
         Args:
-            df (pd.DataFrame): Input DataFrame.
+            df (Union[pd.DataFrame, np.ndarray]): Input DataFrame or 2-D array.
         """
         self._validate_input(df)
-        self._compute_scores(df)
+        self._fit_cached(df)
+
         self._fitted = True
         return self
 
     @abstractmethod
-    def _compute_scores(self, df: pd.DataFrame):
+    def _compute_scores(self, df: Union[pd.DataFrame, np.ndarray]):
         """
         Compute outlier scores for the dataframe columns.
         To be implemented by each specific detector.
@@ -71,14 +202,417 @@ class OutlierDetectorBase(ABC):
         pass
 
     @abstractmethod
-    def detect(self, df: pd.DataFrame) -> pd.DataFrame:
+    def detect(self, df: Union[pd.DataFrame, np.ndarray]) -> Union[pd.DataFrame, np.ndarray]:
         """
-        Detect outliers and return a boolean DataFrame indicating outliers.
+        Detect outliers and return a boolean mask indicating outliers.
 
         Args:
-            df (pd.DataFrame): Input DataFrame
+            df (Union[pd.DataFrame, np.ndarray]): Input DataFrame or 2-D array.
 
         Returns:
-            pd.DataFrame: Boolean mask where True indicates an outlier.
+            Union[pd.DataFrame, np.ndarray]: Boolean mask where True indicates an outlier.
+        """
+        pass
+
+
+class UnivariateDetectorBase(SamplingMixin, IncrementalMixin, SweepMixin, FrequencyMixin, SharingMixin, OutlierDetectorBase):
+    """
+    Base class for detectors that score every column independently.
+
+    Subclasses only implement the per-column kernels ``_fit_column`` and
+    ``_detect_column``. ``_detect_column`` always receives a 1-D NumPy array;
+    ``_fit_column`` may also receive an Arrow array and should therefore use the
+    reductions in ``outlipy.core.stats``. The base class takes care of iterating
+    the columns and building the mask.
+
+    The optional features live in mixins, each with the hooks a detector
+    implements to support it:
+
+    - ``sample`` and ``fit_stream``, ``confidence_intervals`` (``_bounds``): ``_sampling``
+    - ``incremental`` and ``update`` (``_column_state``, ``_state_scores``): ``_incremental``
+    - ``sweep`` (``_score_column``): ``_sweeping``
+    - ``max_cardinality`` (``_fit_frequencies``): ``_frequencies``
+    - ``publish``, ``attach`` and ``refresh``: ``_sharing``
+    - ``outlipy.set_cache``: ``_caching``
+    """
+
+    _cache_fits = True
+
+    # ``_detect_column`` flags the values outside ``_bounds`` (``kernels.outside``),
+    # so a ``Plan`` may detect and replace a column in one kernel.
+    _outside_bounds = False
+
+    def __init__(
+            self,
+            threshold: Union[float, Tuple[float, float]] = 3.0,
+            columns: Optional[List[str]] = None,
+            exclude: Optional[List[str]] = None,
+            dtype: str = "float64",
+            nan_policy: str = "raise",
+            sample: Optional[sampling.Sample] = None,
+            random_state: Optional[int] = None,
+            incremental: bool = False,
+            max_cardinality: Optional[int] = None
+    ):
+        if not sampling.is_valid_sample(sample):
+            raise ConfigurationException(
+                error_code = "CON002",
+                method = self.__class__.__name__,
+                parameter_context = "sample",
+                suggestion = "Use a number of rows (e.g. 1_000_000), a fraction in (0, 1] (e.g. 0.01) or None for every row."
+            )
+
+        if max_cardinality is not None and (isinstance(max_cardinality, bool) or not isinstance(max_cardinality, int) or max_cardinality < 1):
+            raise ConfigurationException(
+                error_code = "CON002",
+                method = self.__class__.__name__,
+                parameter_context = "max_cardinality",
+                suggestion = "Use a positive number of distinct values (e.g. 256) or None to always fit on the rows."
+            )
+
+        super().__init__(
+            threshold = threshold,
+            columns = columns,
+            exclude = exclude,
+            dtype = dtype,
+            nan_policy = nan_policy
+        )
+
+        self.sample = sample
+        self.random_state = random_state
+        self.incremental = incremental
+        self.max_cardinality = max_cardinality
+        self._samples: Dict[Any, np.ndarray] = {}
+        self._states: Dict[Any, Any] = {}
+        self._shared_path: Optional[str] = None
+        self._shared_signature = None
+
+    def _compute_scores(self, df: Union[pd.DataFrame, np.ndarray], quantiles: Optional[Dict[Any, Dict[float, float]]] = None):
+        """
+        Compute the per-column statistics with ``_fit_column``.
+
+        :param df: The DataFrame or 2-D array.
+        :type df: Union[pd.DataFrame, np.ndarray]
+        :param quantiles: Precomputed ``_quantile_levels`` of some columns (column -> level -> value),
+            used instead of fitting them on the rows. Ignored for sampled and incremental fits.
+        :type quantiles: Optional[Dict[Any, Dict[float, float]]]
+        """
+
+        # If suddenly self.columns becomes None.
+        if self.columns is None:
+            raise RuntimeError("Validation was done, but self.columns remains None")
+
+        self._scores = {} # Resets scores
+        self._samples = {}
+        self._states = {}
+        self._shared_path = None
+
+        # The same rows are sampled in every column.
+        rows = sampling.sample_rows(len(df), self.sample, np.random.default_rng(self.random_state))
+
+        # Rows of the input represented by every fitted value, for the summaries.
+        weight = len(df) / len(rows) if rows is not None else 1.0
+
+        for col in self.columns:
+            if quantiles and col in quantiles and rows is None and not self.incremental:
+                self._scores[col] = self._fit_quantiles(quantiles[col])
+                continue
+
+            values = self._column_values(df, col)
+
+            if rows is not None:
+                values = self._samples[col] = self._take_values(values, rows)
+
+            self._scores[col] = self._fit_tracked(values, col, weight)
+
+    def _deterministic(self) -> bool:
+        # Only sampled fits draw random rows.
+        return self.sample is None or self.random_state is not None
+
+    def _fitted_state(self) -> Dict[str, Any]:
+        return dict(super()._fitted_state(), scores = dict(self._scores), samples = self._samples, states = self._states)
+
+    def _restore_state(self, state: Dict[str, Any]):
+        super()._restore_state(state)
+        self._samples = state["samples"]
+        self._states = state["states"]
+        self._shared_path = None
+
+    def detect(self, df: Union[pd.DataFrame, np.ndarray]) -> Union[pd.DataFrame, np.ndarray]:
+        """
+        Return a boolean mask where True marks an outlier.
+
+        :param df: The DataFrame or 2-D array.
+        :type df: Union[pd.DataFrame, np.ndarray]
+        :return: The mask where True marks an outlier, with one column per fitted column.
+        :rtype: Union[DataFrame, ndarray]
+        """
+
+        # Auto fit if it was not fitted yet.
+        if not self._fitted:
+            self.fit(df)
+
+        # if self.columns is unexpectedly become None.
+
+        if self.columns is None:
+            raise RuntimeError("Detector was fitted, but self.columns is unexpectedly None.")
+
+        with stage(self, "detect", df, len(self.columns)):
+            return self._wrap_mask(df, self._cached_mask(df, lambda: self._mask(df)))
+
+    def _mask(self, df: Union[pd.DataFrame, np.ndarray]) -> np.ndarray:
+        outlier_mask = np.empty((len(df), len(self.columns)), dtype = bool)
+
+        for i, col in enumerate(self.columns):
+            scores = self._scores[col]
+            start = 0
+
+            # Arrow columns are scored chunk by chunk, NumPy columns in one go.
+            for chunk in self._iter_chunks(self._column_values(df, col)):
+                stop = start + len(chunk)
+                outlier_mask[start:stop, i] = self._detect_column(chunk, scores)
+                start = stop
+
+        return outlier_mask
+
+    def _fit_values(self, values, col) -> Dict[str, Any]:
+        """
+        Apply the NaN policy and fit a single column with ``_fit_column``
+        (``_fit_frequencies`` for a low-cardinality column).
         """
-        pass
\ No newline at end of file
+        return self._fit_prepared(self._prepared(values, col))
+
+    def _prepared(self, values, col):
+        """
+        The column values under the NaN policy.
+
+        With ``nan_policy="omit"`` the missing values are dropped from this
+        column only (no copy when it has none). They need no special handling
+        in ``_detect_column``: every comparison with NaN is False, so missing
+        values are never flagged.
+        """
+        if self.nan_policy == "omit":
+            values = stats.drop_nan(values)
+
+            if len(values) == 0:
+                raise DetectionException(
+                    error_code = "DET001",
+                    method = self.__class__.__name__,
+                    specific_message = f"Column '{col}' only contains missing values.",
+                    suggestion = "Exclude the column or fill its missing values."
+                )
+
+        return values
+
+    @abstractmethod
+    def _fit_column(self, values) -> Dict[str, Any]:
+        """
+        Compute the statistics of a single column.
+
+        :param values: The 1-D column values (NumPy or Arrow array).
+        :type values: Union[np.ndarray, pyarrow.ChunkedArray]
+        :return: The statistics stored in ``self._scores`` for that column.
+        :rtype: Dict[str, Any]
+        """
+        pass
+
+    def _quantile_levels(self) -> Optional[List[float]]:
+        """
+        The quantile levels the statistics are computed from, for detectors
+        whose fit only needs quantiles; None otherwise. ``Plan`` computes the
+        levels of every step in one pass per column and fits with ``_fit_quantiles``.
+        """
+        return None
+
+    def _fit_quantiles(self, quantiles: Dict[float, float]) -> Dict[str, Any]:
+        """
+        The statistics of a single column from its ``_quantile_levels`` quantiles.
+
+        :param quantiles: The quantile of every level.
+        :type quantiles: Dict[float, float]
+        :return: The statistics stored in ``self._scores`` for that column.
+        :rtype: Dict[str, Any]
+        """
+        raise ConfigurationException(
+            error_code = "CON003",
+            method = self.__class__.__name__,
+            typed_method = "fit from quantiles",
+            suggestion = "Detectors fitted from quantiles return their levels from _quantile_levels (IQR, percentile)."
+        )
+
+    @abstractmethod
+    def _detect_column(self, values: np.ndarray, scores: Dict[str, Any]) -> np.ndarray:
+        """
+        Flag the outliers of a single column using its fitted statistics.
+
+        :param values: The 1-D column values.
+        :type values: np.ndarray
+        :param scores: The statistics returned by ``_fit_column``.
+        :type scores: Dict[str, Any]
+        :return: Boolean array where True marks an outlier.
+        :rtype: np.ndarray
+        """
+        pass
+
+
+class MultivariateDetectorBase(OutlierDetectorBase):
+    """
+    Base class for detectors that score whole rows instead of single columns.
+
+    Rows are read in blocks of ``block_size`` into a small 2-D matrix, so no
+    detector needs the full ``n x p`` matrix unless its fit requires it, and
+    nothing of size ``n x n`` is ever formed. Subclasses set ``self._scores["cutoff"]``
+    when fitting and implement ``_score_block``; a row is an outlier when its
+    score exceeds the cutoff. The row flag is broadcast to every fitted column
+    so the mask has the same shape as a univariate one and works with the handlers.
+
+    With ``nan_policy="omit"`` rows containing NaN are left out of the fit and
+    get a NaN score, which is never flagged.
+    """
+
+    def __init__(
+            self,
+            threshold: float,
+            columns: Optional[List[str]] = None,
+            exclude: Optional[List[str]] = None,
+            dtype: str = "float64",
+            nan_policy: str = "raise",
+            block_size: int = 65536
+    ):
+        if not isinstance(block_size, int) or block_size < 1:
+            raise ConfigurationException(
+                error_code = "CON002",
+                method = self.__class__.__name__,
+                parameter_context = "block_size",
+                suggestion = "The block_size must be a positive integer."
+            )
+
+        super().__init__(
+            threshold = threshold,
+            columns = columns,
+            exclude = exclude,
+            dtype = dtype,
+            nan_policy = nan_policy
+        )
+
+        self.block_size = block_size
+
+    @staticmethod
+    def _column_block(values, start: int, stop: int) -> np.ndarray:
+        """
+        Rows ``start:stop`` of one column as a NumPy array.
+        """
+        if isinstance(values, np.ndarray):
+            return values[start:stop]
+
+        return np.concatenate(list(arrow.iter_numpy_chunks(values.slice(start, stop - start))))
+
+    def _iter_blocks(self, df: Union[pd.DataFrame, np.ndarray], dtype: Optional[np.dtype] = None) -> Iterator[Tuple[int, int, np.ndarray]]:
+        """
+        Yield ``(start, stop, block)`` where ``block`` holds rows ``start:stop`` of the fitted columns.
+
+        :param dtype: dtype of the blocks, float64 by default.
+        """
+        if self.columns is None:
+            raise RuntimeError("Validation was done, but self.columns remains None")
+
+        values = [self._column_values(df, col) for col in self.columns]
+        n_rows = len(df)
+        dtype = np.float64 if dtype is None else dtype
+
+        for start in range(0, n_rows, self.block_size):
+            stop = min(start + self.block_size, n_rows)
+            block = np.empty((stop - start, len(values)), dtype = dtype)
+
+            for j, column in enumerate(values):
+                block[:, j] = self._column_block(column, start, stop)
+
+            yield start, stop, block
+
+    def _take_rows(self, df: Union[pd.DataFrame, np.ndarray], rows: np.ndarray) -> np.ndarray:
+        """
+        The given row positions of the fitted columns as a float64 matrix, for
+        fits that only look at a sample of the rows.
+        """
+        taken = np.empty((len(rows), len(self.columns)), dtype = np.float64)
+
+        for j, col in enumerate(self.columns):
+            taken[:, j] = self._take_values(self._column_values(df, col), rows)
+
+        return taken
+
+    def _complete_rows(self, block: np.ndarray) -> np.ndarray:
+        """
+        Drop the rows with NaN from a block when ``nan_policy="omit"``.
+        """
+        if self.nan_policy == "omit":
+            missing = np.isnan(block).any(axis = 1)
+
+            if missing.any():
+                return block[~missing]
+
+        return block
+
+    def _matrix(self, df: Union[pd.DataFrame, np.ndarray]) -> np.ndarray:
+        """
+        All fitted columns as one float64 matrix, for fits that need every row at once.
+        """
+        blocks = [self._complete_rows(block) for _, _, block in self._iter_blocks(df)]
+
+        return blocks[0] if len(blocks) == 1 else np.concatenate(blocks)
+
+    def score(self, df: Union[pd.DataFrame, np.ndarray]) -> np.ndarray:
+        """
+        Outlier score of every row; higher is more outlying.
+
+        :param df: The DataFrame, Arrow table or 2-D array.
+        :type df: Union[pd.DataFrame, np.ndarray]
+        :return: One score per row.
+        :rtype: np.ndarray
+        """
+
+        if not self._fitted:
+            self.fit(df)
+
+        scores = np.empty(len(df), dtype = np.float64)
+
+        for start, stop, block in self._iter_blocks(df, self.dtype):
+            scores[start:stop] = self._score_block(block)
+
+            if self.nan_policy == "omit":
+                scores[start:stop][np.isnan(block).any(axis = 1)] = np.nan
+
+        return scores
+
+    def detect(self, df: Union[pd.DataFrame, np.ndarray]) -> Union[pd.DataFrame, np.ndarray]:
+        """
+        Return a boolean mask where True marks an outlying row.
+
+        :param df: The DataFrame, Arrow table or 2-D array.
+        :type df: Union[pd.DataFrame, np.ndarray]
+        :return: The mask, with the row flag repeated in every fitted column.
+        :rtype: Union[DataFrame, ndarray]
+        """
+
+        if not self._fitted:
+            self.fit(df)
+
+        with stage(self, "detect", df, len(self.columns)):
+            return self._wrap_mask(df, self._cached_mask(df, lambda: self._mask(df)))
+
+    def _mask(self, df: Union[pd.DataFrame, np.ndarray]) -> np.ndarray:
+        outlying = self.score(df) > self._scores["cutoff"]
+
+        return np.repeat(outlying[:, None], len(self.columns), axis = 1)
+
+    @abstractmethod
+    def _score_block(self, block: np.ndarray) -> np.ndarray:
+        """
+        Score a block of rows.
+
+        :param block: 2-D block of the fitted columns, in the compute dtype.
+        :type block: np.ndarray
+        :return: One score per row of the block.
+        :rtype: np.ndarray
+        """
+        pass
@@ -0,0 +1,387 @@
+import pandas as pd
+import numpy as np
+
+from typing import Optional, List, Dict, Any, Union, Hashable
+
+from .base import UnivariateDetectorBase
+from ..core import stats
+from ..core.instrumentation import stage
+from ..exceptions import ConfigurationException
+
+
+class DriftMonitor:
+    """
+    Compact history of a univariate detector fitted batch after batch.
+
+    ``record(detector, df)`` stores, per column, the fitted statistics, the
+    bounds, the outlier rate and a histogram of the batch, in fixed-size
+    arrays used as a ring buffer (the oldest batch is overwritten once
+    ``capacity`` batches are stored). The histogram bin edges are the
+    quantiles of the first recorded batch, so histograms of different
+    batches are directly comparable and drift never needs the historical rows.
+
+    ``drift()`` compares the latest batch with the baseline (the first
+    recorded batch, see ``set_baseline``) or with the previous batch, for all
+    columns at once:
+
+    - ``psi``: population stability index of the histograms.
+    - ``ks``: largest distance between the binned CDFs (Kolmogorov-Smirnov
+      statistic at the bin edges, a lower bound of the exact one).
+    - ``bound_shift``: largest move of the lower or upper bound, as a share of
+      the reference bound width.
+    - ``rate_change``: change of the outlier rate.
+
+    A column is flagged as drifted when any of them exceeds its tolerance. The
+    outlier rate tolerance grows with the sampling noise of the two rates:
+    the change must exceed both ``rate_tolerance`` and ``rate_z`` binomial
+    standard errors of the difference, so small batches are not flagged
+    for the noise of a handful of rows.
+
+    Attributes:
+        capacity (int): Batches kept in the history.
+        n_bins (int): Histogram bins per column.
+        psi_threshold (float): PSI above which a column drifted (0.2 is a common choice).
+        ks_threshold (float): KS statistic above which a column drifted.
+        bound_tolerance (float): Relative bound shift above which a column drifted.
+        rate_tolerance (float): Smallest absolute outlier rate change flagged as drift.
+    """
+
+    # Floor of the bin shares in the PSI, so empty bins give a finite value.
+    epsilon = 1e-6
+
+    # Standard errors of the rate difference a change must exceed to be flagged.
+    rate_z = 3.0
+
+    def __init__(
+            self,
+            *,
+            capacity: int = 365,
+            n_bins: int = 20,
+            psi_threshold: float = 0.2,
+            ks_threshold: float = 0.1,
+            bound_tolerance: float = 0.1,
+            rate_tolerance: float = 0.01
+    ):
+        for name, value in (("capacity", capacity), ("n_bins", n_bins)):
+            if isinstance(value, bool) or not isinstance(value, int) or value < (2 if name == "n_bins" else 1):
+                raise ConfigurationException(
+                    error_code = "CON002",
+                    method = self.__class__.__name__,
+                    parameter_context = name,
+                    suggestion = f"The {name} must be a positive integer{' of at least 2' if name == 'n_bins' else ''}."
+                )
+
+        for name, value in (("psi_threshold", psi_threshold), ("ks_threshold", ks_threshold),
+                            ("bound_tolerance", bound_tolerance), ("rate_tolerance", rate_tolerance)):
+            if not isinstance(value, (int, float)) or value < 0:
+                raise ConfigurationException(
+                    error_code = "CON002",
+                    method = self.__class__.__name__,
+                    parameter_context = name,
+                    suggestion = f"The {name} must be a non-negative number."
+                )
+
+        self.capacity = capacity
+        self.n_bins = n_bins
+        self.psi_threshold = psi_threshold
+        self.ks_threshold = ks_threshold
+        self.bound_tolerance = bound_tolerance
+        self.rate_tolerance = rate_tolerance
+
+        self.columns: Optional[List[Hashable]] = None
+        self.stat_names: Optional[List[str]] = None
+        self._edges: Optional[np.ndarray] = None
+        self._recorded = 0
+        self._baseline: Optional[Dict[str, np.ndarray]] = None
+
+    def __repr__(self):
+        return f"DriftMonitor(batches={len(self)}, capacity={self.capacity}, columns={self.columns})"
+
+    def __len__(self):
+        return min(self._recorded, self.capacity)
+
+    # ------------------------------------
+    #               Recording
+    # ------------------------------------
+
+    def record(self, detector: UnivariateDetectorBase, df: Union[pd.DataFrame, np.ndarray], label: Optional[Hashable] = None):
+        """
+        Store the fitted statistics of ``detector`` and the histograms and outlier rates of ``df``.
+
+        The histograms and outlier rates are computed in one pass over ``df``.
+        Fits the detector first if it is not fitted yet.
+
+        :param detector: The fitted univariate detector (IQR, Z-score, MAD, percentile).
+        :type detector: UnivariateDetectorBase
+        :param df: The batch the detector was fitted on, or the batch to monitor.
+        :type df: Union[pd.DataFrame, np.ndarray]
+        :param label: Name of the batch, e.g. its date. Defaults to the number of recorded batches.
+        :type label: Optional[Hashable]
+        """
+
+        if not isinstance(detector, UnivariateDetectorBase):
+            raise ConfigurationException(
+                error_code = "CON002",
+                method = self.__class__.__name__,
+                parameter_context = "detector",
+                suggestion = "Drift is monitored for univariate detectors (IQR, Z-score, MAD, percentile)."
+            )
+
+        if not detector._fitted:
+            detector.fit(df)
+
+        if self.columns is None:
+            self._allocate(detector, df)
+        elif list(detector.columns) != self.columns:
+            raise ConfigurationException(
+                error_code = "CON002",
+                method = self.__class__.__name__,
+                parameter_context = "detector",
+                suggestion = f"Every recorded batch must use the columns of the first one: {self.columns}."
+            )
+
+        slot = self._recorded % self.capacity
+
+        with stage(self, "record", df, len(self.columns)):
+            for j, col in enumerate(self.columns):
+                scores = detector._scores[col]
+                self._stats[slot, j] = [float(scores.get(name, np.nan)) for name in self.stat_names]
+
+                try:
+                    self._bounds[slot, j] = detector._bounds(scores)
+                except ConfigurationException:
+                    # The detector defines no bounds.
+                    self._bounds[slot, j] = np.nan
+
+                histogram = np.zeros(self.n_bins, dtype = np.int64)
+                flagged = 0
+
+                for chunk in detector._iter_chunks(detector._column_values(df, col)):
+                    flagged += int(np.count_nonzero(detector._detect_column(chunk, scores)))
+                    chunk = stats.drop_nan(chunk)
+                    histogram += np.bincount(np.searchsorted(self._edges[j], chunk, side = "right"), minlength = self.n_bins)
+
+                self._histograms[slot, j] = histogram
+                self._rates[slot, j] = flagged / histogram.sum() if histogram.sum() else np.nan
+
+        self._labels[slot] = self._recorded if label is None else label
+        self._rows[slot] = len(df)
+        self._recorded += 1
+
+        if self._baseline is None:
+            self.set_baseline()
+
+        return self
+
+    def _allocate(self, detector: UnivariateDetectorBase, df: Union[pd.DataFrame, np.ndarray]):
+        """
+        Fix the columns, the statistic names and the bin edges from the first batch, and allocate the history.
+        """
+        self.columns = list(detector.columns)
+        self.stat_names = [name for name, value in detector._scores[self.columns[0]].items() if np.isscalar(value)]
+
+        n_columns = len(self.columns)
+        grid = np.linspace(0.0, 1.0, self.n_bins + 1)[1:-1]
+        self._edges = np.empty((n_columns, self.n_bins - 1))
+
+        for j, col in enumerate(self.columns):
+            values = stats.drop_nan(detector._column_values(df, col))
+            self._edges[j] = stats.quantile(values, grid) if len(values) else np.nan
+
+        self._stats = np.full((self.capacity, n_columns, len(self.stat_names)), np.nan)
+        self._bounds = np.full((self.capacity, n_columns, 2), np.nan)
+        self._histograms = np.zeros((self.capacity, n_columns, self.n_bins), dtype = np.int64)
+        self._rates = np.full((self.capacity, n_columns), np.nan)
+        self._rows = np.zeros(self.capacity, dtype = np.int64)
+        self._labels = np.empty(self.capacity, dtype = object)
+
+    def set_baseline(self, label: Optional[Hashable] = None):
+        """
+        Compare with this recorded batch from now on (default: the latest one).
+
+        The baseline is copied out of the history, so it stays available after
+        the ring buffer overwrote it.
+
+        :param label: Label of a stored batch.
+        :type label: Optional[Hashable]
+        """
+        slot = self._slot(label)
+
+        self._baseline = {
+            "label": self._labels[slot],
+            "bounds": self._bounds[slot].copy(),
+            "histograms": self._histograms[slot].copy(),
+            "rates": self._rates[slot].copy()
+        }
+
+        return self
+
+    def _slot(self, label: Optional[Hashable] = None) -> int:
+        if not self._recorded:
+            raise ConfigurationException(
+                error_code = "CON001",
+                method = self.__class__.__name__,
+                parameter = "record",
+                suggestion = "Record at least one batch with record(detector, df) first."
+            )
+
+        if label is None:
+            return (self._recorded - 1) % self.capacity
+
+        for slot in self._order():
+            if self._labels[slot] == label:
+                return slot
+
+        raise ConfigurationException(
+            error_code = "CON002",
+            method = self.__class__.__name__,
+            parameter_context = "label",
+            suggestion = f"No stored batch is labelled {label!r}; the history keeps the last {self.capacity} batches."
+        )
+
+    def _order(self) -> np.ndarray:
+        """
+        Slots of the stored batches, oldest first.
+        """
+        return (self._recorded - len(self) + np.arange(len(self))) % self.capacity
+
+    # ------------------------------------
+    #               Drift
+    # ------------------------------------
+
+    def drift(self, reference: str = "baseline") -> pd.DataFrame:
+        """
+        Drift of the latest batch per column.
+
+        :param reference: "baseline" (default) or "previous" (the batch recorded before the latest).
+        :type reference: str
+        :return: One row per column with psi, ks, bound_shift, outlier_rate, reference_rate, rate_change and drifted.
+        :rtype: pd.DataFrame
+        """
+
+        if reference not in ("baseline", "previous"):
+            raise ConfigurationException(
+                error_code = "CON002",
+                method = self.__class__.__name__,
+                parameter_context = "reference",
+                suggestion = "The reference must be 'baseline' or 'previous'."
+            )
+
+        latest = self._slot()
+
+        if reference == "previous":
+            if len(self) < 2:
+                raise ConfigurationException(
+                    error_code = "CON002",
+                    method = self.__class__.__name__,
+                    parameter_context = "reference",
+                    suggestion = "Comparing with the previous batch needs at least two recorded batches."
+                )
+
+            previous = (latest - 1) % self.capacity
+            base = {"bounds": self._bounds[previous], "histograms": self._histograms[previous], "rates": self._rates[previous]}
+        else:
+            base = self._baseline
+
+        metrics = self._metrics(base, self._bounds[latest], self._histograms[latest], self._rates[latest])
+
+        return pd.DataFrame(metrics, index = pd.Index(self.columns, name = "column"))
+
+    def drift_history(self) -> pd.DataFrame:
+        """
+        Drift of every stored batch against the baseline, oldest first.
+
+        :return: One row per batch and column (index ``(batch, column)``) with the columns of ``drift``.
+        :rtype: pd.DataFrame
+        """
+        self._slot()
+        order = self._order()
+
+        metrics = self._metrics(self._baseline, self._bounds[order], self._histograms[order], self._rates[order])
+        index = pd.MultiIndex.from_product([self._labels[order], self.columns], names = ["batch", "column"])
+
+        return pd.DataFrame({name: values.reshape(-1) for name, values in metrics.items()}, index = index)
+
+    def _metrics(self, base: Dict[str, Any], bounds: np.ndarray, histograms: np.ndarray, rates: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Drift metrics of one or more batches (leading axes) against the reference, vectorized over the columns.
+        """
+        reference = self._shares(base["histograms"])
+        current = self._shares(histograms)
+
+        psi = ((current - reference) * np.log(current / reference)).sum(axis = -1)
+        ks = np.abs(np.cumsum(current, axis = -1) - np.cumsum(reference, axis = -1)).max(axis = -1)
+
+        width = base["bounds"][..., 1] - base["bounds"][..., 0]
+        shift = np.abs(bounds - base["bounds"]).max(axis = -1)
+
+        with np.errstate(divide = "ignore", invalid = "ignore"):
+            bound_shift = np.where(width > 0, shift / width, np.nan)
+
+        rate_change = rates - base["rates"]
+        rate_tolerance = np.maximum(self.rate_tolerance, self.rate_z * self._rate_error(base, histograms, rates))
+
+        drifted = (psi > self.psi_threshold) | (ks > self.ks_threshold) | (np.abs(rate_change) > rate_tolerance)
+        drifted |= np.nan_to_num(bound_shift) > self.bound_tolerance
+
+        return {
+            "psi": psi,
+            "ks": ks,
+            "bound_shift": bound_shift,
+            "outlier_rate": rates,
+            "reference_rate": np.broadcast_to(base["rates"], rates.shape),
+            "rate_change": rate_change,
+            "drifted": drifted
+        }
+
+    @staticmethod
+    def _rate_error(base: Dict[str, Any], histograms: np.ndarray, rates: np.ndarray) -> np.ndarray:
+        """
+        Binomial standard error of the outlier rate difference, from the pooled rate of both batches.
+        """
+        n_base = np.maximum(base["histograms"].sum(axis = -1), 1)
+        n_current = np.maximum(histograms.sum(axis = -1), 1)
+        pooled = (base["rates"] * n_base + rates * n_current) / (n_base + n_current)
+
+        return np.sqrt(pooled * (1 - pooled) * (1 / n_base + 1 / n_current))
+
+    def _shares(self, histograms: np.ndarray) -> np.ndarray:
+        totals = histograms.sum(axis = -1, keepdims = True)
+        shares = histograms / np.maximum(totals, 1)
+
+        return np.maximum(shares, self.epsilon)
+
+    # ------------------------------------
+    #               History
+    # ------------------------------------
+
+    def history(self) -> pd.DataFrame:
+        """
+        The stored fitted statistics, bounds and outlier rates, oldest batch first.
+
+        :return: One row per batch and column (index ``(batch, column)``).
+        :rtype: pd.DataFrame
+        """
+        self._slot()
+        order = self._order()
+        n_columns = len(self.columns)
+
+        frame = pd.DataFrame(
+            self._stats[order].reshape(-1, len(self.stat_names)),
+            columns = self.stat_names,
+            index = pd.MultiIndex.from_product([self._labels[order], self.columns], names = ["batch", "column"])
+        )
+        frame["lower"] = self._bounds[order, :, 0].reshape(-1)
+        frame["upper"] = self._bounds[order, :, 1].reshape(-1)
+        frame["outlier_rate"] = self._rates[order].reshape(-1)
+        frame["rows"] = np.repeat(self._rows[order], n_columns)
+
+        return frame
+
+    def flagged(self, reference: str = "baseline") -> List[Hashable]:
+        """
+        The columns whose latest batch drifted.
+        """
+        drift = self.drift(reference)
+
+        return drift.index[drift["drifted"].to_numpy()].tolist()
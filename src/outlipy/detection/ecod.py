@@ -0,0 +1,127 @@
+import pandas as pd
+import numpy as np
+
+from typing import Optional, List, Union
+
+from .base import MultivariateDetectorBase
+from ..exceptions import ConfigurationException, DetectionException
+
+
+class ECODDetector(MultivariateDetectorBase):
+    """
+    Empirical-Cumulative-distribution-based Outlier Detection (Li et al., 2022).
+
+    For every column the left tail probability ``P(X <= x)`` and the right
+    tail probability ``P(X >= x)`` are read from the empirical distribution.
+    A row's score is the largest of three sums of ``-log`` tail probabilities
+    over the columns: the left tails, the right tails, and the tail each
+    column is skewed towards. There is no distribution parameter to tune.
+
+    threshold: quantile of the scores of the fitted rows used as cutoff,
+               e.g. 0.99 flags about 1% of the rows.
+
+    Fitting sorts every column once (one ``np.sort`` over the 2-D matrix)
+    and keeps the sorted columns; tail counts are ranks found with
+    ``searchsorted`` on the sorted values of each block, so fitting and
+    scoring are O(n log n).
+    """
+
+    def __init__(
+            self,
+            *,
+            threshold: float = 0.99,
+            columns: Optional[List[str]] = None,
+            exclude: Optional[List[str]] = None,
+            dtype: str = "float64",
+            nan_policy: str = "raise",
+            block_size: int = 65536
+    ):
+        if not isinstance(threshold, float) or not 0 < threshold < 1:
+            raise ConfigurationException(
+                error_code = "CON002",
+                method = self.__class__.__name__,
+                parameter_context = "threshold",
+                suggestion = "The threshold is a quantile of the fitted scores, e.g. 0.99. Ensure 0.0 < threshold < 1.0."
+            )
+
+        super().__init__(
+            threshold = threshold,
+            columns = columns,
+            exclude = exclude,
+            dtype = dtype,
+            nan_policy = nan_policy,
+            block_size = block_size
+        )
+
+    # ------------------------------------
+    #               Fitting
+    # ------------------------------------
+
+    def _compute_scores(self, df: Union[pd.DataFrame, np.ndarray]):
+        """
+        Sort the columns, find the skewness of every column and the cutoff.
+
+        :param df: The DataFrame, Arrow table or 2-D array.
+        :type df: Union[pd.DataFrame, np.ndarray]
+        """
+
+        matrix = self._matrix(df)
+
+        if not len(matrix):
+            raise DetectionException(
+                error_code = "DET001",
+                method = self.__class__.__name__,
+                specific_message = "Every row contains a missing value.",
+                suggestion = "Fill or drop the missing values before fitting."
+            )
+
+        centered = matrix - matrix.mean(axis = 0)
+        left_skewed = (centered ** 3).mean(axis = 0) < 0
+        del centered
+
+        # Sorting the transposed matrix leaves every column contiguous for searchsorted.
+        self._scores = {
+            "sorted": np.sort(matrix.T, axis = 1),
+            "left_skewed": left_skewed,
+            "n_samples": len(matrix)
+        }
+
+        fitted = np.concatenate([self._score_block(matrix[start:start + self.block_size])
+                                 for start in range(0, len(matrix), self.block_size)])
+        self._scores["cutoff"] = float(np.quantile(fitted, self.threshold))
+
+    # ------------------------------------
+    #               Scoring
+    # ------------------------------------
+
+    def _score_block(self, block: np.ndarray) -> np.ndarray:
+        """
+        ECOD score of every row of the block.
+
+        :param block: 2-D block of the fitted columns, in the compute dtype.
+        :type block: np.ndarray
+        """
+
+        ordered = self._scores["sorted"]
+        n = self._scores["n_samples"]
+
+        # Rows with at most / at least the value in every column.
+        at_most = np.empty(block.shape, dtype = np.float64)
+        at_least = np.empty(block.shape, dtype = np.float64)
+
+        for j in range(block.shape[1]):
+            # Sorted queries make searchsorted walk the column in order (several times faster).
+            order = np.argsort(block[:, j])
+            queries = block[order, j]
+
+            at_most[order, j] = np.searchsorted(ordered[j], queries, side = "right")
+            at_least[order, j] = n - np.searchsorted(ordered[j], queries, side = "left")
+
+        # -log of the tail probabilities, with one pseudo-row so values outside
+        # the fitted range stay finite.
+        left = np.log(n + 1.0) - np.log(at_most + 1.0)
+        right = np.log(n + 1.0) - np.log(at_least + 1.0)
+
+        automatic = np.where(self._scores["left_skewed"], left, right).sum(axis = 1)
+
+        return np.maximum(np.maximum(left.sum(axis = 1), right.sum(axis = 1)), automatic)
@@ -0,0 +1,370 @@
+import pandas as pd
+import numpy as np
+import math
+
+from typing import Optional, List, Union, Tuple
+
+from .base import MultivariateDetectorBase
+from ..core.instrumentation import stage
+from ..exceptions import ConfigurationException, DetectionException
+
+# Fine histogram of one column on the grid of width 2**k anchored at 0:
+# (k, index of the first bin, counts, minimum, maximum).
+Grid = Tuple[int, int, np.ndarray, float, float]
+
+
+def _grid_span(k: int, minimum: float, maximum: float) -> int:
+    """
+    Number of grid bins of width 2**k between ``minimum`` and ``maximum``.
+    """
+    return math.floor(math.ldexp(maximum, -k)) - math.floor(math.ldexp(minimum, -k)) + 1
+
+
+def _grid_exponent(k: int, minimum: float, maximum: float, resolution: int) -> int:
+    """
+    Smallest exponent ``>= k`` whose grid covers the range in at most ``resolution`` bins.
+
+    The exponent only depends on the range, so histograms of disjoint chunks
+    coarsened to the larger exponent land on exactly the grid a single fit over
+    all rows would have chosen.
+    """
+    # Grid indices stay exact integers in float64.
+    k = max(k, math.frexp(max(abs(minimum), abs(maximum)))[1] - 52)
+
+    if maximum > minimum:
+        k = max(k, math.ceil(math.log2((maximum - minimum) / resolution)))
+
+    while _grid_span(k, minimum, maximum) > resolution:
+        k += 1
+
+    return k
+
+
+def _coarsen(grid: Grid, k: int) -> Grid:
+    """
+    Move a fine histogram to the coarser grid of width 2**k by merging adjacent bins.
+    """
+    old_k, start, counts, minimum, maximum = grid
+
+    if k == old_k:
+        return grid
+
+    index = (start + np.arange(len(counts), dtype = np.int64)) >> (k - old_k)
+    new_start = int(index[0])
+    counts = np.bincount(index - new_start, weights = counts).astype(np.int64)
+
+    return k, new_start, counts, minimum, maximum
+
+
+def _grid_histogram(values: np.ndarray, resolution: int) -> Grid:
+    """
+    Fine histogram of the values in a single vectorized pass.
+    """
+    minimum = float(values.min())
+    maximum = float(values.max())
+    k = _grid_exponent(-1074, minimum, maximum, resolution)
+
+    index = np.floor(np.ldexp(values, -k)).astype(np.int64)
+    start = math.floor(math.ldexp(minimum, -k))
+
+    return k, start, np.bincount(index - start), minimum, maximum
+
+
+def _merge_grids(a: Grid, b: Grid, resolution: int) -> Grid:
+    """
+    Exact merge of two fine histograms of the same column.
+    """
+    minimum = min(a[3], b[3])
+    maximum = max(a[4], b[4])
+    k = _grid_exponent(max(a[0], b[0]), minimum, maximum, resolution)
+
+    a = _coarsen(a, k)
+    b = _coarsen(b, k)
+    start = min(a[1], b[1])
+
+    counts = np.zeros(_grid_span(k, minimum, maximum), dtype = np.int64)
+    counts[a[1] - start:a[1] - start + len(a[2])] += a[2]
+    counts[b[1] - start:b[1] - start + len(b[2])] += b[2]
+
+    return k, start, counts, minimum, maximum
+
+
+class HBOSDetector(MultivariateDetectorBase):
+    """
+    Histogram-based Outlier Score (Goldstein & Dengel, 2012).
+
+    Every column gets a histogram of ``n_bins`` bins, normalized so the
+    highest bin has height 1. The score of a row is the sum over the columns of
+    ``log(1 / height)`` of the bin it falls in, so fitting and scoring are both
+    linear in the number of rows. Columns are treated as independent.
+
+    threshold: quantile of the score distribution implied by the histograms
+               used as cutoff, e.g. 0.99.
+    binning: "static" for bins of equal width, "dynamic" for bins holding
+             (about) the same number of rows, which suits skewed columns.
+    alpha: pseudo-count added to every bin, so empty bins and values outside
+           the fitted range get a large but finite score.
+
+    Each column is first counted on a fine grid of power-of-two width, which
+    merges exactly; ``partial_fit`` and ``merge`` therefore give the same
+    detector as one ``fit`` over all rows. The fitted histograms are kept as
+    ``(columns, bins)`` arrays of edges and scores, so scoring is a
+    ``searchsorted`` and a ``take`` per column.
+    """
+
+    # Fine grid bins per column, from which the n_bins histogram is derived.
+    resolution = 2 ** 14
+    # Draws used to estimate the cutoff quantile.
+    n_draws = 2 ** 16
+
+    def __init__(
+            self,
+            *,
+            threshold: float = 0.99,
+            columns: Optional[List[str]] = None,
+            exclude: Optional[List[str]] = None,
+            n_bins: int = 10,
+            binning: str = "static",
+            alpha: float = 0.1,
+            dtype: str = "float64",
+            nan_policy: str = "raise",
+            block_size: int = 65536
+    ):
+        if not isinstance(threshold, float) or not 0 < threshold < 1:
+            raise ConfigurationException(
+                error_code = "CON002",
+                method = self.__class__.__name__,
+                parameter_context = "threshold",
+                suggestion = "The threshold is a score quantile, e.g. 0.99. Ensure 0.0 < threshold < 1.0."
+            )
+
+        if not isinstance(n_bins, int) or n_bins < 2:
+            raise ConfigurationException(
+                error_code = "CON002",
+                method = self.__class__.__name__,
+                parameter_context = "n_bins",
+                suggestion = "The n_bins must be an integer of at least 2."
+            )
+
+        if binning not in ("static", "dynamic"):
+            raise ConfigurationException(
+                error_code = "CON002",
+                method = self.__class__.__name__,
+                parameter_context = "binning",
+                suggestion = "The binning must be 'static' (equal width) or 'dynamic' (equal frequency)."
+            )
+
+        if not alpha > 0:
+            raise ConfigurationException(
+                error_code = "CON002",
+                method = self.__class__.__name__,
+                parameter_context = "alpha",
+                suggestion = "The alpha must be positive, e.g. 0.1."
+            )
+
+        super().__init__(
+            threshold = threshold,
+            columns = columns,
+            exclude = exclude,
+            dtype = dtype,
+            nan_policy = nan_policy,
+            block_size = block_size
+        )
+
+        self.n_bins = n_bins
+        self.binning = binning
+        self.alpha = alpha
+        self._grids: Optional[List[Grid]] = None
+
+    # ------------------------------------
+    #               Fitting
+    # ------------------------------------
+
+    def _compute_scores(self, df: Union[pd.DataFrame, np.ndarray]):
+        """
+        Count every column and derive the histograms.
+
+        :param df: The DataFrame, Arrow table or 2-D array.
+        :type df: Union[pd.DataFrame, np.ndarray]
+        """
+
+        self._grids = None
+        self._update_grids(df)
+        self._finalize_histograms()
+
+    def partial_fit(self, df: Union[pd.DataFrame, np.ndarray]):
+        """
+        Add another chunk of rows to the histograms.
+
+        The columns are fixed by the first chunk.
+
+        :param df: The next chunk (DataFrame, Arrow table or 2-D array).
+        :type df: Union[pd.DataFrame, np.ndarray]
+        """
+
+        if not self._fitted:
+            self._grids = None
+
+        self._validate_input(df)
+
+        with stage(self, "partial_fit", df, len(self.columns)):
+            self._update_grids(df)
+            self._finalize_histograms()
+
+        self._cache_key = None
+        self._fitted = True
+        return self
+
+    def merge(self, other: "HBOSDetector"):
+        """
+        Add the counts of another detector fitted on different rows of the same columns.
+
+        Useful to fit chunks in parallel and combine the results.
+
+        :param other: A fitted detector with the same columns and settings.
+        :type other: HBOSDetector
+        """
+
+        if not (isinstance(other, HBOSDetector) and self._fitted and other._fitted
+                and list(other.columns) == list(self.columns)
+                and (other.n_bins, other.binning, other.alpha) == (self.n_bins, self.binning, self.alpha)):
+            raise ConfigurationException(
+                error_code = "CON002",
+                method = self.__class__.__name__,
+                parameter_context = "other",
+                suggestion = "Only fitted HBOSDetectors with the same columns, n_bins, binning and alpha can be merged."
+            )
+
+        self._grids = [_merge_grids(a, b, self.resolution) for a, b in zip(self._grids, other._grids)]
+        self._finalize_histograms()
+        self._cache_key = None
+
+        return self
+
+    def _update_grids(self, df: Union[pd.DataFrame, np.ndarray]):
+        """
+        Merge the fine histograms of every row block of ``df`` into ``self._grids``.
+        """
+        for _, _, block in self._iter_blocks(df):
+            block = self._complete_rows(block)
+
+            if not len(block):
+                continue
+
+            grids = [_grid_histogram(block[:, j], self.resolution) for j in range(block.shape[1])]
+
+            if self._grids is None:
+                self._grids = grids
+            else:
+                self._grids = [_merge_grids(a, b, self.resolution) for a, b in zip(self._grids, grids)]
+
+    def _finalize_histograms(self):
+        """
+        Turn the fine histograms into the ``n_bins`` histograms, the lookup arrays and the cutoff.
+        """
+        if self._grids is None:
+            raise DetectionException(
+                error_code = "DET001",
+                method = self.__class__.__name__,
+                specific_message = "Every row contains a missing value.",
+                suggestion = "Fill or drop the missing values before fitting."
+            )
+
+        histograms = [self._histogram(grid) for grid in self._grids]
+        width = max(len(edges) for edges, _ in histograms)
+
+        # Padded (columns, bins) arrays. Slot 0 of the scores is below the first
+        # edge, slot i holds bin i and the slots after the last bin are above it.
+        edges = np.full((len(histograms), width), np.inf)
+        scores = np.empty((len(histograms), width + 1))
+        probabilities = np.zeros((len(histograms), width - 1))
+
+        for j, (column_edges, counts) in enumerate(histograms):
+            n_bins = len(counts)
+            n = counts.sum()
+
+            widths = np.diff(column_edges)
+            heights = (counts + self.alpha) / ((n + self.alpha * n_bins) * widths)
+            outside = self.alpha / ((n + self.alpha * n_bins) * widths[[0, -1]])
+            peak = heights.max()
+
+            edges[j, :n_bins + 1] = column_edges
+            scores[j, 1:n_bins + 1] = np.log(peak / heights)
+            scores[j, 0] = np.log(peak / outside[0])
+            scores[j, n_bins + 1:] = np.log(peak / outside[1])
+            probabilities[j, :n_bins] = counts / n
+
+        self._scores = {
+            "edges": edges,
+            "bin_scores": scores,
+            "n_samples": int(self._grids[0][2].sum()),
+            "cutoff": self._cutoff(scores, probabilities)
+        }
+
+    def _histogram(self, grid: Grid) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Edges and counts of the ``n_bins`` histogram of one column.
+
+        The last edge is just above the maximum, so the maximum falls in the last bin.
+        """
+        k, start, counts, minimum, maximum = grid
+        upper = np.nextafter(maximum, np.inf)
+
+        if self.binning == "static":
+            edges = np.linspace(minimum, maximum, self.n_bins + 1)
+        else:
+            # Equal-frequency edges at the fine bins where the cumulative count crosses i * n / n_bins.
+            cumulative = np.cumsum(counts)
+            targets = cumulative[-1] * np.arange(1, self.n_bins) / self.n_bins
+            crossing = np.searchsorted(cumulative, targets)
+            inner = np.ldexp((start + crossing + 1).astype(np.float64), k)
+            edges = np.concatenate([[minimum], inner[(inner > minimum) & (inner < maximum)], [maximum]])
+
+        edges[-1] = upper
+        edges = np.unique(edges)
+
+        # Fine bins are assigned to the histogram bin of their center.
+        nonzero = np.flatnonzero(counts)
+        centers = np.ldexp(start + nonzero + 0.5, k)
+        bins = np.clip(np.searchsorted(edges, centers, side = "right") - 1, 0, len(edges) - 2)
+
+        return edges, np.bincount(bins, weights = counts[nonzero], minlength = len(edges) - 1)
+
+    def _cutoff(self, scores: np.ndarray, probabilities: np.ndarray) -> float:
+        """
+        ``threshold`` quantile of the score of a row drawn from the histograms.
+
+        Estimated from ``n_draws`` rows with a fixed seed, treating the columns
+        as independent like the score itself. Only the histograms are used, so
+        the cutoff does not depend on how the rows were split into chunks.
+        """
+        rng = np.random.default_rng(0)
+        total = np.zeros(self.n_draws)
+
+        for j in range(len(scores)):
+            cumulative = np.cumsum(probabilities[j])
+            bins = np.searchsorted(cumulative, rng.random(self.n_draws) * cumulative[-1], side = "right")
+            total += scores[j, 1 + np.minimum(bins, len(cumulative) - 1)]
+
+        return float(np.quantile(total, self.threshold))
+
+    # ------------------------------------
+    #               Scoring
+    # ------------------------------------
+
+    def _score_block(self, block: np.ndarray) -> np.ndarray:
+        """
+        Histogram-based outlier score of every row of the block.
+
+        :param block: 2-D block of the fitted columns, in the compute dtype.
+        :type block: np.ndarray
+        """
+
+        edges = self._scores["edges"]
+        bin_scores = self._scores["bin_scores"]
+        scores = np.zeros(len(block), dtype = np.float64)
+
+        for j in range(block.shape[1]):
+            scores += np.take(bin_scores[j], np.searchsorted(edges[j], block[:, j], side = "right"))
+
+        return scores
@@ -1,23 +1,36 @@
 import pandas as pd
+import numpy as np
 
-from .base import OutlierDetectorBase
+from .base import UnivariateDetectorBase
 
+from ..core import stats, kernels
+from ..core.sketch import QuantileSketch
+from ..core.frequency import FrequencyTable
 from ..exceptions import ConfigurationException, DetectionException
 
-from typing import Optional, List
+from typing import Optional, List, Union, Dict, Any, Tuple
 
-class IQRDetector(OutlierDetectorBase):
+class IQRDetector(UnivariateDetectorBase):
     """
     Interquartile Range (IQR) based outlier detector.
 
     threshold: multiplier for IQR to define the bounds.
                Typical default = 1.5 or 3.0 depending on desired sensitivity.
     """
+
+    _outside_bounds = True
+
     def __init__(
             self,
             threshold: float = 1.5,
             columns: Optional[List[str]] = None,
-            exclude: Optional[List[str]] = None
+            exclude: Optional[List[str]] = None,
+            dtype: str = "float64",
+            nan_policy: str = "raise",
+            sample: Optional[Union[int, float]] = None,
+            random_state: Optional[int] = None,
+            incremental: bool = False,
+            max_cardinality: Optional[int] = None
     ):
         if threshold < 0:
             raise ConfigurationException(
@@ -26,26 +39,38 @@ class IQRDetector(OutlierDetectorBase):
                 parameter_context = "threshold",
                 suggestion = "Please input a value greater than 0."
             )
+
+        if not isinstance(threshold, float):
+            raise ConfigurationException(
+                error_code = "CON002",
+                method = self.__class__.__name__,
+                parameter_context = "threshold",
+                suggestion = "Ensure the threshold parameter is a single float value (e.g., 1.5)."
+            )
         
         super().__init__(
             threshold = threshold,
             columns = columns,
-            exclude = exclude
+            exclude = exclude,
+            dtype = dtype,
+            nan_policy = nan_policy,
+            sample = sample,
+            random_state = random_state,
+            incremental = incremental,
+            max_cardinality = max_cardinality
         )
 
 
-    def _compute_scores(self, df: pd.DataFrame):
+    def _compute_scores(self, df: Union[pd.DataFrame, np.ndarray], quantiles: Optional[Dict[Any, Dict[float, float]]] = None):
         """
         Compute Q1, Q3, IQR, and lower/upper bounds for each selected column.
 
-        :param df: The DataFrame
-        :type df: pd.DataFrame
+        :param df: The DataFrame or 2-D array.
+        :type df: Union[pd.DataFrame, np.ndarray]
+        :param quantiles: Precomputed quartiles of some columns (column -> level -> value).
+        :type quantiles: Optional[Dict[Any, Dict[float, float]]]
         """
 
-        numeric_df = df[self.columns]
-
-        self._scores = {}  # reset scores
-
         if not isinstance(self.threshold, float):
             raise ConfigurationException(
                 error_code="CON002", 
@@ -54,58 +79,92 @@ class IQRDetector(OutlierDetectorBase):
                 suggestion="Ensure the threshold parameter is a single float value (e.g., 1.5)."
                 )
 
-        for col in numeric_df.columns:
-            q1 = numeric_df[col].quantile(0.25)
-            q3 = numeric_df[col].quantile(0.75)
-            iqr = q3 - q1
-
-            if iqr == 0:
-                # Raise DET004 Zero Variance - cannot compute IQR-based outliers
-                raise DetectionException(
-                    error_code = "DET004",
-                    method = self.__class__.__name__,
-                    suggestion = "Remove Constant/Uninformative Features or verify Data Preprocessing"
-                )
-   
-            lower = q1 - self.threshold * iqr
-            upper = q3 + self.threshold * iqr
+        super()._compute_scores(df, quantiles)
 
-            self._scores[col] = {
-                "q1": q1,
-                "q3": q3,
-                "iqr": iqr,
-                "lower": lower,
-                "upper": upper
-            }
+    def _fit_column(self, values) -> Dict[str, Any]:
+        """
+        Compute Q1, Q3, IQR, and lower/upper bounds for a single column.
 
-    def detect(self, df: pd.DataFrame) -> pd.DataFrame:
+        :param values: The 1-D column values.
+        :type values: np.ndarray
         """
-        Return a DataFrame of booleans where True marks an outlier.
 
-        :param df: The DataFrame.
-        :type df: pd.DataFrame
-        :return: The mask where True marks an outlier.
-        :rtype: DataFrame
+        return self._quartile_scores(*stats.quantile(values, [0.25, 0.75]))
+
+    def _quantile_levels(self) -> List[float]:
+        return [0.25, 0.75]
+
+    def _fit_quantiles(self, quantiles: Dict[float, float]) -> Dict[str, Any]:
         """
+        Quartiles from precomputed quantiles.
+        """
+        return self._quartile_scores(quantiles[0.25], quantiles[0.75])
 
-        # Auto fit if it was not fitted yet.
-        if not self._fitted:
-            self.fit(df)
+    def _fit_frequencies(self, table: FrequencyTable) -> Dict[str, Any]:
+        """
+        Quartiles and bounds from the frequency table of a low-cardinality column.
+        """
+        return self._quartile_scores(*table.quantile([0.25, 0.75]))
 
-        # if self.columns is unexpectedly become None.
+    def _state_scores(self, state: QuantileSketch) -> Dict[str, Any]:
+        """
+        Quartiles and bounds from the merged quantile sketch.
+        """
+        return self._quartile_scores(*state.quantile([0.25, 0.75]))
 
-        if self.columns is None:
-            raise RuntimeError("Detector was fitted, but self.columns is unexpectedly None.")
+    def _quartile_scores(self, q1: float, q3: float) -> Dict[str, Any]:
+        iqr = q3 - q1
 
-        outlier_mask = pd.DataFrame(False, index = df.index, columns = self.columns)
+        if iqr == 0:
+            # Raise DET004 Zero Variance - cannot compute IQR-based outliers
+            raise DetectionException(
+                error_code = "DET004",
+                method = self.__class__.__name__,
+                suggestion = "Remove Constant/Uninformative Features or verify Data Preprocessing"
+            )
 
-        for col in self.columns:
-            bounds = self._scores[col]
-            lower, upper = bounds["lower"], bounds["upper"]
-            series = df[col]
+        lower = q1 - self.threshold * iqr
+        upper = q3 + self.threshold * iqr
 
-            outliers = (series < lower) | (series > upper)
-            outlier_mask[col] = outliers
+        return {
+            "q1": q1,
+            "q3": q3,
+            "iqr": iqr,
+            "lower": lower,
+            "upper": upper
+        }
 
-        return outlier_mask
+    def _bounds(self, scores: Dict[str, Any]) -> Tuple[float, float]:
+        """
+        The fitted IQR bounds.
+        """
+        return scores["lower"], scores["upper"]
+
+    def _score_column(self, values: np.ndarray, scores: Dict[str, Any]) -> np.ndarray:
+        """
+        Distance of every value beyond the quartiles, in IQRs (negative inside them).
+
+        A value is outside the bounds of threshold ``t`` when this exceeds ``t``;
+        values exactly on a bound may round either way.
+        """
+
+        q1, q3, iqr = scores["q1"], scores["q3"], scores["iqr"]
+
+        below = np.subtract(q1, values, dtype = self.dtype)
+        above = np.subtract(values, q3, dtype = self.dtype)
+        np.maximum(below, above, out = below)
+        below /= iqr
+
+        return below
+
+    def _detect_column(self, values: np.ndarray, scores: Dict[str, Any]) -> np.ndarray:
+        """
+        Flag the values outside the fitted IQR bounds.
+
+        :param values: The 1-D column values.
+        :type values: np.ndarray
+        :return: The mask where True marks an outlier.
+        :rtype: np.ndarray
+        """
 
+        return kernels.outside(values, scores["lower"], scores["upper"])
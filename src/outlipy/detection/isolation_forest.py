@@ -0,0 +1,314 @@
+import pandas as pd
+import numpy as np
+import math
+import os
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, List, Union, Tuple
+
+from .base import MultivariateDetectorBase
+from ..exceptions import ConfigurationException, DetectionException
+
+# Flat tree in heap layout: (feature, threshold) of the internal slots and the
+# path length of the bottom slots. The children of slot i are 2i + 1 and 2i + 2.
+Tree = Tuple[np.ndarray, np.ndarray, np.ndarray]
+
+EULER_GAMMA = 0.5772156649015329
+
+
+def _average_path_length(n: Union[int, np.ndarray]) -> Union[float, np.ndarray]:
+    """
+    Average path length c(n) of an unsuccessful search in a binary search tree of n points.
+    """
+    n = np.asarray(n, dtype = np.float64)
+    result = np.zeros_like(n)
+
+    result[n == 2] = 1.0
+    large = n > 2
+    result[large] = 2.0 * (np.log(n[large] - 1.0) + EULER_GAMMA) - 2.0 * (n[large] - 1.0) / n[large]
+
+    return result if result.ndim else float(result)
+
+
+def _build_tree(sample: np.ndarray, height_limit: int, seed: np.random.SeedSequence) -> Tree:
+    """
+    Grow one isolation tree level by level.
+
+    All nodes of a level are split at once: every node draws a random feature
+    and a uniform threshold between the minimum and maximum of its samples on
+    that feature. Nodes with one sample, no spread or at the height limit
+    become leaves.
+
+    The tree is stored as a complete binary tree of depth ``height_limit``.
+    Slots below a leaf keep the default threshold +inf, so a row reaching a
+    leaf keeps going left and ends in the bottom slot holding the leaf's depth
+    plus c(size) for the unbuilt subtree. Every row thus takes exactly
+    ``height_limit`` steps and scoring needs no per-row leaf test.
+    """
+    rng = np.random.default_rng(seed)
+    n_samples, n_features = sample.shape
+    n_internal = 2 ** height_limit - 1
+
+    feature = np.zeros(n_internal, dtype = np.int32)
+    threshold = np.full(n_internal, np.inf, dtype = np.float64)
+    path_length = np.zeros(n_internal + 1, dtype = np.float64)
+
+    node_of = np.zeros(n_samples, dtype = np.intp)     # Current slot of every sample
+    active = np.zeros(1, dtype = np.intp)               # Slots of the current level
+    depth = 0
+
+    while active.size:
+        position = np.full(2 * n_internal + 1, -1, dtype = np.intp)
+        position[active] = np.arange(active.size)
+
+        members = np.flatnonzero(position[node_of] >= 0)
+        member_position = position[node_of[members]]
+
+        split_feature = rng.integers(0, n_features, size = active.size)
+        values = sample[members, split_feature[member_position]]
+
+        sizes = np.bincount(member_position, minlength = active.size)
+        low = np.full(active.size, np.inf)
+        high = np.full(active.size, -np.inf)
+        np.minimum.at(low, member_position, values)
+        np.maximum.at(high, member_position, values)
+
+        splits = (sizes > 1) & (high > low) & (depth < height_limit)
+
+        # Bottom slot reached from a leaf by always going left.
+        leaves = active[~splits]
+        bottom = (leaves + 1) * 2 ** (height_limit - depth) - 1
+        path_length[bottom - n_internal] = depth + _average_path_length(sizes[~splits])
+
+        if not splits.any():
+            break
+
+        nodes = active[splits]
+        cut = low[splits] + rng.random(nodes.size) * (high[splits] - low[splits])
+
+        feature[nodes] = split_feature[splits]
+        threshold[nodes] = cut
+
+        # Send the samples of the split nodes to their children.
+        moving = splits[member_position]
+        rows = members[moving]
+        parent = node_of[rows]
+        node_of[rows] = 2 * parent + 1 + (values[moving] >= threshold[parent])
+
+        active = np.concatenate([2 * nodes + 1, 2 * nodes + 2])
+        depth += 1
+
+    return feature, threshold, path_length
+
+
+def _build_trees(samples: List[np.ndarray], seeds: List[np.random.SeedSequence], height_limit: int) -> List[Tree]:
+    """
+    Build several trees; the unit of work sent to a worker process.
+    """
+    return [_build_tree(sample, height_limit, seed) for sample, seed in zip(samples, seeds)]
+
+
+class IsolationForestDetector(MultivariateDetectorBase):
+    """
+    Isolation Forest outlier detector (Liu, Ting & Zhou, 2008).
+
+    Outliers are isolated by fewer random splits than regular rows. The score
+    ``2 ** (-E[h(x)] / c(max_samples))`` is close to 1 for outliers and at or
+    below 0.5 for regular rows; rows scoring above ``threshold`` are flagged.
+
+    Every tree is stored as flat arrays in heap layout (feature and threshold
+    per internal slot, path length per bottom slot, children of slot i at
+    2i + 1 and 2i + 2) and the trees are stacked into forest-wide arrays.
+    Scoring moves a block of rows through all trees one level at a time, so
+    the cost is linear in the number of rows.
+
+    threshold: anomaly score cutoff in (0, 1), e.g. 0.6.
+    max_samples: rows drawn without replacement to grow each tree.
+    n_jobs: worker processes used to grow the trees (-1 = all CPUs).
+    """
+
+    # (row, tree) pairs scored together; small enough to stay in cache.
+    score_cells = 2 ** 15
+
+    def __init__(
+            self,
+            *,
+            threshold: float = 0.6,
+            columns: Optional[List[str]] = None,
+            exclude: Optional[List[str]] = None,
+            n_estimators: int = 100,
+            max_samples: int = 256,
+            random_state: Optional[int] = None,
+            n_jobs: int = 1,
+            dtype: str = "float64",
+            nan_policy: str = "raise",
+            block_size: int = 65536
+    ):
+        if not isinstance(threshold, float) or not 0 < threshold < 1:
+            raise ConfigurationException(
+                error_code = "CON002",
+                method = self.__class__.__name__,
+                parameter_context = "threshold",
+                suggestion = "The threshold is an anomaly score, e.g. 0.6. Ensure 0.0 < threshold < 1.0."
+            )
+
+        for name, value in (("n_estimators", n_estimators), ("max_samples", max_samples)):
+            if not isinstance(value, int) or value < (1 if name == "n_estimators" else 2):
+                raise ConfigurationException(
+                    error_code = "CON002",
+                    method = self.__class__.__name__,
+                    parameter_context = name,
+                    suggestion = f"The {name} must be an integer of at least {1 if name == 'n_estimators' else 2}."
+                )
+
+        if not isinstance(n_jobs, int) or n_jobs == 0 or n_jobs < -1:
+            raise ConfigurationException(
+                error_code = "CON002",
+                method = self.__class__.__name__,
+                parameter_context = "n_jobs",
+                suggestion = "Use a positive number of processes, or -1 for all CPUs."
+            )
+
+        super().__init__(
+            threshold = threshold,
+            columns = columns,
+            exclude = exclude,
+            dtype = dtype,
+            nan_policy = nan_policy,
+            block_size = block_size
+        )
+
+        self.n_estimators = n_estimators
+        self.max_samples = max_samples
+        self.random_state = random_state
+        self.n_jobs = n_jobs
+
+    # ------------------------------------
+    #               Fitting
+    # ------------------------------------
+
+    def _compute_scores(self, df: Union[pd.DataFrame, np.ndarray]):
+        """
+        Draw a subsample per tree and grow the forest.
+
+        Only the sampled rows are read from ``df``. Each tree gets its own
+        ``SeedSequence`` child, so the forest is identical for any ``n_jobs``.
+
+        :param df: The DataFrame, Arrow table or 2-D array.
+        :type df: Union[pd.DataFrame, np.ndarray]
+        """
+
+        n_rows = len(df)
+        sample_size = min(self.max_samples, n_rows)
+        height_limit = math.ceil(math.log2(max(sample_size, 2)))
+
+        tree_seeds = np.random.SeedSequence(self.random_state).spawn(self.n_estimators)
+        sample_seeds, build_seeds = zip(*(seed.spawn(2) for seed in tree_seeds))
+
+        indices = [np.random.default_rng(seed).choice(n_rows, sample_size, replace = False) for seed in sample_seeds]
+        rows = np.unique(np.concatenate(indices))
+        sampled = self._take_rows(df, rows)
+
+        samples = [self._complete_rows(sampled[np.searchsorted(rows, index)]) for index in indices]
+
+        if any(len(sample) == 0 for sample in samples):
+            raise DetectionException(
+                error_code = "DET001",
+                method = self.__class__.__name__,
+                specific_message = "A tree sample only contains rows with missing values.",
+                suggestion = "Fill or drop the missing values, or increase max_samples."
+            )
+
+        trees = self._grow(samples, list(build_seeds), height_limit)
+
+        self._scores = self._stack_trees(trees)
+        self._scores["normalizer"] = _average_path_length(sample_size)
+        self._scores["cutoff"] = self.threshold
+
+    def _grow(self, samples: List[np.ndarray], seeds: List[np.random.SeedSequence], height_limit: int) -> List[Tree]:
+        """
+        Grow the trees in this process or on a process pool.
+        """
+        n_jobs = (os.cpu_count() or 1) if self.n_jobs == -1 else self.n_jobs
+        n_jobs = min(n_jobs, len(samples))
+
+        if n_jobs == 1:
+            return _build_trees(samples, seeds, height_limit)
+
+        bounds = np.linspace(0, len(samples), n_jobs + 1).astype(int)
+
+        with ProcessPoolExecutor(max_workers = n_jobs) as executor:
+            futures = [
+                executor.submit(_build_trees, samples[start:stop], seeds[start:stop], height_limit)
+                for start, stop in zip(bounds[:-1], bounds[1:])
+            ]
+            return [tree for future in futures for tree in future.result()]
+
+    @staticmethod
+    def _stack_trees(trees: List[Tree]) -> dict:
+        """
+        Stack the trees into forest-wide ``(n_estimators, slots)`` arrays.
+        """
+        feature, threshold, path_length = (np.stack(parts) for parts in zip(*trees))
+
+        return {
+            "feature": feature,
+            "threshold": threshold,
+            "path_length": path_length
+        }
+
+    # ------------------------------------
+    #               Scoring
+    # ------------------------------------
+
+    def _score_block(self, block: np.ndarray) -> np.ndarray:
+        """
+        Anomaly score of every row of the block.
+
+        :param block: 2-D block of the fitted columns, in the compute dtype.
+        :type block: np.ndarray
+        """
+
+        forest = self._scores
+        n_trees, n_internal = forest["feature"].shape
+        height_limit = int(np.log2(n_internal + 1))
+
+        feature = forest["feature"].ravel()
+        threshold = forest["threshold"].astype(block.dtype, copy = False).ravel()
+        path_length = forest["path_length"].ravel()
+
+        tree_offset = (np.arange(n_trees, dtype = np.int32) * n_internal)[None, :]
+        leaf_offset = (np.arange(n_trees, dtype = np.int32) * (n_internal + 1) - n_internal)[None, :]
+
+        step = max(1, self.score_cells // n_trees)
+        scores = np.empty(len(block), dtype = np.float64)
+
+        for start in range(0, len(block), step):
+            rows = block[start:start + step]
+            m = len(rows)
+
+            # Column-major copy, so the value of (row, feature) is at feature * m + row.
+            flat_rows = rows.T.ravel()
+            column_start = feature * np.int32(m)
+            row_index = np.arange(m, dtype = np.int32)[:, None]
+
+            # Slot of every (row, tree) pair; all of them go down one level per iteration.
+            slot = np.zeros((m, n_trees), dtype = np.int32)
+            node = np.empty_like(slot)
+            index = np.empty_like(slot)
+
+            for _ in range(height_limit):
+                np.add(slot, tree_offset, out = node)
+                np.take(column_start, node, out = index)
+                index += row_index
+
+                goes_right = np.take(flat_rows, index) >= np.take(threshold, node)
+                slot *= 2
+                slot += 1
+                slot += goes_right
+
+            np.add(slot, leaf_offset, out = node)
+            mean_depth = np.take(path_length, node).mean(axis = 1)
+            scores[start:start + m] = np.exp2(-mean_depth / forest["normalizer"])
+
+        return scores
@@ -0,0 +1,298 @@
+import pandas as pd
+import numpy as np
+import weakref
+import os
+
+from abc import abstractmethod
+from typing import Optional, List, Union
+
+from .base import MultivariateDetectorBase
+from ..core import cache
+from ..core.neighbors import NeighborIndex
+from ..exceptions import ConfigurationException, MultivariateException
+
+
+class NeighborDetectorBase(MultivariateDetectorBase):
+    """
+    Base class for detectors scoring a row by its nearest fitted rows.
+
+    ``fit`` builds a ``NeighborIndex`` over the reference rows once; scoring
+    new rows is a batched neighbor query against that index, never a rebuild.
+    The fitted rows are scored against their ``n_neighbors`` nearest *other*
+    rows, and ``score``/``detect`` on the same object that was fitted, with
+    the same content, reuse those scores.
+
+    threshold: quantile of the scores of the fitted rows used as cutoff,
+               e.g. 0.99 flags about 1% of the rows.
+    algorithm: "auto", "kd_tree" (needs scipy) or "brute".
+    n_jobs: threads answering the neighbor queries.
+    max_samples: approximate mode for large data. The index holds a random
+                 sample of this many rows instead of all of them, and every
+                 row is scored against the sample.
+    """
+
+    def __init__(
+            self,
+            *,
+            threshold: float = 0.99,
+            columns: Optional[List[str]] = None,
+            exclude: Optional[List[str]] = None,
+            n_neighbors: int = 5,
+            algorithm: str = "auto",
+            n_jobs: int = 1,
+            max_samples: Optional[int] = None,
+            random_state: Optional[int] = None,
+            dtype: str = "float64",
+            nan_policy: str = "raise",
+            block_size: int = 65536
+    ):
+        if not isinstance(threshold, float) or not 0 < threshold < 1:
+            raise ConfigurationException(
+                error_code = "CON002",
+                method = self.__class__.__name__,
+                parameter_context = "threshold",
+                suggestion = "The threshold is a quantile of the fitted scores, e.g. 0.99. Ensure 0.0 < threshold < 1.0."
+            )
+
+        if not isinstance(n_neighbors, int) or n_neighbors < 1:
+            raise ConfigurationException(
+                error_code = "CON002",
+                method = self.__class__.__name__,
+                parameter_context = "n_neighbors",
+                suggestion = "The n_neighbors must be a positive integer."
+            )
+
+        if algorithm not in ("auto", "kd_tree", "brute"):
+            raise ConfigurationException(
+                error_code = "CON002",
+                method = self.__class__.__name__,
+                parameter_context = "algorithm",
+                suggestion = "The algorithm must be 'auto', 'kd_tree' or 'brute'."
+            )
+
+        if not isinstance(n_jobs, int) or n_jobs == 0 or n_jobs < -1:
+            raise ConfigurationException(
+                error_code = "CON002",
+                method = self.__class__.__name__,
+                parameter_context = "n_jobs",
+                suggestion = "Use a positive number of threads, or -1 for all CPUs."
+            )
+
+        if max_samples is not None and (not isinstance(max_samples, int) or max_samples <= n_neighbors):
+            raise ConfigurationException(
+                error_code = "CON002",
+                method = self.__class__.__name__,
+                parameter_context = "max_samples",
+                suggestion = "The max_samples must be an integer larger than n_neighbors, or None to index every row."
+            )
+
+        super().__init__(
+            threshold = threshold,
+            columns = columns,
+            exclude = exclude,
+            dtype = dtype,
+            nan_policy = nan_policy,
+            block_size = block_size
+        )
+
+        self.n_neighbors = n_neighbors
+        self.algorithm = algorithm
+        self.n_jobs = n_jobs
+        self.max_samples = max_samples
+        self.random_state = random_state
+        self._index: Optional[NeighborIndex] = None
+        self._fitted_on = None
+        self._fitted_fingerprint: Optional[str] = None
+        self._fitted_scores: Optional[np.ndarray] = None
+
+    # ------------------------------------
+    #               Fitting
+    # ------------------------------------
+
+    def _deterministic(self) -> bool:
+        # Only the approximate mode samples the reference rows.
+        return self.max_samples is None or self.random_state is not None
+
+    def _compute_scores(self, df: Union[pd.DataFrame, np.ndarray]):
+        """
+        Build the index over the reference rows and score the fitted rows.
+
+        :param df: The DataFrame, Arrow table or 2-D array.
+        :type df: Union[pd.DataFrame, np.ndarray]
+        """
+
+        blocks = [block for _, _, block in self._iter_blocks(df)]
+        matrix = blocks[0] if len(blocks) == 1 else np.concatenate(blocks)
+        complete = ~np.isnan(matrix).any(axis = 1) if self.nan_policy == "omit" else np.ones(len(matrix), dtype = bool)
+        matrix = matrix[complete] if not complete.all() else matrix
+
+        if len(matrix) <= self.n_neighbors:
+            raise MultivariateException(
+                error_code = "MVT002",
+                method = self.__class__.__name__,
+                suggestion = f"At least {self.n_neighbors + 1} complete rows are needed for n_neighbors = {self.n_neighbors}, got {len(matrix)}."
+            )
+
+        # Position of every fitted row among the reference rows (-1 if not sampled).
+        if self.max_samples is not None and len(matrix) > self.max_samples:
+            rng = np.random.default_rng(self.random_state)
+            reference = np.sort(rng.choice(len(matrix), self.max_samples, replace = False))
+            self_index = np.full(len(matrix), -1, dtype = np.intp)
+            self_index[reference] = np.arange(len(reference))
+        else:
+            reference = np.arange(len(matrix))
+            self_index = reference
+
+        self._index = NeighborIndex(matrix[reference], algorithm = self.algorithm, n_jobs = self._threads())
+        distances, indices = self._index.query(matrix, self.n_neighbors, self_index = self_index)
+
+        self._scores = {"n_samples": len(matrix), "algorithm": self._index.algorithm}
+        self._fit_reference(distances[reference], indices[reference])
+
+        scores = np.full(len(complete), np.nan)
+        scores[complete] = self._neighbor_scores(distances, indices)
+
+        self._scores["cutoff"] = float(np.quantile(scores[complete], self.threshold))
+        self._fitted_scores = scores
+        self._fitted_on = self._reference_to(df)
+        self._fitted_fingerprint = self._fingerprint(df) if self._fitted_on is not None else None
+
+    def __getstate__(self):
+        # The weak reference to the fitted input cannot be pickled; its scores are only reused for that object.
+        state = self.__dict__.copy()
+        state["_fitted_on"] = None
+        state["_fitted_fingerprint"] = None
+        state["_fitted_scores"] = None
+
+        return state
+
+    def _threads(self) -> int:
+        return (os.cpu_count() or 1) if self.n_jobs == -1 else self.n_jobs
+
+    @staticmethod
+    def _reference_to(df):
+        """
+        Weak reference to the fitted input, so it is not kept alive by the detector.
+        """
+        try:
+            return weakref.ref(df)
+        except TypeError:
+            return None
+
+    def _fingerprint(self, df: Union[pd.DataFrame, np.ndarray]) -> str:
+        """
+        Fingerprint of the fitted columns of ``df``; edits in place change it.
+        """
+        return cache.fingerprint(self.columns, lambda col: self._column_values(df, col))
+
+    def _fit_reference(self, distances: np.ndarray, indices: np.ndarray):
+        """
+        Store what the score needs about the reference rows, from their own neighbors.
+        """
+        pass
+
+    @abstractmethod
+    def _neighbor_scores(self, distances: np.ndarray, indices: np.ndarray) -> np.ndarray:
+        """
+        Score of every row from the distances and positions of its nearest reference rows.
+        """
+        pass
+
+    # ------------------------------------
+    #               Scoring
+    # ------------------------------------
+
+    def score(self, df: Union[pd.DataFrame, np.ndarray]) -> np.ndarray:
+        """
+        Outlier score of every row; higher is more outlying.
+
+        The fitted object gets its fitted scores back unless its values were
+        changed since; other rows are scored against the fitted index.
+
+        :param df: The DataFrame, Arrow table or 2-D array.
+        :type df: Union[pd.DataFrame, np.ndarray]
+        :return: One score per row.
+        :rtype: np.ndarray
+        """
+
+        if not self._fitted:
+            self.fit(df)
+
+        # Same object is not same data: it may have been edited in place since the fit.
+        if self._fitted_on is not None and self._fitted_on() is df and len(df) == len(self._fitted_scores) and self._fingerprint(df) == self._fitted_fingerprint:
+            return self._fitted_scores.copy()
+
+        return super().score(df)
+
+    def _score_block(self, block: np.ndarray) -> np.ndarray:
+        """
+        Neighbor-based score of every row of the block.
+
+        :param block: 2-D block of the fitted columns, in the compute dtype.
+        :type block: np.ndarray
+        """
+
+        scores = np.full(len(block), np.nan)
+        complete = ~np.isnan(block).any(axis = 1)
+
+        distances, indices = self._index.query(block[complete], self.n_neighbors)
+        scores[complete] = self._neighbor_scores(distances, indices)
+
+        return scores
+
+
+class KNNDetector(NeighborDetectorBase):
+    """
+    k-nearest-neighbor distance outlier detector (Ramaswamy et al., 2000).
+
+    A row's score is the distance to its ``n_neighbors``-th nearest row
+    (``method="largest"``) or the mean distance to its ``n_neighbors`` nearest
+    rows (``method="mean"``). Rows far from every other row are outliers.
+    The columns should be on comparable scales.
+    """
+
+    def __init__(
+            self,
+            *,
+            threshold: float = 0.99,
+            columns: Optional[List[str]] = None,
+            exclude: Optional[List[str]] = None,
+            n_neighbors: int = 5,
+            method: str = "largest",
+            algorithm: str = "auto",
+            n_jobs: int = 1,
+            max_samples: Optional[int] = None,
+            random_state: Optional[int] = None,
+            dtype: str = "float64",
+            nan_policy: str = "raise",
+            block_size: int = 65536
+    ):
+        if method not in ("largest", "mean"):
+            raise ConfigurationException(
+                error_code = "CON002",
+                method = self.__class__.__name__,
+                parameter_context = "method",
+                suggestion = "The method must be 'largest' (k-th neighbor distance) or 'mean'."
+            )
+
+        super().__init__(
+            threshold = threshold,
+            columns = columns,
+            exclude = exclude,
+            n_neighbors = n_neighbors,
+            algorithm = algorithm,
+            n_jobs = n_jobs,
+            max_samples = max_samples,
+            random_state = random_state,
+            dtype = dtype,
+            nan_policy = nan_policy,
+            block_size = block_size
+        )
+
+        self.method = method
+
+    def _neighbor_scores(self, distances: np.ndarray, indices: np.ndarray) -> np.ndarray:
+        if self.method == "largest":
+            return distances[:, -1]
+
+        return distances.mean(axis = 1)
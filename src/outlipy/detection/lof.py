@@ -0,0 +1,72 @@
+import numpy as np
+
+from typing import Optional, List
+
+from .knn import NeighborDetectorBase
+
+
+class LOFDetector(NeighborDetectorBase):
+    """
+    Local Outlier Factor detector (Breunig et al., 2000).
+
+    Compares the local density of a row with the densities of its
+    ``n_neighbors`` nearest rows. A factor close to 1 means the row is as
+    dense as its neighborhood; clearly larger values mark rows in sparser
+    regions than their neighbors, which also finds outliers next to dense
+    clusters that a global distance misses.
+
+    The k-distance and local reachability density of every reference row are
+    computed once at fit; scoring a new row only needs its own neighbors.
+    """
+
+    # Added to the mean reachability distance, so duplicated rows keep a finite density.
+    epsilon = 1e-10
+
+    def __init__(
+            self,
+            *,
+            threshold: float = 0.99,
+            columns: Optional[List[str]] = None,
+            exclude: Optional[List[str]] = None,
+            n_neighbors: int = 20,
+            algorithm: str = "auto",
+            n_jobs: int = 1,
+            max_samples: Optional[int] = None,
+            random_state: Optional[int] = None,
+            dtype: str = "float64",
+            nan_policy: str = "raise",
+            block_size: int = 65536
+    ):
+        super().__init__(
+            threshold = threshold,
+            columns = columns,
+            exclude = exclude,
+            n_neighbors = n_neighbors,
+            algorithm = algorithm,
+            n_jobs = n_jobs,
+            max_samples = max_samples,
+            random_state = random_state,
+            dtype = dtype,
+            nan_policy = nan_policy,
+            block_size = block_size
+        )
+
+    def _fit_reference(self, distances: np.ndarray, indices: np.ndarray):
+        k_distance = distances[:, -1]
+
+        self._scores["k_distance"] = k_distance
+        self._scores["lrd"] = self._density(distances, indices, k_distance)
+
+    def _density(self, distances: np.ndarray, indices: np.ndarray, k_distance: np.ndarray) -> np.ndarray:
+        """
+        Local reachability density: inverse mean of ``max(k-distance(o), d(x, o))`` over the neighbors o.
+        """
+        reachability = np.maximum(distances, np.take(k_distance, indices))
+
+        return 1.0 / (reachability.mean(axis = 1) + self.epsilon)
+
+    def _neighbor_scores(self, distances: np.ndarray, indices: np.ndarray) -> np.ndarray:
+        lrd = self._scores["lrd"]
+        density = self._density(distances, indices, self._scores["k_distance"])
+
+        return np.take(lrd, indices).mean(axis = 1) / density
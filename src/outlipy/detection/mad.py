@@ -1,12 +1,14 @@
-import pandas as pd
 import numpy as np
 
-from typing import Optional, List
+from typing import Optional, List, Dict, Any, Union, Tuple
 
-from .base import OutlierDetectorBase
+from .base import UnivariateDetectorBase
+from ..core import stats, kernels
+from ..core.sketch import QuantileSketch
+from ..core.frequency import FrequencyTable
 from ..exceptions import ConfigurationException, DetectionException
 
-class MADDetector(OutlierDetectorBase):
+class MADDetector(UnivariateDetectorBase):
     """
     Modified Z-score (Median Absolute Deviation or MAD) based outlier detector.
 
@@ -18,7 +20,13 @@ class MADDetector(OutlierDetectorBase):
             *,
             threshold: float = 3.5,
             columns: Optional[List[str]] = None,
-            exclude: Optional[List[str]] = None
+            exclude: Optional[List[str]] = None,
+            dtype: str = "float64",
+            nan_policy: str = "raise",
+            sample: Optional[Union[int, float]] = None,
+            random_state: Optional[int] = None,
+            incremental: bool = False,
+            max_cardinality: Optional[int] = None
     ):
         if threshold < 0:
             raise ConfigurationException(
@@ -31,74 +39,88 @@ class MADDetector(OutlierDetectorBase):
         super().__init__(
             threshold = threshold,
             columns = columns,
-            exclude = exclude
+            exclude = exclude,
+            dtype = dtype,
+            nan_policy = nan_policy,
+            sample = sample,
+            random_state = random_state,
+            incremental = incremental,
+            max_cardinality = max_cardinality
         )
 
+        self.scaling_factor = 0.67449
+
     
-    def _compute_scores(self, df: pd.DataFrame):
+    def _fit_column(self, values) -> Dict[str, Any]:
         """
-        Compute the median and Median Absolute Deviation (MAD) for each column.
+        Compute the median and Median Absolute Deviation (MAD) for a single column.
         """
 
-        # If suddenly self.columns becomes None.
-        if self.columns is None:
-            raise RuntimeError("Validation was done, but self.columns remains None")
+        median = stats.median(values)
 
-        data_to_use = df[self.columns]
+        return self._median_scores(median, stats.median(stats.abs_deviation(values, median, self.dtype)))
 
-        self._scores = {} # Resets scores
+    def _fit_frequencies(self, table: FrequencyTable) -> Dict[str, Any]:
+        """
+        Median and MAD from the frequency table of a low-cardinality column.
+        """
+        median = table.median()
 
-        self.scaling_factor = 0.67449
+        return self._median_scores(median, table.abs_deviation(median, self.dtype).median())
 
-        for col in self.columns:
-            series = data_to_use[col]
+    def _state_scores(self, state: QuantileSketch) -> Dict[str, Any]:
+        """
+        Median and MAD from the merged quantile sketch.
+        """
+        median = state.quantile(0.5)
+        deviations = np.abs(state.points - median)
+        order = np.argsort(deviations, kind = "stable")
 
-            median = series.median()
+        return self._median_scores(median, stats.weighted_quantile(deviations[order], state.weights[order], 0.5))
+
+    def _median_scores(self, median: float, mad: float) -> Dict[str, Any]:
+        if median == 0:
+            raise DetectionException(
+                error_code = "DET005",
+                method = self.__class__.__name__,
+                suggestion = "Zero Modified Absolute Deviation (MAD = 0). Remove constant/uninformative features."
+            )
 
-            mad = (series - median).abs().median()
+        return {
+            "median": median,
+            "mad": mad
+        }
 
-            if median == 0:
-                raise DetectionException(
-                    error_code = "DET005",
-                    method = self.__class__.__name__,
-                    suggestion = "Zero Modified Absolute Deviation (MAD = 0). Remove constant/uninformative features."
-                )
-            
-            self._scores[col] = {
-                "median": median,
-                "mad": mad
-            }
+    def _bounds(self, scores: Dict[str, Any]) -> Tuple[float, float]:
+        """
+        Values whose modified Z-score equals the threshold.
+        """
+        spread = self.threshold * scores["mad"] / self.scaling_factor
+        return scores["median"] - spread, scores["median"] + spread
 
-    def detect(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _detect_column(self, values: np.ndarray, scores: Dict[str, Any]) -> np.ndarray:
         """
-        Return a DataFrame of booleans where True marks an outlier.
+        Flag the values whose absolute Modified Z-score exceeds the threshold.
 
-        :param df: The DataFrame.
-        :type df: pd.DataFrame
+        :param values: The 1-D column values.
+        :type values: np.ndarray
         :return: The mask where True marks an outlier.
-        :rtype: DataFrame
+        :rtype: np.ndarray
         """
 
-        # Auto fit if it was not fitted yet.
-        if not self._fitted:
-            self.fit(df)
-
-        # if self.columns is unexpectedly become None.
-
-        if self.columns is None:
-            raise RuntimeError("Detector was fitted, but self.columns is unexpectedly None.")
+        return kernels.scaled_above(values, scores["median"], self.scaling_factor, scores["mad"], self.threshold, self.dtype)
 
-        outlier_mask = pd.DataFrame(False, index = df.index, columns = self.columns)
-
-        for col in self.columns:
-            stats = self._scores[col]
-            median, mad = stats["median"], stats["mad"]
-            series = df[col]
-
-            modified_zscores = self.scaling_factor * np.abs(series - median) / mad
+    def _score_column(self, values: np.ndarray, scores: Dict[str, Any]) -> np.ndarray:
+        """
+        Absolute Modified Z-score of every value.
+        """
 
-            outliers = modified_zscores > self.threshold
+        median, mad = scores["median"], scores["mad"]
 
-            outlier_mask[col] = outliers
+        # One buffer in the compute dtype, updated in place.
+        modified_zscores = np.subtract(values, median, dtype = self.dtype)
+        np.abs(modified_zscores, out = modified_zscores)
+        modified_zscores *= self.scaling_factor
+        modified_zscores /= mad
 
-        return outlier_mask
\ No newline at end of file
+        return modified_zscores
@@ -0,0 +1,353 @@
+import pandas as pd
+import numpy as np
+import math
+
+from typing import Optional, List, Union, Tuple
+
+from .base import MultivariateDetectorBase
+from ..core import stats
+from ..core.instrumentation import stage
+from ..exceptions import ConfigurationException, MultivariateException
+
+
+def _squared_distances(data: np.ndarray, location: np.ndarray, factor: np.ndarray, block_size: int) -> np.ndarray:
+    """
+    Squared Mahalanobis distances of the rows of ``data``.
+
+    ``factor`` is the inverse of the Cholesky factor L of the covariance, so
+    ``d^2 = ||L^-1 (x - location)||^2``. Rows are processed in blocks, keeping
+    the temporaries at ``block_size x p``.
+    """
+    distances = np.empty(len(data), dtype = np.float64)
+
+    for start in range(0, len(data), block_size):
+        whitened = (data[start:start + block_size] - location) @ factor.T
+        distances[start:start + block_size] = np.einsum("ij,ij->i", whitened, whitened)
+
+    return distances
+
+
+def _covariance(rows: np.ndarray) -> np.ndarray:
+    """
+    Maximum-likelihood covariance of the rows, always 2-D (also for one column).
+    """
+    return np.atleast_2d(np.cov(rows, rowvar = False, bias = True))
+
+
+def _inverse_cholesky(covariance: np.ndarray) -> Optional[np.ndarray]:
+    """
+    Inverse of the lower Cholesky factor, or None if the covariance is singular.
+
+    ``L[j, j]^2`` is the variance of column j left after regressing it on the
+    previous columns; a (numerically) zero value means a linearly dependent
+    column, which rounding can otherwise let through the factorization.
+    """
+    try:
+        lower = np.linalg.cholesky(covariance)
+    except np.linalg.LinAlgError:
+        return None
+
+    if (np.diag(lower) ** 2 <= 1e-10 * np.diag(covariance)).any():
+        return None
+
+    return np.linalg.solve(lower, np.eye(len(covariance)))
+
+
+class MahalanobisDetector(MultivariateDetectorBase):
+    """
+    Mahalanobis distance based multivariate outlier detector.
+
+    Flags rows that are unusual in the combination of their features, even if
+    every single value is within its column's normal range. A row is an outlier
+    when its squared distance exceeds the ``threshold`` quantile of the
+    chi-square distribution with one degree of freedom per column.
+
+    threshold: chi-square quantile used as cutoff, e.g. 0.975.
+    robust: estimate location and covariance with the Minimum Covariance
+            Determinant (FastMCD) so the outliers do not mask themselves.
+            Otherwise the classical mean and covariance are used, which can
+            also be accumulated chunk by chunk with ``partial_fit``.
+    """
+
+    # FastMCD settings (Rousseeuw & Van Driessen, 1999).
+    n_trials = 30
+    n_candidates = 10
+    subsample_size = 1500
+    max_c_steps = 30
+
+    def __init__(
+            self,
+            *,
+            threshold: float = 0.975,
+            columns: Optional[List[str]] = None,
+            exclude: Optional[List[str]] = None,
+            robust: bool = False,
+            support_fraction: Optional[float] = None,
+            random_state: Optional[int] = None,
+            dtype: str = "float64",
+            nan_policy: str = "raise",
+            block_size: int = 65536
+    ):
+        if not isinstance(threshold, float) or not 0 < threshold < 1:
+            raise ConfigurationException(
+                error_code = "CON002",
+                method = self.__class__.__name__,
+                parameter_context = "threshold",
+                suggestion = "The threshold is a chi-square quantile, e.g. 0.975. Ensure 0.0 < threshold < 1.0."
+            )
+
+        if support_fraction is not None and not 0.5 <= support_fraction <= 1:
+            raise ConfigurationException(
+                error_code = "CON002",
+                method = self.__class__.__name__,
+                parameter_context = "support_fraction",
+                suggestion = "Ensure 0.5 <= support_fraction <= 1.0, or leave it as None for (n + p + 1) / 2 rows."
+            )
+
+        super().__init__(
+            threshold = threshold,
+            columns = columns,
+            exclude = exclude,
+            dtype = dtype,
+            nan_policy = nan_policy,
+            block_size = block_size
+        )
+
+        self.robust = robust
+        self.support_fraction = support_fraction
+        self.random_state = random_state
+        self._moments = (0, None, None)
+
+    # ------------------------------------
+    #               Fitting
+    # ------------------------------------
+
+    def _deterministic(self) -> bool:
+        # Only the robust estimate draws random subsets.
+        return not self.robust or self.random_state is not None
+
+    def _compute_scores(self, df: Union[pd.DataFrame, np.ndarray]):
+        """
+        Estimate the location and covariance of the selected columns.
+
+        :param df: The DataFrame, Arrow table or 2-D array.
+        :type df: Union[pd.DataFrame, np.ndarray]
+        """
+
+        if self.robust:
+            location, covariance, n_samples = self._fast_mcd(self._matrix(df))
+            self._set_estimate(location, covariance, n_samples)
+        else:
+            self._moments = (0, None, None)
+            self._update_moments(df)
+            self._finalize_moments()
+
+    def partial_fit(self, df: Union[pd.DataFrame, np.ndarray]):
+        """
+        Update the classical mean and covariance with another chunk of rows.
+
+        Chunks are merged exactly, so fitting chunk by chunk gives the same
+        estimate as one ``fit`` over all rows. The columns are fixed by the
+        first chunk.
+
+        :param df: The next chunk (DataFrame, Arrow table or 2-D array).
+        :type df: Union[pd.DataFrame, np.ndarray]
+        """
+
+        if self.robust:
+            raise ConfigurationException(
+                error_code = "CON002",
+                method = self.__class__.__name__,
+                parameter_context = "robust",
+                suggestion = "partial_fit only supports the classical covariance. Use robust = False or call fit on all rows."
+            )
+
+        if not self._fitted:
+            self._moments = (0, None, None)
+
+        self._validate_input(df)
+
+        with stage(self, "partial_fit", df, len(self.columns)):
+            self._update_moments(df)
+            self._finalize_moments()
+
+        self._cache_key = None
+        self._fitted = True
+        return self
+
+    def _update_moments(self, df: Union[pd.DataFrame, np.ndarray]):
+        """
+        Merge the moments of every row block of ``df`` into ``self._moments``.
+        """
+        n, mean, scatter = self._moments
+
+        for _, _, block in self._iter_blocks(df):
+            block = self._complete_rows(block)
+
+            if len(block):
+                if mean is None:
+                    n, mean, scatter = stats.block_scatter(block)
+                else:
+                    n, mean, scatter = stats.merge_scatter(n, mean, scatter, *stats.block_scatter(block))
+
+        self._moments = (n, mean, scatter)
+
+    def _finalize_moments(self):
+        """
+        Turn the accumulated moments into the sample covariance estimate.
+        """
+        n, mean, scatter = self._moments
+
+        if mean is None or n <= len(mean):
+            self._raise_too_few_samples(n)
+
+        self._set_estimate(mean, scatter / (n - 1), n)
+
+    def _set_estimate(self, location: np.ndarray, covariance: np.ndarray, n_samples: int):
+        """
+        Store the estimate together with the inverse Cholesky factor and the cutoff.
+        """
+        factor = _inverse_cholesky(covariance)
+
+        if factor is None:
+            raise MultivariateException(
+                error_code = "MVT001",
+                method = self.__class__.__name__,
+                suggestion = "Remove constant or linearly dependent columns (e.g. a column that is the sum of others)."
+            )
+
+        if not np.isfinite(factor).all():
+            raise MultivariateException(
+                error_code = "MVT005",
+                method = self.__class__.__name__,
+                suggestion = "The covariance matrix is ill-conditioned. Rescale the columns or remove near-duplicate columns."
+            )
+
+        self._scores = {
+            "location": location,
+            "covariance": covariance,
+            "precision_factor": factor,
+            "n_samples": n_samples,
+            "cutoff": math.sqrt(stats.chi2_ppf(self.threshold, len(location)))
+        }
+
+    def _raise_too_few_samples(self, n: int):
+        raise MultivariateException(
+            error_code = "MVT002",
+            method = self.__class__.__name__,
+            suggestion = f"At least {len(self.columns) + 1} complete rows are needed for {len(self.columns)} columns, got {n}."
+        )
+
+    # ------------------------------------
+    #               FastMCD
+    # ------------------------------------
+
+    def _c_steps(self, data: np.ndarray, h: int, location: np.ndarray, covariance: np.ndarray, max_steps: int):
+        """
+        Concentration steps: refit on the ``h`` rows closest to the current estimate
+        until the covariance determinant stops decreasing.
+
+        :return: ``(log_det, location, covariance)``, or None if a covariance became singular.
+        """
+        log_det = np.inf
+
+        for _ in range(max_steps):
+            factor = _inverse_cholesky(covariance)
+
+            if factor is None:
+                return None
+
+            distances = _squared_distances(data, location, factor, self.block_size)
+            support = data[np.argpartition(distances, h - 1)[:h]]
+
+            location = support.mean(axis = 0)
+            covariance = _covariance(support)
+            sign, new_log_det = np.linalg.slogdet(covariance)
+
+            if sign <= 0:
+                return None
+
+            # Converged once the determinant changes by less than 1e-5 (relative).
+            converged = new_log_det > log_det - 1e-5
+            log_det = min(log_det, new_log_det)
+
+            if converged:
+                break
+
+        return log_det, location, covariance
+
+    def _fast_mcd(self, data: np.ndarray) -> Tuple[np.ndarray, np.ndarray, int]:
+        """
+        Reweighted Minimum Covariance Determinant estimate (FastMCD).
+
+        Random (p + 1)-row starts are concentrated on a subsample, the best
+        candidates are refined there until convergence and only the winner is
+        refined on all rows. The result is corrected for consistency and
+        reweighted on the rows within the 97.5% chi-square quantile.
+        """
+        n, p = data.shape
+
+        if n <= p:
+            self._raise_too_few_samples(n)
+
+        h = math.ceil(self.support_fraction * n) if self.support_fraction else (n + p + 1) // 2
+        h = min(max(h, p + 1), n)
+        rng = np.random.default_rng(self.random_state)
+
+        subsample = data if n <= self.subsample_size else data[rng.choice(n, self.subsample_size, replace = False)]
+        h_subsample = min(max(math.ceil(h * len(subsample) / n), p + 1), len(subsample))
+
+        candidates = []
+
+        for _ in range(self.n_trials):
+            start = subsample[rng.choice(len(subsample), p + 1, replace = False)]
+            result = self._c_steps(subsample, h_subsample, start.mean(axis = 0), _covariance(start), 2)
+
+            if result is not None:
+                candidates.append(result)
+
+        candidates.sort(key = lambda candidate: candidate[0])
+        refined = [self._c_steps(subsample, h_subsample, location, covariance, self.max_c_steps) for _, location, covariance in candidates[:self.n_candidates]]
+        refined = [result for result in refined if result is not None]
+        best = min(refined, key = lambda candidate: candidate[0]) if refined else None
+
+        if best is not None and subsample is not data:
+            best = self._c_steps(data, h, best[1], best[2], self.max_c_steps)
+
+        if best is None:
+            raise MultivariateException(
+                error_code = "MVT001",
+                method = self.__class__.__name__,
+                suggestion = "Every MCD subset had a singular covariance. Remove constant or discrete columns."
+            )
+
+        _, location, covariance = best
+
+        # Consistency correction, then reweighting on the rows that look regular.
+        distances = _squared_distances(data, location, _inverse_cholesky(covariance), self.block_size)
+        correction = np.median(distances) / stats.chi2_ppf(0.5, p)
+        inliers = data[distances / correction <= stats.chi2_ppf(0.975, p)]
+
+        if len(inliers) <= p:
+            return location, covariance * correction, n
+
+        return inliers.mean(axis = 0), _covariance(inliers), len(inliers)
+
+    # ------------------------------------
+    #               Scoring
+    # ------------------------------------
+
+    def _score_block(self, block: np.ndarray) -> np.ndarray:
+        """
+        Mahalanobis distance of every row of the block.
+
+        :param block: 2-D block of the fitted columns, in the compute dtype.
+        :type block: np.ndarray
+        """
+
+        location = self._scores["location"].astype(block.dtype, copy = False)
+        factor = self._scores["precision_factor"].astype(block.dtype, copy = False)
+
+        whitened = (block - location) @ factor.T
+
+        return np.sqrt(np.einsum("ij,ij->i", whitened, whitened))
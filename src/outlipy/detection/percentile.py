@@ -1,24 +1,36 @@
 import pandas as pd
 import numpy as np
 
-from typing import Optional, List, Tuple, Union
+from typing import Optional, List, Tuple, Union, Dict, Any
 
-from .base import OutlierDetectorBase
+from .base import UnivariateDetectorBase
+from ..core import stats, kernels
+from ..core.sketch import QuantileSketch
+from ..core.frequency import FrequencyTable
 from ..exceptions import ConfigurationException, DetectionException
 
-class PercentileDetector(OutlierDetectorBase):
+class PercentileDetector(UnivariateDetectorBase):
     """
     Percentile-based outlier detector.
 
     A data point is considered an outlier if it falls outside the range 
     defined by the lower and upper percentile bounds.
     """
+
+    _outside_bounds = True
+
     def __init__(
             self,
             *,
             threshold: Union[Tuple[float, float], float] = (0.05, 0.95),
             columns: Optional[List[str]] = None,
-            exclude: Optional[List[str]] = None
+            exclude: Optional[List[str]] = None,
+            dtype: str = "float64",
+            nan_policy: str = "raise",
+            sample: Optional[Union[int, float]] = None,
+            random_state: Optional[int] = None,
+            incremental: bool = False,
+            max_cardinality: Optional[int] = None
     ):
         if not (isinstance(threshold, tuple) and len(threshold) == 2):
             raise ConfigurationException(
@@ -39,23 +51,21 @@ class PercentileDetector(OutlierDetectorBase):
         super().__init__(
             threshold = threshold,
             columns = columns,
-            exclude = exclude
+            exclude = exclude,
+            dtype = dtype,
+            nan_policy = nan_policy,
+            sample = sample,
+            random_state = random_state,
+            incremental = incremental,
+            max_cardinality = max_cardinality
         )
 
     
-    def _compute_scores(self, df: pd.DataFrame):
+    def _compute_scores(self, df: Union[pd.DataFrame, np.ndarray], quantiles: Optional[Dict[Any, Dict[float, float]]] = None):
         """
         Compute the actual lower and upper bounds corresponding to the percentile thresholds.
         """
 
-        # If suddenly self.columns becomes None.
-        if self.columns is None:
-            raise RuntimeError("Validation was done, but self.columns remains None")
-
-        data_to_use = df[self.columns]
-
-        self._scores = {} # Resets scores
-
         if not isinstance(self.threshold, tuple):
             raise ConfigurationException(
                 error_code = "CON002",
@@ -64,55 +74,63 @@ class PercentileDetector(OutlierDetectorBase):
                 suggestion = "Example: (0.05, 0.95) for 5th and 95th percentiles."
             )
 
-        lower_q, upper_q = self.threshold
-
-        for col in self.columns:
-            series = data_to_use[col]
+        super()._compute_scores(df, quantiles)
 
-            lower_bound = series.quantile(lower_q)
-            upper_bound = series.quantile(upper_q)
+    def _fit_column(self, values) -> Dict[str, Any]:
+        """
+        Compute the lower and upper percentile bounds for a single column.
+        """
 
-            if lower_bound == upper_bound:
-                raise DetectionException(
-                    error_code = "DET003",
-                    method = self.__class__.__name__,
-                    suggestion = "The percentile range resulted in zero variance. Remove constant/uninformative features."
-                )
-            
-            self._scores[col] = {
-                "lower_bound": lower_bound,
-                "upper_bound": upper_bound
-            }
+        return self._percentile_scores(*stats.quantile(values, list(self.threshold)))
 
+    def _quantile_levels(self) -> List[float]:
+        return list(self.threshold)
 
-    def detect(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _fit_quantiles(self, quantiles: Dict[float, float]) -> Dict[str, Any]:
         """
-        Detect outliers based on the calculated percentile bounds.
-
-        :param df: The DataFrame.
-        :type df: pd.DataFrame
-        :return: The mask where True marks an outlier.
-        :rtype: DataFrame
+        Percentile bounds from precomputed quantiles.
         """
+        return self._percentile_scores(quantiles[self.threshold[0]], quantiles[self.threshold[1]])
 
-        # Auto fit if it was not fitted yet.
-        if not self._fitted:
-            self.fit(df)
+    def _fit_frequencies(self, table: FrequencyTable) -> Dict[str, Any]:
+        """
+        Percentile bounds from the frequency table of a low-cardinality column.
+        """
+        return self._percentile_scores(*table.quantile(list(self.threshold)))
 
-        # if self.columns is unexpectedly become None.
+    def _state_scores(self, state: QuantileSketch) -> Dict[str, Any]:
+        """
+        Percentile bounds from the merged quantile sketch.
+        """
+        return self._percentile_scores(*state.quantile(list(self.threshold)))
 
-        if self.columns is None:
-            raise RuntimeError("Detector was fitted, but self.columns is unexpectedly None.")
+    def _percentile_scores(self, lower_bound: float, upper_bound: float) -> Dict[str, Any]:
+        if lower_bound == upper_bound:
+            raise DetectionException(
+                error_code = "DET003",
+                method = self.__class__.__name__,
+                suggestion = "The percentile range resulted in zero variance. Remove constant/uninformative features."
+            )
 
-        outlier_mask = pd.DataFrame(False, index = df.index, columns = self.columns)
+        return {
+            "lower_bound": lower_bound,
+            "upper_bound": upper_bound
+        }
 
-        for col in self.columns:
-            bounds = self._scores[col]
-            lower_bound, upper_bound = bounds["lower_bound"], bounds["upper_bound"]
-            series = df[col]
+    def _bounds(self, scores: Dict[str, Any]) -> Tuple[float, float]:
+        """
+        The fitted percentile bounds.
+        """
+        return scores["lower_bound"], scores["upper_bound"]
 
-            outliers = (series < lower_bound) | (series > upper_bound)
+    def _detect_column(self, values: np.ndarray, scores: Dict[str, Any]) -> np.ndarray:
+        """
+        Flag the values outside the calculated percentile bounds.
 
-            outlier_mask[col] = outliers
+        :param values: The 1-D column values.
+        :type values: np.ndarray
+        :return: The mask where True marks an outlier.
+        :rtype: np.ndarray
+        """
 
-        return outlier_mask
\ No newline at end of file
+        return kernels.outside(values, scores["lower_bound"], scores["upper_bound"])
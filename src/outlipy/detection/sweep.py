@@ -0,0 +1,69 @@
+import pandas as pd
+import numpy as np
+
+from typing import Any, Dict, Optional
+
+
+class SweepResult:
+    """
+    Outlier counts of a detector for many thresholds, from one scoring pass.
+
+    Attributes:
+        thresholds (np.ndarray): The evaluated thresholds, in the order they were given.
+        counts (pd.DataFrame): Outliers per threshold (rows) and column (columns).
+        n_rows (int): Rows of the scored input.
+        masks (Dict[float, Any]): The masks of the thresholds requested with ``masks=``,
+            in the container type of the input.
+    """
+
+    def __init__(
+            self,
+            *,
+            thresholds: np.ndarray,
+            counts: pd.DataFrame,
+            n_rows: int,
+            masks: Optional[Dict[float, Any]] = None
+    ):
+        self.thresholds = thresholds
+        self.counts = counts
+        self.n_rows = n_rows
+        self.masks = masks or {}
+
+    def __repr__(self):
+        return f"SweepResult(thresholds={len(self.thresholds)}, columns={self.counts.shape[1]}, n_rows={self.n_rows})"
+
+    @property
+    def rates(self) -> pd.DataFrame:
+        """
+        Share of the rows flagged per threshold and column.
+        """
+        return self.counts / self.n_rows if self.n_rows else self.counts.astype(float)
+
+    def total(self) -> pd.Series:
+        """
+        Outliers per threshold summed over the columns.
+        """
+        return self.counts.sum(axis = 1)
+
+    def threshold_for_rate(self, rate: float) -> float:
+        """
+        Smallest evaluated threshold flagging at most ``rate`` of the values of every column.
+
+        :param rate: Largest acceptable share of outliers per column, e.g. 0.01.
+        :type rate: float
+        :return: The threshold, or NaN if no evaluated threshold is strict enough.
+        :rtype: float
+        """
+        within = (self.rates <= rate).all(axis = 1)
+        candidates = self.counts.index[within.to_numpy()]
+
+        return float(candidates.min()) if len(candidates) else float("nan")
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Long format: one row per threshold and column with the count and the rate.
+        """
+        counts = self.counts.stack().rename("count")
+        rates = self.rates.stack().rename("rate")
+
+        return pd.concat([counts, rates], axis = 1)
@@ -1,15 +1,17 @@
-import pandas as pd
 import numpy as np
 
-from typing import Optional, List
+from typing import Optional, List, Dict, Any, Union, Tuple
 
+from ..core import stats, kernels
+from ..core.sketch import Moments
+from ..core.frequency import FrequencyTable
 from ..exceptions import ConfigurationException, DetectionException
 
-from .base import OutlierDetectorBase
+from .base import UnivariateDetectorBase
 
 
 
-class ZScoreDetector(OutlierDetectorBase):
+class ZScoreDetector(UnivariateDetectorBase):
     """
     Z-score based outlier detector.
 
@@ -20,7 +22,13 @@ class ZScoreDetector(OutlierDetectorBase):
             self,
             threshold: float = 3.0,
             columns: Optional[List[str]] = None,
-            exclude: Optional[List[str]] = None
+            exclude: Optional[List[str]] = None,
+            dtype: str = "float64",
+            nan_policy: str = "raise",
+            sample: Optional[Union[int, float]] = None,
+            random_state: Optional[int] = None,
+            incremental: bool = False,
+            max_cardinality: Optional[int] = None
     ):
         if threshold <= 0:
             raise ConfigurationException(
@@ -33,68 +41,88 @@ class ZScoreDetector(OutlierDetectorBase):
         super().__init__(
             threshold = threshold,
             columns = columns,
-            exclude = exclude
+            exclude = exclude,
+            dtype = dtype,
+            nan_policy = nan_policy,
+            sample = sample,
+            random_state = random_state,
+            incremental = incremental,
+            max_cardinality = max_cardinality
         )
     
-    def _compute_scores(self, df: pd.DataFrame):
+    def _fit_column(self, values) -> Dict[str, Any]:
         """
-        Compute the mean and standard deviation for each selected column.
+        Compute the mean and standard deviation for a single column.
 
-        :param df: The DataFrame
-        :type df: pd.DataFrame
+        :param values: The 1-D column values.
+        :type values: np.ndarray
         """
 
-        # If suddenly self.columns becomes None.
-        if self.columns is None:
-            raise RuntimeError("Validation was done, but self.columns remains None")
+        return self._moment_scores(stats.mean(values), stats.std(values))
 
-        data_to_use = df[self.columns]
+    def _fit_frequencies(self, table: FrequencyTable) -> Dict[str, Any]:
+        """
+        Count-weighted mean and standard deviation from the frequency table of a low-cardinality column.
+        """
+        return self._moment_scores(table.mean(), table.std())
 
-        self._scores = {} # Resets scores
+    def _column_state(self, values, weight: float, scores: Optional[Dict[str, Any]] = None) -> Moments:
+        """
+        Count, mean and variance of the column; reuses the fitted mean and standard deviation.
+        """
+        if scores is None:
+            scores = {"mean": stats.mean(values), "std_dev": stats.std(values)}
 
-        for col in self.columns:
-            series = data_to_use[col]
+        return Moments(len(values) * weight, scores["mean"], scores["std_dev"] ** 2)
 
-            mean = series.mean()
-            std_dev = series.std(ddof = 0)
+    def _state_scores(self, state: Moments) -> Dict[str, Any]:
+        """
+        Mean and standard deviation of the merged moments.
+        """
+        return self._moment_scores(state.mean, state.std)
 
-            if std_dev == 0:
-                raise DetectionException(
-                    error_code = "DET003",
-                    method = self.__class__.__name__,
-                    suggestion = "Remove Constant/Uninformative Features or verify Data Preprocessing (Standard deviation is zero)."
-                )
-            
-            self._scores[col] = {
-                "mean": mean,
-                "std_dev": std_dev
-            }
+    def _moment_scores(self, mean: float, std_dev: float) -> Dict[str, Any]:
+        if std_dev == 0:
+            raise DetectionException(
+                error_code = "DET003",
+                method = self.__class__.__name__,
+                suggestion = "Remove Constant/Uninformative Features or verify Data Preprocessing (Standard deviation is zero)."
+            )
 
+        return {
+            "mean": mean,
+            "std_dev": std_dev
+        }
 
-    def detect(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _bounds(self, scores: Dict[str, Any]) -> Tuple[float, float]:
+        """
+        Mean plus and minus threshold standard deviations.
         """
-        Detect outliers based on the Z-score threshold.
+        spread = self.threshold * scores["std_dev"]
+        return scores["mean"] - spread, scores["mean"] + spread
 
-        :param df: The DataFrame
-        :type df: pd.DataFrame
+    def _detect_column(self, values: np.ndarray, scores: Dict[str, Any]) -> np.ndarray:
         """
-        if not self._fitted:
-            self.fit(df)
+        Flag the values whose absolute Z-score exceeds the threshold.
 
-        if self.columns is None:
-            raise RuntimeError("Detector was fitted, but self.columns is unexpectedly None.")
-        
-        outlier_mask = pd.DataFrame(False, index = df.index, columns = self.columns)
+        :param values: The 1-D column values.
+        :type values: np.ndarray
+        :return: The mask where True marks an outlier.
+        :rtype: np.ndarray
+        """
 
-        for col in self.columns:
-            stats = self._scores[col]
-            mean, std_dev = stats['mean'], stats['std_dev']
-            series = df[col]
+        return kernels.scaled_above(values, scores["mean"], 1.0, scores["std_dev"], self.threshold, self.dtype)
 
-            z_scores = np.abs((series - mean) / std_dev)
+    def _score_column(self, values: np.ndarray, scores: Dict[str, Any]) -> np.ndarray:
+        """
+        Absolute Z-score of every value.
+        """
 
-            outliers = z_scores > self.threshold
+        mean, std_dev = scores['mean'], scores['std_dev']
 
-            outlier_mask[col] = outliers
+        # One buffer in the compute dtype, updated in place.
+        z_scores = np.subtract(values, mean, dtype = self.dtype)
+        np.abs(z_scores, out = z_scores)
+        z_scores /= std_dev
 
-        return outlier_mask
\ No newline at end of file
+        return z_scores
@@ -1,8 +1,24 @@
-from .base import OutliPyException
-from .columns import InvalidColumnException
-from .detection import DetectionException, MultivariateException
-from .handling import HandlingException
-from .configuration import ConfigurationException
+from typing import TYPE_CHECKING
+
+from ..core.lazy import lazy_attributes
+
+# Each submodule registers its error templates when it is first imported;
+# ErrorCodeRegistry.get imports the right one on demand.
+__getattr__, __dir__ = lazy_attributes(__name__, {
+    "OutliPyException": ".base",
+    "InvalidColumnException": ".columns",
+    "DetectionException": ".detection",
+    "MultivariateException": ".detection",
+    "HandlingException": ".handling",
+    "ConfigurationException": ".configuration",
+})
+
+if TYPE_CHECKING:
+    from .base import OutliPyException
+    from .columns import InvalidColumnException
+    from .detection import DetectionException, MultivariateException
+    from .handling import HandlingException
+    from .configuration import ConfigurationException
 
 __all__ = [
     "OutliPyException",
@@ -6,6 +6,11 @@ class OutliPyException(Exception, ABC):
     """
     Base exception. It creates the message but doesn't care about specific parameters.
 
+    The message is only formatted when it is first read (``str(exc)``,
+    ``exc.message`` or ``exc.args``), so raising and catching many exceptions
+    stays cheap. ``exc.args`` is ``(message,)`` as for any exception, and
+    exceptions pickle with their error code, method, context and suggestion.
+
     Args:
         error_code (str): The error code raised.
         method (str): The method currently being used.
@@ -25,9 +30,35 @@ class OutliPyException(Exception, ABC):
         self.method = method
         self.context = context or {} 
         self.suggestion = suggestion or "Please check your configuration."
-        
-        message = self._build_message()
-        super().__init__(message)
+        self._message = None
+
+        super().__init__(error_code)
+
+    @property
+    def message(self) -> str:
+        """
+        The formatted message, built on first access and cached.
+        """
+        if self._message is None:
+            self._message = self._build_message()
+
+        return self._message
+
+    @property
+    def args(self) -> tuple:
+        return (self.message,)
+
+    @args.setter
+    def args(self, value: tuple):
+        # Assigning args (e.g. to reword an error) replaces the message.
+        self._message = str(value[0]) if len(value) == 1 else str(tuple(value))
+
+    def __str__(self) -> str:
+        return self.message
+
+    def __reduce__(self):
+        # The keyword-only __init__ cannot be called with args: restore the attributes instead.
+        return _restore, (self.__class__, self.__dict__)
 
     def _build_message(self) -> str:
         """
@@ -50,4 +81,11 @@ class OutliPyException(Exception, ABC):
             method = self.method,               
             suggestion = self.suggestion,       
             **self.context 
-        )
\ No newline at end of file
+        )
+
+
+def _restore(cls, state: Dict[str, Any]) -> OutliPyException:
+    exc = cls.__new__(cls)
+    exc.__dict__.update(state)
+
+    return exc
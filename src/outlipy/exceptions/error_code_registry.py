@@ -1,18 +1,41 @@
+from importlib import import_module
 from typing import Optional
 
 class ErrorCodeRegistry:
     """
     Register error codes.
+
+    Templates are registered by the module defining the matching exception, when
+    that module is imported. ``get`` imports the module owning a code prefix on
+    first use, so no template is registered before it can be needed.
     """
     _registry = {}
 
+    # Error code prefix -> module registering its templates.
+    _providers = {
+        "ICE": "outlipy.exceptions.columns",
+        "CON": "outlipy.exceptions.configuration",
+        "DET": "outlipy.exceptions.detection",
+        "MVT": "outlipy.exceptions.detection",
+        "HEX": "outlipy.exceptions.handling",
+    }
+
     @classmethod
     def register(cls, code: str, message_template: str) -> None:
         if code in cls._registry:
             raise ValueError(f"Duplicate error code detected: {code}")
-        
+
         cls._registry[code] = message_template
 
     @classmethod
     def get(cls, code: str) -> Optional[str]:
-        return cls._registry.get(code, None)
\ No newline at end of file
+        template = cls._registry.get(code, None)
+
+        if template is None:
+            provider = cls._providers.get(code[:3])
+
+            if provider is not None:
+                import_module(provider)
+                template = cls._registry.get(code, None)
+
+        return template
@@ -1,10 +1,27 @@
-from .base import OutlierHandlerBase
-from .central_tendency import MeanHandler, MedianHandler
-from .winsorization import WinsorizationHandler
-from .remove import RemoveHandler
-from .constant_replacement import ConstantHandler
-from .interpolation import InterpolateHandler
-from .group_handling import GroupedHandler
+from typing import TYPE_CHECKING
+
+from ..core.lazy import lazy_attributes
+
+# Submodules are imported on first access, see outlipy.core.lazy.
+__getattr__, __dir__ = lazy_attributes(__name__, {
+    "OutlierHandlerBase": ".base",
+    "MeanHandler": ".central_tendency",
+    "MedianHandler": ".central_tendency",
+    "WinsorizationHandler": ".winsorization",
+    "RemoveHandler": ".remove",
+    "ConstantHandler": ".constant_replacement",
+    "InterpolateHandler": ".interpolation",
+    "GroupedHandler": ".group_handling",
+})
+
+if TYPE_CHECKING:
+    from .base import OutlierHandlerBase
+    from .central_tendency import MeanHandler, MedianHandler
+    from .winsorization import WinsorizationHandler
+    from .remove import RemoveHandler
+    from .constant_replacement import ConstantHandler
+    from .interpolation import InterpolateHandler
+    from .group_handling import GroupedHandler
 
 
 __all__ = [
@@ -16,4 +33,4 @@ __all__ = [
     "ConstantHandler",
     "InterpolateHandler",
     "GroupedHandler"
-]
\ No newline at end of file
+]
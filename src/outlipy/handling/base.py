@@ -1,20 +1,25 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Optional, List, Any, Dict
 import pandas as pd
-from ..utils import validate_input, validate_strategy
+import numpy as np
+from ..utils import validate_input, validate_strategy, validate_dtype
+from ..core.instrumentation import stage
+from ..core.params import ParamsMixin
 
-class OutlierHandlerBase(ABC):
+class OutlierHandlerBase(ParamsMixin, ABC):
     """
     Abstract base class for all Outlier Handling in OutliPy
 
     attributes:
         methods (str): The method used for handling outliers (e.g., "mean", "median", "winsorization").
         columns (Optional[List[str]]): Columns to apply handling on.
+        dtype (np.dtype): Float type integer columns are upcast to ("float32" or "float64").
     """
 
-    def __init__(self, *, method: Optional[str] = None, columns: Optional[List[str]] = None):
+    def __init__(self, *, method: Optional[str] = None, columns: Optional[List[str]] = None, dtype: str = "float64"):
         self.method = method or self.__class__.__name__
         self.columns = columns
+        self.dtype = validate_dtype(dtype, self.method)
         self._validated = False
 
     def __repr__(self):
@@ -35,7 +40,8 @@ class OutlierHandlerBase(ABC):
         detector_name = self.__class__.__name__
         columns = self.columns
 
-        validated_columns = validate_input(df, detector_name, columns)
+        with stage(self, "validate", df):
+            validated_columns = validate_input(df, detector_name, columns)
 
         self.columns = validated_columns
 
@@ -52,6 +58,33 @@ class OutlierHandlerBase(ABC):
         
         self._validated = True
 
+    @staticmethod
+    def _as_column_dtype(column: pd.Series, value: Any) -> Any:
+        """
+        Cast a replacement value to the float dtype of the column.
+
+        Replacements are computed in float64; casting them keeps a float32
+        column float32 instead of upcasting or rejecting the assignment.
+        """
+        if isinstance(column.dtype, np.dtype) and column.dtype.kind == "f":
+            return column.dtype.type(value)
+
+        return value
+
+    def _handle(self, df_clean: pd.DataFrame, outlier_mask: Optional[pd.DataFrame], quantiles: Optional[Dict[Any, Dict[float, float]]] = None) -> pd.DataFrame:
+        """
+        Handle the outliers of a validated copy of the input. ``apply`` copies
+        and calls it; a ``Plan`` calls it for several handlers on one copy.
+
+        Handlers that only implement ``apply`` are run through it, on a copy of ``df_clean``.
+
+        :param df_clean: The copy to modify in place (validated, ``self.columns`` resolved).
+        :param outlier_mask: The mask, with the index of ``df_clean``.
+        :param quantiles: Precomputed quantiles of some columns (column -> level -> value), if any.
+        :return: ``df_clean``, or a new frame for handlers that drop rows or only implement ``apply``.
+        """
+        return self.apply(df_clean, outlier_mask)
+
     @abstractmethod
     def apply(self, df: pd.DataFrame, outlier_mask: Optional[pd.DataFrame] = None) -> pd.DataFrame:
         """
@@ -1,8 +1,9 @@
 import pandas as pd
 import numpy as np
 
-from typing import Optional, List
+from typing import Optional, List, Dict, Any
 from .base import OutlierHandlerBase
+from ..core.instrumentation import instrumented
 from ..exceptions import HandlingException
 
 # -----------------------------------------------------------------
@@ -11,9 +12,19 @@ from ..exceptions import HandlingException
 
 class MeanHandler(OutlierHandlerBase):
 
-    def __init__(self, columns: Optional[List[str]] = None):
-        super().__init__(method = self.__class__.__name__, columns = columns)
+    def __init__(self, columns: Optional[List[str]] = None, dtype: str = "float64"):
+        super().__init__(method = self.__class__.__name__, columns = columns, dtype = dtype)
 
+    def _replacement_value(self, values: np.ndarray, outliers: np.ndarray) -> float:
+        """
+        Mean of the non-outlier values, NaN if every value is an outlier.
+        """
+        if outliers.all():
+            return np.nan
+
+        return np.mean(values[~outliers], dtype = np.float64)
+
+    @instrumented("apply")
     def apply(self, df: pd.DataFrame, outlier_mask: Optional[pd.DataFrame] = None) -> pd.DataFrame:
         """
         Replaces outliers with the column mean.
@@ -35,7 +46,12 @@ class MeanHandler(OutlierHandlerBase):
                 suggestion = "Index mismatch: DataFrame and outlier_mask must have the same index."
             )
         
-        df_clean = df.copy()
+        return self._handle(df.copy(), outlier_mask)
+
+    def _handle(self, df_clean: pd.DataFrame, outlier_mask: Optional[pd.DataFrame], quantiles: Optional[Dict[Any, Dict[float, float]]] = None) -> pd.DataFrame:
+        """
+        Handle the outliers of ``df_clean`` in place.
+        """
 
         if self.columns is None:
             raise RuntimeError("Validation was done, but self.columns remains None")
@@ -47,10 +63,7 @@ class MeanHandler(OutlierHandlerBase):
                 if not outliers.any():
                     continue
 
-                series_for_mean = df_clean[col].copy()
-                series_for_mean[outliers] = np.nan
-
-                replacement_val = series_for_mean.mean()
+                replacement_val = self._replacement_value(df_clean[col].to_numpy(), outliers.to_numpy())
 
                 if pd.isna(replacement_val):
                     raise HandlingException(
@@ -60,9 +73,9 @@ class MeanHandler(OutlierHandlerBase):
                     )
                 
                 if pd.api.types.is_integer_dtype(df_clean[col].dtype) and isinstance(replacement_val, (float, np.floating)):
-                    df_clean[col] = df_clean[col].astype(float)
+                    df_clean[col] = df_clean[col].astype(self.dtype)
                 
-                df_clean.loc[outliers, col] = replacement_val
+                df_clean.loc[outliers, col] = self._as_column_dtype(df_clean[col], replacement_val)
 
         return df_clean
 
@@ -74,9 +87,19 @@ class MeanHandler(OutlierHandlerBase):
 
 class MedianHandler(OutlierHandlerBase):
 
-    def __init__(self, columns: Optional[List[str]] = None):
-        super().__init__(method = self.__class__.__name__, columns = columns)
+    def __init__(self, columns: Optional[List[str]] = None, dtype: str = "float64"):
+        super().__init__(method = self.__class__.__name__, columns = columns, dtype = dtype)
 
+    def _replacement_value(self, values: np.ndarray, outliers: np.ndarray) -> float:
+        """
+        Median of the non-outlier values, NaN if every value is an outlier.
+        """
+        if outliers.all():
+            return np.nan
+
+        return np.median(values[~outliers])
+
+    @instrumented("apply")
     def apply(self, df: pd.DataFrame, outlier_mask: Optional[pd.DataFrame] = None) -> pd.DataFrame:
         """
         Replaces outliers with the column mean.
@@ -98,7 +121,12 @@ class MedianHandler(OutlierHandlerBase):
                 suggestion = "Index mismatch: DataFrame and outlier_mask must have the same index."
             )
         
-        df_clean = df.copy()
+        return self._handle(df.copy(), outlier_mask)
+
+    def _handle(self, df_clean: pd.DataFrame, outlier_mask: Optional[pd.DataFrame], quantiles: Optional[Dict[Any, Dict[float, float]]] = None) -> pd.DataFrame:
+        """
+        Handle the outliers of ``df_clean`` in place.
+        """
 
         if self.columns is None:
             raise RuntimeError("Validation was done, but self.columns remains None")
@@ -110,10 +138,7 @@ class MedianHandler(OutlierHandlerBase):
                 if not outliers.any():
                     continue
 
-                series_for_mean = df_clean[col].copy()
-                series_for_mean[outliers] = np.nan
-
-                replacement_val = series_for_mean.median()
+                replacement_val = self._replacement_value(df_clean[col].to_numpy(), outliers.to_numpy())
 
                 if pd.isna(replacement_val):
                     raise HandlingException(
@@ -123,8 +148,8 @@ class MedianHandler(OutlierHandlerBase):
                     )
                 
                 if pd.api.types.is_integer_dtype(df_clean[col].dtype) and isinstance(replacement_val, (float, np.floating)):
-                    df_clean[col] = df_clean[col].astype(float)
+                    df_clean[col] = df_clean[col].astype(self.dtype)
                 
-                df_clean.loc[outliers, col] = replacement_val
+                df_clean.loc[outliers, col] = self._as_column_dtype(df_clean[col], replacement_val)
 
         return df_clean
\ No newline at end of file
@@ -1,7 +1,8 @@
 import pandas as pd
 
-from typing import Optional, List
+from typing import Optional, List, Dict, Any
 from .base import OutlierHandlerBase
+from ..core.instrumentation import instrumented
 from ..exceptions import HandlingException, ConfigurationException
 
 # -----------------------------------------------------------------
@@ -13,8 +14,8 @@ class ConstantHandler(OutlierHandlerBase):
     Handler to replace outliers with a fixed, user-defined constant value.
     """
 
-    def __init__(self, fill_value: float, columns: Optional[List[str]] = None):
-        super().__init__(method = self.__class__.__name__, columns = columns)
+    def __init__(self, fill_value: float, columns: Optional[List[str]] = None, dtype: str = "float64"):
+        super().__init__(method = self.__class__.__name__, columns = columns, dtype = dtype)
 
         if not isinstance(fill_value, (int, float)):
             raise ConfigurationException(
@@ -26,6 +27,7 @@ class ConstantHandler(OutlierHandlerBase):
         
         self.fill_value = fill_value
 
+    @instrumented("apply")
     def apply(self, df: pd.DataFrame, outlier_mask: Optional[pd.DataFrame] = None) -> pd.DataFrame:
         """
         Replaces outliers with the specified constant fill_value.
@@ -47,7 +49,13 @@ class ConstantHandler(OutlierHandlerBase):
                 suggestion = "Index mismatch: DataFrame and outlier_mask must have the same index."
             )
         
-        df_clean = df.copy()
+        return self._handle(df.copy(), outlier_mask)
+
+    def _handle(self, df_clean: pd.DataFrame, outlier_mask: Optional[pd.DataFrame], quantiles: Optional[Dict[Any, Dict[float, float]]] = None) -> pd.DataFrame:
+        """
+        Handle the outliers of ``df_clean`` in place.
+        """
+
         replacement_val = self.fill_value
 
         if self.columns is None:
@@ -64,8 +72,8 @@ class ConstantHandler(OutlierHandlerBase):
                 is_float_replacement = isinstance(replacement_val, float)
 
                 if is_integer_dtype and is_float_replacement:
-                    df_clean[col] = df_clean[col].astype(float)
+                    df_clean[col] = df_clean[col].astype(self.dtype)
 
-                df_clean.loc[outliers, col] = replacement_val
+                df_clean.loc[outliers, col] = self._as_column_dtype(df_clean[col], replacement_val)
 
         return df_clean
\ No newline at end of file
@@ -1,8 +1,10 @@
 import pandas as pd
 import numpy as np
 
-from typing import Optional, List
+from typing import Optional, List, Dict, Any
 from .base import OutlierHandlerBase
+from ..core.instrumentation import instrumented
+from ..core import kernels
 from ..exceptions import HandlingException, ConfigurationException, InvalidColumnException
 from pandas.api.types import is_integer_dtype
 
@@ -16,9 +18,10 @@ class GroupedHandler(OutlierHandlerBase):
     def __init__(self, *, 
                  group_by: List[str],
                  agg_func: str = 'median',
-                 columns: Optional[List[str]] = None):
+                 columns: Optional[List[str]] = None,
+                 dtype: str = "float64"):
 
-        super().__init__(method = self.__class__.__name__, columns=columns)
+        super().__init__(method = self.__class__.__name__, columns=columns, dtype=dtype)
         
         
         if not isinstance(group_by, list) or not all(isinstance(c, str) for c in group_by):
@@ -42,6 +45,7 @@ class GroupedHandler(OutlierHandlerBase):
         self.group_by = group_by
         self.agg_func = agg_func
         
+    @instrumented("apply")
     def apply(self, df: pd.DataFrame, outlier_mask: Optional[pd.DataFrame] = None) -> pd.DataFrame:
         """
         Replaces outliers with the group-specific statistic of the non-outlier data.
@@ -63,9 +67,16 @@ class GroupedHandler(OutlierHandlerBase):
                 suggestion = "Index mismatch: DataFrame and outlier_mask must have the same index."
             )
 
+        return self._handle(df.copy(), outlier_mask)
+
+    def _handle(self, df_clean: pd.DataFrame, outlier_mask: Optional[pd.DataFrame], quantiles: Optional[Dict[Any, Dict[float, float]]] = None) -> pd.DataFrame:
+        """
+        Handle the outliers of ``df_clean`` in place.
+        """
+
         # Check Group Columns
         for col in self.group_by:
-            if col not in df.columns:
+            if col not in df_clean.columns:
                 raise InvalidColumnException(
                     error_code = "ICE001",
                     method = self.__class__.__name__,
@@ -73,11 +84,19 @@ class GroupedHandler(OutlierHandlerBase):
                     suggestion = f"Check missing column from the input DataFrame."
                 )
         
-        df_clean = df.copy()
-
         if self.columns is None:
             raise RuntimeError("Validation was done, but self.columns remains None")
 
+        # With the Numba engine selected explicitly, the group medians are computed from
+        # the group number of every row (-1 where a key is missing), shared by all columns.
+        # "auto" keeps groupby, which is as fast on typical group counts and uses less memory.
+        use_kernel = self.agg_func == "median" and kernels.requested() == "numba"
+
+        if use_kernel:
+            grouping = df_clean.groupby(self.group_by, sort = False)
+            codes = grouping.ngroup().to_numpy(dtype = np.float64, na_value = np.nan)
+            codes = np.where(np.isnan(codes), -1, codes).astype(np.int64)
+
         for col in self.columns:
             if col in outlier_mask.columns and col not in self.group_by:
                 outliers = outlier_mask[col]
@@ -86,20 +105,28 @@ class GroupedHandler(OutlierHandlerBase):
                     continue 
 
                 if is_integer_dtype(df_clean[col].dtype):
-                    df_clean[col] = df_clean[col].astype(float)
-
-                # Mark outliers as NaN to exclude them from group calculation
-                temp_series = df_clean[col].copy()
-                temp_series.loc[outliers] = np.nan
+                    df_clean[col] = df_clean[col].astype(self.dtype)
 
                 # Calculate the group-specific statistic for replacement
-                grouper_data = [df_clean[c] for c in self.group_by]
-                replacements = temp_series.groupby(grouper_data).transform(self.agg_func)    # type: ignore
+                if use_kernel and isinstance(df_clean[col].dtype, np.dtype):
+                    medians = kernels.group_medians(codes, grouping.ngroups, df_clean[col].to_numpy(), outliers.to_numpy(dtype = bool))
+                    replacements = pd.Series(np.where(codes >= 0, medians[codes], np.nan), index = df_clean.index, dtype = df_clean[col].dtype)
+                    temp_series = None
+                else:
+                    # Mark outliers as NaN to exclude them from group calculation
+                    temp_series = df_clean[col].copy()
+                    temp_series.loc[outliers] = np.nan
+
+                    grouper_data = [df_clean[c] for c in self.group_by]
+                    replacements = temp_series.groupby(grouper_data).transform(self.agg_func)    # type: ignore
                 
                 df_clean.loc[outliers, col] = replacements.loc[outliers]
 
                 remaining_nans = df_clean[col].isna() & outliers
                 if remaining_nans.any():
+                    if temp_series is None:
+                        temp_series = df_clean[col].mask(outliers)
+
                     global_stat = temp_series.agg(self.agg_func)
                     
                     if pd.isna(global_stat):
@@ -110,6 +137,6 @@ class GroupedHandler(OutlierHandlerBase):
                             suggestion=f"The column might contain only outliers/NaNs."
                         )
                     
-                    df_clean.loc[remaining_nans, col] = global_stat
+                    df_clean.loc[remaining_nans, col] = self._as_column_dtype(df_clean[col], global_stat)
                     
         return df_clean
\ No newline at end of file
@@ -1,18 +1,22 @@
 import pandas as pd
 import numpy as np
 
-from typing import Optional, List
+from typing import Optional, List, Dict, Any
 from .base import OutlierHandlerBase
+from ..core.instrumentation import instrumented
 from ..exceptions import HandlingException
 
 
 class InterpolateHandler(OutlierHandlerBase):
 
-    def __init__(self, method: str = 'linear', columns: Optional[List[str]] = None):
-        super().__init__(method = self.__class__.__name__, columns = columns)
+    _param_attributes = {"method": "interpolation_method"}
+
+    def __init__(self, method: str = 'linear', columns: Optional[List[str]] = None, dtype: str = "float64"):
+        super().__init__(method = self.__class__.__name__, columns = columns, dtype = dtype)
 
         self.interpolation_method = method
 
+    @instrumented("apply")
     def apply(self, df: pd.DataFrame, outlier_mask: Optional[pd.DataFrame] = None) -> pd.DataFrame:
         """
         Replaces outliers with the column mean.
@@ -34,7 +38,12 @@ class InterpolateHandler(OutlierHandlerBase):
                 suggestion = "Index mismatch: DataFrame and outlier_mask must have the same index."
             )
         
-        df_clean = df.copy()
+        return self._handle(df.copy(), outlier_mask)
+
+    def _handle(self, df_clean: pd.DataFrame, outlier_mask: Optional[pd.DataFrame], quantiles: Optional[Dict[Any, Dict[float, float]]] = None) -> pd.DataFrame:
+        """
+        Handle the outliers of ``df_clean`` in place.
+        """
 
         if self.columns is None:
             raise RuntimeError("Validation was done, but self.columns remains None")
@@ -47,7 +56,7 @@ class InterpolateHandler(OutlierHandlerBase):
                     continue
 
                 if pd.api.types.is_integer_dtype(df_clean[col].dtype):
-                    df_clean[col] = df_clean[col].astype(float)
+                    df_clean[col] = df_clean[col].astype(self.dtype)
 
 
                 series_to_fill = df_clean[col].copy()
@@ -1,7 +1,8 @@
 import pandas as pd
 
-from typing import Optional, List
+from typing import Optional, List, Dict, Any
 from .base import OutlierHandlerBase
+from ..core.instrumentation import instrumented
 
 from ..exceptions.handling import HandlingException
 
@@ -16,6 +17,7 @@ class RemoveHandler(OutlierHandlerBase):
     ):
         super().__init__(method = self.__class__.__name__, columns = columns)
     
+    @instrumented("apply")
     def apply(
             self,
             df: pd.DataFrame,
@@ -41,7 +43,12 @@ class RemoveHandler(OutlierHandlerBase):
                 suggestion="Index mismatch: DataFrame and outlier_mask must have the same index."
             )
             
-        df_clean = df.copy()
+        return self._handle(df.copy(), outlier_mask)
+
+    def _handle(self, df_clean: pd.DataFrame, outlier_mask: Optional[pd.DataFrame], quantiles: Optional[Dict[Any, Dict[float, float]]] = None) -> pd.DataFrame:
+        """
+        Drop the rows of ``df_clean`` with an outlier in the handled columns.
+        """
 
         if self.columns is None:
             raise RuntimeError("Validation was done, but self.columns remains None")
@@ -1,8 +1,11 @@
 import pandas as pd
+import numpy as np
 
-from typing import Optional, List, Tuple
+from typing import Optional, List, Tuple, Dict, Any
 
 from .base import OutlierHandlerBase
+from ..core.instrumentation import instrumented
+from ..core import kernels
 from ..exceptions import HandlingException, ConfigurationException
 
 class WinsorizationHandler(OutlierHandlerBase):
@@ -10,9 +13,10 @@ class WinsorizationHandler(OutlierHandlerBase):
     def __init__(
         self, 
         limits: Tuple[float, float] = (0.05, 0.95), 
-        columns: Optional[List[str]] = None
+        columns: Optional[List[str]] = None,
+        dtype: str = "float64"
     ):
-        super().__init__(method=self.__class__.__name__, columns=columns)
+        super().__init__(method=self.__class__.__name__, columns=columns, dtype=dtype)
         
         # Validation for limits
         if not (isinstance(limits, tuple) and len(limits) == 2 and all(isinstance(i, (int, float)) for i in limits)):
@@ -35,6 +39,27 @@ class WinsorizationHandler(OutlierHandlerBase):
 
         self.limits = limits
 
+    def _limits(self, values: np.ndarray, col, quantiles: Optional[Dict[float, float]] = None) -> Tuple[float, float]:
+        """
+        Compute the lower and upper caps of a single column, or read them from
+        its precomputed ``quantiles`` (level -> value).
+        """
+        if quantiles is None:
+            lower_limit, upper_limit = np.quantile(values, self.limits)
+        else:
+            lower_limit, upper_limit = quantiles[self.limits[0]], quantiles[self.limits[1]]
+
+        # Check for invalid bounds
+        if lower_limit >= upper_limit:
+             raise HandlingException(
+                error_code="HEX003",
+                method=self.__class__.__name__,
+                suggestion=f"Winsorization bounds are identical or reversed for column '{col}'. Data may be constant."
+            )
+
+        return lower_limit, upper_limit
+
+    @instrumented("apply")
     def apply(self, df: pd.DataFrame, outlier_mask: Optional[pd.DataFrame] = None) -> pd.DataFrame:
         """Caps values at defined percentiles."""
         
@@ -44,23 +69,28 @@ class WinsorizationHandler(OutlierHandlerBase):
         if self.columns is None:
             return df.copy() # Return copy if no columns specified
             
-        df_clean = df.copy()
-        lower_q, upper_q = self.limits
+        return self._handle(df.copy(), outlier_mask)
+
+    def _handle(self, df_clean: pd.DataFrame, outlier_mask: Optional[pd.DataFrame], quantiles: Optional[Dict[Any, Dict[float, float]]] = None) -> pd.DataFrame:
+        """
+        Cap the columns of ``df_clean`` in place; ``quantiles`` holds the
+        precomputed quantiles of some columns (column -> level -> value).
+        """
 
         for col in self.columns:
                 
-            lower_limit = df_clean[col].quantile(lower_q)
-            upper_limit = df_clean[col].quantile(upper_q)
-            
-            # Check for invalid bounds
-            if lower_limit >= upper_limit:
-                 raise HandlingException(
-                    error_code="HEX003",
-                    method=self.__class__.__name__,
-                    suggestion=f"Winsorization bounds are identical or reversed for column '{col}'. Data may be constant."
-                )
+            lower_limit, upper_limit = self._limits(df_clean[col].to_numpy(), col, quantiles.get(col) if quantiles else None)
+
+            if pd.api.types.is_integer_dtype(df_clean[col].dtype):
+                df_clean[col] = df_clean[col].astype(self.dtype)
+
+            lower_limit = self._as_column_dtype(df_clean[col], lower_limit)
+            upper_limit = self._as_column_dtype(df_clean[col], upper_limit)
 
             # Core winsorization logic
-            df_clean[col] = df_clean[col].clip(lower=lower_limit, upper=upper_limit)
+            if isinstance(df_clean[col].dtype, np.dtype):
+                df_clean[col] = kernels.clip(df_clean[col].to_numpy(), lower_limit, upper_limit)
+            else:
+                df_clean[col] = df_clean[col].clip(lower=lower_limit, upper=upper_limit)
             
         return df_clean
\ No newline at end of file
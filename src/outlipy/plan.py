@@ -0,0 +1,434 @@
+"""
+Declarative outlier workflows run as one fused pass.
+
+A ``Plan`` lists the detectors, how their masks are combined and the handlers
+to apply. Chaining the same steps by hand validates the table once per step,
+scans every column once per quantile-based step, materializes one mask per
+detector and copies the table once per handler. ``Plan.run`` compiles the
+steps first:
+
+- Validation: steps selecting the same columns share one validation.
+- Statistics: the quantiles needed by the IQR and percentile detectors and by
+  winsorization are computed in one pass per column and shared.
+- Detection: every detector adds its flags to one counter buffer, combined
+  into the final mask without per-detector masks.
+- Handling: the value handlers modify one copy of the table in place, in
+  the declared order; row removals are merged into one selection at the end.
+  A float column whose mask is the bound check of a single IQR or percentile
+  detector and whose first handler is a ``ConstantHandler`` is detected and
+  replaced by one kernel (``kernels.replace_outside``).
+
+The results are those of running the steps one by one, with every handler
+using the combined mask and the row removals applied after the value
+handlers. ``Plan.explain`` shows the compiled execution.
+"""
+
+import numpy as np
+import pandas as pd
+
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from .core import kernels, stats
+from .core.instrumentation import stage
+from .detection.base import OutlierDetectorBase, UnivariateDetectorBase
+from .handling.base import OutlierHandlerBase
+from .handling.constant_replacement import ConstantHandler
+from .handling.remove import RemoveHandler
+from .handling.winsorization import WinsorizationHandler
+from .exceptions import ConfigurationException
+from .utils import validate_input
+
+Step = Union[OutlierDetectorBase, OutlierHandlerBase]
+
+
+class _Program:
+    """
+    The compiled execution of a plan on one table.
+    """
+
+    def __init__(self, n_rows: int, n_cols: int):
+        self.n_rows = n_rows
+        self.n_cols = n_cols
+        # (columns, exclude) -> (resolved columns, steps sharing the validation)
+        self.validations: Dict[Tuple, Tuple[List[Any], List[Step]]] = {}
+        # column -> level -> value, and the steps reading them
+        self.quantiles: Dict[Any, Dict[float, float]] = {}
+        self.quantile_users: Dict[Any, List[Step]] = {}
+        self.columns: List[Any] = []
+        self.in_place: List[OutlierHandlerBase] = []
+        self.removals: List[RemoveHandler] = []
+        # column -> (detector, handler) detected and replaced in one kernel, and the replaced columns
+        self.fused: Dict[Any, Tuple[UnivariateDetectorBase, ConstantHandler]] = {}
+        self.replaced: Dict[Any, np.ndarray] = {}
+
+
+class Plan:
+    """
+    Multi-step outlier workflow: detectors, mask combination and handlers, executed fused.
+
+    Attributes:
+        detectors (List[OutlierDetectorBase]): The detectors, fitted on the table by ``run``.
+        handlers (List[OutlierHandlerBase]): The handlers, applied in order; each handles its
+            ``columns`` (all the detected numeric columns when None).
+        combine (Union[str, int]): How the detector masks are combined per column: "any"
+            (default) flags a value flagged by any detector, "all" by every detector covering
+            the column, an integer ``k`` by at least ``k`` detectors.
+        mask (Optional[pd.DataFrame]): The combined mask of the last ``run`` or ``detect``.
+    """
+
+    def __init__(
+            self,
+            detectors: List[OutlierDetectorBase],
+            handlers: Optional[List[OutlierHandlerBase]] = None,
+            combine: Union[str, int] = "any"
+    ):
+        if not detectors or not all(isinstance(detector, OutlierDetectorBase) for detector in detectors):
+            raise ConfigurationException(
+                error_code = "CON002",
+                method = self.__class__.__name__,
+                parameter_context = "detectors",
+                suggestion = "Pass a non-empty list of detectors, e.g. [IQRDetector(), MADDetector()]."
+            )
+
+        if handlers is not None and not all(isinstance(handler, OutlierHandlerBase) for handler in handlers):
+            raise ConfigurationException(
+                error_code = "CON002",
+                method = self.__class__.__name__,
+                parameter_context = "handlers",
+                suggestion = "Pass a list of handlers, e.g. [MedianHandler(columns = ['a']), WinsorizationHandler(columns = ['b'])]."
+            )
+
+        if combine not in ("any", "all") and (isinstance(combine, bool) or not isinstance(combine, int) or not 1 <= combine <= len(detectors)):
+            raise ConfigurationException(
+                error_code = "CON002",
+                method = self.__class__.__name__,
+                parameter_context = "combine",
+                suggestion = f"Use 'any', 'all' or a number of detectors between 1 and {len(detectors)}."
+            )
+
+        self.detectors = list(detectors)
+        self.handlers = list(handlers or [])
+        self.combine = combine
+        self.mask: Optional[pd.DataFrame] = None
+        self._program: Optional[_Program] = None
+
+    def __repr__(self):
+        return f"Plan(detectors={len(self.detectors)}, handlers={len(self.handlers)}, combine={self.combine!r})"
+
+    # ------------------------------------
+    #               Execution
+    # ------------------------------------
+
+    def run(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Fit the detectors on ``df``, combine their masks and apply the handlers.
+
+        :param df: The DataFrame.
+        :type df: pd.DataFrame
+        :return: The handled copy of ``df``; the combined mask is kept in ``self.mask``.
+        :rtype: pd.DataFrame
+        """
+        program = self._compile(df)
+        self.mask = self._detect(df, program)
+
+        return self._handle(df, program)
+
+    def detect(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Fit the detectors on ``df`` and return their combined mask, without handling.
+
+        :param df: The DataFrame.
+        :type df: pd.DataFrame
+        :return: The combined mask, one column per detected column.
+        :rtype: pd.DataFrame
+        """
+        program = self._compile(df, handlers = False)
+        self.mask = self._detect(df, program)
+
+        return self.mask
+
+    # ------------------------------------
+    #               Compilation
+    # ------------------------------------
+
+    def _compile(self, df: pd.DataFrame, handlers: bool = True) -> _Program:
+        if not isinstance(df, pd.DataFrame):
+            raise TypeError(f"[{self.__class__.__name__}] Input must be a pandas DataFrame, got {type(df).__name__}")
+
+        program = _Program(*df.shape)
+        steps: List[Step] = self.detectors + (self.handlers if handlers else [])
+
+        # One validation per column selection; the strictest NaN policy of the steps sharing it applies.
+        with stage(self, "validate", df):
+            for step in steps:
+                key = (self._key(step.columns), self._key(getattr(step, "exclude", None)))
+                program.validations.setdefault(key, (None, []))[1].append(step)
+
+            for key, (_, sharing) in list(program.validations.items()):
+                allow_nan = all(getattr(step, "nan_policy", "raise") == "omit" for step in sharing)
+                columns = validate_input(df, sharing[0].__class__.__name__, list(key[0]) if key[0] else None, list(key[1]) or None, allow_nan)
+                program.validations[key] = (columns, sharing)
+
+                for step in sharing:
+                    step.columns = list(columns)
+
+        for detector in self.detectors:
+            program.columns.extend(col for col in detector.columns if col not in program.columns)
+
+        if handlers:
+            program.in_place = [handler for handler in self.handlers if not isinstance(handler, RemoveHandler)]
+            program.removals = [handler for handler in self.handlers if isinstance(handler, RemoveHandler)]
+            self._fuse_replacements(df, program)
+
+        with stage(self, "statistics", df):
+            self._share_quantiles(df, program)
+
+        self._program = program
+
+        return program
+
+    @staticmethod
+    def _key(columns: Optional[List[Any]]) -> Tuple:
+        return tuple(columns) if columns else ()
+
+    def _fuse_replacements(self, df: pd.DataFrame, program: _Program):
+        """
+        Select the columns detected and replaced by one kernel: float columns
+        whose combined mask is the bound check of the one detector covering
+        them, and whose first handler replaces the outliers with a constant.
+        """
+        if self.combine not in ("any", "all", 1):
+            return
+
+        covering: Dict[Any, List[OutlierDetectorBase]] = {}
+
+        for detector in self.detectors:
+            for col in detector.columns:
+                covering.setdefault(col, []).append(detector)
+
+        handled = set()
+
+        for handler in program.in_place:
+            for col in handler.columns:
+                if col in handled:
+                    continue
+
+                handled.add(col)
+                detectors = covering.get(col, [])
+
+                if isinstance(handler, ConstantHandler) and len(detectors) == 1 and isinstance(detectors[0], UnivariateDetectorBase) \
+                        and detectors[0]._outside_bounds and isinstance(df[col].dtype, np.dtype) and df[col].dtype.kind == "f":
+                    program.fused[col] = (detectors[0], handler)
+
+    def _share_quantiles(self, df: pd.DataFrame, program: _Program):
+        """
+        Compute in one pass per column the quantile levels read by two or more steps.
+        """
+        levels: Dict[Any, List[Tuple[Step, List[float]]]] = {}
+
+        for detector in self.detectors:
+            if isinstance(detector, UnivariateDetectorBase) and detector._quantile_levels() is not None \
+                    and detector.sample is None and not detector.incremental:
+                for col in detector.columns:
+                    levels.setdefault(col, []).append((detector, detector._quantile_levels()))
+
+        # Winsorization reads the input column only while no earlier handler has written it.
+        written = set()
+
+        for handler in program.in_place:
+            if isinstance(handler, WinsorizationHandler):
+                for col in handler.columns:
+                    if col not in written:
+                        levels.setdefault(col, []).append((handler, list(handler.limits)))
+
+            written.update(handler.columns)
+
+        for col, users in levels.items():
+            if len(users) < 2 or not isinstance(df[col].dtype, np.dtype):
+                continue
+
+            values = stats.drop_nan(df[col].to_numpy())
+
+            if not len(values):
+                continue
+
+            wanted = sorted({level for _, step_levels in users for level in step_levels})
+            program.quantiles[col] = dict(zip(wanted, np.quantile(values, wanted).tolist()))
+            program.quantile_users[col] = [step for step, _ in users]
+
+    # ------------------------------------
+    #           Fused detection
+    # ------------------------------------
+
+    def _detect(self, df: pd.DataFrame, program: _Program) -> pd.DataFrame:
+        positions = {col: j for j, col in enumerate(program.columns)}
+        counts = np.zeros((len(df), len(program.columns)), dtype = np.uint16)
+        coverage = np.zeros(len(program.columns), dtype = np.uint16)
+
+        for detector in self.detectors:
+            shared = {col: q for col, q in program.quantiles.items() if detector in program.quantile_users[col]}
+
+            with stage(detector, "fit", df, len(detector.columns)):
+                if shared:
+                    detector._compute_scores(df, shared)
+                else:
+                    detector._compute_scores(df)
+
+            detector._fitted = True
+            detector._cache_key = None
+
+            with stage(detector, "detect", df, len(detector.columns)):
+                if isinstance(detector, UnivariateDetectorBase):
+                    for col in detector.columns:
+                        column = counts[:, positions[col]]
+
+                        if col in program.fused:
+                            # The handler writes the replaced column in its turn.
+                            lower, upper = detector._bounds(detector._scores[col])
+                            fill = program.fused[col][1].fill_value
+                            flags, program.replaced[col] = kernels.replace_outside(detector._column_values(df, col), lower, upper, fill)
+                            column += flags
+                            continue
+
+                        for start, chunk in detector._iter_offsets(detector._column_values(df, col)):
+                            column[start:start + len(chunk)] += detector._detect_column(chunk, detector._scores[col])
+                else:
+                    # Row detectors flag whole rows.
+                    flags = np.asarray(detector.detect(df))[:, 0]
+
+                    for col in detector.columns:
+                        counts[:, positions[col]] += flags
+
+            coverage[[positions[col] for col in detector.columns]] += 1
+
+        if self.combine == "any":
+            mask = counts > 0
+        elif self.combine == "all":
+            mask = counts == coverage
+        else:
+            mask = counts >= self.combine
+
+        return pd.DataFrame(mask, index = df.index, columns = program.columns)
+
+    # ------------------------------------
+    #             Fused handling
+    # ------------------------------------
+
+    def _handle(self, df: pd.DataFrame, program: _Program) -> pd.DataFrame:
+        if not program.in_place and not program.removals:
+            return df.copy()
+
+        with stage(self, "handle", df):
+            df_clean = self._copy(df, program)
+
+            for handler in program.in_place:
+                shared = {col: q for col, q in program.quantiles.items() if handler in program.quantile_users[col]}
+                fused = [col for col, (_, owner) in program.fused.items() if owner is handler]
+                mask = self.mask.drop(columns = fused) if fused else self.mask
+                df_clean = handler._handle(df_clean, mask, shared or None)
+
+            if program.removals:
+                flagged = np.zeros(len(df_clean), dtype = bool)
+
+                for handler in program.removals:
+                    valid_cols = [col for col in handler.columns if col in self.mask.columns]
+
+                    if valid_cols:
+                        flagged |= self.mask[valid_cols].to_numpy().any(axis = 1)
+
+                if flagged.any():
+                    df_clean = df_clean[~flagged]
+
+        return df_clean
+
+    @staticmethod
+    def _copy(df: pd.DataFrame, program: _Program) -> pd.DataFrame:
+        """
+        The copy of ``df`` the handlers modify in place. Columns replaced by the
+        fused kernel already are new arrays and are taken as they are; their
+        handler never runs before another handler of the same column, so they
+        can be in place from the start.
+        """
+        if not program.replaced:
+            return df.copy()
+
+        columns = {
+            j: program.replaced.pop(col) if col in program.replaced else df.iloc[:, j].array.copy()
+            for j, col in enumerate(df.columns)
+        }
+        df_clean = pd.DataFrame(columns, index = df.index, copy = False)
+        df_clean.columns = df.columns
+
+        return df_clean.__finalize__(df)
+
+    # ------------------------------------
+    #               Explain
+    # ------------------------------------
+
+    def explain(self, df: Optional[pd.DataFrame] = None) -> str:
+        """
+        Describe the fused execution: shared validations and statistics, the
+        combined detection and the handlers run on one copy.
+
+        :param df: Compile the plan for this table; by default the table of the last ``run`` or ``detect``.
+        :type df: Optional[pd.DataFrame]
+        :return: The description, one line per operation.
+        :rtype: str
+        """
+        if df is not None:
+            program = self._compile(df)
+        elif self._program is not None:
+            program = self._program
+        else:
+            raise ConfigurationException(
+                error_code = "CON001",
+                method = self.__class__.__name__,
+                parameter = "df",
+                suggestion = "Pass the table to explain the plan for, or call run first."
+            )
+
+        name = lambda step: step.__class__.__name__
+        listed = lambda columns: ", ".join(str(col) for col in columns)
+        steps = len(self.detectors) + len(program.in_place) + len(program.removals)
+        quantile_steps = sum(len(users) for users in program.quantile_users.values())
+
+        lines = [
+            f"Plan on {program.n_rows} rows x {program.n_cols} columns: {len(self.detectors)} detectors, "
+            f"{len(program.in_place) + len(program.removals)} handlers",
+            f"validate   {len(program.validations)} pass(es) instead of {steps}"
+        ]
+
+        for columns, sharing in program.validations.values():
+            lines.append(f"  [{listed(columns)}] <- {', '.join(name(step) for step in sharing)}")
+
+        lines.append(f"quantiles  {len(program.quantiles)} column pass(es) instead of {quantile_steps}")
+
+        for col, q in program.quantiles.items():
+            levels = ", ".join(f"{level:g}" for level in q)
+            lines.append(f"  {col}: {levels} <- {', '.join(name(step) for step in program.quantile_users[col])}")
+
+        lines.append(
+            f"detect     {len(self.detectors)} detectors into one '{self.combine}' mask over "
+            f"[{listed(program.columns)}], no per-detector masks"
+        )
+
+        for detector in self.detectors:
+            shared = [col for col, users in program.quantile_users.items() if detector in users]
+            source = f"shared quantiles of {listed(shared)}" if shared else "own pass"
+            lines.append(f"  {name(detector)} [{listed(detector.columns)}] fit from {source}")
+
+        if program.in_place or program.removals:
+            lines.append(f"handle     1 copy instead of {len(program.in_place) + len(program.removals)}")
+
+            for handler in program.in_place:
+                shared = [col for col, users in program.quantile_users.items() if handler in users]
+                fused = [col for col, (_, owner) in program.fused.items() if owner is handler]
+                note = f", shared quantiles of {listed(shared)}" if shared else ""
+                note += f", fused with detection on {listed(fused)}" if fused else ""
+                lines.append(f"  {name(handler)} [{listed(handler.columns)}] in place{note}")
+
+            if program.removals:
+                removed = [col for handler in program.removals for col in handler.columns]
+                lines.append(f"  {len(program.removals)} RemoveHandler(s) [{listed(dict.fromkeys(removed))}] as one row selection, last")
+
+        return "\n".join(lines)
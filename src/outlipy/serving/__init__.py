@@ -0,0 +1,21 @@
+from typing import TYPE_CHECKING
+
+from ..core.lazy import lazy_attributes
+
+# Submodules are imported on first access, see outlipy.core.lazy.
+__getattr__, __dir__ = lazy_attributes(__name__, {
+    "ScoringServer": ".server",
+    "serve": ".server",
+    "ScoringClient": ".client",
+})
+
+if TYPE_CHECKING:
+    from .server import ScoringServer, serve
+    from .client import ScoringClient
+
+
+__all__ = [
+    "ScoringServer",
+    "serve",
+    "ScoringClient"
+]
@@ -0,0 +1,81 @@
+import asyncio
+import json
+
+from typing import Any, Dict, Optional
+
+
+class ScoringClient:
+    """
+    Minimal asyncio client of a ``ScoringServer``, over TCP or a unix socket.
+
+    The connection is kept open between requests. One client sends one
+    request at a time; use several clients for concurrent requests.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: Optional[int] = None, path: Optional[str] = None):
+        if (port is None) == (path is None):
+            raise ValueError("Pass either a TCP port or a unix socket path.")
+
+        self.host = host
+        self.port = port
+        self.path = path
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+
+    async def __aenter__(self):
+        await self.connect()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def connect(self):
+        if self.path is not None:
+            self._reader, self._writer = await asyncio.open_unix_connection(self.path)
+        else:
+            self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+
+    async def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            await self._writer.wait_closed()
+            self._writer = None
+
+    async def score(self, rows) -> Dict[str, Any]:
+        """
+        Score rows given in the order of the fitted columns.
+        """
+        return await self._request("POST", "/score", {"rows": rows})
+
+    async def stats(self) -> Dict[str, Any]:
+        return await self._request("GET", "/stats")
+
+    async def info(self) -> Dict[str, Any]:
+        return await self._request("GET", "/info")
+
+    async def _request(self, method: str, target: str, payload: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        if self._writer is None:
+            await self.connect()
+
+        body = json.dumps(payload).encode() if payload is not None else b""
+        self._writer.write(f"{method} {target} HTTP/1.1\r\nHost: outlipy\r\nContent-Length: {len(body)}\r\n\r\n".encode("latin-1") + body)
+        await self._writer.drain()
+
+        status = (await self._reader.readline()).decode("latin-1").split()
+        headers = {}
+
+        while True:
+            line = await self._reader.readline()
+
+            if line in (b"\r\n", b"\n", b""):
+                break
+
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        response = json.loads(await self._reader.readexactly(int(headers.get("content-length", 0))))
+
+        if len(status) < 2 or status[1] != "200":
+            raise RuntimeError(f"{method} {target} failed ({' '.join(status[1:])}): {response.get('error')}")
+
+        return response
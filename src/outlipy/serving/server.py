@@ -0,0 +1,463 @@
+"""
+Micro-batching scoring server for fitted detectors.
+
+Requests arriving at the same time are gathered into one batch (up to
+``max_batch_rows`` rows, waiting at most ``max_delay`` seconds for more) and
+scored with one vectorized call on a float64 matrix, so the per-request cost
+is parsing the JSON body and not building a DataFrame.
+
+HTTP/1.1 with JSON bodies, over TCP or a unix socket:
+
+- ``POST /score`` with ``{"rows": [[...], ...]}`` (values in the order of the
+  fitted columns) returns ``{"outliers": [...]}``, one flag per row, plus
+  ``"mask"`` (one flag per column) for univariate detectors and ``"scores"``
+  for multivariate ones.
+- ``GET /stats`` returns the queue depth, batch sizes and latency percentiles.
+- ``GET /info`` returns the detector class and its fitted columns.
+
+Bodies larger than ``max_body_size`` are answered with 413 and malformed
+requests with 400; both close the connection, since the rest of the stream
+cannot be framed.
+"""
+
+import asyncio
+import collections
+import json
+import os
+
+import numpy as np
+
+from typing import Any, Deque, Dict, List, Optional, Tuple, Union
+
+from ..detection.base import OutlierDetectorBase, UnivariateDetectorBase, MultivariateDetectorBase
+from ..exceptions import ConfigurationException
+
+
+class _Pending:
+    """
+    One request waiting in the queue.
+    """
+
+    __slots__ = ("rows", "future", "enqueued")
+
+    def __init__(self, rows: np.ndarray, future: asyncio.Future, enqueued: float):
+        self.rows = rows
+        self.future = future
+        self.enqueued = enqueued
+
+
+class ScoringServer:
+    """
+    Serve a fitted detector, scoring concurrent requests in micro-batches.
+
+    Attributes:
+        detector (OutlierDetectorBase): The fitted detector.
+        max_batch_rows (int): A batch is scored once it holds this many rows.
+        max_delay (float): Longest wait, in seconds, for more requests after the first one of a batch.
+        latency_window (int): Number of recent requests the latency percentiles are computed on.
+        max_body_size (int): Largest request body accepted, in bytes.
+    """
+
+    def __init__(
+            self,
+            detector: Union[OutlierDetectorBase, str, "os.PathLike[str]"],
+            *,
+            max_batch_rows: int = 8192,
+            max_delay: float = 0.002,
+            latency_window: int = 10000,
+            max_body_size: int = 64 * 1024 * 1024
+    ):
+        if not isinstance(detector, OutlierDetectorBase):
+            detector = OutlierDetectorBase.load(detector)
+
+        if not detector._fitted:
+            raise ConfigurationException(
+                error_code = "CON001",
+                method = self.__class__.__name__,
+                parameter = "detector",
+                suggestion = "Serve a fitted detector: call fit before save or before passing it."
+            )
+
+        if not isinstance(max_batch_rows, int) or max_batch_rows < 1:
+            raise ConfigurationException(
+                error_code = "CON002",
+                method = self.__class__.__name__,
+                parameter_context = "max_batch_rows",
+                suggestion = "The max_batch_rows must be a positive integer."
+            )
+
+        if not isinstance(max_delay, (int, float)) or max_delay < 0:
+            raise ConfigurationException(
+                error_code = "CON002",
+                method = self.__class__.__name__,
+                parameter_context = "max_delay",
+                suggestion = "The max_delay must be a non-negative number of seconds, e.g. 0.002."
+            )
+
+        if isinstance(max_body_size, bool) or not isinstance(max_body_size, int) or max_body_size < 0:
+            raise ConfigurationException(
+                error_code = "CON002",
+                method = self.__class__.__name__,
+                parameter_context = "max_body_size",
+                suggestion = "The max_body_size must be a non-negative number of bytes, e.g. 67108864 (64 MiB)."
+            )
+
+        self.detector = detector
+        self.max_batch_rows = max_batch_rows
+        self.max_delay = max_delay
+        self.latency_window = latency_window
+        self.max_body_size = max_body_size
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._batcher: Optional[asyncio.Task] = None
+        self._batch: List[_Pending] = []  # The batch being gathered or scored
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._latencies: Deque[float] = collections.deque(maxlen = latency_window)
+        self._counters = {"requests": 0, "rows": 0, "batches": 0, "errors": 0}
+
+    def __repr__(self):
+        return f"ScoringServer({self.detector.__class__.__name__}, address={self.address})"
+
+    # ------------------------------------
+    #               Lifecycle
+    # ------------------------------------
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0, path: Optional[str] = None) -> "ScoringServer":
+        """
+        Start the batcher and listen on ``host:port`` (``port=0`` picks a free port) or on the unix socket ``path``.
+        """
+        self._queue = asyncio.Queue()
+        self._batcher = asyncio.create_task(self._batch_loop())
+
+        if path is not None:
+            self._server = await asyncio.start_unix_server(self._handle, path = path)
+        else:
+            self._server = await asyncio.start_server(self._handle, host = host, port = port)
+
+        return self
+
+    async def stop(self):
+        """
+        Stop listening and cancel the batcher; requests still queued or in the
+        interrupted batch are cancelled, so their ``score`` calls raise ``CancelledError``.
+        """
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+        if self._batcher is not None:
+            self._batcher.cancel()
+
+            try:
+                await self._batcher
+            except asyncio.CancelledError:
+                pass
+
+            self._batcher = None
+
+        if self._queue is not None:
+            pending = self._batch
+
+            while not self._queue.empty():
+                pending.append(self._queue.get_nowait())
+
+            for request in pending:
+                if not request.future.done():
+                    request.future.cancel()
+
+            self._batch = []
+            self._queue = None
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, *exc_info):
+        await self.stop()
+
+    @property
+    def address(self) -> Optional[Union[Tuple[str, int], str]]:
+        """
+        ``(host, port)`` or the socket path the server listens on, None when stopped.
+        """
+        if self._server is None or not self._server.sockets:
+            return None
+
+        return self._server.sockets[0].getsockname()
+
+    # ------------------------------------
+    #               Scoring
+    # ------------------------------------
+
+    async def score(self, rows: Any) -> Dict[str, List]:
+        """
+        Score rows through the batcher, in-process (the HTTP handler uses the same path).
+
+        :param rows: 2-D rows in the order of the fitted columns.
+        :type rows: array-like
+        :return: The response body of ``POST /score``.
+        :rtype: Dict[str, List]
+        """
+        if self._batcher is None:
+            raise RuntimeError("The server is not running: call start first.")
+
+        rows = self._as_rows(rows)
+        loop = asyncio.get_running_loop()
+        pending = _Pending(rows, loop.create_future(), loop.time())
+
+        await self._queue.put(pending)
+
+        return await pending.future
+
+    def _as_rows(self, rows: Any) -> np.ndarray:
+        """
+        Validate one request on its own, so a bad request never fails the batch it would join.
+        """
+        try:
+            rows = np.asarray(rows, dtype = np.float64)
+        except (TypeError, ValueError):
+            raise ValueError("rows must be a list of numeric rows.") from None
+
+        if rows.ndim != 2 or rows.shape[1] != len(self.detector.columns):
+            raise ValueError(f"rows must be a list of rows with {len(self.detector.columns)} values each ({self.detector.columns}).")
+
+        if np.isinf(rows).any() or (self.detector.nan_policy != "omit" and np.isnan(rows).any()):
+            raise ValueError("rows contain missing or infinite values.")
+
+        return rows
+
+    async def _batch_loop(self):
+        loop = asyncio.get_running_loop()
+
+        while True:
+            batch = self._batch = [await self._queue.get()]
+            n_rows = len(batch[0].rows)
+            deadline = loop.time() + self.max_delay
+
+            while n_rows < self.max_batch_rows:
+                remaining = deadline - loop.time()
+
+                try:
+                    if remaining > 0:
+                        pending = await asyncio.wait_for(self._queue.get(), remaining)
+                    else:
+                        pending = self._queue.get_nowait()
+                except (asyncio.TimeoutError, asyncio.QueueEmpty):
+                    break
+
+                batch.append(pending)
+                n_rows += len(pending.rows)
+
+            await self._run_batch(batch, loop)
+            self._batch = []
+
+    async def _run_batch(self, batch: List[_Pending], loop: asyncio.AbstractEventLoop):
+        matrix = batch[0].rows if len(batch) == 1 else np.concatenate([pending.rows for pending in batch])
+
+        try:
+            # Off the event loop, so connections keep being read while a batch is scored.
+            result = await loop.run_in_executor(None, self._score_matrix, matrix)
+        except Exception as e:
+            self._counters["errors"] += len(batch)
+
+            for pending in batch:
+                if not pending.future.done():
+                    pending.future.set_exception(e)
+            return
+
+        now = loop.time()
+        start = 0
+
+        for pending in batch:
+            stop = start + len(pending.rows)
+
+            if not pending.future.done():
+                pending.future.set_result({name: values[start:stop].tolist() for name, values in result.items()})
+
+            self._latencies.append(now - pending.enqueued)
+            start = stop
+
+        self._counters["requests"] += len(batch)
+        self._counters["rows"] += len(matrix)
+        self._counters["batches"] += 1
+
+    def _score_matrix(self, matrix: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Score a batch with the detector kernels, column by column or block by block.
+        """
+        detector = self.detector
+
+        if isinstance(detector, UnivariateDetectorBase):
+            mask = np.empty(matrix.shape, dtype = bool)
+
+            for j, col in enumerate(detector.columns):
+                mask[:, j] = detector._detect_column(matrix[:, j], detector._scores[col])
+
+            return {"outliers": mask.any(axis = 1), "mask": mask}
+
+        if isinstance(detector, MultivariateDetectorBase):
+            scores = np.empty(len(matrix), dtype = np.float64)
+
+            for start in range(0, len(matrix), detector.block_size):
+                block = matrix[start:start + detector.block_size].astype(detector.dtype, copy = False)
+                scores[start:start + len(block)] = detector._score_block(block)
+
+            if detector.nan_policy == "omit":
+                scores[np.isnan(matrix).any(axis = 1)] = np.nan
+
+            return {"outliers": scores > detector._scores["cutoff"], "scores": scores}
+
+        mask = np.asarray(detector.detect(matrix), dtype = bool)
+
+        return {"outliers": mask.any(axis = 1), "mask": mask}
+
+    # ------------------------------------
+    #               Statistics
+    # ------------------------------------
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Counters, current queue depth and latency percentiles (milliseconds) of the recent requests.
+        """
+        latencies = np.fromiter(self._latencies, dtype = np.float64) * 1e3
+        p50, p95, p99 = np.percentile(latencies, [50, 95, 99]) if len(latencies) else (np.nan, np.nan, np.nan)
+        batches = self._counters["batches"]
+
+        return {
+            **self._counters,
+            "queue_depth": self._queue.qsize() if self._queue is not None else 0,
+            "mean_batch_rows": self._counters["rows"] / batches if batches else 0.0,
+            "latency_ms": {"p50": float(p50), "p95": float(p95), "p99": float(p99)}
+        }
+
+    # ------------------------------------
+    #               HTTP
+    # ------------------------------------
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """
+        Serve the requests of one connection (kept alive until the client closes it).
+        """
+        try:
+            while True:
+                try:
+                    head = await self._read_head(reader)
+                except ValueError as e:
+                    await self._respond(writer, "400 Bad Request", {"error": str(e)})
+                    break
+
+                if head is None:
+                    break
+
+                method, target, headers, length = head
+
+                if length > self.max_body_size:
+                    await self._respond(writer, "413 Content Too Large", {"error": f"the body is larger than {self.max_body_size} bytes."})
+                    break
+
+                body = await reader.readexactly(length)
+                status, payload = await self._route(method, target, body)
+                await self._respond(writer, status, payload)
+
+                if headers.get("connection", "").lower() == "close":
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _read_head(reader: asyncio.StreamReader) -> Optional[Tuple[str, str, Dict[str, str], int]]:
+        """
+        Read the request line and the headers: ``(method, target, headers, content length)``, None at the end of the stream.
+
+        Raises ValueError for a malformed request (also raised by ``readline`` for lines over the stream limit).
+        """
+        request_line = await reader.readline()
+
+        if not request_line.strip():
+            return None
+
+        parts = request_line.decode("latin-1").split()
+
+        if len(parts) != 3 or not parts[2].startswith("HTTP/"):
+            raise ValueError("malformed request line.")
+
+        headers = {}
+
+        while True:
+            line = await reader.readline()
+
+            if line in (b"\r\n", b"\n", b""):
+                break
+
+            name, colon, value = line.decode("latin-1").partition(":")
+
+            if not colon or not name.strip():
+                raise ValueError("malformed header line.")
+
+            headers[name.strip().lower()] = value.strip()
+
+        length = headers.get("content-length", "0")
+
+        if not length.isdigit():
+            raise ValueError("the Content-Length header must be a non-negative integer.")
+
+        return parts[0], parts[1], headers, int(length)
+
+    @staticmethod
+    async def _respond(writer: asyncio.StreamWriter, status: str, payload: Dict[str, Any]):
+        data = json.dumps(payload).encode()
+
+        writer.write(
+            f"HTTP/1.1 {status}\r\nContent-Type: application/json\r\nContent-Length: {len(data)}\r\n\r\n".encode("latin-1") + data
+        )
+        await writer.drain()
+
+    async def _route(self, method: str, target: str, body: bytes) -> Tuple[str, Dict[str, Any]]:
+        if method == "POST" and target == "/score":
+            try:
+                rows = json.loads(body)["rows"]
+                return "200 OK", await self.score(rows)
+            except (ValueError, KeyError, TypeError) as e:
+                return "400 Bad Request", {"error": str(e) if not isinstance(e, KeyError) else "the body needs a 'rows' list."}
+            except Exception as e:
+                return "500 Internal Server Error", {"error": str(e)}
+
+        if method == "GET" and target == "/stats":
+            return "200 OK", self.stats()
+
+        if method == "GET" and target == "/info":
+            return "200 OK", {"detector": self.detector.__class__.__name__, "columns": [str(col) for col in self.detector.columns]}
+
+        return "404 Not Found", {"error": f"no route for {method} {target}."}
+
+
+def serve(
+        detector: Union[OutlierDetectorBase, str, "os.PathLike[str]"],
+        *,
+        host: str = "127.0.0.1",
+        port: int = 8000,
+        path: Optional[str] = None,
+        **options
+):
+    """
+    Run a ``ScoringServer`` until interrupted (blocking).
+
+    :param detector: A fitted detector or the path of one saved with ``save``.
+    :param host: Interface to listen on.
+    :param port: TCP port.
+    :param path: Unix socket path, instead of ``host``/``port``.
+    :param options: ``max_batch_rows``, ``max_delay``, ``latency_window``, ``max_body_size``.
+    """
+
+    async def main():
+        server = ScoringServer(detector, **options)
+
+        async with server:
+            await server._server.serve_forever()
+
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,300 @@
+"""
+Scikit-learn compatible transformers around the detectors and handlers.
+
+``OutlierIndicator`` outputs the outlier mask of a detector, and
+``OutlierTransformer`` replaces the outliers with a handler. Both fit on the
+training data and apply what they learned to the data they transform. They
+support ``fit``, ``transform``, ``fit_transform``, ``get_params`` and
+``set_params``, so they work in ``Pipeline``, ``ColumnTransformer`` and grid
+searches. Detectors and handlers expose their constructor arguments the same
+way, so a grid search can tune them through the wrapper, e.g.
+``{"outlier__detector__threshold": [1.5, 3.0]}``.
+
+Once fitted, the state is a few float64 arrays: the statistics of a
+univariate detector are kept as one matrix (a row per column), as ``publish``
+writes them, and the handler keeps one replacement value or one pair of
+limits per column. The training data and fit-time summaries are not kept, so
+fitted transformers pickle small, and joblib (parallel cross-validation,
+``Pipeline(memory = ...)``) hashes and copies them cheaply.
+
+Requires the optional dependency ``scikit-learn``
+(``pip install outlipy[sklearn]``).
+"""
+
+import copy
+
+import numpy as np
+import pandas as pd
+
+from typing import Any, List, Optional, Union
+
+try:
+    from sklearn.base import BaseEstimator, TransformerMixin
+except ImportError as e:
+    raise ImportError(
+        "outlipy.sklearn requires the optional dependency 'scikit-learn'. "
+        "Install it with `pip install outlipy[sklearn]`."
+    ) from e
+
+from .core import shared
+from .detection.base import OutlierDetectorBase, UnivariateDetectorBase
+from .handling.base import OutlierHandlerBase
+from .handling.central_tendency import MeanHandler, MedianHandler
+from .handling.constant_replacement import ConstantHandler
+from .handling.interpolation import InterpolateHandler
+from .handling.winsorization import WinsorizationHandler
+from .exceptions import ConfigurationException, HandlingException
+
+
+def _compact(detector: OutlierDetectorBase) -> OutlierDetectorBase:
+    """
+    The fitted detector with its statistics as one float64 matrix (univariate
+    detectors) and without the data kept for sampling, updates or reuse.
+    """
+    if isinstance(detector, UnivariateDetectorBase):
+        settings, stat_names, matrix = detector._statistics()
+        settings._scores = shared.SharedScores(settings.columns, stat_names, matrix)
+
+        return settings
+
+    return detector
+
+
+def _positions(X: Union[pd.DataFrame, np.ndarray], columns: List[Any]) -> np.ndarray:
+    """
+    Positions of the fitted columns in ``X`` (names for DataFrames, positions for arrays).
+    """
+    if isinstance(X, pd.DataFrame):
+        return X.columns.get_indexer(columns)
+
+    return np.asarray(columns, dtype = np.intp)
+
+
+def _column(X: Union[pd.DataFrame, np.ndarray], position: int) -> np.ndarray:
+    return X.iloc[:, position].to_numpy() if isinstance(X, pd.DataFrame) else np.asarray(X)[:, position]
+
+
+class _DetectorTransformer(TransformerMixin, BaseEstimator):
+    """
+    Fitting of the wrapped detector shared by the transformers.
+    """
+
+    def _fit_detector(self, X: Union[pd.DataFrame, np.ndarray]) -> OutlierDetectorBase:
+        if not isinstance(self.detector, OutlierDetectorBase):
+            raise ConfigurationException(
+                error_code = "CON002",
+                method = self.__class__.__name__,
+                parameter_context = "detector",
+                suggestion = "Pass an outlipy detector instance, e.g. IQRDetector()."
+            )
+
+        # Fit a copy: estimator parameters are never modified by fit.
+        detector = copy.deepcopy(self.detector)
+        detector.fit(X)
+
+        self.n_features_in_ = X.shape[1]
+
+        if isinstance(X, pd.DataFrame):
+            self.feature_names_in_ = np.asarray(X.columns, dtype = object)
+
+        self.columns_ = list(detector.columns)
+
+        return detector
+
+    def _as_fitted(self, X: Union[pd.DataFrame, np.ndarray]) -> Union[pd.DataFrame, np.ndarray]:
+        """
+        ``X`` in the container the detector was fitted on: arrays get the fitted
+        column names, DataFrames fitted as arrays are read by position.
+        """
+        if X.shape[1] != self.n_features_in_:
+            raise ValueError(f"X has {X.shape[1]} features, but {self.__class__.__name__} was fitted with {self.n_features_in_}.")
+
+        if hasattr(self, "feature_names_in_") and not isinstance(X, pd.DataFrame):
+            return pd.DataFrame(np.asarray(X), columns = self.feature_names_in_)
+
+        if not hasattr(self, "feature_names_in_") and isinstance(X, pd.DataFrame):
+            return X.to_numpy()
+
+        return X
+
+    def _mask(self, X: Union[pd.DataFrame, np.ndarray]) -> np.ndarray:
+        """
+        Outlier mask of ``X`` (as returned by ``_as_fitted``), one column per fitted column.
+        """
+        return np.asarray(self.detector_.detect(X), dtype = bool)
+
+
+class OutlierIndicator(_DetectorTransformer):
+    """
+    Transformer returning the outlier mask of a detector fitted on the training data.
+
+    ``transform`` returns one boolean column per fitted column, a DataFrame for
+    DataFrame input (as ``detect``) and an array otherwise.
+
+    :param detector: The detector to fit, e.g. ``IQRDetector()``; it is copied, not modified.
+    :type detector: OutlierDetectorBase
+
+    Fitted attributes:
+        detector_ (OutlierDetectorBase): The fitted detector, statistics stored as arrays.
+        columns_ (List): The fitted columns.
+    """
+
+    def __init__(self, detector: Optional[OutlierDetectorBase] = None):
+        self.detector = detector
+
+    def fit(self, X: Union[pd.DataFrame, np.ndarray], y: Any = None) -> "OutlierIndicator":
+        self.detector_ = _compact(self._fit_detector(X))
+
+        return self
+
+    def transform(self, X: Union[pd.DataFrame, np.ndarray]) -> Union[pd.DataFrame, np.ndarray]:
+        mask = self._mask(self._as_fitted(X))
+
+        if isinstance(X, pd.DataFrame):
+            return pd.DataFrame(mask, index = X.index, columns = self.get_feature_names_out())
+
+        return mask
+
+    def get_feature_names_out(self, input_features: Any = None) -> np.ndarray:
+        return np.asarray([f"outlier_{col}" for col in self.columns_], dtype = object)
+
+
+class OutlierTransformer(_DetectorTransformer):
+    """
+    Transformer replacing outliers, with the detector and the handler fitted on the training data.
+
+    The replacement statistics are learned at ``fit`` and reused by every
+    ``transform``: the mean or median of the non-outlier training values
+    (``MeanHandler``, ``MedianHandler``), the constant (``ConstantHandler``) or
+    the training quantile limits (``WinsorizationHandler``).
+    ``InterpolateHandler`` has nothing to learn and interpolates within the
+    transformed rows. Handlers that drop rows (``RemoveHandler``) or need the
+    groups of the transformed rows (``GroupedHandler``) are not supported, since
+    a transformer keeps the rows and their order.
+
+    Only the fitted columns are handled (those in ``handler.columns`` too, when
+    set); the other columns pass through. The output has the container type of
+    the input; integer columns are cast to the handler dtype.
+
+    :param detector: The detector to fit, e.g. ``IQRDetector()``; it is copied, not modified.
+    :type detector: OutlierDetectorBase
+    :param handler: The handler, e.g. ``MedianHandler()``; it is copied, not modified.
+    :type handler: OutlierHandlerBase
+
+    Fitted attributes:
+        detector_ (OutlierDetectorBase): The fitted detector, statistics stored as arrays.
+        columns_ (List): The handled columns.
+        fill_values_ (np.ndarray): The replacement value of every handled column (mean, median, constant).
+        limits_ (np.ndarray): The ``(lower, upper)`` caps of every handled column (winsorization).
+    """
+
+    _FILL_HANDLERS = (MeanHandler, MedianHandler, ConstantHandler)
+
+    def __init__(self, detector: Optional[OutlierDetectorBase] = None, handler: Optional[OutlierHandlerBase] = None):
+        self.detector = detector
+        self.handler = handler
+
+    def fit(self, X: Union[pd.DataFrame, np.ndarray], y: Any = None) -> "OutlierTransformer":
+        handler = self.handler
+
+        if not isinstance(handler, (*self._FILL_HANDLERS, WinsorizationHandler, InterpolateHandler)):
+            raise ConfigurationException(
+                error_code = "CON003",
+                method = self.__class__.__name__,
+                typed_method = f"handler {handler.__class__.__name__}",
+                suggestion = "Use MeanHandler, MedianHandler, ConstantHandler, WinsorizationHandler or InterpolateHandler."
+            )
+
+        detector = self._fit_detector(X)
+        fitted_columns = self.columns_
+        self.columns_ = [col for col in fitted_columns if handler.columns is None or col in handler.columns]
+        self._handled = [fitted_columns.index(col) for col in self.columns_]
+        self.handler_ = copy.deepcopy(handler)
+
+        positions = _positions(X, self.columns_)
+
+        if isinstance(handler, self._FILL_HANDLERS):
+            mask = np.asarray(detector.detect(X), dtype = bool)[:, self._handled]
+            self.fill_values_ = np.empty(len(self.columns_), dtype = np.float64)
+
+            for j, col in enumerate(self.columns_):
+                if isinstance(handler, ConstantHandler):
+                    self.fill_values_[j] = handler.fill_value
+                    continue
+
+                self.fill_values_[j] = handler._replacement_value(_column(X, positions[j]), mask[:, j])
+
+                if np.isnan(self.fill_values_[j]):
+                    raise HandlingException(
+                        error_code = "HEX002",
+                        method = self.__class__.__name__,
+                        suggestion = f"Cannot compute the replacement for column '{col}': every training value is flagged as an outlier."
+                    )
+
+        elif isinstance(handler, WinsorizationHandler):
+            self.limits_ = np.array(
+                [handler._limits(_column(X, positions[j]), col) for j, col in enumerate(self.columns_)],
+                dtype = np.float64
+            ).reshape(len(self.columns_), 2)
+
+        self.detector_ = _compact(detector)
+
+        return self
+
+    def transform(self, X: Union[pd.DataFrame, np.ndarray]) -> Union[pd.DataFrame, np.ndarray]:
+        out = self._handle(self._as_fitted(X))
+
+        # The container type of the input.
+        if isinstance(X, pd.DataFrame) and not isinstance(out, pd.DataFrame):
+            return pd.DataFrame(out, index = X.index, columns = X.columns)
+
+        return out.to_numpy() if isinstance(out, pd.DataFrame) and not isinstance(X, pd.DataFrame) else out
+
+    def _handle(self, X: Union[pd.DataFrame, np.ndarray]) -> Union[pd.DataFrame, np.ndarray]:
+        mask = self._mask(X)[:, self._handled]
+
+        if isinstance(self.handler_, InterpolateHandler):
+            return self._interpolate(X, mask)
+
+        positions = _positions(X, self.columns_)
+
+        if isinstance(X, pd.DataFrame):
+            out = X.copy()
+        else:
+            X = np.asarray(X)
+            out = X.astype(self.handler_.dtype) if X.dtype.kind in "iub" else X.copy()
+
+        for j, col in enumerate(self.columns_):
+            column = _column(X, positions[j]) if isinstance(X, pd.DataFrame) else out[:, positions[j]]
+
+            if column.dtype.kind != "f":
+                column = column.astype(self.handler_.dtype)
+            elif isinstance(X, pd.DataFrame):
+                column = column.copy()
+
+            if isinstance(self.handler_, WinsorizationHandler):
+                np.clip(column, column.dtype.type(self.limits_[j, 0]), column.dtype.type(self.limits_[j, 1]), out = column)
+            else:
+                column[mask[:, j]] = self.fill_values_[j]
+
+            if isinstance(out, pd.DataFrame):
+                out.isetitem(positions[j], column)
+            else:
+                out[:, positions[j]] = column
+
+        return out
+
+    def _interpolate(self, X: Union[pd.DataFrame, np.ndarray], mask: np.ndarray) -> Union[pd.DataFrame, np.ndarray]:
+        frame = X if isinstance(X, pd.DataFrame) else pd.DataFrame(np.asarray(X))
+        outlier_mask = pd.DataFrame(mask, index = frame.index, columns = frame.columns[_positions(X, self.columns_)])
+
+        # apply resolves the handler columns, so a copy keeps handler_ as fitted.
+        handled = copy.copy(self.handler_).apply(frame, outlier_mask)
+
+        return handled if isinstance(X, pd.DataFrame) else handled.to_numpy()
+
+    def get_feature_names_out(self, input_features: Any = None) -> np.ndarray:
+        if hasattr(self, "feature_names_in_"):
+            return self.feature_names_in_
+
+        return np.asarray([f"x{i}" for i in range(self.n_features_in_)], dtype = object)
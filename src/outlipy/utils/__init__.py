@@ -1,10 +1,36 @@
-from .validation import validate_input, validate_strategy
-from .auto_selection import select_numeric_columns
+from typing import TYPE_CHECKING
+
+from ..core.lazy import lazy_attributes
+
+# Submodules are imported on first access, see outlipy.core.lazy.
+__getattr__, __dir__ = lazy_attributes(__name__, {
+    "validate_input": ".validation",
+    "validate_array_input": ".validation",
+    "validate_arrow_input": ".validation",
+    "validate_series_input": ".validation",
+    "validate_strategy": ".validation",
+    "validate_dtype": ".validation",
+    "select_numeric_columns": ".auto_selection",
+    "ValidationReport": ".report",
+    "build_validation_report": ".report",
+})
+
+if TYPE_CHECKING:
+    from .validation import (validate_input, validate_array_input, validate_arrow_input,
+                             validate_series_input, validate_strategy, validate_dtype)
+    from .auto_selection import select_numeric_columns
+    from .report import ValidationReport, build_validation_report
 
 
 
 __all__ = [
     "validate_input",
+    "validate_array_input",
+    "validate_arrow_input",
+    "validate_series_input",
     "validate_strategy",
-    "select_numeric_columns"
-]
\ No newline at end of file
+    "validate_dtype",
+    "select_numeric_columns",
+    "ValidationReport",
+    "build_validation_report"
+]
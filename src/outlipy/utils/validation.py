@@ -1,7 +1,8 @@
 import pandas as pd
 import numpy as np
-from typing import Optional, List
-from ..exceptions import InvalidColumnException, HandlingException
+from typing import Optional, List, Union
+from ..exceptions import InvalidColumnException, HandlingException, ConfigurationException
+from ..core import arrow
 
 
 
@@ -10,20 +11,29 @@ from ..exceptions import InvalidColumnException, HandlingException
 # -----------------------------------------------------------
 
 def validate_input(
-        df: pd.DataFrame, 
+        df: Union[pd.DataFrame, np.ndarray], 
         detector_name: str, 
         columns: Optional[List[str]],
-        exclude: Optional[List[str]] = None
+        exclude: Optional[List[str]] = None,
+        allow_nan: bool = False
 ) -> List[str]:
     """
     Check if dataframe is valid and columns exist.
     
     Args:
-        df (pd.DataFrame): The DataFrame to be validated.
+        df (Union[pd.DataFrame, np.ndarray]): The DataFrame or 2-D array to be validated.
         detector_name (str): The name of the detector.
         columns (Optional[List[str]]): A list of strings passed for checking.
+        allow_nan (bool): Accept NaN / missing values; inf is still rejected.
     """
 
+    # 2-D arrays and Arrow tables are validated without going through pandas
+    if isinstance(df, np.ndarray):
+        return validate_array_input(df, detector_name, columns, exclude, allow_nan)
+
+    if arrow.is_arrow_table(df):
+        return validate_arrow_input(df, detector_name, columns, exclude, allow_nan)
+
     # Basic Type Check
     if not isinstance(df, pd.DataFrame):
         raise TypeError(f"[{detector_name}] Input must be a pandas DataFrame, got {type(df).__name__}")
@@ -49,7 +59,11 @@ def validate_input(
 
     # Auto-select columns if None provided
     if columns is None:
-        cols_to_check = df.select_dtypes(include=[np.number]).columns.tolist()
+        numeric_cols = set(df.select_dtypes(include=[np.number]).columns)
+        cols_to_check = [
+            col for col in df.columns
+            if col in numeric_cols or (arrow.is_arrow_dtype(df[col].dtype) and arrow.is_numeric_type(df[col].dtype.pyarrow_dtype))
+        ]
         
         # If still empty, it means no numeric data exists in the whole DF
         if not cols_to_check:
@@ -106,6 +120,16 @@ def validate_input(
         # Check if existing column is actually numeric
         elif not pd.api.types.is_numeric_dtype(df[col]):
             invalid_cols.append(col)
+        # Arrow-backed columns are checked on their validity bitmaps, not converted
+        elif arrow.is_arrow_dtype(df[col].dtype):
+            count = arrow.count_infinite if allow_nan else arrow.count_missing
+
+            if count(arrow.series_to_arrow(df[col])):
+                nan_inf_cols.append(col)
+        # Only inf is an error when missing values are allowed
+        elif allow_nan:
+            if np.isinf(df[col]).any():
+                nan_inf_cols.append(col)
         # Check if NaNs exist in rows and empty columns
         elif df[col].isna().any() or np.isinf(df[col]).any():
             nan_inf_cols.append(col)
@@ -122,6 +146,299 @@ def validate_input(
     return final_cols
 
 
+# -----------------------------------------------------------
+#                     validate array input
+# -----------------------------------------------------------
+
+def validate_array_input(
+        data: np.ndarray,
+        detector_name: str,
+        columns: Optional[List[int]],
+        exclude: Optional[List[int]] = None,
+        allow_nan: bool = False
+) -> List[int]:
+    """
+    Check if a 2-D array is valid and column positions exist.
+
+    Works on C- or Fortran-ordered arrays and read-only memmaps without copying
+    the whole array; the NaN/inf check runs one column at a time.
+
+    Args:
+        data (np.ndarray): The 2-D array to be validated.
+        detector_name (str): The name of the detector.
+        columns (Optional[List[int]]): Column positions passed for checking.
+        exclude (Optional[List[int]]): Column positions to leave out.
+        allow_nan (bool): Accept NaN values; inf is still rejected.
+    """
+
+    if data.ndim != 2:
+        raise TypeError(f"[{detector_name}] Array input must be 2-D, got {data.ndim}-D")
+
+    n_rows, n_cols = data.shape
+
+    # Check if array is empty
+    if n_rows == 0 or n_cols == 0:
+        raise InvalidColumnException(
+            method = detector_name,
+            error_code = "ICE007",
+            suggestion = "Please input a non-empty array"
+        )
+
+    # All columns of an array share one dtype
+    if data.dtype.kind not in "iuf":
+        raise InvalidColumnException(
+            method = detector_name,
+            no_numeric = True
+        )
+
+    cols_to_check: List[int] = []
+
+    # Auto-select every column if None provided
+    if columns is None:
+        cols_to_check = list(range(n_cols))
+    else:
+        cols_to_check = list(columns)
+
+        # Flags if user input an empty list. Default is None
+        if not cols_to_check:
+            raise InvalidColumnException(
+                method = detector_name,
+                error_code = "ICE000",
+                suggestion = "You provided an empty list of columns. Please specify columns."
+            )
+
+        # Flags if user input duplicate column positions. Example [0, 0]
+        if len(cols_to_check) != len(set(cols_to_check)):
+            seen = set()
+            dupes = [x for x in cols_to_check if x in seen or seen.add(x)]
+            raise InvalidColumnException(
+                error_code = "ICE005",
+                method = detector_name,
+                duplicated = dupes,
+                suggestion = "Remove duplicate column positions from your configuration list."
+            )
+
+    # Apply the exclusion
+    final_cols = cols_to_check
+
+    if exclude:
+        final_cols = [col for col in final_cols if col not in exclude]
+
+    # Check if any columns are left for analysis after exclusion
+    if not final_cols:
+        raise InvalidColumnException(
+             method=detector_name,
+             error_code="ICE002",
+             suggestion="No numeric columns left for analysis after filtering and exclusion."
+        )
+
+    # Validate specific columns
+    invalid_cols = [col for col in final_cols if not isinstance(col, (int, np.integer)) or isinstance(col, bool)]
+    missing_cols = [col for col in final_cols if col not in invalid_cols and not 0 <= col < n_cols]
+    nan_inf_cols = []
+
+    if invalid_cols or missing_cols:
+        raise InvalidColumnException(
+            method = detector_name,
+            missing = missing_cols,
+            invalid = invalid_cols,
+            suggestion = "Array columns must be given as integer positions."
+        )
+
+    # Integer arrays cannot hold NaN or inf
+    if data.dtype.kind == "f":
+        for col in final_cols:
+            if allow_nan:
+                if np.isinf(data[:, col]).any():
+                    nan_inf_cols.append(col)
+            elif not np.isfinite(data[:, col]).all():
+                nan_inf_cols.append(col)
+
+    if nan_inf_cols:
+        raise InvalidColumnException(
+            method = detector_name,
+            nan_cols = nan_inf_cols
+        )
+
+    return [int(col) for col in final_cols]
+
+
+# -----------------------------------------------------------
+#                     validate arrow input
+# -----------------------------------------------------------
+
+def validate_arrow_input(
+        table,
+        detector_name: str,
+        columns: Optional[List[str]],
+        exclude: Optional[List[str]] = None,
+        allow_nan: bool = False
+) -> List[str]:
+    """
+    Check if a ``pyarrow.Table`` is valid and columns exist.
+
+    Nulls are counted from the validity bitmaps; no column is converted to NumPy.
+
+    Args:
+        table (pyarrow.Table): The Arrow table to be validated.
+        detector_name (str): The name of the detector.
+        columns (Optional[List[str]]): A list of strings passed for checking.
+        exclude (Optional[List[str]]): Columns to leave out.
+        allow_nan (bool): Accept nulls and NaN; inf is still rejected.
+    """
+
+    names = table.column_names
+    count = arrow.count_infinite if allow_nan else arrow.count_missing
+
+    # Check if table is empty
+    if table.num_rows == 0 or table.num_columns == 0:
+        raise InvalidColumnException(
+            method = detector_name,
+            error_code = "ICE007",
+            suggestion = "Please input a non-empty table"
+        )
+
+    # Check for duplicated columns
+    if len(names) != len(set(names)):
+        seen = set()
+        dupes = [x for x in names if x in seen or seen.add(x)]
+        raise InvalidColumnException(
+            method = detector_name,
+            duplicated = dupes
+        )
+
+    cols_to_check: List[str] = []
+
+    # Auto-select columns if None provided
+    if columns is None:
+        cols_to_check = [name for name in names if arrow.is_numeric_type(table.schema.field(name).type)]
+
+        if not cols_to_check:
+            raise InvalidColumnException(
+                method = detector_name,
+                no_numeric = True
+            )
+    else:
+        cols_to_check = list(columns)
+
+        if not cols_to_check:
+            raise InvalidColumnException(
+                method = detector_name,
+                error_code = "ICE000",
+                suggestion = "You provided an empty list of columns. Please specify columns."
+            )
+
+        if len(cols_to_check) != len(set(cols_to_check)):
+            seen = set()
+            dupes = [x for x in cols_to_check if x in seen or seen.add(x)]
+            raise InvalidColumnException(
+                error_code = "ICE005",
+                method = detector_name,
+                duplicated = dupes,
+                suggestion = "Remove duplicate column names from your configuration list."
+            )
+
+    # Apply the exclusion
+    final_cols = cols_to_check
+
+    if exclude:
+        final_cols = [col for col in final_cols if col not in exclude]
+
+    if not final_cols:
+        raise InvalidColumnException(
+             method=detector_name,
+             error_code="ICE002",
+             suggestion="No numeric columns left for analysis after filtering and exclusion."
+        )
+
+    # Validate specific columns
+    missing_cols = []
+    invalid_cols = []
+    nan_inf_cols = []
+
+    for col in final_cols:
+        if col not in names:
+            missing_cols.append(col)
+        elif not arrow.is_numeric_type(table.schema.field(col).type):
+            invalid_cols.append(col)
+        elif count(table.column(col)):
+            nan_inf_cols.append(col)
+
+    if missing_cols or invalid_cols or nan_inf_cols:
+        raise InvalidColumnException(
+            method = detector_name,
+            missing = missing_cols,
+            invalid = invalid_cols,
+            nan_cols = nan_inf_cols
+        )
+
+    return final_cols
+
+
+# -----------------------------------------------------------
+#                     validate series input
+# -----------------------------------------------------------
+
+def validate_series_input(series: pd.Series, method_name: str, allow_nan: bool = False):
+    """
+    Lightweight check of a single numeric Series, returning its values.
+
+    This is the per-call fast path of the Series accessor: it only looks at the
+    dtype and makes one NaN/inf pass over float data.
+
+    Args:
+        series (pd.Series): The Series to be validated.
+        method_name (str): The name of the detector or handler.
+        allow_nan (bool): Accept NaN / missing values; inf is still rejected.
+
+    Returns:
+        The 1-D NumPy array, or the backing Arrow array for ``ArrowDtype`` data.
+    """
+
+    name = series.name
+
+    if len(series) == 0:
+        raise InvalidColumnException(
+            method = method_name,
+            error_code = "ICE007",
+            suggestion = "Please input a non-empty Series"
+        )
+
+    dtype = series.dtype
+
+    if arrow.is_arrow_dtype(dtype):
+        if not arrow.is_numeric_type(dtype.pyarrow_dtype):
+            raise InvalidColumnException(method = method_name, invalid = [name])
+
+        values = arrow.series_to_arrow(series)
+        count = arrow.count_infinite if allow_nan else arrow.count_missing
+
+        if count(values):
+            raise InvalidColumnException(method = method_name, nan_cols = [name])
+
+        return values
+
+    if not pd.api.types.is_numeric_dtype(dtype) or pd.api.types.is_bool_dtype(dtype):
+        raise InvalidColumnException(method = method_name, invalid = [name])
+
+    # Nullable extension dtypes carry NA in a separate mask
+    if not isinstance(dtype, np.dtype):
+        if not allow_nan and series.isna().any():
+            raise InvalidColumnException(method = method_name, nan_cols = [name])
+
+        values = series.to_numpy(dtype = np.float64, na_value = np.nan)
+    else:
+        values = series.to_numpy()
+
+    if values.dtype.kind == "f":
+        invalid = np.isinf(values).any() if allow_nan else not np.isfinite(values).all()
+
+        if invalid:
+            raise InvalidColumnException(method = method_name, nan_cols = [name])
+
+    return values
+
+
 # under utilized
 # -----------------------------------------------------------
 #                       validate strategy 
@@ -145,4 +462,39 @@ def validate_strategy(allowed_methods: Optional[List[str]], method_using: str):
             method = method_using,
             typed_method = method_using,
             allowed_methods = allowed_methods
-        )
\ No newline at end of file
+        )
+
+
+# -----------------------------------------------------------
+#                     validate dtype
+# -----------------------------------------------------------
+
+# Compute precisions accepted by the ``dtype`` parameter of detectors and handlers.
+COMPUTE_DTYPES = (np.float32, np.float64)
+
+def validate_dtype(dtype: Union[str, type, np.dtype], method_name: str) -> np.dtype:
+    """
+        Resolve the compute precision of a detector or handler.
+
+        Args:
+            dtype (Union[str, type, np.dtype]): "float32" or "float64" (or the matching NumPy type).
+            method_name (str): The name of the detector or handler.
+
+        Returns:
+            np.dtype: The resolved NumPy dtype.
+    """
+
+    try:
+        resolved = np.dtype(dtype)
+    except TypeError:
+        resolved = None
+
+    if resolved is None or resolved.type not in COMPUTE_DTYPES:
+        raise ConfigurationException(
+            error_code = "CON002",
+            method = method_name,
+            parameter_context = "dtype",
+            suggestion = "The compute dtype must be 'float32' or 'float64'."
+        )
+
+    return resolved
@@ -0,0 +1,72 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import outlipy
+from outlipy import IQRDetector, ZScoreDetector, HBOSDetector
+
+
+@pytest.fixture
+def df():
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(rng.normal(size = (20_000, 3)), columns = ["a", "b", "c"])
+
+
+@pytest.fixture
+def disk(tmp_path):
+    cache = outlipy.set_cache(tmp_path, masks = True)
+    yield cache
+    outlipy.set_cache(None)
+
+
+def test_refit_restores_cached_statistics(df, disk):
+    first = IQRDetector().fit(df)
+    second = IQRDetector().fit(df)
+
+    assert disk.hits == 1
+    assert second._scores == first._scores
+
+
+def test_changed_data_is_refitted(df, disk):
+    IQRDetector().fit(df)
+    edited = df.copy()
+    edited.iloc[123, 1] += 1.0
+    IQRDetector().fit(edited)
+
+    assert disk.hits == 0
+
+
+def test_cached_masks_match_uncached(df, disk):
+    for make in (IQRDetector, ZScoreDetector, HBOSDetector):
+        cached = [make().fit(df).detect(df) for _ in range(2)]
+
+        outlipy.set_cache(None)
+        expected = make().fit(df).detect(df)
+        outlipy.set_cache(disk.directory, masks = True)
+
+        for mask in cached:
+            pd.testing.assert_frame_equal(mask, expected)
+
+
+def test_parameter_changed_after_fit_is_not_served_stale_mask(df, disk):
+    detector = ZScoreDetector(threshold = 3.0).fit(df)
+    detector.detect(df)
+    detector.threshold = 1.0
+    cached = detector.detect(df)
+
+    outlipy.set_cache(None)
+    expected = ZScoreDetector(threshold = 1.0).fit(df).detect(df)
+
+    pd.testing.assert_frame_equal(cached, expected)
+    assert cached.to_numpy().sum() > 1000
+
+
+def test_row_detectors_skip_the_fingerprint_without_mask_caching(df, tmp_path):
+    outlipy.set_cache(tmp_path)
+
+    try:
+        detector = HBOSDetector().fit(df)
+    finally:
+        outlipy.set_cache(None)
+
+    assert detector._cache_key is None
@@ -0,0 +1,50 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from outlipy import DriftMonitor
+from outlipy.core import stats
+from outlipy.detection.base import UnivariateDetectorBase
+from outlipy.exceptions import ConfigurationException
+
+
+class AboveMedian(UnivariateDetectorBase):
+    """
+    A detector implementing only the required per-column hooks.
+    """
+
+    def _fit_column(self, values):
+        return {"median": float(stats.quantile(values, [0.5])[0])}
+
+    def _detect_column(self, values, scores):
+        return values > scores["median"] + self.threshold
+
+
+@pytest.fixture
+def df():
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(rng.normal(size = (2_000, 2)), columns = ["a", "b"])
+
+
+@pytest.mark.parametrize("call", [
+    lambda detector, df: detector.confidence_intervals(),
+    lambda detector, df: detector._fit_quantiles({0.5: 0.0}),
+    lambda detector, df: detector.sweep(df, [1.0]),
+    lambda detector, df: detector.update(df),
+], ids = ["bounds", "quantiles", "sweep", "update"])
+def test_missing_optional_hooks_raise_con003(df, call):
+    detector = AboveMedian(sample = 500, random_state = 0, incremental = True).fit(df)
+
+    with pytest.raises(ConfigurationException) as raised:
+        call(detector, df)
+
+    assert raised.value.error_code == "CON003"
+
+
+def test_drift_records_detectors_without_bounds(df):
+    monitor = DriftMonitor()
+    monitor.record(AboveMedian(), df).record(AboveMedian(), df + 0.1)
+
+    assert len(monitor) == 2
+    assert np.isnan(monitor._bounds[:2]).all()
+    assert monitor.drift()["rate_change"].notna().all()
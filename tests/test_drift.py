@@ -0,0 +1,103 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from outlipy import DriftMonitor
+from outlipy.detection.iqr import IQRDetector
+from outlipy.exceptions import ConfigurationException
+
+
+def batch(seed, rows = 1_000, loc = 0.0, scale = 1.0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame(rng.normal(loc, scale, size = (rows, 3)), columns = ["a", "b", "c"])
+
+
+def monitor_of(*batches):
+    monitor = DriftMonitor()
+
+    for df in batches:
+        monitor.record(IQRDetector().fit(df), df)
+
+    return monitor
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_stationary_refits_are_not_flagged(seed):
+    monitor = monitor_of(batch(seed), batch(seed + 100))
+
+    assert monitor.flagged() == []
+    assert monitor.flagged("previous") == []
+
+
+def test_rate_tolerance_scales_with_batch_size():
+    monitor = monitor_of(batch(0), batch(1))
+    base, latest = monitor._baseline, monitor._slot()
+    small = DriftMonitor._rate_error(base, monitor._histograms[latest], monitor._rates[latest])
+
+    monitor = monitor_of(batch(0, rows = 100_000), batch(1, rows = 100_000))
+    base, latest = monitor._baseline, monitor._slot()
+    large = DriftMonitor._rate_error(base, monitor._histograms[latest], monitor._rates[latest])
+
+    assert (large < small / 5).all()
+
+
+def test_rate_change_on_a_fixed_detector_is_flagged():
+    reference = batch(0, rows = 5_000)
+    detector = IQRDetector().fit(reference)
+
+    monitor = DriftMonitor(psi_threshold = np.inf, ks_threshold = np.inf, bound_tolerance = np.inf)
+    monitor.record(detector, reference)
+    monitor.record(detector, batch(1, rows = 5_000, scale = 1.5))
+
+    drift = monitor.drift()
+
+    assert (drift["rate_change"] > 0.03).all()
+    assert monitor.flagged() == ["a", "b", "c"]
+
+
+def test_shifted_batch_is_flagged():
+    monitor = monitor_of(batch(0), batch(1, loc = 0.5))
+    drift = monitor.drift()
+
+    assert (drift["psi"] > monitor.psi_threshold).all()
+    assert (drift["ks"] > monitor.ks_threshold).all()
+    assert (drift["bound_shift"] > monitor.bound_tolerance).all()
+    assert monitor.flagged() == ["a", "b", "c"]
+
+
+def test_only_the_drifted_column_is_flagged():
+    shifted = batch(1)
+    shifted["b"] = shifted["b"] * 2.0
+
+    assert monitor_of(batch(0), shifted).flagged() == ["b"]
+
+
+def test_history_keeps_the_last_batches_and_the_baseline():
+    monitor = DriftMonitor(capacity = 3)
+
+    for i in range(5):
+        df = batch(i, loc = 1.0 if i == 4 else 0.0)
+        monitor.record(IQRDetector().fit(df), df, label = f"day {i}")
+
+    history = monitor.history()
+
+    assert len(monitor) == 3
+    assert history.index.get_level_values("batch").unique().tolist() == ["day 2", "day 3", "day 4"]
+    assert (history["rows"] == 1_000).all()
+
+    # The baseline (day 0) was overwritten in the history but is still compared with.
+    assert monitor.flagged() == ["a", "b", "c"]
+    assert monitor.drift_history().loc["day 2", "drifted"].sum() == 0
+
+    monitor.set_baseline("day 3")
+    assert monitor.flagged() == monitor.flagged("previous") == ["a", "b", "c"]
+
+    with pytest.raises(ConfigurationException):
+        monitor.set_baseline("day 0")
+
+
+def test_recorded_batches_need_the_first_columns():
+    monitor = monitor_of(batch(0))
+
+    with pytest.raises(ConfigurationException):
+        monitor.record(IQRDetector().fit(batch(1)[["a", "b"]]), batch(1)[["a", "b"]])
@@ -0,0 +1,46 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from outlipy import ECODDetector
+
+
+@pytest.fixture
+def df():
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        "a": rng.normal(size = 800),
+        "b": -rng.exponential(size = 800),
+        "c": rng.integers(0, 5, size = 800).astype(float)
+    })
+
+
+def brute_force_scores(fitted, rows):
+    """
+    ECOD scores with the tail counts taken by comparing every row with every fitted value.
+    """
+    n = len(fitted)
+    at_most = (fitted[None, :, :] <= rows[:, None, :]).sum(axis = 1)
+    at_least = (fitted[None, :, :] >= rows[:, None, :]).sum(axis = 1)
+    left = np.log(n + 1.0) - np.log(at_most + 1.0)
+    right = np.log(n + 1.0) - np.log(at_least + 1.0)
+
+    centered = fitted - fitted.mean(axis = 0)
+    skewed = np.where((centered ** 3).mean(axis = 0) < 0, left, right)
+
+    return np.maximum.reduce([left.sum(axis = 1), right.sum(axis = 1), skewed.sum(axis = 1)])
+
+
+def test_sorted_scores_match_brute_force(df):
+    rng = np.random.default_rng(1)
+    rows = np.vstack([df.to_numpy()[:200], rng.normal(scale = 3.0, size = (200, 3))])
+    detector = ECODDetector(block_size = 64).fit(df)
+
+    assert np.allclose(detector.score(pd.DataFrame(rows, columns = df.columns)), brute_force_scores(df.to_numpy(), rows))
+
+
+def test_cutoff_flags_the_threshold_share_of_fitted_rows(df):
+    detector = ECODDetector(threshold = 0.95).fit(df)
+
+    assert np.allclose(detector.score(df), brute_force_scores(df.to_numpy(), df.to_numpy()))
+    assert detector.detect(df).any(axis = 1).mean() == pytest.approx(0.05, abs = 0.01)
@@ -0,0 +1,178 @@
+"""
+Both kernel engines must give identical masks and handled frames.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("numba")
+
+import outlipy
+from outlipy import (IQRDetector, ZScoreDetector, MADDetector, PercentileDetector, MahalanobisDetector,
+                     IsolationForestDetector, HBOSDetector, ECODDetector, KNNDetector, LOFDetector,
+                     WinsorizationHandler, MeanHandler, MedianHandler, RemoveHandler,
+                     ConstantHandler, InterpolateHandler, GroupedHandler, Plan)
+from outlipy.core import kernels
+
+FEATURES = ["a", "b", "c"]
+
+DETECTORS = {
+    "iqr": lambda **kw: IQRDetector(**kw),
+    "zscore": lambda **kw: ZScoreDetector(**kw),
+    "mad": lambda **kw: MADDetector(**kw),
+    "percentile": lambda **kw: PercentileDetector(threshold = (0.02, 0.98), **kw),
+    "mahalanobis": lambda **kw: MahalanobisDetector(**kw),
+    "isolation_forest": lambda **kw: IsolationForestDetector(random_state = 0, **kw),
+    "hbos": lambda **kw: HBOSDetector(**kw),
+    "ecod": lambda **kw: ECODDetector(**kw),
+    "knn": lambda **kw: KNNDetector(**kw),
+    "lof": lambda **kw: LOFDetector(**kw),
+}
+
+HANDLERS = {
+    "winsorization": lambda: WinsorizationHandler(limits = (0.05, 0.95), columns = FEATURES),
+    "mean": lambda: MeanHandler(columns = FEATURES),
+    "median": lambda: MedianHandler(columns = FEATURES),
+    "remove": lambda: RemoveHandler(columns = FEATURES),
+    "constant": lambda: ConstantHandler(fill_value = 0.0, columns = FEATURES),
+    "interpolate": lambda: InterpolateHandler(columns = FEATURES),
+    "grouped": lambda: GroupedHandler(group_by = ["g"], columns = FEATURES),
+    "grouped_multi_key": lambda: GroupedHandler(group_by = ["g", "h"], columns = FEATURES),
+}
+
+
+@pytest.fixture
+def engine():
+    """
+    Run a callable under one engine, restoring the previous selection afterwards.
+    """
+    previous = outlipy.core.kernels.requested()
+
+    def run(name, fn):
+        outlipy.set_engine(name)
+
+        try:
+            return fn()
+        finally:
+            outlipy.set_engine(previous)
+
+    return run
+
+
+def _frame(nan: bool) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    n_rows = 3_000
+    df = pd.DataFrame({
+        "a": rng.normal(size = n_rows),
+        "b": rng.standard_t(3, size = n_rows),
+        "c": rng.normal(10.0, 2.0, size = n_rows).astype(np.float32),
+        "g": rng.integers(0, 12, size = n_rows),
+        "h": rng.choice(["x", "y", "z"], size = n_rows),
+    })
+    df.loc[::97, "a"] = 40.0
+    df.loc[::113, "c"] = np.float32(-30.0)
+
+    if nan:
+        df.loc[::53, "b"] = np.nan
+
+    return df
+
+
+def _mask(df: pd.DataFrame) -> pd.DataFrame:
+    # The mask given to the handlers, computed once outside the compared engines.
+    return IQRDetector(columns = FEATURES).fit(df).detect(df)
+
+
+@pytest.mark.parametrize("nan", [False, True], ids = ["complete", "nan"])
+@pytest.mark.parametrize("dtype", ["float64", "float32"])
+@pytest.mark.parametrize("name", DETECTORS)
+def test_detector_masks_match(engine, name, dtype, nan):
+    df = _frame(nan)
+    make = DETECTORS[name]
+    kwargs = {"columns": FEATURES, "dtype": dtype, "nan_policy": "omit" if nan else "raise"}
+
+    masks = [engine(e, lambda: make(**kwargs).fit(df).detect(df)) for e in ("numpy", "numba")]
+
+    pd.testing.assert_frame_equal(masks[0], masks[1])
+
+
+@pytest.mark.parametrize("nan", [False, True], ids = ["complete", "nan"])
+@pytest.mark.parametrize("dtype", ["float64", "float32"])
+@pytest.mark.parametrize("name", [name for name in DETECTORS if name in ("iqr", "zscore", "mad", "percentile")])
+def test_univariate_masks_match_on_arrays(engine, name, dtype, nan):
+    values = _frame(nan)[FEATURES].to_numpy(dtype = dtype)
+    make = DETECTORS[name]
+    kwargs = {"dtype": dtype, "nan_policy": "omit" if nan else "raise"}
+
+    masks = [engine(e, lambda: make(**kwargs).fit(values).detect(values)) for e in ("numpy", "numba")]
+
+    np.testing.assert_array_equal(masks[0], masks[1])
+
+
+# Handlers reject columns with NaN; the NaN paths of the kernels are covered by the detectors.
+@pytest.mark.parametrize("name", HANDLERS)
+def test_handled_frames_match(engine, name):
+    df = _frame(nan = False)
+    mask = _mask(df)
+    make = HANDLERS[name]
+
+    frames = [engine(e, lambda: make().apply(df, mask)) for e in ("numpy", "numba")]
+
+    pd.testing.assert_frame_equal(frames[0], frames[1], check_exact = True)
+
+
+def test_grouped_medians_match_with_missing_keys(engine):
+    df = _frame(nan = False)
+    df.loc[::31, "h"] = None
+    mask = _mask(df)
+    handler = HANDLERS["grouped_multi_key"]
+
+    frames = [engine(e, lambda: handler().apply(df, mask)) for e in ("numpy", "numba")]
+
+    pd.testing.assert_frame_equal(frames[0], frames[1], check_exact = True)
+
+
+def test_fused_plan_matches_steps(engine):
+    df = _frame(nan = False)
+    detectors = lambda: [IQRDetector(columns = ["a", "c"]), PercentileDetector(threshold = (0.02, 0.98), columns = ["b"])]
+    handlers = lambda: [ConstantHandler(fill_value = 0.0, columns = FEATURES), MedianHandler(columns = ["a"])]
+
+    def fused():
+        plan = Plan(detectors(), handlers())
+        assert "fused with detection on a, b, c" in plan.explain(df)
+        return plan.run(df), plan.mask
+
+    def steps():
+        mask = pd.concat([detector.fit(df).detect(df) for detector in detectors()], axis = 1)[["a", "c", "b"]]
+        out = df
+        for handler in handlers():
+            out = handler.apply(out, mask)
+        return out, mask
+
+    for name in ("numpy", "numba"):
+        (out, mask), (expected, expected_mask) = engine(name, fused), engine(name, steps)
+
+        pd.testing.assert_frame_equal(out, expected, check_exact = True)
+        pd.testing.assert_frame_equal(mask, expected_mask)
+
+
+def test_rolling_statistics_match(engine):
+    values = np.cumsum(np.random.default_rng(0).normal(size = 10_000)) + 1e4
+    values[::613] = np.nan
+
+    (means, stds), (expected_means, expected_stds) = [engine(e, lambda: kernels.rolling_mean_std(values, 40)) for e in ("numba", "numpy")]
+
+    # The loop and pandas update the running moments differently: equal up to rounding.
+    np.testing.assert_allclose(means, expected_means, rtol = 1e-12)
+    np.testing.assert_allclose(stds, expected_stds, rtol = 1e-8)
+
+
+def test_series_fast_paths_match(engine):
+    series = pd.Series(np.cumsum(np.random.default_rng(0).normal(size = 5_000)))
+    series[::250] += 8.0
+
+    for method, kwargs in (("rolling_zscore", {"window": 30}), ("winsor", {})):
+        results = [engine(e, lambda: getattr(series.outli, method)(**kwargs)) for e in ("numpy", "numba")]
+
+        pd.testing.assert_series_equal(results[0], results[1], check_exact = True)
@@ -0,0 +1,70 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from outlipy import IQRDetector, ZScoreDetector, MADDetector, PercentileDetector
+from outlipy.core.frequency import FrequencyTable
+
+DETECTORS = [IQRDetector, ZScoreDetector, MADDetector, PercentileDetector]
+
+
+@pytest.fixture
+def df():
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        "rating": rng.choice([1.0, 2.0, 3.0, 4.0, 5.0], size = 50_000, p = [0.05, 0.1, 0.2, 0.4, 0.25]),
+        "count": rng.poisson(3.0, size = 50_000),
+        "price": rng.lognormal(size = 50_000)
+    })
+
+
+def assert_scores_close(scores, expected):
+    for col in expected:
+        for name, value in expected[col].items():
+            assert scores[col][name] == pytest.approx(value, rel = 1e-12, abs = 1e-12), (col, name)
+
+
+@pytest.mark.parametrize("make", DETECTORS)
+def test_frequency_table_fits_equal_row_fits(df, make):
+    rows = make().fit(df)
+    tables = make(max_cardinality = 64).fit(df)
+
+    assert_scores_close(tables._scores, rows._scores)
+    assert tables.detect(df).equals(rows.detect(df))
+
+
+@pytest.mark.parametrize("make", [IQRDetector, ZScoreDetector, MADDetector])
+def test_frequency_table_sweeps_equal_row_sweeps(df, make):
+    thresholds = [0.5, 1.0, 1.5, 2.0, 3.0]
+    rows = make().fit(df).sweep(df, thresholds)
+    tables = make(max_cardinality = 64).fit(df).sweep(df, thresholds, masks = [1.5])
+
+    assert tables.counts.equals(rows.counts)
+    assert tables.masks[1.5].equals(make(threshold = 1.5).fit(df).detect(df))
+
+
+def test_frequency_table_statistics_match_numpy(df):
+    values = df["count"].to_numpy()
+    table = FrequencyTable.from_values(values, 64)
+    levels = [0.0, 0.1, 0.25, 0.5, 0.75, 0.9, 0.99, 1.0]
+
+    assert table.total == len(values)
+    assert np.array_equal(table.quantile(levels), np.quantile(values, levels))
+    assert table.median() == np.median(values)
+    assert table.mean() == pytest.approx(values.mean(), rel = 1e-12)
+    assert table.std() == pytest.approx(values.std(), rel = 1e-12)
+
+
+def test_high_cardinality_columns_are_fitted_on_the_rows(df):
+    detector = IQRDetector(max_cardinality = 64)
+
+    assert detector._frequencies(df["price"].to_numpy()) is None
+    assert detector._frequencies(df["rating"].to_numpy()) is not None
+    assert FrequencyTable.from_values(np.array([1.0, np.nan]), 64) is None
+
+
+def test_bootstrap_of_a_frequency_table_fit(df):
+    intervals = IQRDetector(sample = 10_000, random_state = 0, max_cardinality = 64).fit(df).confidence_intervals()
+
+    assert (intervals["lower_ci_low"] <= intervals["lower"]).all()
+    assert (intervals["upper"] <= intervals["upper_ci_high"]).all()
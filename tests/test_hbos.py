@@ -0,0 +1,49 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from outlipy import HBOSDetector
+from outlipy.exceptions import ConfigurationException
+
+
+@pytest.fixture
+def df():
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        "a": rng.normal(size = 6_000),
+        "b": rng.exponential(size = 6_000),
+        "c": rng.uniform(-3, 3, size = 6_000)
+    })
+
+
+@pytest.mark.parametrize("binning", ["static", "dynamic"])
+def test_partial_fit_equals_fit(df, binning):
+    fitted = HBOSDetector(binning = binning).fit(df)
+    chunked = HBOSDetector(binning = binning)
+
+    # The chunks widen the fitted range one after the other.
+    for start in range(0, len(df), 1_000):
+        chunked.partial_fit(df.sort_values("a").iloc[start:start + 1_000])
+
+    assert np.array_equal(chunked.score(df), fitted.score(df))
+    assert chunked._scores["cutoff"] == fitted._scores["cutoff"]
+
+
+def test_merge_equals_fit(df):
+    fitted = HBOSDetector().fit(df)
+    merged = HBOSDetector().fit(df.iloc[:2_500]).merge(HBOSDetector().fit(df.iloc[2_500:]))
+
+    assert np.array_equal(merged.score(df), fitted.score(df))
+
+
+def test_merge_needs_the_same_settings(df):
+    with pytest.raises(ConfigurationException):
+        HBOSDetector().fit(df).merge(HBOSDetector(n_bins = 20).fit(df))
+
+
+def test_rows_in_empty_bins_are_flagged(df):
+    detector = HBOSDetector().fit(df)
+    rows = pd.DataFrame({"a": [0.0, 10.0], "b": [0.5, 0.5], "c": [0.0, 0.0]})
+
+    assert np.isfinite(detector.score(rows)).all()
+    assert detector.detect(rows).any(axis = 1).tolist() == [False, True]
@@ -0,0 +1,70 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from outlipy import IQRDetector, ZScoreDetector, MADDetector, PercentileDetector
+from outlipy.exceptions import ConfigurationException
+
+DETECTORS = [IQRDetector, ZScoreDetector, MADDetector, PercentileDetector]
+
+
+def batches(n_batches, rows, seed = 0):
+    rng = np.random.default_rng(seed)
+    return [pd.DataFrame({"a": rng.normal(i, 1.0, size = rows), "b": rng.lognormal(size = rows)}) for i in range(n_batches)]
+
+
+def assert_scores_close(scores, expected, rtol):
+    for col in expected:
+        for name, value in expected[col].items():
+            assert scores[col][name] == pytest.approx(value, rel = rtol, abs = rtol), (col, name)
+
+
+@pytest.mark.parametrize("make", DETECTORS)
+def test_update_equals_a_full_refit_while_the_summary_is_exact(make):
+    parts = batches(4, 1_500)
+    detector = make(incremental = True).fit(parts[0])
+
+    for part in parts[1:]:
+        detector.update(part)
+
+    full = pd.concat(parts, ignore_index = True)
+
+    assert_scores_close(detector._scores, make().fit(full)._scores, 1e-9)
+    assert detector.detect(full).equals(make().fit(full).detect(full))
+
+
+@pytest.mark.parametrize("make", DETECTORS)
+def test_update_is_close_to_a_full_refit_on_compressed_summaries(make):
+    parts = batches(5, 40_000)
+    detector = make(incremental = True).fit(parts[0])
+
+    for part in parts[1:]:
+        detector.update(part)
+
+    full = pd.concat(parts, ignore_index = True)
+    mask = detector.detect(full)
+    expected = make().fit(full).detect(full)
+
+    assert_scores_close(detector._scores, make().fit(full)._scores, 1e-2)
+    assert (mask != expected).to_numpy().mean() < 1e-3
+
+
+def test_decay_follows_the_latest_batches():
+    parts = batches(2, 5_000)
+    detector = ZScoreDetector(incremental = True).fit(parts[0]).update(parts[1], decay = 0.5)
+
+    weighted = pd.concat([parts[0], parts[1], parts[1]], ignore_index = True)
+
+    assert_scores_close(detector._scores, ZScoreDetector().fit(weighted)._scores, 1e-3)
+
+
+def test_update_needs_an_incremental_fit():
+    parts = batches(2, 100)
+
+    with pytest.raises(ConfigurationException) as raised:
+        IQRDetector().fit(parts[0]).update(parts[1])
+    assert raised.value.error_code == "CON001"
+
+    with pytest.raises(ConfigurationException) as raised:
+        IQRDetector(incremental = True).fit(parts[0]).update(parts[1], decay = 0.0)
+    assert raised.value.error_code == "CON002"
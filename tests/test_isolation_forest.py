@@ -0,0 +1,39 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from outlipy import IsolationForestDetector
+
+
+@pytest.fixture
+def df():
+    rng = np.random.default_rng(0)
+    rows = rng.normal(size = (3_000, 3))
+    rows[:10] += 8.0
+    return pd.DataFrame(rows, columns = ["a", "b", "c"])
+
+
+def test_forest_does_not_depend_on_n_jobs(df):
+    single = IsolationForestDetector(n_estimators = 20, random_state = 0, n_jobs = 1).fit(df)
+    parallel = IsolationForestDetector(n_estimators = 20, random_state = 0, n_jobs = 2).fit(df)
+
+    assert np.array_equal(single.score(df), parallel.score(df))
+    assert single.detect(df).equals(parallel.detect(df))
+
+
+def test_forest_is_reproducible(df):
+    first = IsolationForestDetector(random_state = 3).fit(df).score(df)
+    second = IsolationForestDetector(random_state = 3).fit(df).score(df)
+    other = IsolationForestDetector(random_state = 4).fit(df).score(df)
+
+    assert np.array_equal(first, second)
+    assert not np.array_equal(first, other)
+
+
+def test_isolated_rows_score_highest(df):
+    detector = IsolationForestDetector(random_state = 0).fit(df)
+    scores = detector.score(df)
+
+    assert ((0 < scores) & (scores < 1)).all()
+    assert set(np.argsort(scores)[-10:]) == set(range(10))
+    assert detector.detect(df).iloc[:10].all(axis = None)
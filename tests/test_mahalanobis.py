@@ -0,0 +1,60 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from outlipy import MahalanobisDetector
+from outlipy.exceptions import ConfigurationException
+
+
+@pytest.fixture
+def df():
+    rng = np.random.default_rng(0)
+    rows = rng.multivariate_normal([0.0, 1.0, -1.0], [[1.0, 0.8, 0.0], [0.8, 1.0, 0.3], [0.0, 0.3, 2.0]], size = 5_000)
+    return pd.DataFrame(rows, columns = ["a", "b", "c"])
+
+
+def test_partial_fit_equals_fit(df):
+    fitted = MahalanobisDetector().fit(df)
+    chunked = MahalanobisDetector(block_size = 700)
+
+    for start in range(0, len(df), 1_300):
+        chunked.partial_fit(df.iloc[start:start + 1_300])
+
+    assert chunked._scores["n_samples"] == fitted._scores["n_samples"] == len(df)
+    assert np.allclose(chunked._scores["location"], fitted._scores["location"])
+    assert np.allclose(chunked._scores["covariance"], fitted._scores["covariance"])
+    assert np.allclose(chunked.score(df), fitted.score(df))
+    assert chunked.detect(df).equals(fitted.detect(df))
+
+
+def test_classical_fit_matches_numpy(df):
+    detector = MahalanobisDetector().fit(df)
+    centered = df.to_numpy() - df.to_numpy().mean(axis = 0)
+    expected = np.sqrt(np.einsum("ij,jk,ik->i", centered, np.linalg.inv(np.cov(centered, rowvar = False)), centered))
+
+    assert np.allclose(detector.score(df), expected)
+
+
+def test_robust_fit_is_not_masked_by_a_cluster_of_outliers(df):
+    contaminated = df.copy()
+    contaminated.iloc[:500] = [6.0, -5.0, 4.0]
+
+    classical = MahalanobisDetector().fit(contaminated).detect(contaminated)
+    robust = MahalanobisDetector(robust = True, random_state = 0).fit(contaminated).detect(contaminated)
+
+    assert robust.iloc[:500].all(axis = None)
+    assert not classical.iloc[:500].any(axis = None)
+
+
+def test_robust_fit_is_reproducible(df):
+    first = MahalanobisDetector(robust = True, random_state = 1).fit(df)
+    second = MahalanobisDetector(robust = True, random_state = 1).fit(df)
+
+    assert np.array_equal(first._scores["covariance"], second._scores["covariance"])
+
+
+def test_partial_fit_of_the_robust_estimate_raises(df):
+    with pytest.raises(ConfigurationException) as raised:
+        MahalanobisDetector(robust = True).partial_fit(df)
+
+    assert raised.value.error_code == "CON002"
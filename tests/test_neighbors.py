@@ -0,0 +1,93 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from outlipy import KNNDetector, LOFDetector
+
+
+@pytest.fixture
+def df():
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(rng.normal(size = (500, 2)), columns = ["a", "b"])
+
+
+@pytest.mark.parametrize("make", [KNNDetector, LOFDetector])
+def test_fitted_frame_edited_in_place_is_rescored(df, make):
+    detector = make().fit(df)
+    fitted = detector.score(df)
+
+    df.iloc[:, :] = df.to_numpy() * 10
+    rescored = detector.score(df)
+
+    assert not np.allclose(rescored, fitted)
+    assert np.allclose(rescored, detector.score(df.copy()))
+    assert detector.detect(df).to_numpy().sum() > detector.detect(df / 10).to_numpy().sum()
+
+
+def test_fitted_frame_reuses_its_scores(df):
+    detector = KNNDetector().fit(df)
+
+    # A copy is scored against the index, where every row finds itself at distance 0.
+    assert np.array_equal(detector.score(df), detector._fitted_scores)
+    assert not np.array_equal(detector.score(df.copy()), detector._fitted_scores)
+
+
+def brute_force_neighbors(reference, rows, k, exclude_self = False):
+    """
+    Sorted distances and positions of the k nearest reference rows, from the full distance matrix.
+    """
+    distances = np.sqrt(((rows[:, None, :] - reference[None, :, :]) ** 2).sum(axis = 2))
+
+    if exclude_self:
+        np.fill_diagonal(distances, np.inf)
+
+    indices = np.argsort(distances, axis = 1, kind = "stable")[:, :k]
+
+    return np.take_along_axis(distances, indices, axis = 1), indices
+
+
+def brute_force_lof(reference, rows, k, exclude_self = False):
+    ref_distances, ref_indices = brute_force_neighbors(reference, reference, k, exclude_self = True)
+    k_distance = ref_distances[:, -1]
+    lrd = 1.0 / (np.maximum(ref_distances, k_distance[ref_indices]).mean(axis = 1) + LOFDetector.epsilon)
+
+    distances, indices = brute_force_neighbors(reference, rows, k, exclude_self)
+    density = 1.0 / (np.maximum(distances, k_distance[indices]).mean(axis = 1) + LOFDetector.epsilon)
+
+    return lrd[indices].mean(axis = 1) / density
+
+
+@pytest.fixture
+def new_rows():
+    rng = np.random.default_rng(1)
+    return pd.DataFrame(rng.normal(scale = 2.0, size = (200, 2)), columns = ["a", "b"])
+
+
+@pytest.mark.parametrize("algorithm", ["brute", "kd_tree"])
+@pytest.mark.parametrize("method", ["largest", "mean"])
+def test_knn_scores_match_brute_force(df, new_rows, algorithm, method):
+    detector = KNNDetector(n_neighbors = 7, method = method, algorithm = algorithm).fit(df)
+    reduce = (lambda d: d[:, -1]) if method == "largest" else (lambda d: d.mean(axis = 1))
+
+    fitted, _ = brute_force_neighbors(df.to_numpy(), df.to_numpy(), 7, exclude_self = True)
+    scored, _ = brute_force_neighbors(df.to_numpy(), new_rows.to_numpy(), 7)
+
+    assert np.allclose(detector.score(df), reduce(fitted))
+    assert np.allclose(detector.score(new_rows), reduce(scored))
+
+
+@pytest.mark.parametrize("algorithm", ["brute", "kd_tree"])
+def test_lof_scores_match_brute_force(df, new_rows, algorithm):
+    detector = LOFDetector(n_neighbors = 10, algorithm = algorithm).fit(df)
+
+    assert np.allclose(detector.score(df), brute_force_lof(df.to_numpy(), df.to_numpy(), 10, exclude_self = True))
+    assert np.allclose(detector.score(new_rows), brute_force_lof(df.to_numpy(), new_rows.to_numpy(), 10))
+
+
+@pytest.mark.parametrize("make", [KNNDetector, LOFDetector])
+def test_threads_do_not_change_the_scores(df, new_rows, make):
+    single = make(n_jobs = 1, algorithm = "brute", block_size = 64).fit(df)
+    threaded = make(n_jobs = 2, algorithm = "brute", block_size = 64).fit(df)
+
+    assert np.array_equal(single.score(new_rows), threaded.score(new_rows))
+    assert np.array_equal(single.score(df), threaded.score(df))
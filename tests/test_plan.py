@@ -0,0 +1,107 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from outlipy import Plan, IQRDetector, PercentileDetector, ZScoreDetector, MedianHandler, MeanHandler
+from outlipy import ConstantHandler, WinsorizationHandler, RemoveHandler
+from outlipy.handling.base import OutlierHandlerBase
+
+
+class ClipToZero(OutlierHandlerBase):
+    """
+    A handler implementing only ``apply``.
+    """
+
+    def apply(self, df, outlier_mask = None):
+        out = df.copy()
+        self._validate_input(out)
+
+        for col in self.columns:
+            out.loc[outlier_mask[col], col] = 0.0
+
+        return out
+
+
+def test_plan_runs_handlers_implementing_only_apply():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(rng.normal(size = (5_000, 2)), columns = ["a", "b"])
+    plan = Plan([IQRDetector()], [ClipToZero(columns = ["a"]), MedianHandler(columns = ["b"])])
+
+    out = plan.run(df)
+    mask = IQRDetector().fit(df).detect(df)
+
+    assert (out.loc[mask["a"], "a"] == 0.0).all()
+    pd.testing.assert_frame_equal(out[["b"]], MedianHandler(columns = ["b"]).apply(df, mask)[["b"]])
+
+
+@pytest.fixture
+def df():
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(rng.standard_t(3, size = (5_000, 4)), columns = ["a", "b", "c", "d"])
+
+
+def run_steps(detectors, handlers, combine, df):
+    """
+    The plan run by hand: each detector fitted on its own, the masks combined, then every handler in turn.
+    """
+    masks = [detector.fit(df).detect(df) for detector in detectors]
+    columns = [col for col in df.columns if any(col in mask.columns for mask in masks)]
+    counts = sum(mask.reindex(columns = columns, fill_value = False).to_numpy(dtype = int) for mask in masks)
+    coverage = sum(np.isin(columns, mask.columns).astype(int) for mask in masks)
+
+    if combine == "any":
+        flags = counts > 0
+    elif combine == "all":
+        flags = counts == coverage
+    else:
+        flags = counts >= combine
+
+    mask = pd.DataFrame(flags, index = df.index, columns = columns)
+    out = df
+
+    for handler in [handler for handler in handlers if not isinstance(handler, RemoveHandler)]:
+        out = handler.apply(out, mask)
+
+    for handler in [handler for handler in handlers if isinstance(handler, RemoveHandler)]:
+        out = handler.apply(out, mask)
+
+    return mask, out
+
+
+@pytest.mark.parametrize("combine", ["any", "all", 2])
+def test_plan_with_shared_quantiles_matches_steps(df, combine):
+    steps = lambda: (
+        [IQRDetector(), PercentileDetector(threshold = (0.05, 0.95)), ZScoreDetector()],
+        [WinsorizationHandler(limits = (0.05, 0.95), columns = ["a", "b"]), MeanHandler(columns = ["c"])]
+    )
+    plan = Plan(*steps(), combine = combine)
+
+    out = plan.run(df)
+    mask, expected = run_steps(*steps(), combine, df)
+
+    # The IQR and percentile detectors and the winsorization read the same quantiles.
+    assert set(plan._program.quantiles) == {"a", "b", "c", "d"}
+    pd.testing.assert_frame_equal(plan.mask, mask)
+    pd.testing.assert_frame_equal(out, expected)
+
+
+def test_plan_with_column_disjoint_handlers_matches_steps(df):
+    steps = lambda: (
+        [IQRDetector()],
+        [
+            MedianHandler(columns = ["a"]),
+            WinsorizationHandler(columns = ["b"]),
+            ConstantHandler(fill_value = 0.0, columns = ["c"]),
+            RemoveHandler(columns = ["d"])
+        ]
+    )
+    plan = Plan(*steps())
+
+    out = plan.run(df)
+    mask, expected = run_steps(*steps(), "any", df)
+
+    # One copy is shared by the value handlers, the constant column is replaced while detecting.
+    assert list(plan._program.fused) == ["c"]
+    assert len(out) < len(df)
+    pd.testing.assert_frame_equal(plan.mask, mask)
+    pd.testing.assert_frame_equal(out, expected)
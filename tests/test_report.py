@@ -0,0 +1,44 @@
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from outlipy.utils import ValidationReport, build_validation_report
+from outlipy.exceptions import ConfigurationException, InvalidColumnException
+
+
+def test_report_flags_duplicated_columns():
+    df = pd.DataFrame(np.arange(12.0).reshape(4, 3), columns = ["a", "a", "b"])
+    df["c"] = [1.0, 1.0, 1.0, 1.0]
+
+    report = build_validation_report(df)
+
+    assert isinstance(report, ValidationReport)
+    assert report.duplicated == ["a"]
+    assert report.columns == ["b", "c"]
+    assert report.constant == ["c"]
+
+    with pytest.raises(InvalidColumnException):
+        report.raise_for_issues()
+
+
+def test_report_flags_duplicated_requested_columns():
+    df = pd.DataFrame({"a": [1.0, 2.0, 3.0], "b": [1.0, np.nan, 3.0]})
+
+    report = build_validation_report(df, columns = ["a", "a", "b", "z"])
+
+    assert report.duplicated == ["a"]
+    assert report.missing == ["z"]
+    assert report.nan_inf == {"b": 1}
+
+
+def test_exception_args_hold_the_message_and_pickle():
+    exc = ConfigurationException(error_code = "CON002", method = "Test", parameter_context = "threshold", suggestion = "Use 1.5.")
+    restored = pickle.loads(pickle.dumps(exc))
+
+    assert exc.args == (str(exc),)
+    assert "threshold" in exc.args[0]
+    assert type(restored) is ConfigurationException
+    assert restored.args == exc.args
+    assert restored.error_code == "CON002"
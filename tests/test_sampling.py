@@ -0,0 +1,80 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from outlipy import IQRDetector, ZScoreDetector, MADDetector, PercentileDetector
+from outlipy.exceptions import ConfigurationException
+
+DETECTORS = [IQRDetector, ZScoreDetector, MADDetector, PercentileDetector]
+
+
+@pytest.fixture
+def df():
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({"a": rng.normal(size = 200_000), "b": rng.gamma(2.0, size = 200_000)})
+
+
+@pytest.mark.parametrize("make", DETECTORS)
+def test_sample_of_every_row_equals_the_full_fit(df, make):
+    full = make().fit(df)
+
+    for sample in (len(df), 1.0):
+        sampled = make(sample = sample, random_state = 0).fit(df)
+        assert sampled._scores == full._scores
+
+
+@pytest.mark.parametrize("make", DETECTORS)
+def test_intervals_cover_the_bounds_of_the_full_fit(df, make):
+    full = make().fit(df)
+    covered = []
+
+    for seed in range(10):
+        sampled = make(sample = 5_000, random_state = seed).fit(df)
+        intervals = sampled.confidence_intervals(level = 0.95)
+
+        assert (intervals["sample_size"] == 5_000).all()
+
+        for col in df.columns:
+            lower, upper = full._bounds(full._scores[col])
+            row = intervals.loc[col]
+
+            assert row["lower_ci_low"] <= row["lower"] <= row["lower_ci_high"]
+            assert row["upper_ci_low"] <= row["upper"] <= row["upper_ci_high"]
+            covered += [row["lower_ci_low"] <= lower <= row["lower_ci_high"], row["upper_ci_low"] <= upper <= row["upper_ci_high"]]
+
+    # About 95% of the 40 intervals should hold the bound of the full fit.
+    assert np.mean(covered) >= 0.85
+
+
+def test_sampled_fit_is_reproducible(df):
+    first = IQRDetector(sample = 0.05, random_state = 1).fit(df)
+    second = IQRDetector(sample = 0.05, random_state = 1).fit(df)
+
+    assert first._scores == second._scores
+    assert len(first._samples["a"]) == 10_000
+
+
+def test_fit_stream_with_a_large_reservoir_equals_the_full_fit(df):
+    chunks = (df.iloc[start:start + 30_000] for start in range(0, len(df), 30_000))
+    streamed = IQRDetector(sample = len(df), random_state = 0).fit_stream(chunks)
+
+    assert streamed._scores == IQRDetector().fit(df)._scores
+
+
+def test_fit_stream_keeps_a_uniform_sample(df):
+    ordered = df.sort_values("a")
+    chunks = (ordered.iloc[start:start + 10_000] for start in range(0, len(df), 10_000))
+    streamed = ZScoreDetector(sample = 20_000, random_state = 0).fit_stream(chunks)
+
+    # A sample biased towards the first or last chunks would move the mean by about a standard deviation.
+    assert abs(streamed._scores["a"]["mean"]) < 0.05
+
+
+def test_sampling_errors(df):
+    with pytest.raises(ConfigurationException) as raised:
+        IQRDetector(sample = 0.5).fit_stream([df])
+    assert raised.value.error_code == "CON002"
+
+    with pytest.raises(ConfigurationException) as raised:
+        IQRDetector().fit(df).confidence_intervals()
+    assert raised.value.error_code == "CON001"
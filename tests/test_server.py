@@ -0,0 +1,98 @@
+import asyncio
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from outlipy import IQRDetector
+from outlipy.serving.server import ScoringServer
+
+
+@pytest.fixture
+def detector():
+    rng = np.random.default_rng(0)
+    return IQRDetector().fit(pd.DataFrame(rng.normal(size = (1_000, 2)), columns = ["a", "b"]))
+
+
+def test_score_batches_requests(detector):
+    async def main():
+        async with ScoringServer(detector) as server:
+            return await asyncio.gather(server.score([[0.0, 0.0]]), server.score([[100.0, 0.0]]))
+
+    first, second = asyncio.run(main())
+
+    assert first["outliers"] == [False]
+    assert second["mask"] == [[True, False]]
+
+
+def test_stop_cancels_waiting_requests(detector):
+    async def main():
+        # The batch waits for more rows, so the requests are pending when the server stops.
+        server = await ScoringServer(detector, max_batch_rows = 1_000, max_delay = 60.0).start()
+        requests = [asyncio.ensure_future(server.score([[0.0, 0.0]])) for _ in range(3)]
+        await asyncio.sleep(0.05)
+        await server.stop()
+
+        return await asyncio.wait_for(asyncio.gather(*requests, return_exceptions = True), 2)
+
+    results = asyncio.run(main())
+
+    assert all(isinstance(result, asyncio.CancelledError) for result in results)
+
+
+def test_score_after_stop_raises(detector):
+    async def main():
+        server = await ScoringServer(detector).start()
+        await server.stop()
+        await server.score([[0.0, 0.0]])
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(main())
+
+
+async def exchange(server, request):
+    reader, writer = await asyncio.open_connection(*server.address[:2])
+    writer.write(request)
+    await writer.drain()
+
+    response = await asyncio.wait_for(reader.read(), 2)
+    writer.close()
+
+    return response
+
+
+@pytest.mark.parametrize("request_line", [b"GARBAGE\r\n", b"GET /info\r\n", b"GET /info HTTP/1.1 extra\r\n"])
+def test_malformed_request_gets_400(detector, request_line):
+    async def main():
+        async with ScoringServer(detector) as server:
+            return await exchange(server, request_line + b"\r\n")
+
+    assert asyncio.run(main()).startswith(b"HTTP/1.1 400 Bad Request")
+
+
+@pytest.mark.parametrize("header", [b"Content-Length: ten", b"Content-Length: -1", b"no colon"])
+def test_malformed_header_gets_400(detector, header):
+    async def main():
+        async with ScoringServer(detector) as server:
+            return await exchange(server, b"POST /score HTTP/1.1\r\n" + header + b"\r\n\r\n")
+
+    assert asyncio.run(main()).startswith(b"HTTP/1.1 400 Bad Request")
+
+
+def test_body_over_the_limit_gets_413(detector):
+    async def main():
+        async with ScoringServer(detector, max_body_size = 1_000) as server:
+            # The declared size is rejected before the body is read, so none is sent.
+            too_large = await exchange(server, b"POST /score HTTP/1.1\r\nContent-Length: 1000000000\r\n\r\n")
+
+            body = b'{"rows": [[0.0, 0.0]]}'
+            accepted = await exchange(
+                server, b"POST /score HTTP/1.1\r\nConnection: close\r\nContent-Length: %d\r\n\r\n" % len(body) + body
+            )
+
+            return too_large, accepted
+
+    too_large, accepted = asyncio.run(main())
+
+    assert too_large.startswith(b"HTTP/1.1 413 Content Too Large")
+    assert accepted.startswith(b"HTTP/1.1 200 OK")
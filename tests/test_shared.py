@@ -0,0 +1,99 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from outlipy import IQRDetector, ZScoreDetector, MADDetector, PercentileDetector
+from outlipy.core import shared
+from outlipy.exceptions import ConfigurationException
+
+
+@pytest.fixture
+def df():
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({"a": rng.normal(size = 2_000), "b": rng.exponential(size = 2_000)})
+
+
+def count_outliers(path, df):
+    return IQRDetector.attach(path).detect(df).to_numpy().sum(axis = 0).tolist()
+
+
+def test_attach_maps_the_file_it_read_the_header_from(tmp_path, monkeypatch):
+    path = tmp_path / "stats.bin"
+    shared.publish(path, {"version": 1}, np.ones((2, 3)))
+    read_signature = shared._signature
+
+    # A new version is published after the header was read, before the matrix is mapped.
+    def publish_meanwhile(status):
+        shared.publish(path, {"version": 2}, np.full((2, 3), 2.0))
+        return read_signature(status)
+
+    monkeypatch.setattr(shared, "_signature", publish_meanwhile)
+    header, matrix, signature = shared.attach(path)
+
+    assert header["version"] == 1
+    assert np.array_equal(matrix, np.ones((2, 3)))
+    assert signature != shared.signature(path)
+
+
+def test_attached_detector_refreshes_to_the_new_version(tmp_path):
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(rng.normal(size = (1_000, 2)), columns = ["a", "b"])
+    path = tmp_path / "iqr.bin"
+
+    IQRDetector().fit(df).publish(path)
+    attached = IQRDetector.attach(path)
+
+    assert not attached.refresh()
+
+    refitted = IQRDetector().fit(df * 2)
+    refitted.publish(path)
+
+    assert attached.refresh()
+    assert attached.detect(df).equals(refitted.detect(df))
+
+
+@pytest.mark.parametrize("make", [IQRDetector, ZScoreDetector, MADDetector, PercentileDetector])
+def test_attached_detector_equals_the_published_one(tmp_path, df, make):
+    path = tmp_path / "stats.bin"
+    published = make().fit(df)
+    published.publish(path)
+
+    attached = make.attach(path)
+
+    assert attached._fitted and list(attached.columns) == ["a", "b"]
+    assert {col: dict(attached._scores[col]) for col in attached.columns} == published._scores
+    assert attached.detect(df).equals(published.detect(df))
+    assert not attached._scores.matrix.flags.writeable
+
+
+def test_processes_attach_one_published_file(tmp_path, df):
+    path = tmp_path / "iqr.bin"
+    detector = IQRDetector().fit(df)
+    detector.publish(path)
+
+    with ProcessPoolExecutor(max_workers = 2) as executor:
+        counts = list(executor.map(count_outliers, [path] * 4, [df] * 4))
+
+    assert counts == [detector.detect(df).to_numpy().sum(axis = 0).tolist()] * 4
+
+
+def test_sharing_errors(tmp_path, df):
+    path = tmp_path / "stats.bin"
+
+    with pytest.raises(ConfigurationException):
+        IQRDetector().publish(path)
+
+    with pytest.raises(ConfigurationException):
+        IQRDetector().fit(df).refresh()
+
+    IQRDetector().fit(df).publish(path)
+
+    with pytest.raises(TypeError):
+        ZScoreDetector.attach(path)
+
+    path.write_bytes(b"not published")
+
+    with pytest.raises(ValueError):
+        IQRDetector.attach(path)
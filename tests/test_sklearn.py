@@ -0,0 +1,57 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("sklearn")
+
+from sklearn.base import clone
+from sklearn.linear_model import LinearRegression
+from sklearn.model_selection import GridSearchCV
+from sklearn.pipeline import Pipeline
+
+from outlipy import IQRDetector, PercentileDetector, MedianHandler, WinsorizationHandler, InterpolateHandler
+from outlipy.sklearn import OutlierTransformer
+from outlipy.exceptions import ConfigurationException
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame(rng.normal(size = (400, 3)), columns = ["a", "b", "c"])
+    X.iloc[::40, 0] = 25.0
+    y = X["b"] * 2.0 + rng.normal(scale = 0.1, size = 400)
+    return X, y
+
+
+@pytest.mark.parametrize("estimator", [
+    IQRDetector(threshold = 2.0, columns = ["a"]),
+    PercentileDetector(threshold = (0.05, 0.95)),
+    MedianHandler(columns = ["a"]),
+    WinsorizationHandler(limits = (0.1, 0.9)),
+    InterpolateHandler(method = "nearest"),
+])
+def test_detectors_and_handlers_clone(estimator):
+    assert clone(estimator).get_params() == estimator.get_params()
+
+
+def test_grid_search_tunes_nested_detector_and_handler_parameters(data):
+    X, y = data
+    pipeline = Pipeline([("o", OutlierTransformer(IQRDetector(), MedianHandler())), ("m", LinearRegression())])
+    search = GridSearchCV(pipeline, {"o__detector__threshold": [1.5, 3.0], "o__handler__columns": [None, ["a"]]}, cv = 3)
+
+    search.fit(X, y)
+
+    assert search.best_params_["o__detector__threshold"] in (1.5, 3.0)
+    assert search.best_estimator_.named_steps["o"].detector.threshold == search.best_params_["o__detector__threshold"]
+
+
+def test_set_params_validates_and_rejects_unknown_parameters():
+    detector = IQRDetector()
+
+    assert detector.set_params(threshold = 2.5).threshold == 2.5
+
+    with pytest.raises(ConfigurationException):
+        detector.set_params(threshold = -1.0)
+
+    with pytest.raises(ValueError):
+        detector.set_params(window = 3)
@@ -0,0 +1,56 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from outlipy import IQRDetector, ZScoreDetector, MADDetector, PercentileDetector
+from outlipy.exceptions import ConfigurationException
+
+THRESHOLDS = [0.5, 1.0, 1.5, 2.0, 2.5, 3.0, 3.5, 5.0]
+
+
+@pytest.fixture
+def df():
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({"a": rng.normal(size = 20_000), "b": rng.standard_t(2, size = 20_000)})
+
+
+@pytest.mark.parametrize("make", [IQRDetector, ZScoreDetector, MADDetector])
+def test_sweep_counts_equal_detect(df, make):
+    result = make().fit(df).sweep(df, THRESHOLDS, masks = [1.5, 3.0])
+
+    for threshold in THRESHOLDS:
+        mask = make(threshold = threshold).fit(df).detect(df)
+
+        assert result.counts.loc[threshold].tolist() == mask.sum().tolist()
+
+        if threshold in result.masks:
+            assert result.masks[threshold].equals(mask)
+
+
+def test_sweep_skips_missing_values(df):
+    df.iloc[::7, 0] = np.nan
+    detector = ZScoreDetector(nan_policy = "omit").fit(df)
+    result = detector.sweep(df, THRESHOLDS)
+
+    for threshold in THRESHOLDS:
+        mask = ZScoreDetector(threshold = threshold, nan_policy = "omit").fit(df).detect(df)
+        assert result.counts.loc[threshold].tolist() == mask.sum().tolist()
+
+
+def test_threshold_for_rate(df):
+    result = ZScoreDetector().sweep(df, THRESHOLDS)
+    threshold = result.threshold_for_rate(0.01)
+
+    assert (result.rates.loc[threshold] <= 0.01).all()
+    assert (result.rates.loc[[t for t in THRESHOLDS if t < threshold]].max(axis = 1) > 0.01).all()
+    assert np.isnan(result.threshold_for_rate(0.0))
+
+
+def test_sweep_errors(df):
+    with pytest.raises(ConfigurationException) as raised:
+        PercentileDetector().fit(df).sweep(df, THRESHOLDS)
+    assert raised.value.error_code == "CON003"
+
+    with pytest.raises(ConfigurationException) as raised:
+        ZScoreDetector().fit(df).sweep(df, THRESHOLDS, masks = [4.0])
+    assert raised.value.error_code == "CON002"